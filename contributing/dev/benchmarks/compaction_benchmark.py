@@ -0,0 +1,186 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares per-turn prompt size and compaction latency across modes.
+
+Simulates a session where some turns carry very large tool outputs and runs
+the compaction configured on the app after every turn, the same way Runner
+does. The summarizer LLM is a fake with a fixed latency, so no credentials are
+needed.
+
+Usage:
+  python contributing/dev/benchmarks/compaction_benchmark.py --turns 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import AsyncGenerator
+from unittest import mock
+import warnings
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.apps.app import App
+from google.adk.apps.app import EventsCompactionConfig
+from google.adk.apps.compaction import _estimate_event_tokens
+from google.adk.apps.compaction import _run_compaction
+from google.adk.apps.llm_event_summarizer import LlmEventSummarizer
+from google.adk.events.event import Event
+from google.adk.flows.llm_flows import contents
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.genai import types
+
+
+class _FakeSummaryLlm(BaseLlm):
+  """Returns a short summary after a fixed delay."""
+
+  latency: float = 0.05
+  calls: int = 0
+
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    self.calls += 1
+    await asyncio.sleep(self.latency)
+    prompt = llm_request.contents[0].parts[0].text
+    yield LlmResponse(
+        content=types.Content(
+            role='model',
+            parts=[types.Part(text=f'summary of {len(prompt)} chars ' * 20)],
+        )
+    )
+
+
+def _turn_events(turn: int, tool_output_chars: int) -> list[Event]:
+  invocation_id = f'inv{turn}'
+  big = turn % 5 == 3
+  return [
+      Event(
+          invocation_id=invocation_id,
+          author='user',
+          content=types.Content(
+              role='user', parts=[types.Part(text=f'question {turn} ' * 10)]
+          ),
+      ),
+      Event(
+          invocation_id=invocation_id,
+          author='agent',
+          content=types.Content(
+              role='model',
+              parts=[
+                  types.Part(
+                      function_call=types.FunctionCall(
+                          id=f'call{turn}', name='lookup', args={'q': turn}
+                      )
+                  )
+              ],
+          ),
+      ),
+      Event(
+          invocation_id=invocation_id,
+          author='agent',
+          content=types.Content(
+              role='user',
+              parts=[
+                  types.Part(
+                      function_response=types.FunctionResponse(
+                          id=f'call{turn}',
+                          name='lookup',
+                          response={
+                              'result': (
+                                  'x' * (tool_output_chars if big else 200)
+                              )
+                          },
+                      )
+                  )
+              ],
+          ),
+      ),
+      Event(
+          invocation_id=invocation_id,
+          author='agent',
+          content=types.Content(
+              role='model', parts=[types.Part(text=f'answer {turn} ' * 20)]
+          ),
+      ),
+  ]
+
+
+def _prompt_tokens(events: list[Event]) -> int:
+  return sum(
+      _estimate_event_tokens(Event(author='x', content=c))
+      for c in contents._get_contents(None, events)
+  )
+
+
+async def _run(label: str, config: EventsCompactionConfig, args) -> None:
+  llm = _FakeSummaryLlm(model='fake', latency=args.summary_latency)
+  config.summarizer = LlmEventSummarizer(llm=llm)
+  app = App(
+      name='bench', root_agent=mock.Mock(spec=BaseAgent), plugins=[]
+  ).model_copy(update={'events_compaction_config': config})
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(app_name='bench', user_id='u')
+
+  sizes = []
+  latencies = []
+  for turn in range(1, args.turns + 1):
+    for event in _turn_events(turn, args.tool_output_chars):
+      await session_service.append_event(session, event)
+    start = time.perf_counter()
+    await _run_compaction(app, session, session_service)
+    latencies.append(time.perf_counter() - start)
+    sizes.append(_prompt_tokens(session.events))
+
+  print(f'== {label}')
+  print(
+      f'  prompt tokens/turn: max={max(sizes)} last={sizes[-1]}'
+      f' mean={sum(sizes) // len(sizes)}'
+  )
+  print(
+      f'  compaction latency/turn: max={max(latencies) * 1000:.1f}ms'
+      f' total={sum(latencies) * 1000:.1f}ms summarizer_calls={llm.calls}'
+  )
+  if args.verbose:
+    print('  per-turn prompt tokens:', sizes)
+
+
+async def main() -> None:
+  warnings.filterwarnings('ignore', message=r'\[EXPERIMENTAL\]')
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--turns', type=int, default=30)
+  parser.add_argument('--tool-output-chars', type=int, default=200_000)
+  parser.add_argument('--summary-latency', type=float, default=0.05)
+  parser.add_argument('--token-threshold', type=int, default=20_000)
+  parser.add_argument('--verbose', action='store_true')
+  args = parser.parse_args()
+
+  await _run(
+      'invocation interval (compaction_interval=5, overlap_size=1)',
+      EventsCompactionConfig(compaction_interval=5, overlap_size=1),
+      args,
+  )
+  await _run(
+      f'token budget (token_threshold={args.token_threshold})',
+      EventsCompactionConfig(token_threshold=args.token_threshold),
+      args,
+  )
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
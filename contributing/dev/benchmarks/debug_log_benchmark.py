@@ -0,0 +1,104 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the per-request cost of debug logging with DEBUG disabled.
+
+Builds an LLM request with a long history and many tool declarations, then
+logs it the way the Gemini backend does, once with the message built eagerly
+as it used to be, and once through `lazy_log`. The logger is at INFO level, as
+in production, so neither message is ever emitted.
+
+Usage:
+  python contributing/dev/benchmarks/debug_log_benchmark.py --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from google.adk.models.google_llm import _build_request_log
+from google.adk.models.llm_request import LlmRequest
+from google.adk.utils._lazy_log import lazy_log
+from google.genai import types
+
+
+def _request(turns: int, tools: int) -> LlmRequest:
+  contents = [
+      types.Content(
+          role='user' if i % 2 == 0 else 'model',
+          parts=[types.Part(text=f'Message {i}: ' + 'lorem ipsum ' * 50)],
+      )
+      for i in range(turns)
+  ]
+  declarations = [
+      types.FunctionDeclaration(
+          name=f'tool_{i}',
+          description='A tool. ' * 20,
+          parameters=types.Schema(
+              type=types.Type.OBJECT,
+              properties={
+                  f'param_{j}': types.Schema(type=types.Type.STRING)
+                  for j in range(5)
+              },
+          ),
+      )
+      for i in range(tools)
+  ]
+  return LlmRequest(
+      model='gemini-2.5-flash',
+      contents=contents,
+      config=types.GenerateContentConfig(
+          system_instruction='You are a helpful agent. ' * 100,
+          tools=[types.Tool(function_declarations=declarations)],
+      ),
+  )
+
+
+def _time_per_request(log, llm_request: LlmRequest, requests: int) -> float:
+  start = time.perf_counter()
+  for _ in range(requests):
+    log(llm_request)
+  return (time.perf_counter() - start) / requests
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--requests', type=int, default=200)
+  parser.add_argument('--turns', type=int, default=100)
+  parser.add_argument('--tools', type=int, default=30)
+  args = parser.parse_args()
+
+  logger = logging.getLogger('google_adk.debug_log_benchmark')
+  logger.setLevel(logging.INFO)
+  llm_request = _request(args.turns, args.tools)
+
+  eager = _time_per_request(
+      lambda r: logger.debug(_build_request_log(r)), llm_request, args.requests
+  )
+  lazy = _time_per_request(
+      lambda r: logger.debug(lazy_log(_build_request_log, r)),
+      llm_request,
+      args.requests,
+  )
+  print(
+      f'{args.turns} contents, {args.tools} tools, {args.requests} requests'
+      ' at INFO level'
+  )
+  print(f'{"eager":>6}: {eager * 1e6:10.1f} us per request')
+  print(f'{"lazy":>6}: {lazy * 1e6:10.1f} us per request')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,91 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the import time of ADK entry points in fresh interpreters.
+
+Each statement is run in a new Python process, so nothing is cached between
+measurements, and the median over the runs is reported. With `--check`, the
+script exits with an error if a statement that should stay cheap, such as
+`import google.adk` or loading the CLI, exceeds its budget, to catch imports
+that undo the lazy loading of the packages.
+
+Usage:
+  python contributing/dev/benchmarks/import_time_benchmark.py --runs 5 --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Statements and, for the ones that should stay cheap, their budget in
+# seconds. The budgets leave room for slow machines; the imports they guard
+# take a few milliseconds, while loading google.genai takes seconds.
+_STATEMENTS = {
+    'import google.adk': 0.5,
+    'import google.adk.agents': 0.5,
+    'import google.adk.models': 0.5,
+    'import google.adk.plugins': 0.5,
+    'import google.adk.tools': 0.5,
+    'from google.adk.cli import main': 1.0,
+    'from google.adk import Agent': None,
+    'from google.adk import Runner': None,
+}
+
+_TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def _measure(statement: str) -> float:
+  output = subprocess.run(
+      [sys.executable, '-c', _TIMER.format(statement=statement)],
+      check=True,
+      capture_output=True,
+      text=True,
+  ).stdout
+  return float(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--runs', type=int, default=5)
+  parser.add_argument(
+      '--check',
+      action='store_true',
+      help='Exit with an error if an import exceeds its budget.',
+  )
+  args = parser.parse_args()
+
+  over_budget = []
+  for statement, budget in _STATEMENTS.items():
+    median = statistics.median(_measure(statement) for _ in range(args.runs))
+    note = ''
+    if budget is not None:
+      note = f'(budget {budget * 1000:.0f} ms)'
+      if median > budget:
+        over_budget.append(statement)
+        note += ' OVER BUDGET'
+    print(f'{statement:>34}: {median * 1000:8.1f} ms {note}')
+
+  if args.check and over_budget:
+    sys.exit(f'Over budget: {", ".join(over_budget)}')
+
+
+if __name__ == '__main__':
+  main()
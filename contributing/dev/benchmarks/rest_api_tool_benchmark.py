@@ -0,0 +1,131 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures concurrent RestApiTool throughput against a local stub server.
+
+Starts a threaded HTTP/1.1 server that answers after a fixed delay, then issues
+concurrent tool calls through an OpenAPIToolset, which shares one pooled async
+client across its tools. For comparison, the same calls are also made with a
+blocking `requests.request` per call, the way RestApiTool used to send them.
+
+Usage:
+  python contributing/dev/benchmarks/rest_api_tool_benchmark.py --calls 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import threading
+import time
+import warnings
+
+from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset import OpenAPIToolset
+import requests
+
+
+def _make_handler(latency: float):
+
+  class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+      time.sleep(latency)
+      body = json.dumps({'id': self.path.rsplit('/', 1)[-1]}).encode()
+      self.send_response(200)
+      self.send_header('Content-Type', 'application/json')
+      self.send_header('Content-Length', str(len(body)))
+      self.end_headers()
+      self.wfile.write(body)
+
+    def log_message(self, *args):
+      pass
+
+  return _StubHandler
+
+
+def _spec(base_url: str) -> dict:
+  return {
+      'openapi': '3.0.0',
+      'info': {'title': 'stub', 'version': '1'},
+      'servers': [{'url': base_url}],
+      'paths': {
+          '/items/{itemId}': {
+              'get': {
+                  'operationId': 'getItem',
+                  'parameters': [{
+                      'name': 'itemId',
+                      'in': 'path',
+                      'required': True,
+                      'schema': {'type': 'string'},
+                  }],
+                  'responses': {'200': {'description': 'ok'}},
+              }
+          }
+      },
+  }
+
+
+async def _run_pooled(base_url: str, args) -> float:
+  toolset = OpenAPIToolset(spec_dict=_spec(base_url))
+  tool = toolset.get_tool('get_item')
+  start = time.perf_counter()
+  results = await asyncio.gather(*[
+      tool.call(args={'item_id': str(i)}, tool_context=None)
+      for i in range(args.calls)
+  ])
+  elapsed = time.perf_counter() - start
+  await toolset.close()
+  assert results[-1] == {'id': str(args.calls - 1)}
+  return elapsed
+
+
+async def _run_blocking(base_url: str, args) -> float:
+  async def call(i: int):
+    # What RestApiTool.call used to do: a blocking call on the event loop.
+    return requests.request(method='get', url=f'{base_url}/items/{i}').json()
+
+  start = time.perf_counter()
+  await asyncio.gather(*[call(i) for i in range(args.calls)])
+  return time.perf_counter() - start
+
+
+async def main() -> None:
+  warnings.filterwarnings('ignore', message=r'\[EXPERIMENTAL\]')
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--calls', type=int, default=200)
+  parser.add_argument('--latency', type=float, default=0.02)
+  args = parser.parse_args()
+
+  server = ThreadingHTTPServer(('127.0.0.1', 0), _make_handler(args.latency))
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  base_url = f'http://127.0.0.1:{server.server_address[1]}'
+  try:
+    for label, run in [
+        ('blocking requests', _run_blocking),
+        ('pooled async client', _run_pooled),
+    ]:
+      elapsed = await run(base_url, args)
+      print(
+          f'{label:>20}: {args.calls} calls in {elapsed:.2f}s'
+          f' ({args.calls / elapsed:.0f} calls/s)'
+      )
+  finally:
+    server.shutdown()
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
@@ -12,9 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
+from typing import Any
+from typing import TYPE_CHECKING
+
 from . import version
-from .agents.llm_agent import Agent
-from .runners import Runner
+
+# The TYPE_CHECKING block is needed for autocomplete to work.
+if TYPE_CHECKING:
+  from .agents.llm_agent import Agent
+  from .runners import Runner
+
+# Importing the agents and the runner loads most of ADK and google.genai, so
+# they are only imported when first accessed.
+_LAZY_MAPPING = {
+    "Agent": (".agents.llm_agent", "Agent"),
+    "Runner": (".runners", "Runner"),
+}
 
 __version__ = version.__version__
 __all__ = ["Agent", "Runner"]
+
+
+def __getattr__(name: str) -> Any:
+  """Lazy loads the public API to keep `import google.adk` cheap."""
+  if name not in _LAZY_MAPPING:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+  module_path, attr_name = _LAZY_MAPPING[name]
+  module = importlib.import_module(module_path, __name__)
+  attr = getattr(module, attr_name)
+  globals()[name] = attr
+  return attr
+
+
+def __dir__() -> list[str]:
+  return list(globals().keys()) + __all__
@@ -0,0 +1,247 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""HTTP clients and agent cards shared by the remote A2A agents."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import logging
+import sys
+import threading
+import time
+from typing import Callable
+from typing import Optional
+from urllib.parse import urlparse
+
+try:
+  from a2a.types import AgentCard
+except ImportError as e:
+  if sys.version_info < (3, 10):
+    raise ImportError(
+        "A2A requires Python 3.10 or above. Please upgrade your Python version."
+    ) from e
+  else:
+    raise e
+
+import httpx
+
+from ..experimental import a2a_experimental
+
+logger = logging.getLogger("google_adk." + __name__)
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+DEFAULT_CARD_TTL_SECONDS = 300.0
+DEFAULT_MAX_CLIENTS = 256
+
+
+@dataclasses.dataclass
+class _CachedCard:
+  card: AgentCard
+  etag: Optional[str]
+  expires_at: float
+
+
+def _get_card_ttl(
+    headers: httpx.Headers, default_ttl: float
+) -> Optional[float]:
+  """Returns how long a card may be used without revalidation, if at all."""
+  directives = {}
+  for directive in headers.get("cache-control", "").split(","):
+    name, _, value = directive.strip().partition("=")
+    directives[name.lower()] = value.strip('"')
+  if "no-store" in directives:
+    return None
+  if "no-cache" in directives:
+    return 0
+  try:
+    return max(int(directives["max-age"]), 0)
+  except (KeyError, ValueError):
+    return default_ttl
+
+
+@a2a_experimental
+class A2AClientPool:
+  """Shares HTTP clients and agent cards across remote A2A agents.
+
+  Remote A2A agents given the same pool share one HTTP client, and thus its
+  keep-alive connections, per host and timeout, instead of each opening its
+  own. Agent cards fetched through the pool are cached for the max-age of
+  their response, or `card_ttl_seconds` without one, and then revalidated
+  with their ETag. Concurrent fetches of the same card are sent once.
+
+  A client is bound to the event loop it was created on, so each loop gets
+  its own clients. Clients of closed loops are forgotten, as are the least
+  recently used ones past `max_clients`; they aren't closed, as the agents
+  they were handed to may still use them.
+  """
+
+  def __init__(
+      self,
+      *,
+      limits: httpx.Limits = DEFAULT_LIMITS,
+      card_ttl_seconds: float = DEFAULT_CARD_TTL_SECONDS,
+      max_clients: int = DEFAULT_MAX_CLIENTS,
+      clock: Callable[[], float] = time.monotonic,
+  ):
+    """Initializes the pool.
+
+    Args:
+      limits: The connection limits and keep-alive expiry of each client.
+      card_ttl_seconds: How long agent cards whose response has no max-age are
+        used without revalidation.
+      max_clients: The maximum number of clients the pool keeps.
+      clock: The clock card expiries are measured with.
+    """
+    self._limits = limits
+    self._card_ttl_seconds = card_ttl_seconds
+    self._max_clients = max_clients
+    self._clock = clock
+    self._lock = threading.Lock()
+    # Keyed by origin, timeout and event loop, in least recently used order.
+    self._clients: collections.OrderedDict[
+        tuple[str, float, asyncio.AbstractEventLoop], httpx.AsyncClient
+    ] = collections.OrderedDict()
+    self._cards: dict[str, _CachedCard] = {}
+    self._in_flight: dict[
+        str, tuple[asyncio.AbstractEventLoop, asyncio.Task[AgentCard]]
+    ] = {}
+
+  def get_client(self, url: str, timeout: float) -> httpx.AsyncClient:
+    """Returns the client shared by the requests to the host of url.
+
+    Args:
+      url: A URL on the host the client connects to.
+      timeout: The timeout of the requests of the client, in seconds.
+
+    Returns:
+      The client for the host and timeout on the running event loop.
+    """
+    parsed_url = urlparse(url)
+    loop = asyncio.get_running_loop()
+    key = (f"{parsed_url.scheme}://{parsed_url.netloc}", timeout, loop)
+    with self._lock:
+      client = self._clients.get(key)
+      if client is not None and not client.is_closed:
+        self._clients.move_to_end(key)
+        return client
+      client = httpx.AsyncClient(
+          timeout=httpx.Timeout(timeout=timeout), limits=self._limits
+      )
+      self._clients[key] = client
+      self._forget_stale_clients()
+      return client
+
+  async def get_agent_card(self, url: str, timeout: float) -> AgentCard:
+    """Returns the agent card at url, fetching it unless cached and fresh.
+
+    Args:
+      url: The URL of the agent card.
+      timeout: The timeout of the request fetching the card, in seconds.
+
+    Returns:
+      The agent card.
+    """
+    with self._lock:
+      cached = self._cards.get(url)
+      if cached is not None and self._clock() < cached.expires_at:
+        return cached.card
+
+    loop = asyncio.get_running_loop()
+    with self._lock:
+      flight = self._in_flight.get(url)
+      if flight is None or flight[0] is not loop:
+        # A fetch in flight on another loop cannot be awaited from this one.
+        task = loop.create_task(self._fetch_agent_card(url, timeout))
+        self._in_flight[url] = (loop, task)
+      else:
+        task = flight[1]
+    # Shielded so that a cancelled caller doesn't cancel the fetch for the
+    # others awaiting it.
+    return await asyncio.shield(task)
+
+  def invalidate_agent_card(self, url: str) -> None:
+    """Drops the cached agent card at url."""
+    with self._lock:
+      self._cards.pop(url, None)
+
+  async def aclose(self) -> None:
+    """Closes the clients of the running event loop and forgets the others."""
+    loop = asyncio.get_running_loop()
+    with self._lock:
+      clients = list(self._clients.items())
+      self._clients.clear()
+    for (_, _, client_loop), client in clients:
+      if client_loop is loop:
+        await client.aclose()
+
+  def _forget_stale_clients(self) -> None:
+    """Forgets the clients of closed loops and the least recently used ones.
+
+    Clients of a closed loop can't be closed anymore, and the others may still
+    be used by the agents they were handed to.
+    """
+    for key in [key for key in self._clients if key[2].is_closed()]:
+      del self._clients[key]
+    while len(self._clients) > self._max_clients:
+      self._clients.popitem(last=False)
+
+  async def _fetch_agent_card(self, url: str, timeout: float) -> AgentCard:
+    try:
+      with self._lock:
+        cached = self._cards.get(url)
+      headers = {}
+      if cached is not None and cached.etag:
+        headers["If-None-Match"] = cached.etag
+
+      response = await self.get_client(url, timeout).get(url, headers=headers)
+      if response.status_code == 304 and cached is not None:
+        card = cached.card
+        etag = response.headers.get("etag", cached.etag)
+      else:
+        response.raise_for_status()
+        card = AgentCard.model_validate(response.json())
+        etag = response.headers.get("etag")
+
+      ttl = _get_card_ttl(response.headers, self._card_ttl_seconds)
+      with self._lock:
+        if ttl is None:
+          self._cards.pop(url, None)
+        else:
+          self._cards[url] = _CachedCard(
+              card=card, etag=etag, expires_at=self._clock() + ttl
+          )
+      return card
+    finally:
+      with self._lock:
+        flight = self._in_flight.get(url)
+        if flight and flight[1] is asyncio.current_task():
+          del self._in_flight[url]
+
+
+_default_pool: Optional[A2AClientPool] = None
+
+
+def get_a2a_client_pool() -> A2AClientPool:
+  """Returns the pool shared by default across the process."""
+  global _default_pool
+  if _default_pool is None:
+    _default_pool = A2AClientPool()
+  return _default_pool
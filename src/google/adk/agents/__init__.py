@@ -12,32 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
 import logging
 import sys
+from typing import Any
+from typing import TYPE_CHECKING
 
-from .base_agent import BaseAgent
-from .invocation_context import InvocationContext
-from .live_request_queue import LiveRequest
-from .live_request_queue import LiveRequestQueue
-from .llm_agent import Agent
-from .llm_agent import LlmAgent
-from .loop_agent import LoopAgent
-from .parallel_agent import ParallelAgent
-from .run_config import RunConfig
-from .sequential_agent import SequentialAgent
-
-__all__ = [
-    'Agent',
-    'BaseAgent',
-    'LlmAgent',
-    'LoopAgent',
-    'ParallelAgent',
-    'SequentialAgent',
-    'InvocationContext',
-    'LiveRequest',
-    'LiveRequestQueue',
-    'RunConfig',
-]
+# The TYPE_CHECKING block is needed for autocomplete to work.
+if TYPE_CHECKING:
+  from .base_agent import BaseAgent
+  from .invocation_context import InvocationContext
+  from .live_request_queue import LiveRequest
+  from .live_request_queue import LiveRequestQueue
+  from .llm_agent import Agent
+  from .llm_agent import LlmAgent
+  from .loop_agent import LoopAgent
+  from .mcp_instruction_provider import McpInstructionProvider
+  from .parallel_agent import ParallelAgent
+  from .run_config import RunConfig
+  from .sequential_agent import SequentialAgent
+
+# Agents are imported on first access, so that importing one agent type, or
+# the package for its submodules, doesn't load all the others and MCP.
+_LAZY_MAPPING = {
+    'Agent': ('.llm_agent', 'Agent'),
+    'BaseAgent': ('.base_agent', 'BaseAgent'),
+    'LlmAgent': ('.llm_agent', 'LlmAgent'),
+    'LoopAgent': ('.loop_agent', 'LoopAgent'),
+    'ParallelAgent': ('.parallel_agent', 'ParallelAgent'),
+    'SequentialAgent': ('.sequential_agent', 'SequentialAgent'),
+    'InvocationContext': ('.invocation_context', 'InvocationContext'),
+    'LiveRequest': ('.live_request_queue', 'LiveRequest'),
+    'LiveRequestQueue': ('.live_request_queue', 'LiveRequestQueue'),
+    'RunConfig': ('.run_config', 'RunConfig'),
+}
 
 if sys.version_info < (3, 10):
   logger = logging.getLogger('google_adk.' + __name__)
@@ -46,8 +54,27 @@ if sys.version_info < (3, 10):
       ' version in order to use it.'
   )
 else:
-  from .mcp_instruction_provider import McpInstructionProvider
-
-  __all__.extend([
+  _LAZY_MAPPING['McpInstructionProvider'] = (
+      '.mcp_instruction_provider',
       'McpInstructionProvider',
-  ])
+  )
+
+__all__ = list(_LAZY_MAPPING.keys())
+
+
+def __getattr__(name: str) -> Any:
+  """Lazy loads agents to avoid expensive imports."""
+  if name not in _LAZY_MAPPING:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+  module_path, attr_name = _LAZY_MAPPING[name]
+  module = importlib.import_module(module_path, __name__)
+  attr = getattr(module, attr_name)
+  globals()[name] = attr
+  return attr
+
+
+# __dir__ is used to expose all public interfaces to keep mocking with autoscope
+# working.
+def __dir__() -> list[str]:
+  return list(globals().keys()) + __all__
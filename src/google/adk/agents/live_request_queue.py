@@ -15,6 +15,10 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import dataclasses
+from enum import Enum
+import threading
 from typing import Optional
 
 from google.genai import types
@@ -41,20 +45,177 @@ class LiveRequest(BaseModel):
   """If set, close the queue. queue.shutdown() is only supported in Python 3.13+."""
 
 
+class OverflowPolicy(Enum):
+  """What a bounded LiveRequestQueue does with realtime frames when full."""
+
+  BLOCK = 'block'
+  """Block senders of realtime frames until there is room.
+
+  Only `send_realtime_threadsafe` can wait; `send_realtime` runs on the event
+  loop, so it raises `asyncio.QueueFull` instead.
+  """
+
+  DROP_OLDEST = 'drop_oldest'
+  """Drop the oldest queued realtime frame to make room for the new one."""
+
+  COALESCE = 'coalesce'
+  """Append PCM audio to the newest queued frame if it has the same format.
+
+  Frames that can't be coalesced fall back to `DROP_OLDEST`.
+  """
+
+
+@dataclasses.dataclass
+class LiveRequestQueueStats:
+  """Counters for monitoring a LiveRequestQueue."""
+
+  depth: int = 0
+  """The number of requests currently queued."""
+  max_depth: int = 0
+  """The highest number of requests queued at once."""
+  dropped_frames: int = 0
+  """The number of realtime frames dropped because the queue was full."""
+  coalesced_frames: int = 0
+  """The number of realtime frames merged into a queued frame."""
+
+
+# Coalesced frames are copied on every merge, so they are kept small enough
+# for that to stay cheap. This is about 2 seconds of 16 kHz 16-bit PCM audio.
+_MAX_COALESCED_FRAME_BYTES = 64 * 1024
+
+
+class _LiveRequestBuffer(asyncio.Queue):
+  """An asyncio.Queue that applies an OverflowPolicy to realtime frames."""
+
+  def __init__(self, max_size: int, overflow_policy: OverflowPolicy):
+    # Only realtime frames are bounded, so control requests, e.g. the one
+    # closing the queue, are never lost or blocked.
+    super().__init__()
+    self._max_frames = max_size
+    self._overflow_policy = overflow_policy
+    self._frames = 0
+    # Senders waiting for room for a frame, with OverflowPolicy.BLOCK.
+    self._frame_waiters: collections.deque[asyncio.Future[None]] = (
+        collections.deque()
+    )
+    self.stats = LiveRequestQueueStats()
+
+  def put_nowait(self, item: LiveRequest) -> None:
+    if self._overflow_policy == OverflowPolicy.BLOCK and self._is_full(item):
+      raise asyncio.QueueFull
+    super().put_nowait(item)
+
+  async def put(self, item: LiveRequest) -> None:
+    while self._overflow_policy == OverflowPolicy.BLOCK and self._is_full(item):
+      waiter = asyncio.get_running_loop().create_future()
+      self._frame_waiters.append(waiter)
+      try:
+        await waiter
+      finally:
+        if waiter in self._frame_waiters:
+          self._frame_waiters.remove(waiter)
+    self.put_nowait(item)
+
+  def _is_full(self, item: LiveRequest) -> bool:
+    return (
+        item.blob is not None
+        and bool(self._max_frames)
+        and self._frames >= self._max_frames
+    )
+
+  def _put(self, item: LiveRequest) -> None:
+    if self._overflow_policy != OverflowPolicy.BLOCK and self._is_full(item):
+      if self._overflow_policy == OverflowPolicy.COALESCE and self._coalesce(
+          item
+      ):
+        return
+      self._drop_oldest_frame()
+    self._queue.append(item)
+    if item.blob is not None:
+      self._frames += 1
+    self.stats.depth = len(self._queue)
+    self.stats.max_depth = max(self.stats.max_depth, self.stats.depth)
+
+  def _get(self) -> LiveRequest:
+    item = self._queue.popleft()
+    if item.blob is not None:
+      self._frames -= 1
+      while self._frame_waiters:
+        waiter = self._frame_waiters.popleft()
+        if not waiter.done():
+          waiter.set_result(None)
+          break
+    self.stats.depth = len(self._queue)
+    return item
+
+  def _coalesce(self, item: LiveRequest) -> bool:
+    if not self._queue:
+      return False
+    last = self._queue[-1]
+    if (
+        last.blob is None
+        or last.blob.mime_type != item.blob.mime_type
+        or not (item.blob.mime_type or '').startswith('audio/pcm')
+        or len(last.blob.data) + len(item.blob.data)
+        > _MAX_COALESCED_FRAME_BYTES
+    ):
+      return False
+    self._queue[-1] = LiveRequest(
+        blob=types.Blob(
+            data=last.blob.data + item.blob.data,
+            mime_type=item.blob.mime_type,
+        )
+    )
+    self.stats.coalesced_frames += 1
+    return True
+
+  def _drop_oldest_frame(self) -> None:
+    for i, queued in enumerate(self._queue):
+      if queued.blob is not None:
+        del self._queue[i]
+        self._frames -= 1
+        self.stats.dropped_frames += 1
+        return
+
+
 class LiveRequestQueue:
-  """Queue used to send LiveRequest in a live(bidirectional streaming) way."""
+  """Queue used to send LiveRequest in a live(bidirectional streaming) way.
 
-  def __init__(self):
+  By default the queue is unbounded. If `max_size` is set, at most that many
+  realtime frames are queued, and `overflow_policy` decides what happens to
+  frames sent while the queue is full, e.g. because the model connection has
+  stalled.
+
+  Requests are consumed on the event loop that calls `get`. Audio captured on
+  other threads should be sent with `send_realtime_threadsafe`; frames sent
+  with it before that loop runs are queued directly.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_size: int = 0,
+      overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+  ):
     # Ensure there's an event loop available in this thread
     try:
-      asyncio.get_running_loop()
+      self._loop = asyncio.get_running_loop()
     except RuntimeError:
       # No running loop, create one
-      loop = asyncio.new_event_loop()
-      asyncio.set_event_loop(loop)
+      self._loop = asyncio.new_event_loop()
+      asyncio.set_event_loop(self._loop)
 
+    # Guards rebinding the queue to the loop consuming it against threads
+    # sending frames to that loop.
+    self._loop_lock = threading.Lock()
+    self._overflow_policy = overflow_policy
     # Now create the queue (it will use the event loop we just ensured exists)
-    self._queue = asyncio.Queue()
+    self._queue = _LiveRequestBuffer(max_size, overflow_policy)
+
+  @property
+  def stats(self) -> LiveRequestQueueStats:
+    """A snapshot of the queue depth and overflow counters."""
+    return dataclasses.replace(self._queue.stats)
 
   def close(self):
     self._queue.put_nowait(LiveRequest(close=True))
@@ -65,6 +226,34 @@ class LiveRequestQueue:
   def send_realtime(self, blob: types.Blob):
     self._queue.put_nowait(LiveRequest(blob=blob))
 
+  def send_realtime_threadsafe(self, blob: types.Blob):
+    """Sends a realtime blob from any thread.
+
+    With `OverflowPolicy.BLOCK`, this waits for room in the queue when called
+    from a thread other than the event loop's. Until the loop consuming the
+    queue runs, nothing can make room, so it raises `asyncio.QueueFull`
+    instead.
+    """
+    request = LiveRequest(blob=blob)
+    try:
+      on_loop_thread = asyncio.get_running_loop() is self._loop
+    except RuntimeError:
+      on_loop_thread = False
+    if on_loop_thread:
+      self._queue.put_nowait(request)
+      return
+    with self._loop_lock:
+      loop = self._loop
+      if not loop.is_running():
+        # Callbacks scheduled on a loop that isn't running would be lost, and
+        # nothing consumes the queue yet, so the frame is queued directly.
+        self._queue.put_nowait(request)
+        return
+    if self._overflow_policy == OverflowPolicy.BLOCK:
+      asyncio.run_coroutine_threadsafe(self._queue.put(request), loop).result()
+    else:
+      loop.call_soon_threadsafe(self._queue.put_nowait, request)
+
   def send_activity_start(self):
     """Sends an activity start signal to mark the beginning of user input."""
     self._queue.put_nowait(LiveRequest(activity_start=types.ActivityStart()))
@@ -77,4 +266,8 @@ class LiveRequestQueue:
     self._queue.put_nowait(req)
 
   async def get(self) -> LiveRequest:
+    loop = asyncio.get_running_loop()
+    if self._loop is not loop:
+      with self._loop_lock:
+        self._loop = loop
     return await self._queue.get()
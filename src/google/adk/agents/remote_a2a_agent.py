@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
 import dataclasses
 import json
 import logging
@@ -21,6 +23,7 @@ from pathlib import Path
 from typing import Any
 from typing import AsyncGenerator
 from typing import Callable
+from typing import Literal
 from typing import Optional
 from typing import Union
 from urllib.parse import urlparse
@@ -70,11 +73,13 @@ from ..a2a.converters.part_converter import GenAIPartToA2APartConverter
 from ..a2a.experimental import a2a_experimental
 from ..a2a.logs.log_utils import build_a2a_request_log
 from ..a2a.logs.log_utils import build_a2a_response_log
+from ..a2a.utils import client_pool
 from ..agents.invocation_context import InvocationContext
 from ..events.event import Event
 from ..flows.llm_flows.contents import _is_other_agent_reply
 from ..flows.llm_flows.contents import _present_other_agent_message
 from ..flows.llm_flows.functions import find_matching_function_call
+from ..utils._lazy_log import lazy_log
 from .base_agent import BaseAgent
 
 __all__ = [
@@ -82,16 +87,29 @@ __all__ = [
     "AGENT_CARD_WELL_KNOWN_PATH",
     "AgentCardResolutionError",
     "RemoteA2aAgent",
+    "prefetch_agent_cards",
 ]
 
 
 # Constants
 A2A_METADATA_PREFIX = "a2a:"
 DEFAULT_TIMEOUT = 600.0
+# Bounds of the state kept per agent to build requests from the new session
+# events only.
+_MAX_SYNCED_SESSIONS = 1024
+_MAX_CONVERTED_EVENTS = 4096
 
 logger = logging.getLogger("google_adk." + __name__)
 
 
+@dataclasses.dataclass(frozen=True)
+class _SyncCursor:
+  """The last session event sent to the remote agent."""
+
+  event_id: str
+  context_id: Optional[str]
+
+
 @a2a_experimental
 class AgentCardResolutionError(Exception):
   """Raised when agent card resolution fails."""
@@ -136,6 +154,11 @@ class RemoteA2aAgent(BaseAgent):
       a2a_request_meta_provider: Optional[
           Callable[[InvocationContext, A2AMessage], dict[str, Any]]
       ] = None,
+      request_metadata_storage: Literal[
+          "every_event", "first_event", "artifact"
+      ] = "every_event",
+      response_metadata_verbosity: Literal["full", "summary", "none"] = "full",
+      a2a_client_pool: Optional[client_pool.A2AClientPool] = None,
       **kwargs: Any,
   ) -> None:
     """Initialize RemoteA2aAgent.
@@ -152,6 +175,19 @@ class RemoteA2aAgent(BaseAgent):
       a2a_request_meta_provider: Optional callable that takes InvocationContext
         and A2AMessage and returns a metadata object to attach to the A2A
         request.
+      request_metadata_storage: Where the A2A request is recorded in the
+        custom metadata of the emitted events. "every_event" embeds it in each
+        event, "first_event" only in the first one, and "artifact" saves it as
+        an artifact of the session, falling back to "first_event" when there is
+        no artifact service. Except for "every_event", all events reference the
+        request by its message id.
+      response_metadata_verbosity: How much of the A2A response is recorded in
+        the custom metadata of each event: the "full" response, a "summary" of
+        its ids and state, or "none" of it.
+      a2a_client_pool: Optional A2AClientPool to take the HTTP client from and
+        fetch the agent card through, instead of creating an own client and
+        fetching the card on every resolution. Agents with a pool have their
+        card prefetched by the first run of a Runner.
       **kwargs: Additional arguments passed to BaseAgent
 
     Raises:
@@ -171,13 +207,32 @@ class RemoteA2aAgent(BaseAgent):
     self._httpx_client = httpx_client
     if a2a_client_factory and a2a_client_factory._config.httpx_client:
       self._httpx_client = a2a_client_factory._config.httpx_client
-    self._httpx_client_needs_cleanup = self._httpx_client is None
+    self._a2a_client_pool = a2a_client_pool
+    self._httpx_client_needs_cleanup = (
+        self._httpx_client is None and a2a_client_pool is None
+    )
     self._timeout = timeout
     self._is_resolved = False
+    # The resolution in flight, if any, and the loop it runs on, so that
+    # concurrent runs and the prefetch of the card resolve the agent once.
+    self._resolution: Optional[
+        tuple[asyncio.AbstractEventLoop, asyncio.Task[None]]
+    ] = None
     self._genai_part_converter = genai_part_converter
     self._a2a_part_converter = a2a_part_converter
     self._a2a_client_factory: Optional[A2AClientFactory] = a2a_client_factory
     self._a2a_request_meta_provider = a2a_request_meta_provider
+    self._request_metadata_storage = request_metadata_storage
+    self._response_metadata_verbosity = response_metadata_verbosity
+    # Keyed by session id, the last event of each session sent to the remote
+    # agent, so that later requests only carry the events after it.
+    self._sync_cursors: collections.OrderedDict[str, _SyncCursor] = (
+        collections.OrderedDict()
+    )
+    # Keyed by event id, the A2A parts session events were converted to.
+    self._converted_parts: collections.OrderedDict[str, list[A2APart]] = (
+        collections.OrderedDict()
+    )
 
     # Validate and store agent card reference
     if isinstance(agent_card, AgentCard):
@@ -195,10 +250,17 @@ class RemoteA2aAgent(BaseAgent):
   async def _ensure_httpx_client(self) -> httpx.AsyncClient:
     """Ensure HTTP client is available and properly configured."""
     if not self._httpx_client:
-      self._httpx_client = httpx.AsyncClient(
-          timeout=httpx.Timeout(timeout=self._timeout)
-      )
-      self._httpx_client_needs_cleanup = True
+      if self._a2a_client_pool and self._agent_card:
+        # Pooled clients are shared with other agents and closed by the pool.
+        self._httpx_client = self._a2a_client_pool.get_client(
+            str(self._agent_card.url), self._timeout
+        )
+        self._httpx_client_needs_cleanup = False
+      else:
+        self._httpx_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout=self._timeout)
+        )
+        self._httpx_client_needs_cleanup = True
       if self._a2a_client_factory:
         registry = self._a2a_client_factory._registry
         self._a2a_client_factory = A2AClientFactory(
@@ -227,6 +289,9 @@ class RemoteA2aAgent(BaseAgent):
       if not parsed_url.scheme or not parsed_url.netloc:
         raise ValueError(f"Invalid URL format: {url}")
 
+      if self._a2a_client_pool:
+        return await self._a2a_client_pool.get_agent_card(url, self._timeout)
+
       base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
       relative_card_path = parsed_url.path
 
@@ -295,6 +360,21 @@ class RemoteA2aAgent(BaseAgent):
     if self._is_resolved and self._a2a_client:
       return
 
+    loop = asyncio.get_running_loop()
+    resolution = self._resolution
+    if resolution is None or resolution[0] is not loop or resolution[1].done():
+      # A resolution in flight on another loop cannot be awaited from this
+      # one, and a failed one is retried.
+      task = loop.create_task(self._resolve())
+      self._resolution = (loop, task)
+    else:
+      task = resolution[1]
+    # Shielded so that a cancelled caller, e.g. the prefetch of a closed
+    # runner, doesn't cancel the resolution for the others awaiting it.
+    await asyncio.shield(task)
+
+  async def _resolve(self) -> None:
+    """Resolves the agent card and initializes the A2A client."""
     try:
       if not self._agent_card:
 
@@ -367,6 +447,7 @@ class RemoteA2aAgent(BaseAgent):
     message_parts: list[A2APart] = []
     context_id = None
 
+    cursor = self._sync_cursors.get(ctx.session.id)
     events_to_process = []
     for event in reversed(ctx.session.events):
       if event.author == self.name:
@@ -376,26 +457,88 @@ class RemoteA2aAgent(BaseAgent):
           metadata = event.custom_metadata
           context_id = metadata.get(A2A_METADATA_PREFIX + "context_id")
         break
+      if cursor is not None and event.id == cursor.event_id:
+        # stop on content already sent to the remote agent by a request it
+        # answered without content of its own
+        context_id = cursor.context_id
+        break
       events_to_process.append(event)
 
     for event in reversed(events_to_process):
-      if _is_other_agent_reply(self.name, event):
-        event = _present_other_agent_message(event)
+      message_parts.extend(self._convert_event_parts(event))
 
-      if not event or not event.content or not event.content.parts:
-        continue
+    return message_parts, context_id
 
-      for part in event.content.parts:
+  def _convert_event_parts(self, event: Event) -> list[A2APart]:
+    """Converts the parts of a session event, reusing earlier conversions."""
+    converted = self._converted_parts.get(event.id)
+    if converted is not None:
+      self._converted_parts.move_to_end(event.id)
+      return converted
+
+    converted = []
+    presented_event = event
+    if _is_other_agent_reply(self.name, event):
+      presented_event = _present_other_agent_message(event)
+
+    if (
+        presented_event
+        and presented_event.content
+        and presented_event.content.parts
+    ):
+      for part in presented_event.content.parts:
         converted_parts = self._genai_part_converter(part)
         if not isinstance(converted_parts, list):
           converted_parts = [converted_parts] if converted_parts else []
 
         if converted_parts:
-          message_parts.extend(converted_parts)
+          converted.extend(converted_parts)
         else:
           logger.warning("Failed to convert part to A2A format: %s", part)
 
-    return message_parts, context_id
+    if event.id:
+      self._converted_parts[event.id] = converted
+      if len(self._converted_parts) > _MAX_CONVERTED_EVENTS:
+        self._converted_parts.popitem(last=False)
+    return converted
+
+  def _update_sync_cursor(
+      self,
+      ctx: InvocationContext,
+      last_event: Event,
+      context_id: Optional[str],
+  ) -> None:
+    """Records that the session events up to last_event were sent.
+
+    Args:
+      ctx: The invocation context.
+      last_event: The last session event sent.
+      context_id: The remote context the events were sent to, if known.
+    """
+    if last_event.author == self.name or not last_event.id:
+      return
+    if context_id is None:
+      # Events sent to an unknown context can't be continued from, so they
+      # are sent again with the next request.
+      self._sync_cursors.pop(ctx.session.id, None)
+      return
+    self._sync_cursors[ctx.session.id] = _SyncCursor(
+        event_id=last_event.id, context_id=context_id
+    )
+    self._sync_cursors.move_to_end(ctx.session.id)
+    if len(self._sync_cursors) > _MAX_SYNCED_SESSIONS:
+      self._sync_cursors.popitem(last=False)
+
+  def _get_response_context_id(
+      self, a2a_response: A2AClientEvent | A2AMessage
+  ) -> Optional[str]:
+    """Returns the remote context of a response, if it has one."""
+    if isinstance(a2a_response, tuple):
+      task = a2a_response[0]
+      return task.context_id if task else None
+    if isinstance(a2a_response, A2AMessage):
+      return a2a_response.context_id
+    return None
 
   async def _handle_a2a_response(
       self, a2a_response: A2AClientEvent | A2AMessage, ctx: InvocationContext
@@ -503,6 +646,8 @@ class RemoteA2aAgent(BaseAgent):
       return
 
     # Create A2A request for function response or regular message
+    last_synced_event: Optional[Event] = None
+    context_id: Optional[str] = None
     a2a_request = self._create_a2a_request_for_user_function_response(ctx)
     if not a2a_request:
       message_parts, context_id = self._construct_message_parts_from_session(
@@ -527,9 +672,12 @@ class RemoteA2aAgent(BaseAgent):
           role="user",
           context_id=context_id,
       )
+      if ctx.session.events:
+        last_synced_event = ctx.session.events[-1]
 
-    logger.debug(build_a2a_request_log(a2a_request))
+    logger.debug(lazy_log(build_a2a_request_log, a2a_request))
 
+    request_info: Optional[dict[str, Any]] = None
     try:
       request_metadata = None
       if self._a2a_request_meta_provider:
@@ -539,7 +687,10 @@ class RemoteA2aAgent(BaseAgent):
           request=a2a_request,
           request_metadata=request_metadata,
       ):
-        logger.debug(build_a2a_response_log(a2a_response))
+        logger.debug(lazy_log(build_a2a_response_log, a2a_response))
+        if last_synced_event is not None:
+          # Set by the responses on first contact, even without an event.
+          context_id = self._get_response_context_id(a2a_response) or context_id
 
         event = await self._handle_a2a_response(a2a_response, ctx)
         if not event:
@@ -547,40 +698,112 @@ class RemoteA2aAgent(BaseAgent):
 
         # Add metadata about the request and response
         event.custom_metadata = event.custom_metadata or {}
-        event.custom_metadata[A2A_METADATA_PREFIX + "request"] = (
-            a2a_request.model_dump(exclude_none=True, by_alias=True)
-        )
-        # If the response is a ClientEvent, record the task state; otherwise,
-        # record the message object.
-        if isinstance(a2a_response, tuple):
-          event.custom_metadata[A2A_METADATA_PREFIX + "response"] = (
-              a2a_response[0].model_dump(exclude_none=True, by_alias=True)
-          )
+        if request_info is None:
+          request_info = await self._store_request_metadata(ctx, a2a_request)
+          event.custom_metadata.update(request_info)
+          # Later events only reference the request when it was stored once.
+          if self._request_metadata_storage != "every_event":
+            request_info = {
+                key: value
+                for key, value in request_info.items()
+                if key != A2A_METADATA_PREFIX + "request"
+            }
         else:
+          event.custom_metadata.update(request_info)
+        response_info = self._get_response_metadata(a2a_response)
+        if response_info is not None:
           event.custom_metadata[A2A_METADATA_PREFIX + "response"] = (
-              a2a_response.model_dump(exclude_none=True, by_alias=True)
+              response_info
           )
 
         yield event
 
+      if last_synced_event is not None:
+        self._update_sync_cursor(ctx, last_synced_event, context_id)
+
     except Exception as e:
       error_message = f"A2A request failed: {e}"
       logger.error(error_message)
 
+      if request_info is None:
+        request_info = await self._store_request_metadata(ctx, a2a_request)
       yield Event(
           author=self.name,
           error_message=error_message,
           invocation_id=ctx.invocation_id,
           branch=ctx.branch,
           custom_metadata={
-              A2A_METADATA_PREFIX
-              + "request": a2a_request.model_dump(
-                  exclude_none=True, by_alias=True
-              ),
+              **request_info,
               A2A_METADATA_PREFIX + "error": error_message,
           },
       )
 
+  async def _store_request_metadata(
+      self, ctx: InvocationContext, a2a_request: A2AMessage
+  ) -> dict[str, Any]:
+    """Stores the A2A request and returns the metadata of the first event."""
+    request_dump = a2a_request.model_dump(exclude_none=True, by_alias=True)
+    if self._request_metadata_storage == "every_event":
+      return {A2A_METADATA_PREFIX + "request": request_dump}
+
+    metadata = {A2A_METADATA_PREFIX + "request_id": a2a_request.message_id}
+    if (
+        self._request_metadata_storage == "artifact"
+        and ctx.artifact_service is not None
+    ):
+      filename = f"a2a_request_{a2a_request.message_id}.json"
+      try:
+        await ctx.artifact_service.save_artifact(
+            app_name=ctx.app_name,
+            user_id=ctx.user_id,
+            session_id=ctx.session.id,
+            filename=filename,
+            artifact=genai_types.Part.from_bytes(
+                data=json.dumps(request_dump).encode("utf-8"),
+                mime_type="application/json",
+            ),
+        )
+        metadata[A2A_METADATA_PREFIX + "request_artifact"] = filename
+        return metadata
+      except Exception as e:
+        logger.warning(
+            "Failed to save A2A request %s as an artifact, embedding it in"
+            " the first event instead: %s",
+            a2a_request.message_id,
+            e,
+        )
+    metadata[A2A_METADATA_PREFIX + "request"] = request_dump
+    return metadata
+
+  def _get_response_metadata(
+      self, a2a_response: A2AClientEvent | A2AMessage
+  ) -> Optional[dict[str, Any]]:
+    """Returns the response metadata of an event, per the verbosity.
+
+    Summaries keep the ids and state of the response, under the same keys as
+    in the full response.
+    """
+    if self._response_metadata_verbosity == "none":
+      return None
+    # If the response is a ClientEvent, record the task state; otherwise,
+    # record the message object.
+    if isinstance(a2a_response, tuple):
+      task = a2a_response[0]
+      if self._response_metadata_verbosity == "summary":
+        return {
+            "id": task.id,
+            "contextId": task.context_id,
+            "status": {"state": task.status.state.value},
+        }
+      return task.model_dump(exclude_none=True, by_alias=True)
+    if self._response_metadata_verbosity == "summary":
+      return {
+          "messageId": a2a_response.message_id,
+          "contextId": a2a_response.context_id,
+          "role": a2a_response.role.value,
+      }
+    return a2a_response.model_dump(exclude_none=True, by_alias=True)
+
   async def _run_live_impl(
       self, ctx: InvocationContext
   ) -> AsyncGenerator[Event, None]:
@@ -605,3 +828,33 @@ class RemoteA2aAgent(BaseAgent):
         )
       finally:
         self._httpx_client = None
+
+
+async def prefetch_agent_cards(agent: BaseAgent) -> None:
+  """Resolves the remote A2A agents of an agent tree concurrently.
+
+  Only agents sharing an A2AClientPool are resolved ahead of their first run;
+  failures are logged and left to be retried by that run.
+
+  Args:
+    agent: The root of the agent tree.
+  """
+  remote_agents = []
+  pending = [agent]
+  while pending:
+    current = pending.pop()
+    if isinstance(current, RemoteA2aAgent) and current._a2a_client_pool:
+      remote_agents.append(current)
+    pending.extend(current.sub_agents)
+
+  results = await asyncio.gather(
+      *(remote_agent._ensure_resolved() for remote_agent in remote_agents),
+      return_exceptions=True,
+  )
+  for remote_agent, result in zip(remote_agents, results):
+    if isinstance(result, Exception):
+      logger.warning(
+          "Failed to prefetch the agent card of %s: %s",
+          remote_agent.name,
+          result,
+      )
@@ -71,15 +71,44 @@ class EventsCompactionConfig(BaseModel):
   summarizer: Optional[BaseEventsSummarizer] = None
   """The event summarizer to use for compaction."""
 
-  compaction_interval: int
+  compaction_interval: Optional[int] = None
   """The number of *new* user-initiated invocations that, once
   fully represented in the session's events, will trigger a compaction."""
 
-  overlap_size: int
+  overlap_size: int = 0
   """The number of preceding invocations to include from the
   end of the last compacted range. This creates an overlap between consecutive
   compacted summaries, maintaining context."""
 
+  token_threshold: Optional[int] = None
+  """The estimated token size of the uncompacted history (the latest summary
+  plus all events after it) that triggers a compaction. When set, compaction is
+  driven by prompt size instead of `compaction_interval`."""
+
+  target_token_budget: Optional[int] = None
+  """The estimated token size the uncompacted history should fit in after a
+  token-triggered compaction. The oldest invocations are folded into the
+  summary until the remaining events fit. Defaults to half of
+  `token_threshold`."""
+
+  max_concurrent_compactions: int = 4
+  """The maximum number of compactions, and therefore summarization LLM calls,
+  a Runner runs at the same time across all sessions."""
+
+  @model_validator(mode="after")
+  def _validate_trigger(self) -> EventsCompactionConfig:
+    if self.compaction_interval is None and self.token_threshold is None:
+      raise ValueError(
+          "Either compaction_interval or token_threshold must be set."
+      )
+    if (
+        self.token_threshold is not None
+        and self.target_token_budget is not None
+        and self.target_token_budget > self.token_threshold
+    ):
+      raise ValueError("target_token_budget must not exceed token_threshold.")
+    return self
+
 
 class App(BaseModel):
   """Represents an LLM-backed agentic application.
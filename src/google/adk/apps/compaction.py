@@ -14,15 +14,184 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import json
 import logging
+from typing import Optional
 
 from google.adk.apps.app import App
+from google.adk.apps.base_events_summarizer import BaseEventsSummarizer
 from google.adk.apps.llm_event_summarizer import LlmEventSummarizer
+from google.adk.events.event import Event
 from google.adk.sessions.base_session_service import BaseSessionService
 from google.adk.sessions.session import Session
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+# Rough estimate used for token-budget compaction: 4 characters per token.
+_CHARS_PER_TOKEN = 4
+
+
+def _estimate_event_tokens(event: Event) -> int:
+  """Estimates the prompt tokens an event contributes to an LLM request."""
+  content = event.content
+  if event.actions and event.actions.compaction:
+    content = event.actions.compaction.compacted_content
+  if not content or not content.parts:
+    return 0
+  total_chars = 0
+  for part in content.parts:
+    if part.text:
+      total_chars += len(part.text)
+    elif part.function_call:
+      total_chars += len(part.function_call.name or '')
+      total_chars += len(json.dumps(part.function_call.args or {}, default=str))
+    elif part.function_response:
+      total_chars += len(part.function_response.name or '')
+      total_chars += len(
+          json.dumps(part.function_response.response or {}, default=str)
+      )
+    elif part.inline_data and part.inline_data.data:
+      total_chars += len(part.inline_data.data)
+  return total_chars // _CHARS_PER_TOKEN
+
+
+def _get_summarizer(app: App) -> BaseEventsSummarizer:
+  if not app.events_compaction_config.summarizer:
+    app.events_compaction_config.summarizer = LlmEventSummarizer(
+        llm=app.root_agent.canonical_model
+    )
+  return app.events_compaction_config.summarizer
+
+
+async def _run_compaction(
+    app: App, session: Session, session_service: BaseSessionService
+):
+  """Runs the compaction mode configured in `app.events_compaction_config`.
+
+  Token-budget compaction takes precedence when `token_threshold` is set;
+  otherwise the invocation-count sliding window is used.
+
+  Args:
+    app: The application instance.
+    session: The session containing events to compact.
+    session_service: The session service for appending events.
+  """
+  config = app.events_compaction_config
+  if not config:
+    return
+  if config.token_threshold is not None:
+    await _run_compaction_for_token_budget(app, session, session_service)
+  elif config.compaction_interval is not None:
+    await _run_compaction_for_sliding_window(app, session, session_service)
+
+
+async def _run_compaction_for_token_budget(
+    app: App, session: Session, session_service: BaseSessionService
+) -> Optional[Event]:
+  """Runs compaction triggered by the estimated size of the history.
+
+  The uncompacted history is the latest compaction summary (if any) plus every
+  event after the range it covers. When its estimated token size exceeds
+  `token_threshold`, the oldest whole invocations are folded into the summary
+  until the remaining events fit `target_token_budget`. The latest invocation
+  is always kept verbatim.
+
+  Summaries are incremental: the previous summary event is passed to the
+  summarizer together with the newly folded events, and the resulting
+  compaction covers both, so each LLM call only reads the previous summary and
+  the new events rather than the whole history.
+
+  Args:
+    app: The application instance.
+    session: The session containing events to compact.
+    session_service: The session service for appending events.
+
+  Returns:
+    The appended compaction event, or None if no compaction happened.
+  """
+  config = app.events_compaction_config
+  events = session.events
+  if not events:
+    return None
+
+  last_compaction_event = None
+  for event in reversed(events):
+    if (
+        event.actions
+        and event.actions.compaction
+        and event.actions.compaction.end_timestamp is not None
+    ):
+      last_compaction_event = event
+      break
+  last_compacted_end_timestamp = (
+      last_compaction_event.actions.compaction.end_timestamp
+      if last_compaction_event
+      else 0.0
+  )
+
+  uncompacted_events = [
+      e
+      for e in events
+      if not (e.actions and e.actions.compaction)
+      and e.timestamp > last_compacted_end_timestamp
+  ]
+  if not uncompacted_events:
+    return None
+
+  event_tokens = [_estimate_event_tokens(e) for e in uncompacted_events]
+  summary_tokens = (
+      _estimate_event_tokens(last_compaction_event)
+      if last_compaction_event
+      else 0
+  )
+  total_tokens = summary_tokens + sum(event_tokens)
+  if total_tokens <= config.token_threshold:
+    return None
+
+  target = (
+      config.target_token_budget
+      if config.target_token_budget is not None
+      else config.token_threshold // 2
+  )
+
+  # Fold the oldest invocations until the remaining events fit the target.
+  # Invocations are never split so function calls stay with their responses.
+  last_invocation_id = uncompacted_events[-1].invocation_id
+  remaining_tokens = sum(event_tokens)
+  split_idx = 0
+  while split_idx < len(uncompacted_events) and remaining_tokens > target:
+    invocation_id = uncompacted_events[split_idx].invocation_id
+    if invocation_id == last_invocation_id:
+      break
+    while (
+        split_idx < len(uncompacted_events)
+        and uncompacted_events[split_idx].invocation_id == invocation_id
+    ):
+      remaining_tokens -= event_tokens[split_idx]
+      split_idx += 1
+
+  if split_idx == 0:
+    return None
+
+  events_to_compact = uncompacted_events[:split_idx]
+  if last_compaction_event:
+    events_to_compact.insert(0, last_compaction_event)
+
+  compaction_event = await _get_summarizer(app).maybe_summarize_events(
+      events=events_to_compact
+  )
+  if compaction_event:
+    await session_service.append_event(session=session, event=compaction_event)
+  logger.debug(
+      'Token-budget compaction folded %d events (~%d of %d tokens).',
+      split_idx,
+      total_tokens - summary_tokens - remaining_tokens,
+      total_tokens,
+  )
+  return compaction_event
+
 
 async def _run_compaction_for_sliding_window(
     app: App, session: Session, session_service: BaseSessionService
@@ -181,16 +350,141 @@ async def _run_compaction_for_sliding_window(
   if not events_to_compact:
     return None
 
-  if not app.events_compaction_config.summarizer:
-    app.events_compaction_config.summarizer = LlmEventSummarizer(
-        llm=app.root_agent.canonical_model
-    )
-
-  compaction_event = (
-      await app.events_compaction_config.summarizer.maybe_summarize_events(
-          events=events_to_compact
-      )
+  compaction_event = await _get_summarizer(app).maybe_summarize_events(
+      events=events_to_compact
   )
   if compaction_event:
     await session_service.append_event(session=session, event=compaction_event)
   logger.debug('Event compactor finished.')
+
+
+@dataclasses.dataclass
+class CompactionStats:
+  """Counters describing the state of a `CompactionScheduler`.
+
+  Attributes:
+    queued: Sessions waiting for a compaction to start.
+    in_flight: Compactions currently running.
+    coalesced: Requests merged into an already queued compaction.
+    completed: Compactions that finished, successfully or not.
+    failed: Compactions that raised an error.
+  """
+
+  queued: int = 0
+  in_flight: int = 0
+  coalesced: int = 0
+  completed: int = 0
+  failed: int = 0
+
+
+class CompactionScheduler:
+  """Runs background compactions for a Runner.
+
+  Requests are coalesced per session: while a compaction for a session is
+  queued or running, further requests for it are merged into at most one
+  follow-up run, which re-reads the session so it sees the summary the
+  previous run appended. This avoids summarising the same range twice when
+  turns arrive faster than compactions finish. A semaphore caps how many
+  compactions (and therefore summarisation LLM calls) run at once across all
+  sessions, and `close` drains outstanding work.
+  """
+
+  def __init__(self, max_concurrent_compactions: int = 4):
+    self._max_concurrent_compactions = max(1, max_concurrent_compactions)
+    self._tasks: dict[tuple[str, str, str], asyncio.Task] = {}
+    self._pending: dict[tuple[str, str, str], Session] = {}
+    self._semaphore: Optional[asyncio.Semaphore] = None
+    self._loop: Optional[asyncio.AbstractEventLoop] = None
+    self._in_flight = 0
+    self._coalesced = 0
+    self._completed = 0
+    self._failed = 0
+
+  @property
+  def stats(self) -> CompactionStats:
+    """Returns a snapshot of the scheduler counters."""
+    return CompactionStats(
+        queued=len(self._pending),
+        in_flight=self._in_flight,
+        coalesced=self._coalesced,
+        completed=self._completed,
+        failed=self._failed,
+    )
+
+  def schedule(
+      self, app: App, session: Session, session_service: BaseSessionService
+  ) -> None:
+    """Requests a compaction of `session` after an invocation finished."""
+    loop = asyncio.get_running_loop()
+    if self._loop is not loop:
+      # Tasks and the semaphore are bound to the loop they were created on.
+      self._tasks.clear()
+      self._pending.clear()
+      self._semaphore = asyncio.Semaphore(self._max_concurrent_compactions)
+      self._loop = loop
+
+    key = (session.app_name, session.user_id, session.id)
+    if key in self._pending:
+      self._coalesced += 1
+    self._pending[key] = session
+    if key not in self._tasks:
+      self._tasks[key] = asyncio.create_task(
+          self._run_for_session(key, app, session_service)
+      )
+
+  async def _run_for_session(
+      self,
+      key: tuple[str, str, str],
+      app: App,
+      session_service: BaseSessionService,
+  ) -> None:
+    is_rerun = False
+    try:
+      while key in self._pending:
+        async with self._semaphore:
+          session = self._pending.pop(key, None)
+          if session is None:
+            break
+          if is_rerun:
+            # The previous run may have appended a summary this copy lacks.
+            session = (
+                await session_service.get_session(
+                    app_name=session.app_name,
+                    user_id=session.user_id,
+                    session_id=session.id,
+                )
+                or session
+            )
+          self._in_flight += 1
+          try:
+            await _run_compaction(app, session, session_service)
+          except Exception:
+            self._failed += 1
+            logger.warning(
+                'Event compaction failed for session %s.', key[2], exc_info=True
+            )
+          finally:
+            self._in_flight -= 1
+            self._completed += 1
+        is_rerun = True
+    finally:
+      if self._tasks.get(key) is asyncio.current_task():
+        del self._tasks[key]
+
+  async def close(self, timeout: float = 10.0) -> None:
+    """Waits for queued and running compactions, cancelling after timeout."""
+    tasks = [task for task in self._tasks.values() if not task.done()]
+    if not tasks:
+      return
+    logger.info('Waiting for %d pending compaction(s).', len(tasks))
+    _, not_done = await asyncio.wait(tasks, timeout=timeout)
+    if not_done:
+      logger.warning(
+          'Cancelling %d compaction(s) still running after %.1fs.',
+          len(not_done),
+          timeout,
+      )
+      for task in not_done:
+        task.cancel()
+      await asyncio.gather(*not_done, return_exceptions=True)
+    self._pending.clear()
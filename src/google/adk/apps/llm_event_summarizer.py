@@ -44,6 +44,11 @@ class LlmEventSummarizer(BaseEventsSummarizer):
   When `maybe_compact_events` is called with a list of events, this class
   formats the events, generates a summary using an LLM, and returns a new
   `Event` containing the summary within an `EventCompaction`.
+
+  Summaries can be built incrementally: if the first event passed in is itself
+  a compaction event, its summary is given to the LLM as the starting point and
+  the new compaction covers the previous compaction's range plus the new
+  events, so earlier history never has to be re-summarized.
   """
 
   _DEFAULT_PROMPT_TEMPLATE = (
@@ -74,10 +79,15 @@ class LlmEventSummarizer(BaseEventsSummarizer):
     """Formats a list of events into a string for the LLM prompt."""
     formatted_history = []
     for event in events:
-      if event.content and event.content.parts:
-        for part in event.content.parts:
+      content = event.content
+      author = event.author
+      if event.actions and event.actions.compaction:
+        content = event.actions.compaction.compacted_content
+        author = 'summary of earlier conversation'
+      if content and content.parts:
+        for part in content.parts:
           if part.text:
-            formatted_history.append(f'{event.author}: {part.text}')
+            formatted_history.append(f'{author}: {part.text}')
     return '\\n'.join(formatted_history)
 
   async def maybe_summarize_events(
@@ -118,6 +128,10 @@ class LlmEventSummarizer(BaseEventsSummarizer):
     summary_content.role = 'model'
 
     start_timestamp = events[0].timestamp
+    previous_compaction = events[0].actions and events[0].actions.compaction
+    if previous_compaction and previous_compaction.start_timestamp is not None:
+      # Extending a previous summary: the new one supersedes it.
+      start_timestamp = previous_compaction.start_timestamp
     end_timestamp = events[-1].timestamp
 
     compaction = EventCompaction(
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from typing import Optional
 
@@ -28,6 +29,7 @@ from .auth_schemes import AuthSchemeType
 from .auth_schemes import ExtendedOAuth2
 from .auth_schemes import OpenIdConnectWithConfig
 from .auth_tool import AuthConfig
+from .exchanged_credential_cache import get_exchanged_credential_cache
 from .exchanger.base_credential_exchanger import BaseCredentialExchanger
 from .exchanger.credential_exchanger_registry import CredentialExchangerRegistry
 from .oauth2_discovery import OAuth2DiscoveryManager
@@ -45,6 +47,11 @@ class CredentialManager:
   a centralized interface for handling various credential types and authentication
   schemes while maintaining proper credential hygiene (refresh, exchange, caching).
 
+  Exchanges and refreshes go through a process-wide cache, so concurrent tool
+  calls sharing a credential trigger a single token request, and tokens
+  obtained by one manager are reused by others with the same auth scheme and
+  credential until shortly before they expire.
+
   This class is only for use by Agent Development Kit.
 
   Args:
@@ -83,6 +90,7 @@ class CredentialManager:
     self._exchanger_registry = CredentialExchangerRegistry()
     self._refresher_registry = CredentialRefresherRegistry()
     self._discovery_manager = OAuth2DiscoveryManager()
+    self._credential_cache = get_exchanged_credential_cache()
 
     # Register default exchangers and refreshers
     from .exchanger.oauth2_credential_exchanger import OAuth2CredentialExchanger
@@ -140,6 +148,10 @@ class CredentialManager:
 
     # Step 3: Try to load existing processed credential
     credential = await self._load_existing_credential(callback_context)
+    if credential and self._needs_new_client_credentials_token(credential):
+      # Client credentials tokens can't be refreshed, so a new one is
+      # obtained from the raw credential instead.
+      credential = None
 
     # Step 4: If no existing credential, load from auth response
     # TODO instead of load from auth response, we can store auth response in
@@ -153,7 +165,9 @@ class CredentialManager:
     if not credential:
       # For client credentials flow, use raw credentials directly
       if self._is_client_credentials_flow():
-        credential = self._auth_config.raw_auth_credential
+        # Exchanged from a copy, so the configured credential stays the same
+        # and keeps identifying the exchange in the credential cache.
+        credential = self._auth_config.raw_auth_credential.model_copy(deep=True)
       else:
         # For authorization code flow, return None to trigger user authorization
         return None
@@ -213,15 +227,16 @@ class CredentialManager:
     if not exchanger:
       return credential, False
 
-    if isinstance(exchanger, ServiceAccountCredentialExchanger):
-      exchanged_credential = exchanger.exchange_credential(
-          self._auth_config.auth_scheme, credential
-      )
-    else:
-      exchanged_credential = await exchanger.exchange(
-          credential, self._auth_config.auth_scheme
-      )
+    async def exchange() -> AuthCredential:
+      if isinstance(exchanger, ServiceAccountCredentialExchanger):
+        return exchanger.exchange_credential(
+            self._auth_config.auth_scheme, credential
+        )
+      return await exchanger.exchange(credential, self._auth_config.auth_scheme)
 
+    exchanged_credential = await self._credential_cache.get_or_run(
+        self._get_operation_key("exchange", credential), exchange
+    )
     return exchanged_credential, True
 
   async def _refresh_credential(
@@ -235,13 +250,37 @@ class CredentialManager:
     if await refresher.is_refresh_needed(
         credential, self._auth_config.auth_scheme
     ):
-      refreshed_credential = await refresher.refresh(
-          credential, self._auth_config.auth_scheme
+      refreshed_credential = await self._credential_cache.get_or_run(
+          self._get_operation_key("refresh", credential),
+          lambda: refresher.refresh(credential, self._auth_config.auth_scheme),
       )
       return refreshed_credential, True
 
     return credential, False
 
+  def _get_operation_key(
+      self, operation: str, credential: AuthCredential
+  ) -> str:
+    """Builds the credential cache key of an exchange or refresh.
+
+    The key covers everything the result depends on, so it is only shared by
+    callers that would have obtained the same token.
+    """
+    scheme = self._auth_config.model_dump_json(include={"auth_scheme"})
+    key = f"{operation}\n{scheme}\n{credential.model_dump_json()}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+  def _needs_new_client_credentials_token(
+      self, credential: AuthCredential
+  ) -> bool:
+    """Check if a client credentials token is about to expire."""
+    return (
+        self._is_client_credentials_flow()
+        and credential.oauth2 is not None
+        and not credential.oauth2.refresh_token
+        and self._credential_cache.is_expiring(credential)
+    )
+
   def _is_credential_ready(self) -> bool:
     """Check if credential is ready to use without further processing."""
     raw_credential = self._auth_config.raw_auth_credential
@@ -0,0 +1,176 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import threading
+import time
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+from ..utils.feature_decorator import experimental
+from .auth_credential import AuthCredential
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# Matches the leeway authlib applies in `OAuth2Token.is_expired`, so a token
+# the cache considers stale is also one the OAuth2 refresher will refresh.
+_DEFAULT_REFRESH_MARGIN_SECONDS = 60
+
+
+def _get_expires_at(credential: AuthCredential) -> Optional[float]:
+  oauth2 = getattr(credential, "oauth2", None)
+  expires_at = getattr(oauth2, "expires_at", None)
+  return expires_at if isinstance(expires_at, (int, float)) else None
+
+
+@experimental
+class ExchangedCredentialCache:
+  """Deduplicates and caches credential exchanges and refreshes.
+
+  Operations are identified by a key that the caller derives from everything
+  the result depends on. While an operation is in flight, concurrent callers
+  with the same key on the same event loop await it instead of starting their
+  own. Results that carry an OAuth2 expiry are kept until
+  `refresh_margin_seconds` before they expire, so tokens are renewed before
+  requests start failing with them. Stale results are dropped whenever a new
+  one is stored, and at most `max_entries` results are kept, evicting the least
+  recently used ones, as refreshes derive new keys from the tokens they renew.
+
+  Each caller except the one that ran the operation gets its own copy of the
+  result, as credentials are mutated in place by the exchangers.
+  """
+
+  def __init__(
+      self,
+      *,
+      refresh_margin_seconds: float = _DEFAULT_REFRESH_MARGIN_SECONDS,
+      max_entries: int = 1024,
+      clock: Callable[[], float] = time.time,
+  ):
+    self._refresh_margin_seconds = refresh_margin_seconds
+    self._max_entries = max_entries
+    self._clock = clock
+    self._lock = threading.Lock()
+    self._entries: collections.OrderedDict[
+        str, tuple[AuthCredential, float]
+    ] = collections.OrderedDict()
+    self._in_flight: dict[
+        str, tuple[asyncio.AbstractEventLoop, asyncio.Task[AuthCredential]]
+    ] = {}
+
+  async def get_or_run(
+      self,
+      key: str,
+      operation: Callable[[], Awaitable[AuthCredential]],
+  ) -> AuthCredential:
+    """Returns the cached result for key, running operation at most once.
+
+    Args:
+      key: Identifies the operation and its inputs.
+      operation: Produces the credential if there is no fresh cached one and
+        no operation for key is in flight.
+
+    Returns:
+      The credential produced by operation.
+    """
+    cached = self.get(key)
+    if cached is not None:
+      return cached
+
+    loop = asyncio.get_running_loop()
+    with self._lock:
+      flight = self._in_flight.get(key)
+      is_leader = flight is None or flight[0] is not loop
+      if is_leader:
+        # An operation in flight on another loop cannot be awaited from this
+        # one, so it is replaced rather than joined.
+        task = loop.create_task(self._run(key, operation))
+        self._in_flight[key] = (loop, task)
+      else:
+        task = flight[1]
+    # Shielded so that a cancelled caller doesn't cancel the operation for
+    # the others awaiting it.
+    result = await asyncio.shield(task)
+    return result if is_leader else result.model_copy(deep=True)
+
+  def get(self, key: str) -> Optional[AuthCredential]:
+    """Returns a copy of the cached result for key, unless it is stale."""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      credential, expires_at = entry
+      if self._clock() >= expires_at - self._refresh_margin_seconds:
+        del self._entries[key]
+        return None
+      self._entries.move_to_end(key)
+    return credential.model_copy(deep=True)
+
+  def is_expiring(self, credential: AuthCredential) -> bool:
+    """Whether credential expires within the refresh margin."""
+    expires_at = _get_expires_at(credential)
+    return (
+        expires_at is not None
+        and self._clock() >= expires_at - self._refresh_margin_seconds
+    )
+
+  def clear(self) -> None:
+    """Drops all cached results."""
+    with self._lock:
+      self._entries.clear()
+
+  async def _run(
+      self,
+      key: str,
+      operation: Callable[[], Awaitable[AuthCredential]],
+  ) -> AuthCredential:
+    try:
+      result = await operation()
+    finally:
+      with self._lock:
+        flight = self._in_flight.get(key)
+        if flight and flight[1] is asyncio.current_task():
+          del self._in_flight[key]
+    expires_at = _get_expires_at(result)
+    if expires_at is not None:
+      with self._lock:
+        self._entries[key] = (result.model_copy(deep=True), expires_at)
+        self._entries.move_to_end(key)
+        self._evict()
+    return result
+
+  def _evict(self) -> None:
+    """Drops the stale results, then the least recently used over the bound."""
+    stale_before = self._clock() + self._refresh_margin_seconds
+    for key, (_, expires_at) in list(self._entries.items()):
+      if expires_at <= stale_before:
+        del self._entries[key]
+    while len(self._entries) > self._max_entries:
+      self._entries.popitem(last=False)
+
+
+_default_cache: Optional[ExchangedCredentialCache] = None
+
+
+def get_exchanged_credential_cache() -> ExchangedCredentialCache:
+  """Returns the cache shared by all CredentialManagers in the process."""
+  global _default_cache
+  if _default_cache is None:
+    _default_cache = ExchangedCredentialCache()
+  return _default_cache
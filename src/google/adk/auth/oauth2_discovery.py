@@ -14,10 +14,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import dataclasses
 import json
 import logging
+import threading
+import time
+from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
 from urllib.parse import urlparse
 
 import httpx
@@ -48,9 +58,72 @@ class ProtectedResourceMetadata(BaseModel):
   authorization_servers: List[str] = []
 
 
+_MetadataT = TypeVar("_MetadataT", bound=BaseModel)
+
+_DEFAULT_CACHE_TTL_SECONDS = 3600
+_MAX_CACHED_METADATA = 256
+
+
+@dataclasses.dataclass
+class _CachedMetadata:
+  metadata: BaseModel
+  endpoint: str
+  """The endpoint the metadata was fetched from."""
+  etag: Optional[str]
+  expires_at: Optional[float]
+  """When to revalidate the metadata, or None if it must not be cached."""
+
+
+# The least recently used metadata is evicted first.
+_metadata_cache: collections.OrderedDict[Tuple[str, str], _CachedMetadata] = (
+    collections.OrderedDict()
+)
+
+
+def _get_cache_ttl(headers: httpx.Headers) -> Optional[float]:
+  """Returns how long a response may be cached for, per Cache-Control."""
+  directives = {}
+  for directive in headers.get("cache-control", "").split(","):
+    name, _, value = directive.strip().partition("=")
+    directives[name.lower()] = value
+  if "no-store" in directives:
+    return None
+  if "no-cache" in directives:
+    return 0
+  try:
+    return int(directives["max-age"])
+  except (KeyError, ValueError):
+    return _DEFAULT_CACHE_TTL_SECONDS
+
+
+# Keyed by the event loop they are bound to, the clients of discovery requests.
+_http_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+_http_clients_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+  """Returns the client shared by discovery requests on the running loop."""
+  loop = asyncio.get_running_loop()
+  with _http_clients_lock:
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+      # The clients of closed loops can't be closed anymore, as their
+      # connections can only be closed on their loop, so they are forgotten.
+      for client_loop in [l for l in _http_clients if l.is_closed()]:
+        del _http_clients[client_loop]
+      client = _http_clients[loop] = httpx.AsyncClient()
+    return client
+
+
 @experimental
 class OAuth2DiscoveryManager:
-  """Implements Metadata discovery for OAuth2 following RFC8414 and RFC9728."""
+  """Implements Metadata discovery for OAuth2 following RFC8414 and RFC9728.
+
+  Discovered metadata is cached for the whole process, for as long as the
+  server's Cache-Control header allows or an hour by default, and is then
+  revalidated with its ETag. The metadata of the most recently used servers is
+  kept. All discovery requests on an event loop share one pooled client.
+  """
 
   async def discover_auth_server_metadata(
       self, issuer_url: str
@@ -64,7 +137,7 @@ class OAuth2DiscoveryManager:
       logger.warning("Failed to parse issuer_url %s: %s", issuer_url, e)
       return None
 
-    # Try the standard well-known endpoints in order.
+    # The standard well-known endpoints, in order of preference.
     if path and path != "/":
       endpoints_to_try = [
           # 1. OAuth 2.0 Authorization Server Metadata with path insertion
@@ -82,26 +155,20 @@ class OAuth2DiscoveryManager:
           f"{base_url}/.well-known/openid-configuration",
       ]
 
-    async with httpx.AsyncClient() as client:
-      for endpoint in endpoints_to_try:
-        try:
-          response = await client.get(endpoint, timeout=5)
-          response.raise_for_status()
-          metadata = AuthorizationServerMetadata.model_validate(response.json())
-          # Validate issuer to defend against MIX-UP attacks
-          if metadata.issuer == issuer_url.rstrip("/"):
-            return metadata
-          else:
-            logger.warning(
-                "Issuer in metadata %s does not match issuer_url %s",
-                metadata.issuer,
-                issuer_url,
-            )
-        except httpx.HTTPError as e:
-          logger.debug("Failed to fetch metadata from %s: %s", endpoint, e)
-        except (json.decoder.JSONDecodeError, ValidationError) as e:
-          logger.debug("Failed to parse metadata from %s: %s", endpoint, e)
-    return None
+    def is_valid(metadata: AuthorizationServerMetadata) -> bool:
+      # Validate issuer to defend against MIX-UP attacks
+      if metadata.issuer == issuer_url.rstrip("/"):
+        return True
+      logger.warning(
+          "Issuer in metadata %s does not match issuer_url %s",
+          metadata.issuer,
+          issuer_url,
+      )
+      return False
+
+    return await self._discover(
+        AuthorizationServerMetadata, issuer_url, endpoints_to_try, is_valid
+    )
 
   async def discover_resource_metadata(
       self, resource_url: str
@@ -122,27 +189,109 @@ class OAuth2DiscoveryManager:
     else:
       well_known_endpoint = f"{base_url}/.well-known/oauth-protected-resource"
 
-    async with httpx.AsyncClient() as client:
+    def is_valid(metadata: ProtectedResourceMetadata) -> bool:
+      # Validate resource to defend against MIX-UP attacks
+      if metadata.resource == resource_url.rstrip("/"):
+        return True
+      logger.warning(
+          "Resource in metadata %s does not match resource_url %s",
+          metadata.resource,
+          resource_url,
+      )
+      return False
+
+    return await self._discover(
+        ProtectedResourceMetadata,
+        resource_url,
+        [well_known_endpoint],
+        is_valid,
+    )
+
+  async def _discover(
+      self,
+      model: Type[_MetadataT],
+      url: str,
+      endpoints: List[str],
+      is_valid: Callable[[_MetadataT], bool],
+  ) -> Optional[_MetadataT]:
+    """Returns cached metadata for url, or fetches it from the endpoints.
+
+    The endpoints are probed concurrently, and the first valid response in
+    the order they are listed in is used.
+    """
+    cache_key = (model.__name__, url)
+    cached = _metadata_cache.get(cache_key)
+    if cached and time.monotonic() < cached.expires_at:
+      _metadata_cache.move_to_end(cache_key)
+      return cached.metadata.model_copy()
+
+    client = _get_http_client()
+    entry = None
+    if cached and cached.etag:
+      entry = await self._fetch(
+          client, cached.endpoint, model, is_valid, cached
+      )
+    if entry is None:
+      tasks = [
+          asyncio.ensure_future(self._fetch(client, endpoint, model, is_valid))
+          for endpoint in endpoints
+      ]
       try:
-        response = await client.get(well_known_endpoint, timeout=5)
+        for task in tasks:
+          entry = await task
+          if entry:
+            break
+      finally:
+        for task in tasks:
+          task.cancel()
+
+    if entry is None:
+      _metadata_cache.pop(cache_key, None)
+      return None
+    if entry.expires_at is None:
+      _metadata_cache.pop(cache_key, None)
+    else:
+      _metadata_cache[cache_key] = entry
+      _metadata_cache.move_to_end(cache_key)
+      while len(_metadata_cache) > _MAX_CACHED_METADATA:
+        _metadata_cache.popitem(last=False)
+    return entry.metadata.model_copy()
+
+  async def _fetch(
+      self,
+      client: httpx.AsyncClient,
+      endpoint: str,
+      model: Type[_MetadataT],
+      is_valid: Callable[[_MetadataT], bool],
+      cached: Optional[_CachedMetadata] = None,
+  ) -> Optional[_CachedMetadata]:
+    """Fetches metadata from one endpoint, revalidating cached if given."""
+    request_kwargs = {"timeout": 5}
+    if cached:
+      request_kwargs["headers"] = {"If-None-Match": cached.etag}
+    try:
+      response = await client.get(endpoint, **request_kwargs)
+      if cached and response.status_code == 304:
+        metadata = cached.metadata
+      else:
         response.raise_for_status()
-        metadata = ProtectedResourceMetadata.model_validate(response.json())
-        # Validate resource to defend against MIX-UP attacks
-        if metadata.resource == resource_url.rstrip("/"):
-          return metadata
-        else:
-          logger.warning(
-              "Resource in metadata %s does not match resource_url %s",
-              metadata.resource,
-              resource_url,
-          )
-      except httpx.HTTPError as e:
-        logger.debug(
-            "Failed to fetch metadata from %s: %s", well_known_endpoint, e
-        )
-      except (json.decoder.JSONDecodeError, ValidationError) as e:
-        logger.debug(
-            "Failed to parse metadata from %s: %s", well_known_endpoint, e
-        )
+        metadata = model.model_validate(response.json())
+        if not is_valid(metadata):
+          return None
+    except httpx.HTTPError as e:
+      logger.debug("Failed to fetch metadata from %s: %s", endpoint, e)
+      return None
+    except (json.decoder.JSONDecodeError, ValidationError) as e:
+      logger.debug("Failed to parse metadata from %s: %s", endpoint, e)
+      return None
 
-    return None
+    ttl = _get_cache_ttl(response.headers)
+    etag = response.headers.get("etag")
+    if etag is None and cached:
+      etag = cached.etag
+    return _CachedMetadata(
+        metadata=metadata,
+        endpoint=endpoint,
+        etag=etag,
+        expires_at=None if ttl is None else time.monotonic() + ttl,
+    )
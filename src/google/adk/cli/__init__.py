@@ -12,4 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .cli_tools_click import main
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+  # The CLI is only loaded when run, not when importing a submodule such as
+  # `google.adk.cli.fast_api`.
+  if name == 'main':
+    from .cli_tools_click import main
+
+    return main
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
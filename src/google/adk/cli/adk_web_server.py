@@ -94,6 +94,7 @@ from .utils import evals
 from .utils.base_agent_loader import BaseAgentLoader
 from .utils.shared_value import SharedValue
 from .utils.state import create_empty_state
+from .utils.trace_store import TraceStore
 
 logger = logging.getLogger("google_adk." + __name__)
 
@@ -103,67 +104,33 @@ TAG_DEBUG = "Debug"
 TAG_EVALUATION = "Evaluation"
 
 
-class ApiServerSpanExporter(export_lib.SpanExporter):
-
-  def __init__(self, trace_dict):
-    self.trace_dict = trace_dict
-
-  def export(
-      self, spans: typing.Sequence[ReadableSpan]
-  ) -> export_lib.SpanExportResult:
-    for span in spans:
-      if (
-          span.name == "call_llm"
-          or span.name == "send_data"
-          or span.name.startswith("execute_tool")
-      ):
-        attributes = dict(span.attributes)
-        attributes["trace_id"] = span.get_span_context().trace_id
-        attributes["span_id"] = span.get_span_context().span_id
-        if attributes.get("gcp.vertex.agent.event_id", None):
-          self.trace_dict[attributes["gcp.vertex.agent.event_id"]] = attributes
-    return export_lib.SpanExportResult.SUCCESS
-
-  def force_flush(self, timeout_millis: int = 30000) -> bool:
-    return True
-
-
 class InMemoryExporter(export_lib.SpanExporter):
+  """Records finished spans in a `TraceStore` for the /debug/trace endpoints.
 
-  def __init__(self, trace_dict):
+  The store indexes spans by session, trace and event id and is bounded, so a
+  long-running server neither leaks memory nor slows down the endpoints.
+  """
+
+  def __init__(self, trace_store: TraceStore):
     super().__init__()
-    self._spans = []
-    self.trace_dict = trace_dict
+    self.trace_store = trace_store
 
   @override
   def export(
       self, spans: typing.Sequence[ReadableSpan]
   ) -> export_lib.SpanExportResult:
-    for span in spans:
-      trace_id = span.context.trace_id
-      if span.name == "call_llm":
-        attributes = dict(span.attributes)
-        session_id = attributes.get("gcp.vertex.agent.session_id", None)
-        if session_id:
-          if session_id not in self.trace_dict:
-            self.trace_dict[session_id] = [trace_id]
-          else:
-            self.trace_dict[session_id] += [trace_id]
-    self._spans.extend(spans)
+    self.trace_store.add_spans(spans)
     return export_lib.SpanExportResult.SUCCESS
 
   @override
   def force_flush(self, timeout_millis: int = 30000) -> bool:
     return True
 
-  def get_finished_spans(self, session_id: str):
-    trace_ids = self.trace_dict.get(session_id, None)
-    if trace_ids is None or not trace_ids:
-      return []
-    return [x for x in self._spans if x.context.trace_id in trace_ids]
+  def get_finished_spans(self, session_id: str) -> list[dict[str, Any]]:
+    return self.trace_store.get_session_spans(session_id)
 
   def clear(self):
-    self._spans.clear()
+    self.trace_store.clear()
 
 
 class RunAgentRequest(common.BaseModel):
@@ -627,6 +594,7 @@ class AdkWebServer:
       ] = lambda o, s: None,
       register_processors: Callable[[TracerProvider], None] = lambda o: None,
       otel_to_cloud: bool = False,
+      trace_store: Optional[TraceStore] = None,
   ):
     """Creates a FastAPI app for the ADK web server.
 
@@ -645,13 +613,15 @@ class AdkWebServer:
         to the TracerProvider.
       otel_to_cloud: EXPERIMENTAL. Whether to enable Cloud Trace
       and Cloud Logging integrations.
+      trace_store: The store backing the /debug/trace endpoints. Defaults to a
+        bounded in-memory `TraceStore`.
 
     Returns:
       A FastAPI app instance.
     """
     # Properties we don't need to modify from callbacks
-    trace_dict = {}
-    session_trace_dict = {}
+    if trace_store is None:
+      trace_store = TraceStore()
     # Set up a file system watcher to detect changes in the agents directory.
     observer = Observer()
     setup_observer(observer, self)
@@ -668,13 +638,13 @@ class AdkWebServer:
         tear_down_observer(observer, self)
         # Create tasks for all runner closures to run concurrently
         await cleanup.close_runners(list(self.runner_dict.values()))
+        trace_store.close()
 
-    memory_exporter = InMemoryExporter(session_trace_dict)
+    memory_exporter = InMemoryExporter(trace_store)
 
     _setup_telemetry(
         otel_to_cloud=otel_to_cloud,
         internal_exporters=[
-            export_lib.SimpleSpanProcessor(ApiServerSpanExporter(trace_dict)),
             export_lib.SimpleSpanProcessor(memory_exporter),
         ],
     )
@@ -704,28 +674,14 @@ class AdkWebServer:
 
     @app.get("/debug/trace/{event_id}", tags=[TAG_DEBUG])
     async def get_trace_dict(event_id: str) -> Any:
-      event_dict = trace_dict.get(event_id, None)
+      event_dict = trace_store.get_event_trace(event_id)
       if event_dict is None:
         raise HTTPException(status_code=404, detail="Trace not found")
       return event_dict
 
     @app.get("/debug/trace/session/{session_id}", tags=[TAG_DEBUG])
     async def get_session_trace(session_id: str) -> Any:
-      spans = memory_exporter.get_finished_spans(session_id)
-      if not spans:
-        return []
-      return [
-          {
-              "name": s.name,
-              "span_id": s.context.span_id,
-              "trace_id": s.context.trace_id,
-              "start_time": s.start_time,
-              "end_time": s.end_time,
-              "attributes": dict(s.attributes),
-              "parent_span_id": s.parent.span_id if s.parent else None,
-          }
-          for s in spans
-      ]
+      return memory_exporter.get_finished_spans(session_id)
 
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}",
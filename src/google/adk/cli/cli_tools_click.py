@@ -24,29 +24,44 @@ import logging
 import os
 from pathlib import Path
 import tempfile
+from typing import Any
 from typing import Optional
+from typing import TYPE_CHECKING
 
 import click
 from click.core import ParameterSource
-from fastapi import FastAPI
 import uvicorn
 
 from . import cli_create
 from . import cli_deploy
 from .. import version
 from ..evaluation.constants import MISSING_EVAL_DEPENDENCIES_MESSAGE
-from .cli import run_cli
-from .fast_api import get_fast_api_app
 from .utils import envs
-from .utils import evals
 from .utils import logs
 
+if TYPE_CHECKING:
+  from fastapi import FastAPI
+
 LOG_LEVELS = click.Choice(
     ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
     case_sensitive=False,
 )
 
 
+async def run_cli(**kwargs: Any) -> None:
+  """Runs `cli.run_cli`, imported only by the commands running an agent."""
+  from .cli import run_cli as _run_cli
+
+  await _run_cli(**kwargs)
+
+
+def get_fast_api_app(**kwargs: Any) -> FastAPI:
+  """Runs `fast_api.get_fast_api_app`, imported only by the server commands."""
+  from .fast_api import get_fast_api_app as _get_fast_api_app
+
+  return _get_fast_api_app(**kwargs)
+
+
 class HelpfulCommand(click.Command):
   """Command that shows full help on error instead of just the error message.
 
@@ -577,6 +592,8 @@ def cli_eval(
   eval_set_results_manager = None
 
   if eval_storage_uri:
+    from .utils import evals
+
     gcs_eval_managers = evals.create_gcs_eval_managers_from_uri(
         eval_storage_uri
     )
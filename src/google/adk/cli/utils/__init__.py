@@ -12,14 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
 from typing import Any
-from typing import Optional
-
-from ...agents.base_agent import BaseAgent
-from ...agents.llm_agent import LlmAgent
-from .state import create_empty_state
 
 __all__ = [
     'create_empty_state',
 ]
+
+
+def __getattr__(name: str) -> Any:
+  # Imported on first access, so that the CLI utilities don't load all agents.
+  if name == 'create_empty_state':
+    from .state import create_empty_state
+
+    return create_empty_state
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,304 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bounded, indexed storage for spans served by the /debug/trace endpoints."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Sequence
+
+from opentelemetry.sdk.trace import ReadableSpan
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_SESSION_ID_ATTRIBUTE = "gcp.vertex.agent.session_id"
+_EVENT_ID_ATTRIBUTE = "gcp.vertex.agent.event_id"
+
+_CREATE_TABLES = """
+CREATE TABLE IF NOT EXISTS spans (
+  seq INTEGER PRIMARY KEY AUTOINCREMENT,
+  session_id TEXT,
+  trace_id TEXT NOT NULL,
+  data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS spans_by_session ON spans (session_id, seq);
+CREATE INDEX IF NOT EXISTS spans_by_trace ON spans (trace_id, seq);
+CREATE TABLE IF NOT EXISTS events (
+  event_id TEXT PRIMARY KEY,
+  data TEXT NOT NULL
+);
+"""
+
+
+def _is_event_span(span: ReadableSpan) -> bool:
+  return (
+      span.name == "call_llm"
+      or span.name == "send_data"
+      or span.name.startswith("execute_tool")
+  )
+
+
+def _span_to_dict(span: ReadableSpan) -> dict[str, Any]:
+  return {
+      "name": span.name,
+      "span_id": span.context.span_id,
+      "trace_id": span.context.trace_id,
+      "start_time": span.start_time,
+      "end_time": span.end_time,
+      "attributes": dict(span.attributes),
+      "parent_span_id": span.parent.span_id if span.parent else None,
+  }
+
+
+@dataclasses.dataclass
+class _SessionTraces:
+  # Trace ids in arrival order; a dict is used as an ordered set.
+  trace_ids: dict[int, None] = dataclasses.field(default_factory=dict)
+  span_count: int = 0
+  last_access: float = 0.0
+
+
+class TraceStore:
+  """Keeps recent spans in memory, indexed by session, trace and event id.
+
+  Spans are grouped by trace. A trace is attributed to a session once its
+  `call_llm` span is seen; until then it counts against
+  `max_unassigned_traces`. Sessions are evicted least recently used first when
+  there are more than `max_sessions`, or once they have not been written or
+  read for `session_ttl_seconds`. Within a session, the oldest traces are
+  evicted when it holds more than `max_spans_per_session` spans.
+
+  If `spill_path` is set, evicted traces are written to a SQLite database at
+  that path instead of being discarded, and lookups fall back to it. All
+  lookups cost time proportional to the size of their result.
+
+  The store is thread-safe, as spans may end on any thread.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_sessions: int = 200,
+      max_spans_per_session: int = 5000,
+      max_unassigned_traces: int = 1000,
+      session_ttl_seconds: Optional[float] = None,
+      spill_path: Optional[str] = None,
+      clock: Callable[[], float] = time.monotonic,
+  ):
+    self._max_sessions = max_sessions
+    self._max_spans_per_session = max_spans_per_session
+    self._max_unassigned_traces = max_unassigned_traces
+    self._session_ttl_seconds = session_ttl_seconds
+    self._clock = clock
+    self._lock = threading.Lock()
+
+    self._trace_spans: dict[int, list[dict[str, Any]]] = {}
+    self._trace_sessions: dict[int, str] = {}
+    self._trace_events: dict[int, list[str]] = {}
+    self._events: dict[str, dict[str, Any]] = {}
+    self._sessions: collections.OrderedDict[str, _SessionTraces] = (
+        collections.OrderedDict()
+    )
+    self._unassigned_traces: collections.OrderedDict[int, None] = (
+        collections.OrderedDict()
+    )
+
+    self._spill: Optional[sqlite3.Connection] = None
+    if spill_path:
+      self._spill = sqlite3.connect(spill_path, check_same_thread=False)
+      self._spill.executescript(_CREATE_TABLES)
+
+  def add_spans(self, spans: Sequence[ReadableSpan]) -> None:
+    """Records finished spans."""
+    with self._lock:
+      now = self._clock()
+      self._evict_expired_sessions(now)
+      touched_sessions = set()
+      for span in spans:
+        record = _span_to_dict(span)
+        trace_id = record["trace_id"]
+        self._trace_spans.setdefault(trace_id, []).append(record)
+
+        if _is_event_span(span) and record["attributes"].get(
+            _EVENT_ID_ATTRIBUTE
+        ):
+          event_id = record["attributes"][_EVENT_ID_ATTRIBUTE]
+          attributes = dict(record["attributes"])
+          attributes["trace_id"] = trace_id
+          attributes["span_id"] = record["span_id"]
+          self._events[event_id] = attributes
+          self._trace_events.setdefault(trace_id, []).append(event_id)
+
+        session_id = self._trace_sessions.get(trace_id)
+        if session_id is None and span.name == "call_llm":
+          session_id = record["attributes"].get(_SESSION_ID_ATTRIBUTE)
+          if session_id:
+            self._assign_trace(trace_id, session_id)
+        elif session_id is not None:
+          self._sessions[session_id].span_count += 1
+
+        if session_id:
+          entry = self._sessions[session_id]
+          entry.last_access = now
+          self._sessions.move_to_end(session_id)
+          touched_sessions.add(session_id)
+        else:
+          self._unassigned_traces[trace_id] = None
+          self._unassigned_traces.move_to_end(trace_id)
+
+      for session_id in touched_sessions:
+        self._enforce_session_span_limit(session_id)
+      while len(self._sessions) > self._max_sessions:
+        self._evict_session(next(iter(self._sessions)))
+      while len(self._unassigned_traces) > self._max_unassigned_traces:
+        trace_id, _ = self._unassigned_traces.popitem(last=False)
+        self._evict_trace(trace_id)
+
+  def get_session_spans(self, session_id: str) -> list[dict[str, Any]]:
+    """Returns the spans of all traces attributed to a session."""
+    with self._lock:
+      self._evict_expired_sessions(self._clock())
+      spans = self._load_spilled("session_id", session_id)
+      entry = self._sessions.get(session_id)
+      if entry:
+        entry.last_access = self._clock()
+        self._sessions.move_to_end(session_id)
+        for trace_id in entry.trace_ids:
+          spans.extend(self._trace_spans.get(trace_id, ()))
+      return spans
+
+  def get_trace_spans(self, trace_id: int) -> list[dict[str, Any]]:
+    """Returns the spans of a trace."""
+    with self._lock:
+      spans = self._load_spilled("trace_id", str(trace_id))
+      spans.extend(self._trace_spans.get(trace_id, ()))
+      return spans
+
+  def get_event_trace(self, event_id: str) -> Optional[dict[str, Any]]:
+    """Returns the attributes of the span that produced an event."""
+    with self._lock:
+      attributes = self._events.get(event_id)
+      if attributes is not None or not self._spill:
+        return attributes
+      row = self._spill.execute(
+          "SELECT data FROM events WHERE event_id = ?", (event_id,)
+      ).fetchone()
+      return json.loads(row[0]) if row else None
+
+  def clear(self) -> None:
+    """Removes all spans, including spilled ones."""
+    with self._lock:
+      self._trace_spans.clear()
+      self._trace_sessions.clear()
+      self._trace_events.clear()
+      self._events.clear()
+      self._sessions.clear()
+      self._unassigned_traces.clear()
+      if self._spill:
+        self._spill.execute("DELETE FROM spans")
+        self._spill.execute("DELETE FROM events")
+        self._spill.commit()
+
+  def close(self) -> None:
+    if self._spill:
+      self._spill.close()
+      self._spill = None
+
+  def _assign_trace(self, trace_id: int, session_id: str) -> None:
+    self._unassigned_traces.pop(trace_id, None)
+    entry = self._sessions.get(session_id)
+    if entry is None:
+      entry = self._sessions[session_id] = _SessionTraces()
+    entry.trace_ids[trace_id] = None
+    entry.span_count += len(self._trace_spans[trace_id])
+    self._trace_sessions[trace_id] = session_id
+
+  def _enforce_session_span_limit(self, session_id: str) -> None:
+    entry = self._sessions[session_id]
+    # The newest trace is always kept, even if it alone exceeds the limit.
+    while (
+        entry.span_count > self._max_spans_per_session
+        and len(entry.trace_ids) > 1
+    ):
+      oldest_trace_id = next(iter(entry.trace_ids))
+      self._evict_trace(oldest_trace_id)
+
+  def _evict_expired_sessions(self, now: float) -> None:
+    if self._session_ttl_seconds is None:
+      return
+    # Sessions are ordered by last access, so expired ones come first.
+    while self._sessions:
+      session_id, entry = next(iter(self._sessions.items()))
+      if now - entry.last_access <= self._session_ttl_seconds:
+        break
+      self._evict_session(session_id)
+
+  def _evict_session(self, session_id: str) -> None:
+    entry = self._sessions.pop(session_id)
+    for trace_id in list(entry.trace_ids):
+      self._evict_trace(trace_id)
+
+  def _evict_trace(self, trace_id: int) -> None:
+    """Drops a trace from memory, spilling it to disk if configured."""
+    spans = self._trace_spans.pop(trace_id, [])
+    session_id = self._trace_sessions.pop(trace_id, None)
+    event_ids = self._trace_events.pop(trace_id, [])
+    events = {
+        event_id: self._events.pop(event_id)
+        for event_id in event_ids
+        if event_id in self._events
+    }
+    if session_id is not None and session_id in self._sessions:
+      entry = self._sessions[session_id]
+      entry.trace_ids.pop(trace_id, None)
+      entry.span_count -= len(spans)
+    if not self._spill:
+      return
+    try:
+      self._spill.executemany(
+          "INSERT INTO spans (session_id, trace_id, data) VALUES (?, ?, ?)",
+          [
+              (session_id, str(trace_id), json.dumps(span, default=str))
+              for span in spans
+          ],
+      )
+      self._spill.executemany(
+          "INSERT OR REPLACE INTO events (event_id, data) VALUES (?, ?)",
+          [
+              (event_id, json.dumps(attributes, default=str))
+              for event_id, attributes in events.items()
+          ],
+      )
+      self._spill.commit()
+    except sqlite3.Error:
+      logger.warning(
+          "Failed to spill trace %s to disk.", trace_id, exc_info=True
+      )
+
+  def _load_spilled(self, column: str, value: str) -> list[dict[str, Any]]:
+    if not self._spill:
+      return []
+    rows = self._spill.execute(
+        f"SELECT data FROM spans WHERE {column} = ? ORDER BY seq", (value,)
+    ).fetchall()
+    return [json.loads(row[0]) for row in rows]
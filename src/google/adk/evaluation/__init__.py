@@ -12,20 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging
+import sys
+from typing import Any
 
-logger = logging.getLogger('google_adk.' + __name__)
 
-__all__ = []
-
-try:
-  from .agent_evaluator import AgentEvaluator
-
-  __all__.append('AgentEvaluator')
-except ImportError:
-  logger.debug(
-      'The Vertex[eval] sdk is not installed. If you want to use the Vertex'
-      ' Evaluation with agents, please install it(pip install'
-      ' "google-cloud-aiplatform[evaluation]). If not, you can ignore this'
-      ' warning.'
-  )
+def __getattr__(name: str) -> Any:
+  # AgentEvaluator is imported on first access, as the evaluation
+  # dependencies are heavy and optional, and the CLI imports this package.
+  # Without them, the package has no AgentEvaluator, and __all__, also
+  # computed on first access, doesn't list it.
+  if name == 'AgentEvaluator':
+    try:
+      from .agent_evaluator import AgentEvaluator
+    except ImportError as e:
+      raise AttributeError(
+          'AgentEvaluator requires the Vertex[eval] sdk, please install it'
+          ' (pip install "google-cloud-aiplatform[evaluation]").'
+      ) from e
+    globals()[name] = AgentEvaluator
+    return AgentEvaluator
+  if name == '__all__':
+    names = (
+        ['AgentEvaluator']
+        if hasattr(sys.modules[__name__], 'AgentEvaluator')
+        else []
+    )
+    globals()[name] = names
+    return names
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
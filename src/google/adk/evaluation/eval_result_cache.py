@@ -0,0 +1,97 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+import logging
+import os
+import tempfile
+from typing import Optional
+
+from typing_extensions import override
+
+from ..utils.feature_decorator import experimental
+
+logger = logging.getLogger("google_adk." + __name__)
+
+
+@experimental
+class BaseEvalResultCache(ABC):
+  """A content-addressed store for inference and metric results.
+
+  Keys are hex digests computed by the eval service from everything that can
+  affect a result, so an entry never needs to be invalidated; a change to the
+  inputs simply produces a different key.
+  """
+
+  @abstractmethod
+  def get(self, key: str) -> Optional[str]:
+    """Returns the serialized result stored under key, if any."""
+
+  @abstractmethod
+  def put(self, key: str, value: str) -> None:
+    """Stores a serialized result under key."""
+
+
+@experimental
+class InMemoryEvalResultCache(BaseEvalResultCache):
+  """An eval result cache that lives for the lifetime of the process."""
+
+  def __init__(self):
+    self._entries: dict[str, str] = {}
+
+  @override
+  def get(self, key: str) -> Optional[str]:
+    return self._entries.get(key)
+
+  @override
+  def put(self, key: str, value: str) -> None:
+    self._entries[key] = value
+
+
+@experimental
+class LocalEvalResultCache(BaseEvalResultCache):
+  """An eval result cache that stores one file per entry under cache_dir."""
+
+  def __init__(self, cache_dir: str):
+    self._cache_dir = cache_dir
+
+  @override
+  def get(self, key: str) -> Optional[str]:
+    try:
+      with open(self._get_path(key), "r", encoding="utf-8") as f:
+        return f.read()
+    except FileNotFoundError:
+      return None
+
+  @override
+  def put(self, key: str, value: str) -> None:
+    path = self._get_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write to a temporary file first, so concurrent runs never observe a
+    # partially written entry.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+      with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(value)
+      os.replace(tmp_path, path)
+    except OSError:
+      logger.warning("Failed to write eval cache entry %s", key, exc_info=True)
+      if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+  def _get_path(self, key: str) -> str:
+    return os.path.join(self._cache_dir, key[:2], key + ".json")
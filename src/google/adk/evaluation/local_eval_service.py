@@ -15,13 +15,23 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import dataclasses
+import enum
+import hashlib
 import inspect
+import json
 import logging
+import time
+import types
+from typing import Any
 from typing import AsyncGenerator
 from typing import Callable
+from typing import Literal
 from typing import Optional
 import uuid
 
+from pydantic import BaseModel
 from typing_extensions import override
 
 from ..agents.base_agent import BaseAgent
@@ -30,6 +40,7 @@ from ..artifacts.in_memory_artifact_service import InMemoryArtifactService
 from ..errors.not_found_error import NotFoundError
 from ..sessions.base_session_service import BaseSessionService
 from ..sessions.in_memory_session_service import InMemorySessionService
+from ..sessions.session import Session
 from ..utils.feature_decorator import experimental
 from .base_eval_service import BaseEvalService
 from .base_eval_service import EvaluateConfig
@@ -43,6 +54,7 @@ from .eval_metrics import EvalMetricResult
 from .eval_metrics import EvalMetricResultDetails
 from .eval_metrics import EvalMetricResultPerInvocation
 from .eval_result import EvalCaseResult
+from .eval_result_cache import BaseEvalResultCache
 from .eval_set import EvalCase
 from .eval_set_results_manager import EvalSetResultsManager
 from .eval_sets_manager import EvalSetsManager
@@ -50,6 +62,7 @@ from .evaluation_generator import EvaluationGenerator
 from .evaluator import EvalStatus
 from .evaluator import EvaluationResult
 from .evaluator import PerInvocationResult
+from .in_memory_eval_sets_manager import InMemoryEvalSetsManager
 from .metric_evaluator_registry import DEFAULT_METRIC_EVALUATOR_REGISTRY
 from .metric_evaluator_registry import MetricEvaluatorRegistry
 from .user_simulator_provider import UserSimulatorProvider
@@ -63,9 +76,223 @@ def _get_session_id() -> str:
   return f'{EVAL_SESSION_ID_PREFIX}{str(uuid.uuid4())}'
 
 
+# Bump this whenever the contents of cache entries or keys change, so that
+# entries written by older versions are never read back.
+_CACHE_KEY_VERSION = 1
+
+# Agent configuration nested deeper than this is not part of the fingerprint.
+_MAX_FINGERPRINT_DEPTH = 8
+
+
+@dataclasses.dataclass
+class EvalProgress:
+  """Reports that one eval case finished a stage of an eval run."""
+
+  stage: Literal['inference', 'evaluation']
+  eval_set_id: str
+  eval_case_id: str
+  completed: int
+  """Number of eval cases of the request that have finished this stage."""
+  total: int
+  """Number of eval cases in the request."""
+  elapsed_seconds: float
+  """Time spent on this eval case, including time served from the cache."""
+
+
+@dataclasses.dataclass
+class EvalCacheStats:
+  """Hit and miss counts of the eval result cache."""
+
+  inference_hits: int = 0
+  inference_misses: int = 0
+  metric_hits: int = 0
+  metric_misses: int = 0
+
+
+class _CachedInference(BaseModel):
+  inferences: list[Invocation]
+  session: Optional[Session] = None
+
+
+def _get_user_id(eval_case: EvalCase) -> str:
+  return (
+      eval_case.session_input.user_id
+      if eval_case.session_input and eval_case.session_input.user_id
+      else 'test_user_id'
+  )
+
+
+def _hash_payload(payload: Any) -> str:
+  return hashlib.sha256(
+      json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+  ).hexdigest()
+
+
+def _fingerprint_value(
+    value: Any, depth: int = 0, path: frozenset[int] = frozenset()
+) -> Any:
+  """Returns a JSON-serializable description of an agent config value.
+
+  Functions are described by their qualified name, their code, including the
+  code of the functions nested in them, and the values they close over, so
+  that editing a tool or callback changes the fingerprint. Other objects are
+  described by all of their attributes, including private ones, where tools
+  and toolsets keep their configuration.
+
+  The description is best-effort: state not reachable from the agent tree,
+  or nested deeper than `_MAX_FINGERPRINT_DEPTH`, is not part of it.
+  """
+  if value is None or isinstance(value, (bool, int, float, str)):
+    return value
+  if depth > _MAX_FINGERPRINT_DEPTH or id(value) in path:
+    return type(value).__qualname__
+  if isinstance(value, enum.Enum):
+    return value.value
+  if isinstance(value, bytes):
+    return hashlib.sha256(value).hexdigest()
+  if isinstance(value, type):
+    return f'{value.__module__}.{value.__qualname__}'
+  if inspect.ismodule(value) or isinstance(value, logging.Logger):
+    return value.__name__ if inspect.ismodule(value) else value.name
+  # Objects referring back to one on the current path, e.g. a parent, are
+  # described by their type only.
+  path = path | {id(value)}
+  if isinstance(value, (list, tuple)):
+    return [_fingerprint_value(item, depth + 1, path) for item in value]
+  if isinstance(value, (set, frozenset)):
+    return sorted(
+        (_fingerprint_value(item, depth + 1, path) for item in value),
+        key=lambda item: json.dumps(item, sort_keys=True, default=str),
+    )
+  if isinstance(value, dict):
+    return {
+        str(key): _fingerprint_value(item, depth + 1, path)
+        for key, item in value.items()
+    }
+  if isinstance(value, BaseModel):
+    fields = {
+        name: _fingerprint_value(getattr(value, name, None), depth + 1, path)
+        for name in type(value).model_fields
+        # The parent links back up the agent tree.
+        if name != 'parent_agent'
+    }
+    return {'type': type(value).__qualname__, **fields}
+  if inspect.ismethod(value):
+    value = value.__func__
+  if inspect.isfunction(value):
+    function = inspect.unwrap(value)
+    closure = []
+    for cell in function.__closure__ or ():
+      try:
+        closure.append(_fingerprint_value(cell.cell_contents, depth + 1, path))
+      except ValueError:
+        # The cell is empty.
+        closure.append(None)
+    return {
+        'function': f'{value.__module__}.{value.__qualname__}',
+        'code': _fingerprint_code(function.__code__),
+        'defaults': _fingerprint_value(function.__defaults__, depth + 1, path),
+        'closure': closure,
+    }
+  attributes = getattr(value, '__dict__', {})
+  return {
+      'type': type(value).__qualname__,
+      **{
+          name: _fingerprint_value(attribute, depth + 1, path)
+          for name, attribute in attributes.items()
+      },
+  }
+
+
+def _fingerprint_code(code: types.CodeType) -> dict[str, Any]:
+  """Describes a code object, including the functions defined in it."""
+  constants = []
+  for constant in code.co_consts:
+    if isinstance(constant, types.CodeType):
+      constants.append(_fingerprint_code(constant))
+    elif constant is None or isinstance(constant, (bool, int, float, str)):
+      constants.append(constant)
+    else:
+      constants.append(repr(constant))
+  return {
+      'code': hashlib.sha256(code.co_code).hexdigest(),
+      'names': list(code.co_names),
+      'constants': constants,
+  }
+
+
+def _get_agent_fingerprint(root_agent: BaseAgent) -> str:
+  """Returns a digest of the configuration and code of an agent tree."""
+  return _hash_payload(_fingerprint_value(root_agent))
+
+
+def _invocation_for_cache_key(invocation: Invocation) -> dict[str, Any]:
+  # Ids and timestamps differ between runs even when the content doesn't.
+  return invocation.model_dump(
+      mode='json', exclude={'invocation_id', 'creation_timestamp'}
+  )
+
+
+# The root agent of a process pool worker, built once per worker process.
+_worker_root_agent: Optional[BaseAgent] = None
+
+
+def _init_inference_worker(root_agent_loader: Callable[[], BaseAgent]):
+  global _worker_root_agent
+  _worker_root_agent = root_agent_loader()
+
+
+def _perform_inference_in_worker(
+    app_name: str,
+    eval_set_id: str,
+    eval_case: EvalCase,
+    session_id: str,
+    user_simulator_provider: UserSimulatorProvider,
+) -> tuple[InferenceResult, Optional[Session]]:
+  """Runs inference for one eval case inside a process pool worker."""
+
+  async def perform_inference():
+    eval_service = LocalEvalService(
+        root_agent=_worker_root_agent,
+        eval_sets_manager=InMemoryEvalSetsManager(),
+        session_id_supplier=lambda: session_id,
+        user_simulator_provider=user_simulator_provider,
+    )
+    inference_result = await eval_service._perform_inference_single_eval_item(
+        app_name=app_name,
+        eval_set_id=eval_set_id,
+        eval_case=eval_case,
+        root_agent=_worker_root_agent,
+    )
+    session = await eval_service._get_inference_session(
+        app_name=app_name,
+        user_id=_get_user_id(eval_case),
+        session_id=session_id,
+    )
+    return inference_result, session
+
+  return asyncio.run(perform_inference())
+
+
 @experimental
 class LocalEvalService(BaseEvalService):
-  """An implementation of BaseEvalService, that runs the evals locally."""
+  """An implementation of BaseEvalService, that runs the evals locally.
+
+  If a `result_cache` is given, inferences are cached by eval case and agent
+  fingerprint, and metric results by metric config and invocations. Re-running
+  an eval set then only recomputes the cases and metrics whose inputs changed.
+  The agent fingerprint covers the configuration of the agent tree, including
+  the private attributes of its tools and toolsets, and the code and closures
+  of its tools and callbacks. It is best-effort: pass `agent_fingerprint`
+  explicitly if the agent depends on anything else, like files, environment
+  variables or state nested too deep in the tree, as a stale fingerprint
+  returns cached inferences of the previous agent.
+
+  If `inference_process_pool_size` is set, inference runs in a pool of that
+  many worker processes, for agents that are CPU bound. Each worker builds its
+  own agent with `root_agent_loader`, which must be picklable, e.g. a module
+  level function.
+  """
 
   def __init__(
       self,
@@ -77,7 +304,17 @@ class LocalEvalService(BaseEvalService):
       eval_set_results_manager: Optional[EvalSetResultsManager] = None,
       session_id_supplier: Callable[[], str] = _get_session_id,
       user_simulator_provider: UserSimulatorProvider = UserSimulatorProvider(),
+      result_cache: Optional[BaseEvalResultCache] = None,
+      agent_fingerprint: Optional[str] = None,
+      inference_process_pool_size: Optional[int] = None,
+      root_agent_loader: Optional[Callable[[], BaseAgent]] = None,
+      progress_callback: Optional[Callable[[EvalProgress], None]] = None,
   ):
+    if inference_process_pool_size and root_agent_loader is None:
+      raise ValueError(
+          '`root_agent_loader` is required when `inference_process_pool_size`'
+          ' is set.'
+      )
     self._root_agent = root_agent
     self._eval_sets_manager = eval_sets_manager
     metric_evaluator_registry = (
@@ -91,6 +328,20 @@ class LocalEvalService(BaseEvalService):
     self._eval_set_results_manager = eval_set_results_manager
     self._session_id_supplier = session_id_supplier
     self._user_simulator_provider = user_simulator_provider
+    self._result_cache = result_cache
+    self._agent_fingerprint = agent_fingerprint
+    self._inference_process_pool_size = inference_process_pool_size
+    self._root_agent_loader = root_agent_loader
+    self._progress_callback = progress_callback
+    self._cache_stats = EvalCacheStats()
+    # Sessions of inferences that did not run against self._session_service,
+    # because they were served from the cache or ran in a worker process.
+    self._inference_sessions: dict[str, Session] = {}
+
+  @property
+  def cache_stats(self) -> EvalCacheStats:
+    """Hit and miss counts of the result cache since this service was created."""
+    return dataclasses.replace(self._cache_stats)
 
   @override
   async def perform_inference(
@@ -128,18 +379,45 @@ class LocalEvalService(BaseEvalService):
         value=inference_request.inference_config.parallelism
     )
 
+    executor = None
+    if self._inference_process_pool_size:
+      executor = concurrent.futures.ProcessPoolExecutor(
+          max_workers=self._inference_process_pool_size,
+          initializer=_init_inference_worker,
+          initargs=(self._root_agent_loader,),
+      )
+
     async def run_inference(eval_case):
       async with semaphore:
-        return await self._perform_inference_single_eval_item(
+        start_time = time.perf_counter()
+        inference_result = await self._perform_inference_with_cache(
             app_name=inference_request.app_name,
             eval_set_id=inference_request.eval_set_id,
             eval_case=eval_case,
-            root_agent=self._root_agent,
+            executor=executor,
         )
+        return inference_result, time.perf_counter() - start_time
 
-    inference_results = [run_inference(eval_case) for eval_case in eval_cases]
-    for inference_result in asyncio.as_completed(inference_results):
-      yield await inference_result
+    try:
+      inference_tasks = [run_inference(eval_case) for eval_case in eval_cases]
+      for completed, inference_task in enumerate(
+          asyncio.as_completed(inference_tasks), start=1
+      ):
+        inference_result, elapsed_seconds = await inference_task
+        self._report_progress(
+            EvalProgress(
+                stage='inference',
+                eval_set_id=inference_request.eval_set_id,
+                eval_case_id=inference_result.eval_case_id,
+                completed=completed,
+                total=len(eval_cases),
+                elapsed_seconds=elapsed_seconds,
+            )
+        )
+        yield inference_result
+    finally:
+      if executor:
+        executor.shutdown(wait=False, cancel_futures=True)
 
   @override
   async def evaluate(
@@ -158,18 +436,34 @@ class LocalEvalService(BaseEvalService):
 
     async def run_evaluation(inference_result):
       async with semaphore:
-        return await self._evaluate_single_inference_result(
+        start_time = time.perf_counter()
+        result = await self._evaluate_single_inference_result(
             inference_result=inference_result,
             evaluate_config=evaluate_request.evaluate_config,
         )
+        return result, time.perf_counter() - start_time
 
     evaluation_tasks = [
         run_evaluation(inference_result)
         for inference_result in evaluate_request.inference_results
     ]
 
-    for evaluation_task in asyncio.as_completed(evaluation_tasks):
-      inference_result, eval_case_result = await evaluation_task
+    for completed, evaluation_task in enumerate(
+        asyncio.as_completed(evaluation_tasks), start=1
+    ):
+      (inference_result, eval_case_result), elapsed_seconds = (
+          await evaluation_task
+      )
+      self._report_progress(
+          EvalProgress(
+              stage='evaluation',
+              eval_set_id=inference_result.eval_set_id,
+              eval_case_id=inference_result.eval_case_id,
+              completed=completed,
+              total=len(evaluation_tasks),
+              elapsed_seconds=elapsed_seconds,
+          )
+      )
 
       if self._eval_set_results_manager:
         self._eval_set_results_manager.save_eval_set_result(
@@ -215,11 +509,7 @@ class LocalEvalService(BaseEvalService):
     # would be the score for the eval case.
     overall_eval_metric_results = []
 
-    user_id = (
-        eval_case.session_input.user_id
-        if eval_case.session_input and eval_case.session_input.user_id
-        else 'test_user_id'
-    )
+    user_id = _get_user_id(eval_case)
 
     if eval_case.conversation_scenario is None and len(
         inference_result.inferences
@@ -324,7 +614,7 @@ class LocalEvalService(BaseEvalService):
         overall_eval_metric_results=overall_eval_metric_results,
         eval_metric_result_per_invocation=eval_metric_result_per_invocation,
         session_id=inference_result.session_id,
-        session_details=await self._session_service.get_session(
+        session_details=await self._get_inference_session(
             app_name=inference_result.app_name,
             user_id=user_id,
             session_id=inference_result.session_id,
@@ -341,6 +631,30 @@ class LocalEvalService(BaseEvalService):
       expected_invocations: Optional[list[Invocation]],
   ) -> EvaluationResult:
     """Returns EvaluationResult obtained from evaluating a metric using an Evaluator."""
+    cache_key = None
+    if self._result_cache:
+      cache_key = _hash_payload({
+          'version': _CACHE_KEY_VERSION,
+          'kind': 'metric',
+          'eval_metric': eval_metric.model_dump(mode='json'),
+          'actual_invocations': [
+              _invocation_for_cache_key(invocation)
+              for invocation in actual_invocations
+          ],
+          'expected_invocations': (
+              [
+                  _invocation_for_cache_key(invocation)
+                  for invocation in expected_invocations
+              ]
+              if expected_invocations is not None
+              else None
+          ),
+      })
+      cached_result = self._result_cache.get(cache_key)
+      if cached_result is not None:
+        self._cache_stats.metric_hits += 1
+        return EvaluationResult.model_validate_json(cached_result)
+      self._cache_stats.metric_misses += 1
 
     # Get the metric evaluator from the registry.
     metric_evaluator = self._metric_evaluator_registry.get_evaluator(
@@ -350,18 +664,25 @@ class LocalEvalService(BaseEvalService):
     if inspect.iscoroutinefunction(metric_evaluator.evaluate_invocations):
       # Some evaluators could be async, for example those that use llm as a
       # judge, so we need to make sure that we wait on them.
-      return await metric_evaluator.evaluate_invocations(
+      evaluation_result = await metric_evaluator.evaluate_invocations(
           actual_invocations=actual_invocations,
           expected_invocations=expected_invocations,
       )
     else:
       # Metrics that perform computation synchronously, mostly these don't
       # perform any i/o. An example of this would calculation of rouge_1 score.
-      return metric_evaluator.evaluate_invocations(
+      evaluation_result = metric_evaluator.evaluate_invocations(
           actual_invocations=actual_invocations,
           expected_invocations=expected_invocations,
       )
 
+    if (
+        cache_key
+        and evaluation_result.overall_eval_status != EvalStatus.NOT_EVALUATED
+    ):
+      self._result_cache.put(cache_key, evaluation_result.model_dump_json())
+    return evaluation_result
+
   def _generate_final_eval_status(
       self, overall_eval_metric_results: list[EvalMetricResult]
   ) -> EvalStatus:
@@ -427,3 +748,124 @@ class LocalEvalService(BaseEvalService):
       inference_result.status = InferenceStatus.FAILURE
       inference_result.error_message = str(e)
       return inference_result
+
+  async def _perform_inference_with_cache(
+      self,
+      app_name: str,
+      eval_set_id: str,
+      eval_case: EvalCase,
+      executor: Optional[concurrent.futures.Executor],
+  ) -> InferenceResult:
+    """Returns a cached inference if there is one, otherwise runs the agent."""
+    cache_key = None
+    if self._result_cache:
+      cache_key = self._get_inference_cache_key(app_name, eval_case)
+      cached_inference = self._result_cache.get(cache_key)
+      if cached_inference is not None:
+        self._cache_stats.inference_hits += 1
+        return self._restore_cached_inference(
+            app_name=app_name,
+            eval_set_id=eval_set_id,
+            eval_case_id=eval_case.eval_id,
+            cached_inference=_CachedInference.model_validate_json(
+                cached_inference
+            ),
+        )
+      self._cache_stats.inference_misses += 1
+
+    if executor:
+      session_id = self._session_id_supplier()
+      (
+          inference_result,
+          session,
+      ) = await asyncio.get_running_loop().run_in_executor(
+          executor,
+          _perform_inference_in_worker,
+          app_name,
+          eval_set_id,
+          eval_case,
+          session_id,
+          self._user_simulator_provider,
+      )
+      if session:
+        self._inference_sessions[session_id] = session
+    else:
+      inference_result = await self._perform_inference_single_eval_item(
+          app_name=app_name,
+          eval_set_id=eval_set_id,
+          eval_case=eval_case,
+          root_agent=self._root_agent,
+      )
+
+    if cache_key and inference_result.status == InferenceStatus.SUCCESS:
+      cached_inference = _CachedInference(
+          inferences=inference_result.inferences,
+          session=await self._get_inference_session(
+              app_name=app_name,
+              user_id=_get_user_id(eval_case),
+              session_id=inference_result.session_id,
+          ),
+      )
+      self._result_cache.put(cache_key, cached_inference.model_dump_json())
+    return inference_result
+
+  def _get_inference_cache_key(self, app_name: str, eval_case: EvalCase) -> str:
+    if self._agent_fingerprint is None:
+      self._agent_fingerprint = _get_agent_fingerprint(self._root_agent)
+    return _hash_payload({
+        'version': _CACHE_KEY_VERSION,
+        'kind': 'inference',
+        'app_name': app_name,
+        'agent_fingerprint': self._agent_fingerprint,
+        'eval_case': eval_case.model_dump(
+            mode='json', exclude={'creation_timestamp'}
+        ),
+        'user_simulator_config': _fingerprint_value(
+            self._user_simulator_provider._user_simulator_config
+        ),
+    })
+
+  def _restore_cached_inference(
+      self,
+      app_name: str,
+      eval_set_id: str,
+      eval_case_id: str,
+      cached_inference: _CachedInference,
+  ) -> InferenceResult:
+    # Each run gets its own session id, even when its inference is reused.
+    session_id = self._session_id_supplier()
+    if cached_inference.session:
+      self._inference_sessions[session_id] = (
+          cached_inference.session.model_copy(update={'id': session_id})
+      )
+    return InferenceResult(
+        app_name=app_name,
+        eval_set_id=eval_set_id,
+        eval_case_id=eval_case_id,
+        session_id=session_id,
+        inferences=cached_inference.inferences,
+        status=InferenceStatus.SUCCESS,
+    )
+
+  async def _get_inference_session(
+      self, app_name: str, user_id: str, session_id: Optional[str]
+  ) -> Optional[Session]:
+    if session_id in self._inference_sessions:
+      return self._inference_sessions[session_id]
+    return await self._session_service.get_session(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+    )
+
+  def _report_progress(self, progress: EvalProgress) -> None:
+    logger.info(
+        '%s of eval case `%s` finished in %.2fs (%d/%d).',
+        progress.stage.capitalize(),
+        progress.eval_case_id,
+        progress.elapsed_seconds,
+        progress.completed,
+        progress.total,
+    )
+    if self._progress_callback:
+      self._progress_callback(progress)
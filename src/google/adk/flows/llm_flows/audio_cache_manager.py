@@ -14,6 +14,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import dataclasses
 import logging
 import time
 from typing import TYPE_CHECKING
@@ -29,8 +32,24 @@ if TYPE_CHECKING:
 logger = logging.getLogger('google_adk.' + __name__)
 
 
+@dataclasses.dataclass
+class _AudioSegment:
+  """Audio that was saved to the artifact service before its cache flushed."""
+
+  role: str
+  timestamp: float
+  """Timestamp of the first audio chunk in the segment."""
+  file_data: types.FileData
+
+
 class AudioCacheManager:
-  """Manages audio caching and flushing for live streaming flows."""
+  """Manages audio caching and flushing for live streaming flows.
+
+  Once a cache holds more than `max_cache_size_bytes` of audio, `spill_cache`
+  saves it to the artifact service as a segment and empties it, so memory
+  stays bounded in long sessions. The event created when the cache is flushed
+  references all of its segments, in order.
+  """
 
   def __init__(self, config: AudioCacheConfig | None = None):
     """Initialize the audio cache manager.
@@ -39,6 +58,13 @@ class AudioCacheManager:
       config: Configuration for audio caching behavior.
     """
     self.config = config or AudioCacheConfig()
+    # Keyed by invocation id and cache type ('input' or 'output').
+    self._cached_bytes: dict[tuple[str, str], int] = {}
+    self._spilled_segments: dict[tuple[str, str], list[_AudioSegment]] = {}
+    # Keyed as above, the lock serializing the spills and flushes of a cache,
+    # which run in the send and receive tasks of a live connection, and the
+    # number of tasks holding or waiting for it.
+    self._locks: dict[tuple[str, str], tuple[asyncio.Lock, int]] = {}
 
   def cache_audio(
       self,
@@ -73,6 +99,10 @@ class AudioCacheManager:
         role=role, data=audio_blob, timestamp=time.time()
     )
     cache.append(audio_entry)
+    key = (invocation_context.invocation_id, cache_type)
+    self._cached_bytes[key] = self._cached_bytes.get(key, 0) + len(
+        audio_blob.data
+    )
 
     logger.debug(
         'Cached %s audio chunk: %d bytes, cache size: %d',
@@ -81,6 +111,55 @@ class AudioCacheManager:
         len(cache),
     )
 
+  async def spill_cache(
+      self,
+      invocation_context: InvocationContext,
+      cache_type: str,
+  ) -> None:
+    """Save a cache to the artifact service if it has grown too large.
+
+    The saved audio is referenced by the event created when the cache is next
+    flushed.
+
+    Args:
+      invocation_context: The current invocation context.
+      cache_type: Type of audio cache to check, either 'input' or 'output'.
+    """
+    key = (invocation_context.invocation_id, cache_type)
+    if (
+        self._cached_bytes.get(key, 0) < self.config.max_cache_size_bytes
+        or not invocation_context.artifact_service
+    ):
+      return
+    async with self._lock(key):
+      # The cache may have been flushed while waiting for the lock.
+      if self._cached_bytes.get(key, 0) < self.config.max_cache_size_bytes:
+        return
+      # Reset even if saving fails, so a failing artifact service is not
+      # retried on every chunk.
+      self._cached_bytes[key] = 0
+
+      if cache_type == 'input':
+        audio_cache = invocation_context.input_realtime_cache
+      else:
+        audio_cache = invocation_context.output_realtime_cache
+      file_data = await self._save_audio(
+          invocation_context, audio_cache, f'{cache_type}_audio'
+      )
+      if not file_data:
+        return
+      self._spilled_segments.setdefault(key, []).append(
+          _AudioSegment(
+              role=audio_cache[0].role,
+              timestamp=audio_cache[0].timestamp,
+              file_data=file_data,
+          )
+      )
+      if cache_type == 'input':
+        invocation_context.input_realtime_cache = []
+      else:
+        invocation_context.output_realtime_cache = []
+
   async def flush_caches(
       self,
       invocation_context: InvocationContext,
@@ -106,39 +185,63 @@ class AudioCacheManager:
       A list of Event objects created from the flushed caches.
     """
     flushed_events = []
-    if flush_user_audio and invocation_context.input_realtime_cache:
-      audio_event = await self._flush_cache_to_services(
-          invocation_context,
-          invocation_context.input_realtime_cache,
-          'input_audio',
-      )
-      if audio_event:
-        flushed_events.append(audio_event)
-        invocation_context.input_realtime_cache = []
-
-    if flush_model_audio and invocation_context.output_realtime_cache:
-      logger.debug('Flushed output audio cache')
-      audio_event = await self._flush_cache_to_services(
-          invocation_context,
-          invocation_context.output_realtime_cache,
-          'output_audio',
-      )
-      if audio_event:
-        flushed_events.append(audio_event)
-        invocation_context.output_realtime_cache = []
+    if flush_user_audio:
+      key = (invocation_context.invocation_id, 'input')
+      async with self._lock(key):
+        audio_event = await self._flush_cache_to_services(
+            invocation_context,
+            invocation_context.input_realtime_cache,
+            'input_audio',
+        )
+        if audio_event:
+          flushed_events.append(audio_event)
+          invocation_context.input_realtime_cache = []
+          self._cached_bytes.pop(key, None)
+
+    if flush_model_audio:
+      key = (invocation_context.invocation_id, 'output')
+      async with self._lock(key):
+        audio_event = await self._flush_cache_to_services(
+            invocation_context,
+            invocation_context.output_realtime_cache,
+            'output_audio',
+        )
+        if audio_event:
+          logger.debug('Flushed output audio cache')
+          flushed_events.append(audio_event)
+          invocation_context.output_realtime_cache = []
+          self._cached_bytes.pop(key, None)
 
     return flushed_events
 
+  @contextlib.asynccontextmanager
+  async def _lock(self, key: tuple[str, str]):
+    """Holds the lock of a cache, dropping it once no task uses it."""
+    lock, users = self._locks.get(key, (None, 0))
+    if lock is None:
+      lock = asyncio.Lock()
+    self._locks[key] = (lock, users + 1)
+    try:
+      async with lock:
+        yield
+    finally:
+      lock, users = self._locks[key]
+      if users == 1:
+        del self._locks[key]
+      else:
+        self._locks[key] = (lock, users - 1)
+
   async def _flush_cache_to_services(
       self,
       invocation_context: InvocationContext,
-      audio_cache: list[RealtimeCacheEntry],
+      audio_cache: list[RealtimeCacheEntry] | None,
       cache_type: str,
   ) -> Event | None:
     """Flush a list of audio cache entries to artifact services.
 
     The artifact service stores the actual blob. The session stores the
-    reference to the stored blob.
+    reference to the stored blob, and to any segments of the same cache that
+    were spilled to the artifact service earlier.
 
     Args:
       invocation_context: The invocation context.
@@ -148,17 +251,61 @@ class AudioCacheManager:
     Returns:
       The created Event if the cache was successfully flushed, None otherwise.
     """
-    if not invocation_context.artifact_service or not audio_cache:
+    key = (invocation_context.invocation_id, cache_type.removesuffix('_audio'))
+    segments = list(self._spilled_segments.get(key, ()))
+    if not invocation_context.artifact_service or not (audio_cache or segments):
       logger.debug('Skipping cache flush: no artifact service or empty cache')
       return None
 
+    if audio_cache:
+      file_data = await self._save_audio(
+          invocation_context, audio_cache, cache_type
+      )
+      if not file_data:
+        return None
+      segments.append(
+          _AudioSegment(
+              role=audio_cache[0].role,
+              timestamp=audio_cache[0].timestamp,
+              file_data=file_data,
+          )
+      )
+    self._spilled_segments.pop(key, None)
+
+    # Create event with file data references to add to session
+    return Event(
+        id=Event.new_id(),
+        invocation_id=invocation_context.invocation_id,
+        author=segments[0].role,
+        content=types.Content(
+            role=segments[0].role,
+            parts=[
+                types.Part(file_data=segment.file_data) for segment in segments
+            ],
+        ),
+        timestamp=segments[0].timestamp,
+    )
+
+  async def _save_audio(
+      self,
+      invocation_context: InvocationContext,
+      audio_cache: list[RealtimeCacheEntry],
+      cache_type: str,
+  ) -> types.FileData | None:
+    """Save audio cache entries to the artifact service as a single file.
+
+    Args:
+      invocation_context: The invocation context.
+      audio_cache: The audio cache entries to save.
+      cache_type: Type identifier for the cache ('input_audio' or 'output_audio').
+
+    Returns:
+      A reference to the saved file, or None if saving failed.
+    """
     try:
       # Combine audio chunks into a single file
-      combined_audio_data = b''
-      mime_type = audio_cache[0].data.mime_type if audio_cache else 'audio/pcm'
-
-      for entry in audio_cache:
-        combined_audio_data += entry.data.data
+      combined_audio_data = b''.join(entry.data.data for entry in audio_cache)
+      mime_type = audio_cache[0].data.mime_type
 
       # Generate filename with timestamp from first audio chunk (when recording started)
       timestamp = int(audio_cache[0].timestamp * 1000)  # milliseconds
@@ -180,32 +327,14 @@ class AudioCacheManager:
       # Create artifact reference for session service
       artifact_ref = f'artifact://{invocation_context.app_name}/{invocation_context.user_id}/{invocation_context.session.id}/_adk_live/{filename}#{revision_id}'
 
-      # Create event with file data reference to add to session
-      audio_event = Event(
-          id=Event.new_id(),
-          invocation_id=invocation_context.invocation_id,
-          author=audio_cache[0].role,
-          content=types.Content(
-              role=audio_cache[0].role,
-              parts=[
-                  types.Part(
-                      file_data=types.FileData(
-                          file_uri=artifact_ref, mime_type=mime_type
-                      )
-                  )
-              ],
-          ),
-          timestamp=audio_cache[0].timestamp,
-      )
-
       logger.debug(
-          'Successfully flushed %s cache: %d chunks, %d bytes, saved as %s',
+          'Successfully saved %s cache: %d chunks, %d bytes, saved as %s',
           cache_type,
           len(audio_cache),
           len(combined_audio_data),
           filename,
       )
-      return audio_event
+      return types.FileData(file_uri=artifact_ref, mime_type=mime_type)
 
     except Exception as e:
       logger.error('Failed to flush %s cache: %s', cache_type, e)
@@ -227,11 +356,11 @@ class AudioCacheManager:
 
     input_bytes = sum(
         len(entry.data.data)
-        for entry in (invocation_context.input_realtime_cache or [])
+        for entry in invocation_context.input_realtime_cache or []
     )
     output_bytes = sum(
         len(entry.data.data)
-        for entry in (invocation_context.output_realtime_cache or [])
+        for entry in invocation_context.output_realtime_cache or []
     )
 
     return {
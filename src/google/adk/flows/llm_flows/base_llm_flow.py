@@ -248,6 +248,9 @@ class BaseLlmFlow(ABC):
         self.audio_cache_manager.cache_audio(
             invocation_context, live_request.blob, cache_type='input'
         )
+        await self.audio_cache_manager.spill_cache(
+            invocation_context, cache_type='input'
+        )
 
         await llm_connection.send_realtime(live_request.blob)
 
@@ -327,6 +330,9 @@ class BaseLlmFlow(ABC):
                   self.audio_cache_manager.cache_audio(
                       invocation_context, audio_blob, cache_type='output'
                   )
+                  await self.audio_cache_manager.spill_cache(
+                      invocation_context, cache_type='output'
+                  )
 
                 yield event
         # Give opportunity for other tasks to run.
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import bisect
 import copy
 import logging
 from typing import AsyncGenerator
@@ -267,6 +268,43 @@ def _should_include_event_in_context(
   )
 
 
+def _remove_superseded_compaction_events(
+    compaction_events: list[Event],
+) -> list[Event]:
+  """Returns the compaction events whose range no later one contains.
+
+  Args:
+    compaction_events: The compaction events, in the order they were appended.
+
+  Returns:
+    The compaction events that are not superseded, in the same order.
+  """
+  # The events are visited from the latest one, keeping the largest end
+  # timestamp of the visited ranges by start timestamp in a Fenwick tree, so
+  # that an event is superseded if a visited range starting no later than it
+  # ends no earlier than it.
+  starts = sorted(
+      {event.actions.compaction.start_timestamp for event in compaction_events}
+  )
+  max_ends = [float('-inf')] * (len(starts) + 1)
+  active_compaction_events = []
+  for event in reversed(compaction_events):
+    compaction = event.actions.compaction
+    i = bisect.bisect_right(starts, compaction.start_timestamp)
+    max_end = float('-inf')
+    while i > 0:
+      max_end = max(max_end, max_ends[i])
+      i -= i & -i
+    if max_end < compaction.end_timestamp:
+      active_compaction_events.append(event)
+    i = bisect.bisect_left(starts, compaction.start_timestamp) + 1
+    while i <= len(starts):
+      max_ends[i] = max(max_ends[i], compaction.end_timestamp)
+      i += i & -i
+  active_compaction_events.reverse()
+  return active_compaction_events
+
+
 def _process_compaction_events(events: list[Event]) -> list[Event]:
   """Processes events by applying compaction.
 
@@ -283,23 +321,57 @@ def _process_compaction_events(events: list[Event]) -> list[Event]:
   # [event_1(timestamp=1), event_2(timestamp=2),
   # compaction_1(event_1, event_2, timestamp=3), event_3(timestamp=4),
   # compaction_2(event_2, event_3, timestamp=5), event_4(timestamp=6)]
-  # for each compaction event, it only covers the events at most between the
-  # current compaction and the previous compaction. So during compaction, we
-  # don't have to go across compaction boundaries.
-  # Compaction events are always strictly in order based on event timestamp.
-  events_to_process = []
-  last_compaction_start_time = float('inf')
-
-  # Iterate in reverse to easily handle overlapping compactions.
-  for event in reversed(events):
-    if event.actions and event.actions.compaction:
-      compaction = event.actions.compaction
-      if (
-          compaction.start_timestamp is not None
-          and compaction.end_timestamp is not None
-      ):
-        # Create a new event for the compacted summary.
-        new_event = Event(
+  # Each summary replaces the events in its [start, end] timestamp range and
+  # is placed at its end timestamp. Events outside every range are kept, even
+  # if they were appended before the compaction event itself (e.g. the latest
+  # invocation kept verbatim by token-budget compaction, or events added while
+  # a background compaction was running). A summary whose range is contained
+  # in a later summary's range (an incremental summary that extends it) is
+  # superseded and dropped.
+  compaction_events = [
+      event
+      for event in events
+      if event.actions
+      and event.actions.compaction
+      and event.actions.compaction.start_timestamp is not None
+      and event.actions.compaction.end_timestamp is not None
+  ]
+  active_compaction_events = _remove_superseded_compaction_events(
+      compaction_events
+  )
+
+  # Merge the active ranges into sorted, disjoint ones, so that each event is
+  # looked up with a binary search.
+  range_starts: list[float] = []
+  range_ends: list[float] = []
+  for start, end in sorted(
+      (
+          event.actions.compaction.start_timestamp,
+          event.actions.compaction.end_timestamp,
+      )
+      for event in active_compaction_events
+  ):
+    if range_ends and start <= range_ends[-1]:
+      range_ends[-1] = max(range_ends[-1], end)
+    else:
+      range_starts.append(start)
+      range_ends.append(end)
+
+  def _is_compacted(timestamp: float) -> bool:
+    i = bisect.bisect_right(range_starts, timestamp) - 1
+    return i >= 0 and timestamp <= range_ends[i]
+
+  events_to_process = [
+      event
+      for event in events
+      if not (event.actions and event.actions.compaction)
+      and not _is_compacted(event.timestamp)
+  ]
+  for event in active_compaction_events:
+    compaction = event.actions.compaction
+    # Create a new event for the compacted summary.
+    events_to_process.append(
+        Event(
             timestamp=compaction.end_timestamp,
             author='model',
             content=compaction.compacted_content,
@@ -307,21 +379,9 @@ def _process_compaction_events(events: list[Event]) -> list[Event]:
             invocation_id=event.invocation_id,
             actions=event.actions,
         )
-        # Prepend to maintain chronological order in the final list.
-        events_to_process.insert(0, new_event)
-        # Update the boundary for filtering. Events with timestamps greater than
-        # or equal to this start time have been compacted.
-        last_compaction_start_time = min(
-            last_compaction_start_time, compaction.start_timestamp
-        )
-    elif event.timestamp < last_compaction_start_time:
-      # This event is not a compaction and is before the current compaction
-      # range. Prepend to maintain chronological order.
-      events_to_process.insert(0, event)
-    else:
-      # skip the event
-      pass
-
+    )
+  # Stable sort keeps same-timestamp events in their original order.
+  events_to_process.sort(key=lambda e: e.timestamp)
   return events_to_process
 
 
@@ -14,13 +14,33 @@
 
 """Defines the interface to support a model."""
 
-from .apigee_llm import ApigeeLlm
-from .base_llm import BaseLlm
-from .gemma_llm import Gemma
-from .google_llm import Gemini
-from .llm_request import LlmRequest
-from .llm_response import LlmResponse
-from .registry import LLMRegistry
+import importlib
+from typing import Any
+from typing import TYPE_CHECKING
+
+# The TYPE_CHECKING block is needed for autocomplete to work.
+if TYPE_CHECKING:
+  from .apigee_llm import ApigeeLlm
+  from .base_llm import BaseLlm
+  from .batching_llm import BatchingLlm
+  from .gemma_llm import Gemma
+  from .google_llm import Gemini
+  from .llm_request import LlmRequest
+  from .llm_response import LlmResponse
+  from .registry import LLMRegistry
+
+# The built-in models are registered with LLMRegistry without being imported,
+# see `registry._BUILTIN_LLMS`.
+_LAZY_MAPPING = {
+    'ApigeeLlm': ('.apigee_llm', 'ApigeeLlm'),
+    'BaseLlm': ('.base_llm', 'BaseLlm'),
+    'BatchingLlm': ('.batching_llm', 'BatchingLlm'),
+    'Gemini': ('.google_llm', 'Gemini'),
+    'Gemma': ('.gemma_llm', 'Gemma'),
+    'LlmRequest': ('.llm_request', 'LlmRequest'),
+    'LlmResponse': ('.llm_response', 'LlmResponse'),
+    'LLMRegistry': ('.registry', 'LLMRegistry'),
+}
 
 __all__ = [
     'BaseLlm',
@@ -30,6 +50,19 @@ __all__ = [
 ]
 
 
-LLMRegistry.register(Gemini)
-LLMRegistry.register(Gemma)
-LLMRegistry.register(ApigeeLlm)
+def __getattr__(name: str) -> Any:
+  """Lazy loads models to avoid expensive imports."""
+  if name not in _LAZY_MAPPING:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+  module_path, attr_name = _LAZY_MAPPING[name]
+  module = importlib.import_module(module_path, __name__)
+  attr = getattr(module, attr_name)
+  globals()[name] = attr
+  return attr
+
+
+# __dir__ is used to expose all public interfaces to keep mocking with autoscope
+# working.
+def __dir__() -> list[str]:
+  return list(globals().keys()) + __all__
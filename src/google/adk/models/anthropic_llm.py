@@ -16,10 +16,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
-from functools import cached_property
+import json
 import logging
 import os
+import threading
 from typing import Any
 from typing import AsyncGenerator
 from typing import Generator
@@ -29,13 +31,14 @@ from typing import Optional
 from typing import TYPE_CHECKING
 from typing import Union
 
-from anthropic import AnthropicVertex
+from anthropic import AsyncAnthropicVertex
 from anthropic import NOT_GIVEN
 from anthropic import types as anthropic_types
 from google.genai import types
 from pydantic import BaseModel
 from typing_extensions import override
 
+from ..utils._lazy_log import lazy_log
 from .base_llm import BaseLlm
 from .llm_response import LlmResponse
 
@@ -175,7 +178,7 @@ def message_to_generate_content_response(
   logger.info("Received response from Claude.")
   logger.debug(
       "Claude response: %s",
-      message.model_dump_json(indent=2, exclude_none=True),
+      lazy_log(message.model_dump_json, indent=2, exclude_none=True),
   )
 
   return LlmResponse(
@@ -195,6 +198,103 @@ def message_to_generate_content_response(
   )
 
 
+class _StreamedMessage:
+  """Accumulates the events of a streamed Claude message."""
+
+  def __init__(self):
+    self._blocks: dict[int, dict[str, Any]] = {}
+    self._input_tokens = 0
+    self._output_tokens = 0
+
+  def process_event(
+      self, event: anthropic_types.RawMessageStreamEvent
+  ) -> Optional[LlmResponse]:
+    """Processes a stream event, returning a partial response for new text."""
+    if isinstance(event, anthropic_types.RawMessageStartEvent):
+      self._input_tokens = event.message.usage.input_tokens
+      self._output_tokens = event.message.usage.output_tokens
+    elif isinstance(event, anthropic_types.RawContentBlockStartEvent):
+      block = event.content_block
+      if isinstance(block, anthropic_types.TextBlock):
+        self._blocks[event.index] = {"text": block.text}
+      elif isinstance(block, anthropic_types.ToolUseBlock):
+        self._blocks[event.index] = {
+            "id": block.id,
+            "name": block.name,
+            "input_json": "",
+        }
+    elif isinstance(event, anthropic_types.RawContentBlockDeltaEvent):
+      block = self._blocks.get(event.index)
+      delta = event.delta
+      if block is None:
+        return None
+      if isinstance(delta, anthropic_types.TextDelta) and "text" in block:
+        block["text"] += delta.text
+        return LlmResponse(
+            content=types.ModelContent(
+                parts=[types.Part.from_text(text=delta.text)]
+            ),
+            partial=True,
+        )
+      if (
+          isinstance(delta, anthropic_types.InputJSONDelta)
+          and "input_json" in block
+      ):
+        block["input_json"] += delta.partial_json
+    elif isinstance(event, anthropic_types.RawMessageDeltaEvent):
+      self._output_tokens = event.usage.output_tokens
+    return None
+
+  def to_llm_response(self) -> LlmResponse:
+    """Returns the response for the whole message."""
+    parts = []
+    for _, block in sorted(self._blocks.items()):
+      if "text" in block:
+        parts.append(types.Part.from_text(text=block["text"]))
+      else:
+        part = types.Part.from_function_call(
+            name=block["name"],
+            args=json.loads(block["input_json"] or "{}"),
+        )
+        part.function_call.id = block["id"]
+        parts.append(part)
+    return LlmResponse(
+        content=types.Content(role="model", parts=parts),
+        usage_metadata=types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=self._input_tokens,
+            candidates_token_count=self._output_tokens,
+            total_token_count=self._input_tokens + self._output_tokens,
+        ),
+    )
+
+
+# Keyed by project, region and the event loop they are bound to.
+_clients: dict[
+    tuple[str, str, asyncio.AbstractEventLoop], AsyncAnthropicVertex
+] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_shared_client(project_id: str, region: str) -> AsyncAnthropicVertex:
+  """Returns the client shared by Claude models of a project and region.
+
+  The connection pool of a client is bound to the event loop it is used on, so
+  each event loop gets its own client. The clients of closed loops are
+  forgotten, as their connections can only be closed on their loop.
+  """
+  loop = asyncio.get_running_loop()
+  key = (project_id, region, loop)
+  with _clients_lock:
+    client = _clients.get(key)
+    if client is None:
+      for stale_key in [k for k in _clients if k[2].is_closed()]:
+        del _clients[stale_key]
+      client = _clients[key] = AsyncAnthropicVertex(
+          project_id=project_id, region=region
+      )
+    return client
+
+
 def _update_type_string(value_dict: dict[str, Any]):
   """Updates 'type' field to expected JSON schema format."""
   if "type" in value_dict:
@@ -283,8 +383,7 @@ class Claude(BaseLlm):
         if llm_request.tools_dict
         else NOT_GIVEN
     )
-    # TODO(b/421255973): Enable streaming for anthropic models.
-    message = self._anthropic_client.messages.create(
+    request_args = dict(
         model=llm_request.model,
         system=llm_request.config.system_instruction,
         messages=messages,
@@ -292,10 +391,25 @@ class Claude(BaseLlm):
         tool_choice=tool_choice,
         max_tokens=self.max_tokens,
     )
-    yield message_to_generate_content_response(message)
-
-  @cached_property
-  def _anthropic_client(self) -> AnthropicVertex:
+    if not stream:
+      message = await self._anthropic_client.messages.create(**request_args)
+      yield message_to_generate_content_response(message)
+      return
+
+    streamed_message = _StreamedMessage()
+    events = await self._anthropic_client.messages.create(
+        **request_args, stream=True
+    )
+    async for event in events:
+      partial_response = streamed_message.process_event(event)
+      if partial_response:
+        yield partial_response
+    logger.info("Received streamed response from Claude.")
+    yield streamed_message.to_llm_response()
+
+  @property
+  def _anthropic_client(self) -> AsyncAnthropicVertex:
+    # Not cached on the model, which may be used on several event loops.
     if (
         "GOOGLE_CLOUD_PROJECT" not in os.environ
         or "GOOGLE_CLOUD_LOCATION" not in os.environ
@@ -305,7 +419,6 @@ class Claude(BaseLlm):
           " Anthropic on Vertex."
       )
 
-    return AnthropicVertex(
-        project_id=os.environ["GOOGLE_CLOUD_PROJECT"],
-        region=os.environ["GOOGLE_CLOUD_LOCATION"],
+    return _get_shared_client(
+        os.environ["GOOGLE_CLOUD_PROJECT"], os.environ["GOOGLE_CLOUD_LOCATION"]
     )
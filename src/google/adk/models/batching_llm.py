@@ -0,0 +1,368 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A model wrapper coalescing and rate limiting concurrent requests."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import hashlib
+import logging
+import threading
+import time
+from typing import Any
+from typing import AsyncGenerator
+from typing import Callable
+from typing import Optional
+from typing import Union
+
+from pydantic import Field
+from pydantic import PrivateAttr
+from typing_extensions import override
+
+from ..utils.feature_decorator import experimental
+from .base_llm import BaseLlm
+from .base_llm_connection import BaseLlmConnection
+from .llm_request import LlmRequest
+from .llm_response import LlmResponse
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+# Rough number of characters per token, used to estimate the tokens of a
+# request before it is sent.
+_CHARS_PER_TOKEN = 4
+
+
+class _TokenBucket:
+  """A token bucket refilled continuously up to its per-minute capacity.
+
+  Reservations may overdraw the bucket; callers then wait until the debt is
+  refilled, which serves them in the order they reserved in.
+  """
+
+  def __init__(self, per_minute: int, clock: Callable[[], float]):
+    self._capacity = float(per_minute)
+    self._rate = per_minute / 60
+    self._clock = clock
+    self._tokens = self._capacity
+    self._updated_at = clock()
+    self._lock = threading.Lock()
+
+  def reserve(self, amount: float) -> float:
+    """Takes amount tokens and returns how long to wait before using them."""
+    with self._lock:
+      self._refill()
+      # A request larger than the bucket only waits for a full bucket.
+      self._tokens -= min(amount, self._capacity)
+      return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+  def refund(self, amount: float) -> None:
+    """Returns tokens reserved in excess, or takes more if amount < 0."""
+    with self._lock:
+      self._refill()
+      self._tokens = min(self._tokens + amount, self._capacity)
+
+  def _refill(self) -> None:
+    now = self._clock()
+    self._tokens = min(
+        self._tokens + (now - self._updated_at) * self._rate, self._capacity
+    )
+    self._updated_at = now
+
+
+@dataclasses.dataclass
+class _LoopState:
+  """The state of the wrapper bound to one event loop."""
+
+  loop: asyncio.AbstractEventLoop
+  semaphore: asyncio.Semaphore
+  pending: list[
+      tuple[LlmRequest, Optional[str], asyncio.Future[LlmResponse]]
+  ] = dataclasses.field(default_factory=list)
+  in_flight: dict[str, asyncio.Future[LlmResponse]] = dataclasses.field(
+      default_factory=dict
+  )
+  flush_handle: Optional[asyncio.TimerHandle] = None
+  tasks: set[asyncio.Task[None]] = dataclasses.field(default_factory=set)
+
+
+def _get_request_key(llm_request: LlmRequest) -> Optional[str]:
+  """Returns the hash of the serialized request, if it is serializable."""
+  try:
+    serialized = llm_request.model_dump_json(exclude_none=True)
+  except ValueError:
+    # E.g. a response schema given as a class.
+    return None
+  return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def _estimate_tokens(llm_request: LlmRequest) -> int:
+  """Estimates the input and output tokens of a request from its text."""
+  chars = 0
+  system_instruction = llm_request.config.system_instruction
+  if isinstance(system_instruction, str):
+    chars += len(system_instruction)
+  for content in llm_request.contents:
+    for part in content.parts or []:
+      chars += len(part.text or '')
+  return chars // _CHARS_PER_TOKEN + (llm_request.config.max_output_tokens or 0)
+
+
+@experimental
+class BatchingLlm(BaseLlm):
+  """Coalesces and rate limits the requests sent to a model.
+
+  Concurrent non-streaming requests are collected for `batch_window_seconds`,
+  or until `max_batch_size` of them are pending, and sent together through
+  `_generate_batch`. By default, a batch is sent as concurrent requests of
+  which at most `max_concurrency` are in flight; subclasses may send it
+  through a batch endpoint of the provider instead. Identical requests in
+  flight at the same time are only sent once.
+
+  Each request waits for the rate limits of the model, if given, which are
+  tracked with token buckets. The tokens of a request are estimated from its
+  text and corrected with the usage reported in its response.
+
+  Streaming requests are rate limited but neither batched nor deduplicated.
+
+  Example:
+
+    agent = LlmAgent(
+        model=BatchingLlm(
+            llm=Gemini(model='gemini-2.5-flash'),
+            requests_per_minute=300,
+            tokens_per_minute=1_000_000,
+        ),
+        ...
+    )
+  """
+
+  model: str = ''
+  """The name of the model; defaults to the one of the wrapped model."""
+
+  llm: BaseLlm
+  """The wrapped model."""
+
+  max_concurrency: int = Field(default=8, ge=1)
+  """The maximum number of requests in flight to the wrapped model."""
+
+  requests_per_minute: Optional[int] = Field(default=None, ge=1)
+  """The request rate limit of the model, if any."""
+
+  tokens_per_minute: Optional[int] = Field(default=None, ge=1)
+  """The token rate limit of the model, if any."""
+
+  batch_window_seconds: float = Field(default=0.0, ge=0.0)
+  """How long requests are collected for before their batch is sent."""
+
+  max_batch_size: int = Field(default=16, ge=1)
+  """The number of pending requests sending their batch immediately."""
+
+  _state: Optional[_LoopState] = PrivateAttr(default=None)
+  _request_bucket: Optional[_TokenBucket] = PrivateAttr(default=None)
+  _token_bucket: Optional[_TokenBucket] = PrivateAttr(default=None)
+  _counters: collections.Counter[str] = PrivateAttr(
+      default_factory=collections.Counter
+  )
+  _throttled_seconds: float = PrivateAttr(default=0.0)
+
+  def model_post_init(self, context: Any) -> None:
+    if not self.model:
+      self.model = self.llm.model
+    if self.requests_per_minute:
+      self._request_bucket = _TokenBucket(
+          self.requests_per_minute, time.monotonic
+      )
+    if self.tokens_per_minute:
+      self._token_bucket = _TokenBucket(self.tokens_per_minute, time.monotonic)
+
+  @override
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    if stream:
+      state = self._get_state()
+      estimated_tokens = await self._wait_for_rate_limits(llm_request)
+      async with state.semaphore:
+        final_response = None
+        async for llm_response in self.llm.generate_content_async(
+            llm_request, stream=True
+        ):
+          final_response = llm_response
+          yield llm_response
+      self._reconcile_tokens(estimated_tokens, final_response)
+      return
+
+    state = self._get_state()
+    self._counters['requests'] += 1
+    key = _get_request_key(llm_request)
+    future = state.in_flight.get(key) if key else None
+    if future is not None:
+      self._counters['deduplicated'] += 1
+    else:
+      future = state.loop.create_future()
+      if key:
+        state.in_flight[key] = future
+      state.pending.append((llm_request, key, future))
+      self._schedule_flush(state)
+    # Shielded so that a cancelled caller doesn't cancel the request for the
+    # others awaiting it.
+    llm_response = await asyncio.shield(future)
+    # Callers sharing a response may modify it.
+    yield llm_response.model_copy(deep=True)
+
+  @override
+  def connect(self, llm_request: LlmRequest) -> BaseLlmConnection:
+    return self.llm.connect(llm_request)
+
+  def get_metrics(self) -> dict[str, Union[int, float]]:
+    """Returns the usage counters of the wrapper.
+
+    Returns:
+      A dictionary containing:
+      - requests: Non-streaming requests received
+      - deduplicated: Requests served by an identical one in flight
+      - batches: Batches sent
+      - throttled_seconds: Total time requests waited for the rate limits
+    """
+    return {
+        'requests': self._counters['requests'],
+        'deduplicated': self._counters['deduplicated'],
+        'batches': self._counters['batches'],
+        'throttled_seconds': self._throttled_seconds,
+    }
+
+  async def _generate_batch(
+      self, llm_requests: list[LlmRequest]
+  ) -> list[Union[LlmResponse, BaseException]]:
+    """Sends a batch of requests to the wrapped model.
+
+    Args:
+      llm_requests: The requests of the batch.
+
+    Returns:
+      The response to each request, or the exception it failed with.
+    """
+    return await asyncio.gather(
+        *(self._generate_one(llm_request) for llm_request in llm_requests),
+        return_exceptions=True,
+    )
+
+  async def _generate_one(self, llm_request: LlmRequest) -> LlmResponse:
+    state = self._get_state()
+    estimated_tokens = await self._wait_for_rate_limits(llm_request)
+    async with state.semaphore:
+      final_response = None
+      async for llm_response in self.llm.generate_content_async(
+          llm_request, stream=False
+      ):
+        final_response = llm_response
+    if final_response is None:
+      raise ValueError(f'{self.model} returned no response.')
+    self._reconcile_tokens(estimated_tokens, final_response)
+    return final_response
+
+  async def _wait_for_rate_limits(self, llm_request: LlmRequest) -> int:
+    """Waits until the request fits the rate limits.
+
+    Returns:
+      The tokens reserved for the request.
+    """
+    delay = 0.0
+    estimated_tokens = 0
+    if self._request_bucket:
+      delay = self._request_bucket.reserve(1)
+    if self._token_bucket:
+      estimated_tokens = _estimate_tokens(llm_request)
+      delay = max(delay, self._token_bucket.reserve(estimated_tokens))
+    if delay > 0:
+      self._throttled_seconds += delay
+      logger.debug('Delaying request to %s by %.2fs.', self.model, delay)
+      await asyncio.sleep(delay)
+    return estimated_tokens
+
+  def _reconcile_tokens(
+      self, estimated_tokens: int, llm_response: Optional[LlmResponse]
+  ) -> None:
+    if (
+        not self._token_bucket
+        or not llm_response
+        or not llm_response.usage_metadata
+        or llm_response.usage_metadata.total_token_count is None
+    ):
+      return
+    self._token_bucket.refund(
+        estimated_tokens - llm_response.usage_metadata.total_token_count
+    )
+
+  def _get_state(self) -> _LoopState:
+    loop = asyncio.get_running_loop()
+    if self._state is None or self._state.loop is not loop:
+      # Futures and semaphores are bound to the event loop they are used on.
+      self._state = _LoopState(
+          loop=loop, semaphore=asyncio.Semaphore(self.max_concurrency)
+      )
+    return self._state
+
+  def _schedule_flush(self, state: _LoopState) -> None:
+    if len(state.pending) >= self.max_batch_size:
+      self._flush(state)
+    elif state.flush_handle is None:
+      state.flush_handle = state.loop.call_later(
+          self.batch_window_seconds, self._flush, state
+      )
+
+  def _flush(self, state: _LoopState) -> None:
+    if state.flush_handle is not None:
+      state.flush_handle.cancel()
+      state.flush_handle = None
+    while state.pending:
+      batch = state.pending[: self.max_batch_size]
+      del state.pending[: self.max_batch_size]
+      task = state.loop.create_task(self._send_batch(state, batch))
+      state.tasks.add(task)
+      task.add_done_callback(state.tasks.discard)
+
+  async def _send_batch(
+      self,
+      state: _LoopState,
+      batch: list[
+          tuple[LlmRequest, Optional[str], asyncio.Future[LlmResponse]]
+      ],
+  ) -> None:
+    self._counters['batches'] += 1
+    try:
+      results = await self._generate_batch(
+          [llm_request for llm_request, _, _ in batch]
+      )
+    except Exception as e:
+      results = [e] * len(batch)
+    except BaseException as e:
+      # E.g. a cancellation, which cancels the requests of the batch too.
+      results = [e] * len(batch)
+      raise
+    finally:
+      for (_, key, future), result in zip(batch, results):
+        if key and state.in_flight.get(key) is future:
+          del state.in_flight[key]
+        if future.done():
+          continue
+        if isinstance(result, asyncio.CancelledError):
+          future.cancel()
+        elif isinstance(result, BaseException):
+          future.set_exception(result)
+        else:
+          future.set_result(result)
@@ -0,0 +1,318 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide registry of the live context caches."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import threading
+import time
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import TypeVar
+
+from ..utils.feature_decorator import experimental
+from .cache_metadata import CacheMetadata
+
+_T = TypeVar("_T")
+
+# Caches expiring sooner than this are not handed out to new sessions, as they
+# would likely expire before the request using them reaches the model.
+_MIN_REMAINING_TTL_SECONDS = 60
+
+
+@dataclasses.dataclass
+class _LiveCache:
+  metadata: CacheMetadata
+  key: Hashable
+  refcount: int = 0
+
+
+@experimental
+class ContextCacheRegistry:
+  """Tracks the context caches created in the process.
+
+  Caches are keyed by the cached prefix, i.e. the client scope, the model and
+  the fingerprint of the system instruction, tools and cached contents. All
+  sessions sending the same prefix share one cache, which is refcounted so
+  that it is only deleted once no session uses it anymore. Concurrent
+  creations and TTL extensions of the same cache are run once. Expired caches
+  are forgotten whenever a cache is acquired or released.
+  """
+
+  def __init__(self, *, clock: Callable[[], float] = time.time):
+    self._clock = clock
+    self._lock = threading.Lock()
+    self._caches: dict[str, _LiveCache] = {}
+    self._names_by_key: dict[Hashable, str] = {}
+    self._in_flight: dict[
+        Hashable, tuple[asyncio.AbstractEventLoop, asyncio.Task[Any]]
+    ] = {}
+    self._counters: collections.Counter[str] = collections.Counter()
+
+  async def acquire(
+      self,
+      key: Hashable,
+      create: Callable[[], Awaitable[CacheMetadata]],
+  ) -> CacheMetadata:
+    """Returns a live cache for key, creating it if there is none.
+
+    Args:
+      key: Identifies the cached prefix.
+      create: Creates the cache if there is no live one and no creation for
+        key is in flight.
+
+    Returns:
+      The metadata of the cache, with `invocations_used` set to 1.
+    """
+    with self._lock:
+      self._remove_expired()
+      live = self._get_live(key)
+      if live is not None:
+        live.refcount += 1
+        self._counters["joins"] += 1
+        return live.metadata.model_copy(update={"invocations_used": 1})
+
+    is_leader, metadata = await self._run_once(
+        ("create", key), lambda: self._create(key, create)
+    )
+    with self._lock:
+      live = self._caches.get(metadata.cache_name)
+      if live is not None:
+        live.refcount += 1
+      self._counters["creations" if is_leader else "joins"] += 1
+    return metadata.model_copy(update={"invocations_used": 1})
+
+  async def extend(
+      self,
+      cache_metadata: CacheMetadata,
+      key: Hashable,
+      ttl_seconds: int,
+      update: Callable[[], Awaitable[None]],
+  ) -> float:
+    """Extends the TTL of a cache, unless another session just did.
+
+    Args:
+      cache_metadata: The metadata of the cache as known to the session.
+      key: Identifies the cached prefix.
+      ttl_seconds: The TTL the cache is extended by.
+      update: Extends the TTL of the cache through the caches API.
+
+    Returns:
+      The new expire time of the cache.
+    """
+    name = cache_metadata.cache_name
+    with self._lock:
+      live = self._caches.get(name)
+      if live is not None and (
+          live.metadata.expire_time - self._clock() >= ttl_seconds / 2
+      ):
+        self._counters["reuses"] += 1
+        return live.metadata.expire_time
+
+    async def run() -> float:
+      await update()
+      return self._clock() + ttl_seconds
+
+    is_leader, expire_time = await self._run_once(("extend", name), run)
+    with self._lock:
+      live = self._caches.get(name)
+      if live is None:
+        # Caches created before the registry knew of them, e.g. by a previous
+        # process, are adopted by the session extending them.
+        live = _LiveCache(metadata=cache_metadata, key=key, refcount=1)
+        self._caches[name] = live
+        self._names_by_key.setdefault(key, name)
+      live.metadata = live.metadata.model_copy(
+          update={"expire_time": max(live.metadata.expire_time, expire_time)}
+      )
+      self._counters["extensions" if is_leader else "reuses"] += 1
+      return live.metadata.expire_time
+
+  def get_expire_time(self, cache_name: str) -> Optional[float]:
+    """Returns the expire time of a cache, if it is known to the registry."""
+    with self._lock:
+      live = self._caches.get(cache_name)
+      return live.metadata.expire_time if live is not None else None
+
+  def record_reuse(self) -> None:
+    """Records a request served by the cache its session already uses."""
+    with self._lock:
+      self._counters["reuses"] += 1
+
+  def release(self, cache_name: str) -> bool:
+    """Releases a session's reference to a cache.
+
+    Args:
+      cache_name: The name of the cache the session stops using.
+
+    Returns:
+      Whether the cache should be deleted, i.e. no other session uses it.
+    """
+    with self._lock:
+      self._counters["releases"] += 1
+      self._remove_expired()
+      live = self._caches.get(cache_name)
+      if live is None:
+        return True
+      live.refcount -= 1
+      if live.refcount > 0:
+        return False
+      self._remove(cache_name)
+      return True
+
+  def discard(self, cache_name: str) -> None:
+    """Forgets a cache that was deleted or has expired."""
+    with self._lock:
+      self._remove(cache_name)
+
+  def record_deletion(self) -> None:
+    """Records the deletion of a cache through the caches API."""
+    with self._lock:
+      self._counters["deletions"] += 1
+
+  def get_metrics(self) -> dict[str, Any]:
+    """Returns the usage counters of the registry.
+
+    Returns:
+      A dictionary containing:
+      - live_caches: Number of caches currently tracked
+      - reuses: Requests served by the cache their session already used
+      - joins: Sessions that started using a cache created by another one
+      - creations: Caches created
+      - extensions: TTL extensions made through the caches API
+      - releases: Session references to caches released
+      - deletions: Caches deleted
+      - hit_rate: Fraction of cached requests that didn't create a cache
+    """
+    with self._lock:
+      counters = {
+          name: self._counters[name]
+          for name in (
+              "reuses",
+              "joins",
+              "creations",
+              "extensions",
+              "releases",
+              "deletions",
+          )
+      }
+      live_caches = len(self._caches)
+    hits = counters["reuses"] + counters["joins"] + counters["extensions"]
+    total = hits + counters["creations"]
+    return {
+        "live_caches": live_caches,
+        **counters,
+        "hit_rate": hits / total if total else 0.0,
+    }
+
+  def clear(self) -> None:
+    """Forgets all caches and resets the counters."""
+    with self._lock:
+      self._caches.clear()
+      self._names_by_key.clear()
+      self._counters.clear()
+
+  def _get_live(self, key: Hashable) -> Optional[_LiveCache]:
+    name = self._names_by_key.get(key)
+    if name is None:
+      return None
+    live = self._caches[name]
+    remaining = live.metadata.expire_time - self._clock()
+    if remaining <= 0:
+      self._remove(name)
+      return None
+    if remaining < _MIN_REMAINING_TTL_SECONDS:
+      return None
+    return live
+
+  def _remove_expired(self) -> None:
+    """Forgets the caches that have expired, whether or not they are used."""
+    now = self._clock()
+    expired = [
+        name
+        for name, live in self._caches.items()
+        if live.metadata.expire_time <= now
+    ]
+    for name in expired:
+      self._remove(name)
+
+  def _remove(self, cache_name: str) -> None:
+    live = self._caches.pop(cache_name, None)
+    if live is not None and self._names_by_key.get(live.key) == cache_name:
+      del self._names_by_key[live.key]
+
+  async def _create(
+      self,
+      key: Hashable,
+      create: Callable[[], Awaitable[CacheMetadata]],
+  ) -> CacheMetadata:
+    metadata = await create()
+    with self._lock:
+      self._caches[metadata.cache_name] = _LiveCache(metadata=metadata, key=key)
+      # A newer cache replaces one about to expire for new sessions.
+      self._names_by_key[key] = metadata.cache_name
+    return metadata
+
+  async def _run_once(
+      self, flight_key: Hashable, operation: Callable[[], Awaitable[_T]]
+  ) -> tuple[bool, _T]:
+    """Runs operation, unless one for flight_key is already in flight.
+
+    Returns:
+      Whether this caller ran the operation, and its result.
+    """
+    loop = asyncio.get_running_loop()
+    with self._lock:
+      flight = self._in_flight.get(flight_key)
+      if flight is not None and flight[0] is loop:
+        is_leader = False
+        task = flight[1]
+      else:
+        # An operation in flight on another loop cannot be awaited from this
+        # one, so it is replaced rather than joined.
+        is_leader = True
+        task = loop.create_task(self._run(flight_key, operation))
+        self._in_flight[flight_key] = (loop, task)
+    # Shielded so that a cancelled caller doesn't cancel the operation for
+    # the others awaiting it.
+    return is_leader, await asyncio.shield(task)
+
+  async def _run(
+      self, flight_key: Hashable, operation: Callable[[], Awaitable[_T]]
+  ) -> _T:
+    try:
+      return await operation()
+    finally:
+      with self._lock:
+        flight = self._in_flight.get(flight_key)
+        if flight and flight[1] is asyncio.current_task():
+          del self._in_flight[flight_key]
+
+
+_default_registry: Optional[ContextCacheRegistry] = None
+
+
+def get_context_cache_registry() -> ContextCacheRegistry:
+  """Returns the registry shared by all context cache managers."""
+  global _default_registry
+  if _default_registry is None:
+    _default_registry = ContextCacheRegistry()
+  return _default_registry
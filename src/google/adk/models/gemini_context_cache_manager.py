@@ -27,6 +27,8 @@ from google.genai import types
 
 from ..utils.feature_decorator import experimental
 from .cache_metadata import CacheMetadata
+from .context_cache_registry import ContextCacheRegistry
+from .context_cache_registry import get_context_cache_registry
 from .llm_request import LlmRequest
 from .llm_response import LlmResponse
 
@@ -35,6 +37,10 @@ logger = logging.getLogger("google_adk." + __name__)
 if TYPE_CHECKING:
   from google.genai import Client
 
+# Valid caches expiring sooner than this have their TTL extended, so that a
+# cache in use doesn't expire between two requests of a session.
+_EXTEND_BEFORE_EXPIRY_SECONDS = 120
+
 
 @experimental
 class GeminiContextCacheManager:
@@ -45,13 +51,20 @@ class GeminiContextCacheManager:
   cache compatibility and implements efficient caching strategies.
   """
 
-  def __init__(self, genai_client: Client):
+  def __init__(
+      self,
+      genai_client: Client,
+      registry: Optional[ContextCacheRegistry] = None,
+  ):
     """Initialize cache manager with shared client.
 
     Args:
         genai_client: The GenAI client to use for cache operations.
+        registry: The registry of live caches. Defaults to the one shared by
+          all managers in the process.
     """
     self.genai_client = genai_client
+    self.registry = registry or get_context_cache_registry()
 
   async def handle_context_caching(
       self, llm_request: LlmRequest
@@ -60,7 +73,9 @@ class GeminiContextCacheManager:
 
     Validates existing cache or creates a new one if needed. Applies
     the cache to the request by setting cached_content and removing cached
-    contents from the request.
+    contents from the request. Caches whose contents are unchanged are
+    extended rather than recreated, and sessions sending the same prefix
+    share one cache through the registry.
 
     Args:
         llm_request: Request that may contain cache config and metadata.
@@ -81,32 +96,64 @@ class GeminiContextCacheManager:
             "Cache is valid, reusing cache: %s",
             llm_request.cache_metadata.cache_name,
         )
-        cache_name = llm_request.cache_metadata.cache_name
-        cache_contents_count = llm_request.cache_metadata.contents_count
+        cache_metadata = llm_request.cache_metadata.model_copy()
+        if (
+            cache_metadata.expire_time - time.time()
+            < _EXTEND_BEFORE_EXPIRY_SECONDS
+        ):
+          # Hot caches are extended before they expire under the session.
+          expire_time = await self._extend_cache(llm_request, cache_metadata)
+          if expire_time is not None:
+            cache_metadata = cache_metadata.model_copy(
+                update={"expire_time": expire_time}
+            )
+        else:
+          self.registry.record_reuse()
         self._apply_cache_to_request(
-            llm_request, cache_name, cache_contents_count
+            llm_request,
+            cache_metadata.cache_name,
+            cache_metadata.contents_count,
         )
-        return llm_request.cache_metadata.model_copy()
+        return cache_metadata
       else:
-        # Invalid cache - clean it up and check if we should create new one
         old_cache_metadata = llm_request.cache_metadata
 
-        # Only cleanup if there's an active cache
-        if old_cache_metadata.cache_name is not None:
-          logger.debug(
-              "Cache is invalid, cleaning up: %s",
-              old_cache_metadata.cache_name,
-          )
-          await self.cleanup_cache(old_cache_metadata.cache_name)
-
         # Calculate current fingerprint using contents count from old metadata
         cache_contents_count = old_cache_metadata.contents_count
         current_fingerprint = self._generate_cache_fingerprint(
             llm_request, cache_contents_count
         )
+        fingerprint_matches = (
+            current_fingerprint == old_cache_metadata.fingerprint
+        )
+
+        if old_cache_metadata.cache_name is not None:
+          if fingerprint_matches:
+            # The contents are unchanged, so the cache is extended rather
+            # than deleted and created again.
+            expire_time = await self._extend_cache(
+                llm_request, old_cache_metadata
+            )
+            if expire_time is not None:
+              logger.debug(
+                  "Cache is invalid but unchanged, extended: %s",
+                  old_cache_metadata.cache_name,
+              )
+              cache_metadata = old_cache_metadata.model_copy(
+                  update={"expire_time": expire_time, "invocations_used": 1}
+              )
+              self._apply_cache_to_request(
+                  llm_request, cache_metadata.cache_name, cache_contents_count
+              )
+              return cache_metadata
+          logger.debug(
+              "Cache is invalid, releasing: %s",
+              old_cache_metadata.cache_name,
+          )
+          await self._release_cache(old_cache_metadata.cache_name)
 
         # If fingerprints match, create new cache (expired but same content)
-        if current_fingerprint == old_cache_metadata.fingerprint:
+        if fingerprint_matches:
           logger.debug(
               "Fingerprints match after invalidation, creating new cache"
           )
@@ -305,12 +352,97 @@ class GeminiContextCacheManager:
       return None
 
     try:
-      # Create cache using Gemini API directly
-      return await self._create_gemini_cache(llm_request, cache_contents_count)
+      # Sessions sending the same prefix share the cache, and concurrent
+      # requests for it wait for a single creation.
+      return await self.registry.acquire(
+          self._get_registry_key(llm_request, cache_contents_count),
+          lambda: self._create_gemini_cache(llm_request, cache_contents_count),
+      )
     except Exception as e:
       logger.warning("Failed to create cache: %s", e)
       return None
 
+  def _get_registry_key(
+      self, llm_request: LlmRequest, cache_contents_count: int
+  ) -> tuple:
+    """Returns the key of the cached prefix of the request in the registry.
+
+    Caches are only visible to the project or API key that created them, so
+    the key includes the scope of the client.
+    """
+    api_client = getattr(self.genai_client, "_api_client", None)
+    if api_client is None:
+      client_scope = ("client", id(self.genai_client))
+    else:
+      api_key = getattr(api_client, "api_key", None)
+      client_scope = (
+          getattr(api_client, "vertexai", None),
+          getattr(api_client, "project", None),
+          getattr(api_client, "location", None),
+          hashlib.sha256(api_key.encode()).hexdigest() if api_key else None,
+      )
+    return (
+        client_scope,
+        llm_request.model,
+        self._generate_cache_fingerprint(llm_request, cache_contents_count),
+        cache_contents_count,
+    )
+
+  async def _extend_cache(
+      self, llm_request: LlmRequest, cache_metadata: CacheMetadata
+  ) -> Optional[float]:
+    """Extend the TTL of a cache that hasn't expired yet.
+
+    Args:
+        llm_request: Request using the cache
+        cache_metadata: Metadata of the cache to extend
+
+    Returns:
+        The new expire time, or None if the cache can't be extended
+    """
+    cache_name = cache_metadata.cache_name
+    expire_time = max(
+        cache_metadata.expire_time,
+        self.registry.get_expire_time(cache_name) or 0,
+    )
+    if time.time() >= expire_time:
+      logger.info("Cache expired: %s", cache_name)
+      self.registry.discard(cache_name)
+      return None
+
+    ttl_seconds = llm_request.cache_config.ttl_seconds
+
+    async def update() -> None:
+      await self.genai_client.aio.caches.update(
+          name=cache_name,
+          config=types.UpdateCachedContentConfig(
+              ttl=llm_request.cache_config.ttl_string
+          ),
+      )
+      logger.info("Cache TTL extended: %s", cache_name)
+
+    try:
+      return await self.registry.extend(
+          cache_metadata,
+          self._get_registry_key(llm_request, cache_metadata.contents_count),
+          ttl_seconds,
+          update,
+      )
+    except Exception as e:
+      logger.warning("Failed to extend cache %s: %s", cache_name, e)
+      return None
+
+  async def _release_cache(self, cache_name: str) -> None:
+    """Release a session's use of a cache, deleting it if no one else uses it.
+
+    Args:
+        cache_name: Name of cache to release
+    """
+    if self.registry.release(cache_name):
+      await self.cleanup_cache(cache_name)
+    else:
+      logger.debug("Cache still used by other sessions: %s", cache_name)
+
   def _estimate_request_tokens(self, llm_request: LlmRequest) -> int:
     """Estimate token count for the request.
 
@@ -426,9 +558,11 @@ class GeminiContextCacheManager:
     logger.debug("Attempting to delete cache: %s", cache_name)
     try:
       await self.genai_client.aio.caches.delete(name=cache_name)
+      self.registry.record_deletion()
       logger.info("Cache cleaned up: %s", cache_name)
     except Exception as e:
       logger.warning("Failed to cleanup cache %s: %s", cache_name, e)
+    self.registry.discard(cache_name)
 
   def _apply_cache_to_request(
       self,
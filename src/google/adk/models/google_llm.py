@@ -31,6 +31,7 @@ from google.genai import types
 from typing_extensions import override
 
 from .. import version
+from ..utils._lazy_log import lazy_log
 from ..utils.context_utils import Aclosing
 from ..utils.streaming_utils import StreamingResponseAggregator
 from ..utils.variant_utils import GoogleLLMVariant
@@ -137,7 +138,7 @@ class Gemini(BaseLlm):
         self._api_backend,
         stream,
     )
-    logger.debug(_build_request_log(llm_request))
+    logger.debug(lazy_log(_build_request_log, llm_request))
 
     # Always add tracking headers to custom headers given it will override
     # the headers set in the api client constructor to avoid tracking headers
@@ -164,7 +165,7 @@ class Gemini(BaseLlm):
       aggregator = StreamingResponseAggregator()
       async with Aclosing(responses) as agen:
         async for response in agen:
-          logger.debug(_build_response_log(response))
+          logger.debug(lazy_log(_build_response_log, response))
           async with Aclosing(
               aggregator.process_response(response)
           ) as aggregator_gen:
@@ -185,7 +186,7 @@ class Gemini(BaseLlm):
           config=llm_request.config,
       )
       logger.info('Response received from the model.')
-      logger.debug(_build_response_log(response))
+      logger.debug(lazy_log(_build_response_log, response))
 
       llm_response = LlmResponse.create(response)
       if cache_metadata:
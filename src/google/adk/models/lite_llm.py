@@ -52,6 +52,7 @@ from pydantic import BaseModel
 from pydantic import Field
 from typing_extensions import override
 
+from ..utils._lazy_log import lazy_log
 from .base_llm import BaseLlm
 from .llm_request import LlmRequest
 from .llm_response import LlmResponse
@@ -1028,7 +1029,7 @@ class LiteLlm(BaseLlm):
 
     self._maybe_append_user_content(llm_request)
     _append_fallback_user_content_if_missing(llm_request)
-    logger.debug(_build_request_log(llm_request))
+    logger.debug(lazy_log(_build_request_log, llm_request))
 
     messages, tools, response_format, generation_params = (
         _get_completion_inputs(llm_request)
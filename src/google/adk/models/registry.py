@@ -17,8 +17,10 @@
 from __future__ import annotations
 
 from functools import lru_cache
+import importlib
 import logging
 import re
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -34,6 +36,37 @@ Key is the regex that matches the model name.
 Value is the class that implements the model.
 """
 
+# The models shipped with ADK, registered on the first resolution instead of
+# when `google.adk.models` is imported, as they pull in the genai client.
+_BUILTIN_LLMS = (
+    ('.google_llm', 'Gemini'),
+    ('.gemma_llm', 'Gemma'),
+    ('.apigee_llm', 'ApigeeLlm'),
+)
+_builtin_llms_registered = False
+_builtin_llms_lock = threading.Lock()
+
+
+def _register_builtin_llms() -> None:
+  """Registers the built-in models ahead of the ones registered so far."""
+  global _llm_registry_dict, _builtin_llms_registered
+  if _builtin_llms_registered:
+    return
+  with _builtin_llms_lock:
+    if _builtin_llms_registered:
+      return
+    builtin_registry_dict = {}
+    for module_path, class_name in _BUILTIN_LLMS:
+      llm_cls = getattr(
+          importlib.import_module(module_path, __package__), class_name
+      )
+      for regex in llm_cls.supported_models():
+        builtin_registry_dict[regex] = llm_cls
+    # Classes registered for the same regex by users still take precedence,
+    # while the built-in ones are matched first as if registered on import.
+    _llm_registry_dict = {**builtin_registry_dict, **_llm_registry_dict}
+    _builtin_llms_registered = True
+
 
 class LLMRegistry:
   """Registry for LLMs."""
@@ -95,6 +128,7 @@ class LLMRegistry:
         ValueError: If the model is not found.
     """
 
+    _register_builtin_llms()
     for regex, llm_class in _llm_registry_dict.items():
       if re.compile(regex).fullmatch(model):
         return llm_class
@@ -2,7 +2,7 @@
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
-# You may in obtain a copy of the License at
+# You may obtain a copy of the License at
 #
 #     http://www.apache.org/licenses/LICENSE-2.0
 #
@@ -12,14 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .base_plugin import BasePlugin
-from .logging_plugin import LoggingPlugin
-from .plugin_manager import PluginManager
-from .reflect_retry_tool_plugin import ReflectAndRetryToolPlugin
-
-__all__ = [
-    'BasePlugin',
-    'LoggingPlugin',
-    'PluginManager',
-    'ReflectAndRetryToolPlugin',
-]
+import importlib
+from typing import Any
+from typing import TYPE_CHECKING
+
+# The TYPE_CHECKING block is needed for autocomplete to work.
+if TYPE_CHECKING:
+  from .base_plugin import BasePlugin
+  from .logging_plugin import LoggingPlugin
+  from .plugin_manager import PluginManager
+  from .reflect_retry_tool_plugin import ReflectAndRetryToolPlugin
+  from .response_cache_plugin import ResponseCachePlugin
+  from .tool_result_cache_plugin import ToolResultCachePlugin
+
+_LAZY_MAPPING = {
+    'BasePlugin': ('.base_plugin', 'BasePlugin'),
+    'LoggingPlugin': ('.logging_plugin', 'LoggingPlugin'),
+    'PluginManager': ('.plugin_manager', 'PluginManager'),
+    'ReflectAndRetryToolPlugin': (
+        '.reflect_retry_tool_plugin',
+        'ReflectAndRetryToolPlugin',
+    ),
+    'ResponseCachePlugin': ('.response_cache_plugin', 'ResponseCachePlugin'),
+    'ToolResultCachePlugin': (
+        '.tool_result_cache_plugin',
+        'ToolResultCachePlugin',
+    ),
+}
+
+__all__ = list(_LAZY_MAPPING.keys())
+
+
+def __getattr__(name: str) -> Any:
+  """Lazy loads plugins to avoid expensive imports."""
+  if name not in _LAZY_MAPPING:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+  module_path, attr_name = _LAZY_MAPPING[name]
+  module = importlib.import_module(module_path, __name__)
+  attr = getattr(module, attr_name)
+  globals()[name] = attr
+  return attr
+
+
+# __dir__ is used to expose all public interfaces to keep mocking with autoscope
+# working.
+def __dir__() -> list[str]:
+  return list(globals().keys()) + __all__
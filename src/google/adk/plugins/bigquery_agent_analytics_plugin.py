@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import dataclasses
 from datetime import datetime
 from datetime import timezone
@@ -22,6 +23,7 @@ import logging
 from typing import Any
 from typing import Callable
 from typing import List
+from typing import Literal
 from typing import Optional
 from typing import TYPE_CHECKING
 
@@ -216,6 +218,15 @@ class BigQueryLoggerConfig:
     shutdown_timeout: Seconds to wait for logs to flush during shutdown.
     client_close_timeout: Seconds to wait for BQ client to close.
     max_content_length: The maximum length of content parts before truncation.
+    batch_size: The number of buffered rows that triggers a flush. Each flush
+      writes at most this many rows per Arrow record batch.
+    batch_flush_interval: Maximum seconds a row may sit in the buffer before
+      it is flushed, even if batch_size has not been reached.
+    max_buffer_size: Maximum number of rows held in memory waiting to be
+      written.
+    overflow_policy: What to do when the buffer is full. "drop_oldest"
+      discards the oldest buffered row to make room; "block" makes the logging
+      callback wait until the writer frees space.
   """
 
   enabled: bool = True
@@ -225,6 +236,31 @@ class BigQueryLoggerConfig:
   shutdown_timeout: float = 5.0
   client_close_timeout: float = 2.0
   max_content_length: int = 500
+  batch_size: int = 50
+  batch_flush_interval: float = 1.0
+  max_buffer_size: int = 10000
+  overflow_policy: Literal["drop_oldest", "block"] = "drop_oldest"
+
+
+@dataclasses.dataclass
+class BigQueryWriteStats:
+  """Counters describing the state of the plugin's write buffer.
+
+  Attributes:
+    rows_enqueued: Rows accepted into the buffer.
+    rows_dropped: Rows discarded because the buffer was full.
+    rows_flushed: Rows acknowledged by BigQuery.
+    rows_failed: Rows whose write failed and were discarded.
+    batches_flushed: Record batches acknowledged by BigQuery.
+    buffered_rows: Rows currently waiting in the buffer.
+  """
+
+  rows_enqueued: int = 0
+  rows_dropped: int = 0
+  rows_flushed: int = 0
+  rows_failed: int = 0
+  batches_flushed: int = 0
+  buffered_rows: int = 0
 
 
 # --- Helper Formatters ---
@@ -277,6 +313,94 @@ def _format_args(args: dict[str, Any], max_len: int = 1000) -> str:
   return s[:max_len] + "..." if len(s) > max_len else s
 
 
+class _AppendRowsStream:
+  """A long-lived append_rows connection to a BigQuery write stream.
+
+  Requests are fed to a single bidirectional append_rows call through an
+  async iterator, so the writer schema is only sent once per connection and
+  no new RPC is opened per batch. Responses are matched to requests in order.
+  If the connection breaks, pending appends fail and the next append opens a
+  new connection.
+  """
+
+  def __init__(
+      self,
+      write_client: BigQueryWriteAsyncClient,
+      write_stream: str,
+      serialized_schema: bytes,
+  ):
+    self._write_client = write_client
+    self._write_stream = write_stream
+    self._serialized_schema = serialized_schema
+    self._requests: asyncio.Queue | None = None
+    self._pending: collections.deque[asyncio.Future] = collections.deque()
+    self._reader_task: asyncio.Task | None = None
+
+  @property
+  def is_open(self) -> bool:
+    return self._reader_task is not None and not self._reader_task.done()
+
+  async def _request_iter(self, requests: asyncio.Queue):
+    while True:
+      req = await requests.get()
+      if req is None:
+        return
+      yield req
+
+  async def _open(self):
+    self._requests = asyncio.Queue()
+    responses = await asyncio.shield(
+        self._write_client.append_rows(self._request_iter(self._requests))
+    )
+    self._reader_task = asyncio.create_task(self._read_responses(responses))
+
+  async def _read_responses(self, responses):
+    error: BaseException | None = None
+    try:
+      async for resp in responses:
+        if self._pending:
+          fut = self._pending.popleft()
+          if not fut.done():
+            fut.set_result(resp)
+    except Exception as e:
+      error = e
+    finally:
+      # The connection is gone; fail whatever was still waiting on it.
+      while self._pending:
+        fut = self._pending.popleft()
+        if not fut.done():
+          fut.set_exception(
+              error or RuntimeError("append_rows stream closed unexpectedly")
+          )
+
+  async def append(self, serialized_record_batch: bytes):
+    """Sends one record batch and waits for its AppendRowsResponse."""
+    first_request = not self.is_open
+    if first_request:
+      await self._open()
+    req = bq_storage_types.AppendRowsRequest()
+    if first_request:
+      req.write_stream = self._write_stream
+      req.arrow_rows.writer_schema.serialized_schema = self._serialized_schema
+    req.arrow_rows.rows.serialized_record_batch = serialized_record_batch
+    fut = asyncio.get_running_loop().create_future()
+    self._pending.append(fut)
+    self._requests.put_nowait(req)
+    return await fut
+
+  async def close(self, timeout: float):
+    """Half-closes the request stream and waits for outstanding responses."""
+    if self._requests is not None:
+      self._requests.put_nowait(None)
+    if self._reader_task is not None:
+      try:
+        await asyncio.wait_for(asyncio.shield(self._reader_task), timeout)
+      except asyncio.TimeoutError:
+        self._reader_task.cancel()
+    self._requests = None
+    self._reader_task = None
+
+
 class BigQueryAgentAnalyticsPlugin(BasePlugin):
   """A plugin that logs agent analytic events to Google BigQuery.
 
@@ -286,9 +410,11 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
 
   It uses the BigQuery Write API for efficient, high-throughput streaming
   ingestion and is designed to be non-blocking, ensuring that logging
-  operations do not impact agent performance. If the destination table does
-  not exist, the plugin will attempt to create it based on a predefined
-  schema.
+  operations do not impact agent performance. Rows are buffered in memory and
+  flushed by a single background writer as multi-row Arrow record batches over
+  one long-lived append stream, either when `batch_size` rows are buffered or
+  every `batch_flush_interval` seconds. If the destination table does not
+  exist, the plugin will attempt to create it based on a predefined schema.
   """
 
   def __init__(
@@ -319,7 +445,14 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
     self._write_client: BigQueryWriteAsyncClient | None = None
     self._init_lock: asyncio.Lock | None = None
     self._arrow_schema: pa.Schema | None = None
-    self._background_tasks: set[asyncio.Task] = set()
+    self._append_stream: _AppendRowsStream | None = None
+    self._buffer: collections.deque[dict] = collections.deque()
+    self._stats = BigQueryWriteStats()
+    self._flush_task: asyncio.Task | None = None
+    self._flush_lock: asyncio.Lock | None = None
+    self._flush_requested: asyncio.Event | None = None
+    self._space_available: asyncio.Event | None = None
+    self._loop: asyncio.AbstractEventLoop | None = None
     self._is_shutting_down = False
     self._schema = [
         bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
@@ -397,35 +530,99 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
         logging.error("BQ Plugin: Init Failed:", exc_info=True)
         return False
 
-  async def _perform_write(self, row: dict):
-    """Actual async write operation, intended to run as a background task."""
+  @property
+  def write_stats(self) -> BigQueryWriteStats:
+    """Returns a snapshot of the write buffer counters."""
+    return dataclasses.replace(self._stats, buffered_rows=len(self._buffer))
+
+  def _ensure_writer(self):
+    """Starts the background writer on the running event loop if needed."""
+    loop = asyncio.get_running_loop()
+    if self._loop is loop and self._flush_task and not self._flush_task.done():
+      return
+    if self._loop is not loop:
+      # Primitives and any open stream are bound to the previous loop.
+      self._append_stream = None
+      self._flush_lock = asyncio.Lock()
+      self._flush_requested = asyncio.Event()
+      self._space_available = asyncio.Event()
+      self._loop = loop
+    self._flush_task = asyncio.create_task(self._flush_loop())
+
+  async def _flush_loop(self):
+    """Flushes the buffer on size or interval until the plugin shuts down."""
+    while True:
+      try:
+        await asyncio.wait_for(
+            self._flush_requested.wait(),
+            timeout=self._config.batch_flush_interval,
+        )
+      except asyncio.TimeoutError:
+        pass
+      self._flush_requested.clear()
+      await self.flush()
+
+  async def _enqueue(self, row: dict):
+    """Adds a row to the buffer, applying the configured overflow policy."""
+    max_size = max(1, self._config.max_buffer_size)
+    while len(self._buffer) >= max_size:
+      if self._config.overflow_policy == "block":
+        self._flush_requested.set()
+        self._space_available.clear()
+        await self._space_available.wait()
+        continue
+      self._buffer.popleft()
+      self._stats.rows_dropped += 1
+    self._buffer.append(row)
+    self._stats.rows_enqueued += 1
+    if len(self._buffer) >= self._config.batch_size:
+      self._flush_requested.set()
+
+  async def flush(self):
+    """Writes all currently buffered rows to BigQuery."""
+    if not self._flush_lock:
+      return
+    async with self._flush_lock:
+      while self._buffer:
+        batch_size = max(1, self._config.batch_size)
+        rows = [
+            self._buffer.popleft()
+            for _ in range(min(batch_size, len(self._buffer)))
+        ]
+        self._space_available.set()
+        if await self._write_rows(rows):
+          self._stats.rows_flushed += len(rows)
+          self._stats.batches_flushed += 1
+        else:
+          self._stats.rows_failed += len(rows)
+
+  async def _write_rows(self, rows: list[dict]) -> bool:
+    """Writes rows as one Arrow record batch. Returns True on success."""
     try:
       if (
           not await self._ensure_init()
           or not self._write_client
           or not self._arrow_schema
       ):
-        return
+        return False
+
+      if not self._append_stream:
+        self._append_stream = _AppendRowsStream(
+            self._write_client,
+            f"projects/{self._project_id}/datasets/{self._dataset_id}/tables/{self._table_id}/_default",
+            self._arrow_schema.serialize().to_pybytes(),
+        )
 
       # Serialize
-      pydict = {f.name: [row.get(f.name)] for f in self._arrow_schema}
+      pydict = {
+          f.name: [row.get(f.name) for row in rows] for f in self._arrow_schema
+      }
       batch = pa.RecordBatch.from_pydict(pydict, schema=self._arrow_schema)
-      req = bq_storage_types.AppendRowsRequest(
-          write_stream=f"projects/{self._project_id}/datasets/{self._dataset_id}/tables/{self._table_id}/_default"
-      )
-      req.arrow_rows.writer_schema.serialized_schema = (
-          self._arrow_schema.serialize().to_pybytes()
-      )
-      req.arrow_rows.rows.serialized_record_batch = (
-          batch.serialize().to_pybytes()
-      )
-
-      # Write with protection against immediate cancellation
-      async for resp in await asyncio.shield(
-          self._write_client.append_rows(iter([req]))
-      ):
-        if resp.error.code != 0:
-          logging.error(f"BQ Plugin: Write Error: {resp.error.message}")
+      resp = await self._append_stream.append(batch.serialize().to_pybytes())
+      if resp.error.code != 0:
+        logging.error(f"BQ Plugin: Write Error: {resp.error.message}")
+        return False
+      return True
 
     except RuntimeError as e:
       if "Event loop is closed" not in str(e) and not self._is_shutting_down:
@@ -433,11 +630,13 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
     except asyncio.CancelledError:
       if not self._is_shutting_down:
         logging.warning("BQ Plugin: Write task cancelled unexpectedly.")
+      raise
     except Exception as e:
       logging.error("BQ Plugin: Write Failed:", exc_info=True)
+    return False
 
   async def _log(self, data: dict):
-    """Schedules a log entry to be written in the background."""
+    """Buffers a log entry to be written in the background."""
     if not self._config.enabled:
       return
     event_type = data.get("event_type")
@@ -465,10 +664,8 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
     }
     row.update(data)
 
-    # Fire and forget: Create task and track it
-    task = asyncio.create_task(self._perform_write(row))
-    self._background_tasks.add(task)
-    task.add_done_callback(self._background_tasks.discard)
+    self._ensure_writer()
+    await self._enqueue(row)
 
   async def close(self):
     """Flushes pending logs and closes client."""
@@ -477,18 +674,32 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
     self._is_shutting_down = True
     logging.info("BQ Plugin: Shutdown started.")
 
-    if self._background_tasks:
-      logging.info(
-          f"BQ Plugin: Flushing {len(self._background_tasks)} pending logs..."
+    if self._buffer:
+      logging.info(f"BQ Plugin: Flushing {len(self._buffer)} pending logs...")
+    try:
+      # Also waits for a write that the background writer has in flight.
+      await asyncio.wait_for(
+          self.flush(), timeout=self._config.shutdown_timeout
       )
+    except asyncio.TimeoutError:
+      logging.warning("BQ Plugin: Timeout waiting for logs to flush.")
+    except Exception as e:
+      logging.warning("BQ Plugin: Error flushing logs:", exc_info=True)
+
+    if self._flush_task:
+      self._flush_task.cancel()
       try:
-        await asyncio.wait(
-            self._background_tasks, timeout=self._config.shutdown_timeout
-        )
-      except asyncio.TimeoutError:
-        logging.warning("BQ Plugin: Timeout waiting for logs to flush.")
+        await self._flush_task
+      except (asyncio.CancelledError, Exception):
+        pass
+      self._flush_task = None
+
+    if self._append_stream:
+      try:
+        await self._append_stream.close(self._config.client_close_timeout)
       except Exception as e:
-        logging.warning("BQ Plugin: Error flushing logs:", exc_info=True)
+        logging.warning(f"BQ Plugin: Error closing append stream: {e}")
+      self._append_stream = None
 
     # Use getattr for safe access in case transport is not present.
     if self._write_client and getattr(self._write_client, "transport", None):
@@ -0,0 +1,376 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Storage backends of the caching plugins."""
+
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+import asyncio
+import collections
+from contextlib import asynccontextmanager
+import dataclasses
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import AsyncIterator
+from typing import Callable
+from typing import Optional
+from typing import Union
+
+import aiosqlite
+
+from ..utils.feature_decorator import experimental
+
+
+@experimental
+class BaseCacheBackend(ABC):
+  """Stores serialized cache values by key, each with an optional TTL."""
+
+  @abstractmethod
+  async def get(self, key: str) -> Optional[str]:
+    """Returns the value stored for key, unless missing or expired."""
+
+  @abstractmethod
+  async def set(
+      self, key: str, value: str, ttl_seconds: Optional[float] = None
+  ) -> None:
+    """Stores value for key, for ttl_seconds if given."""
+
+  @abstractmethod
+  async def delete(self, key: str) -> None:
+    """Removes the value stored for key, if any."""
+
+  @abstractmethod
+  async def clear(self) -> None:
+    """Removes all values."""
+
+
+@dataclasses.dataclass
+class _Entry:
+  value: str
+  expires_at: Optional[float]
+
+
+@experimental
+class InMemoryCacheBackend(BaseCacheBackend):
+  """Keeps values in memory, evicting the least recently used ones."""
+
+  def __init__(
+      self,
+      *,
+      max_entries: Optional[int] = 1024,
+      max_bytes: Optional[int] = None,
+      clock: Callable[[], float] = time.time,
+  ):
+    """Initializes the backend.
+
+    Args:
+      max_entries: The maximum number of values kept, if bounded.
+      max_bytes: The maximum total size of the values kept, if bounded.
+        Values larger than it are not stored.
+      clock: The clock expiries are measured with.
+    """
+    self._max_entries = max_entries
+    self._max_bytes = max_bytes
+    self._clock = clock
+    self._entries: collections.OrderedDict[str, _Entry] = (
+        collections.OrderedDict()
+    )
+    self._size = 0
+    self._lock = threading.Lock()
+
+  @property
+  def size_bytes(self) -> int:
+    """The total size of the values kept."""
+    return self._size
+
+  async def get(self, key: str) -> Optional[str]:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      if entry.expires_at is not None and entry.expires_at <= self._clock():
+        self._remove(key)
+        return None
+      self._entries.move_to_end(key)
+      return entry.value
+
+  async def set(
+      self, key: str, value: str, ttl_seconds: Optional[float] = None
+  ) -> None:
+    with self._lock:
+      self._remove(key)
+      if self._max_bytes is not None and len(value) > self._max_bytes:
+        return
+      self._entries[key] = _Entry(
+          value=value,
+          expires_at=(
+              self._clock() + ttl_seconds if ttl_seconds is not None else None
+          ),
+      )
+      self._size += len(value)
+      while (
+          self._max_entries is not None
+          and len(self._entries) > self._max_entries
+      ) or (self._max_bytes is not None and self._size > self._max_bytes):
+        self._remove(next(iter(self._entries)))
+
+  async def delete(self, key: str) -> None:
+    with self._lock:
+      self._remove(key)
+
+  async def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+      self._size = 0
+
+  def _remove(self, key: str) -> None:
+    entry = self._entries.pop(key, None)
+    if entry is not None:
+      self._size -= len(entry.value)
+
+
+_CREATE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_entries_accessed_at
+    ON cache_entries (accessed_at);
+"""
+
+
+@experimental
+class SqliteCacheBackend(BaseCacheBackend):
+  """Keeps values in an SQLite database, shared by the processes using it."""
+
+  def __init__(
+      self,
+      db_path: Union[str, Path],
+      *,
+      max_entries: Optional[int] = 10_000,
+      clock: Callable[[], float] = time.time,
+  ):
+    """Initializes the backend.
+
+    Args:
+      db_path: The path of the database file, created if missing.
+      max_entries: The maximum number of values kept, if bounded. The least
+        recently used ones are evicted first.
+      clock: The clock expiries are measured with.
+    """
+    self._db_path = str(db_path)
+    self._max_entries = max_entries
+    self._clock = clock
+    self._schema_created = False
+
+  async def get(self, key: str) -> Optional[str]:
+    now = self._clock()
+    async with self._connect() as db:
+      async with db.execute(
+          "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+      ) as cursor:
+        row = await cursor.fetchone()
+      if row is None:
+        return None
+      value, expires_at = row
+      if expires_at is not None and expires_at <= now:
+        await db.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        await db.commit()
+        return None
+      await db.execute(
+          "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+      )
+      await db.commit()
+      return value
+
+  async def set(
+      self, key: str, value: str, ttl_seconds: Optional[float] = None
+  ) -> None:
+    now = self._clock()
+    async with self._connect() as db:
+      await db.execute(
+          "INSERT OR REPLACE INTO cache_entries (key, value, expires_at,"
+          " accessed_at) VALUES (?, ?, ?, ?)",
+          (
+              key,
+              value,
+              now + ttl_seconds if ttl_seconds is not None else None,
+              now,
+          ),
+      )
+      await db.execute(
+          "DELETE FROM cache_entries WHERE expires_at <= ?", (now,)
+      )
+      if self._max_entries is not None:
+        await db.execute(
+            "DELETE FROM cache_entries WHERE key IN (SELECT key FROM"
+            " cache_entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        )
+      await db.commit()
+
+  async def delete(self, key: str) -> None:
+    async with self._connect() as db:
+      await db.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+      await db.commit()
+
+  async def clear(self) -> None:
+    async with self._connect() as db:
+      await db.execute("DELETE FROM cache_entries")
+      await db.commit()
+
+  @asynccontextmanager
+  async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
+    """Connects to the database, creating its schema on first use."""
+    async with aiosqlite.connect(self._db_path) as db:
+      if not self._schema_created:
+        await db.executescript(_CREATE_SCHEMA_SQL)
+        self._schema_created = True
+      yield db
+
+
+@experimental
+class DiskCacheBackend(BaseCacheBackend):
+  """Keeps values as files in a directory, one per key."""
+
+  def __init__(
+      self,
+      directory: Union[str, Path],
+      *,
+      max_bytes: Optional[int] = 256 * 1024 * 1024,
+      clock: Callable[[], float] = time.time,
+  ):
+    """Initializes the backend.
+
+    Args:
+      directory: The directory of the files, created if missing.
+      max_bytes: The maximum total size of the files, if bounded. The least
+        recently used ones are evicted first.
+      clock: The clock expiries are measured with.
+    """
+    self._directory = Path(directory)
+    self._max_bytes = max_bytes
+    self._clock = clock
+    self._lock = threading.Lock()
+    # The total size of the files, counted on the first write.
+    self._size: Optional[int] = None
+
+  async def get(self, key: str) -> Optional[str]:
+    return await asyncio.to_thread(self._get, key)
+
+  async def set(
+      self, key: str, value: str, ttl_seconds: Optional[float] = None
+  ) -> None:
+    await asyncio.to_thread(self._set, key, value, ttl_seconds)
+
+  async def delete(self, key: str) -> None:
+    await asyncio.to_thread(self._delete, key)
+
+  async def clear(self) -> None:
+    await asyncio.to_thread(self._clear)
+
+  def _get_path(self, key: str) -> Path:
+    # Keys are hashes or other file-name safe strings.
+    return self._directory / f"{key}.json"
+
+  def _get(self, key: str) -> Optional[str]:
+    path = self._get_path(key)
+    try:
+      entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+      return None
+    expires_at = entry.get("expires_at")
+    if expires_at is not None and expires_at <= self._clock():
+      self._delete(key)
+      return None
+    try:
+      # The modification time orders the files by last use for eviction.
+      os.utime(path)
+    except OSError:
+      pass
+    return entry["value"]
+
+  def _set(self, key: str, value: str, ttl_seconds: Optional[float]) -> None:
+    self._directory.mkdir(parents=True, exist_ok=True)
+    data = json.dumps({
+        "expires_at": (
+            self._clock() + ttl_seconds if ttl_seconds is not None else None
+        ),
+        "value": value,
+    }).encode("utf-8")
+    if self._max_bytes is not None and len(data) > self._max_bytes:
+      return
+    path = self._get_path(key)
+    # Written to a temporary file first so that readers never see a partial
+    # value.
+    temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    temp_path.write_bytes(data)
+    with self._lock:
+      if self._size is None:
+        self._size = sum(size for _, size, _ in self._list_files())
+      self._size -= self._get_file_size(path)
+      os.replace(temp_path, path)
+      # Counted in bytes, as the file sizes the total is recomputed from.
+      self._size += len(data)
+      if self._max_bytes is not None and self._size > self._max_bytes:
+        self._evict()
+
+  def _delete(self, key: str) -> None:
+    path = self._get_path(key)
+    with self._lock:
+      if self._size is not None:
+        self._size -= self._get_file_size(path)
+      path.unlink(missing_ok=True)
+
+  def _evict(self) -> None:
+    """Removes the least recently used files until they fit the bound."""
+    if self._max_bytes is None:
+      return
+    files = sorted(self._list_files())
+    # Other processes may have written to the directory too.
+    self._size = sum(size for _, size, _ in files)
+    for _, size, path in files:
+      if self._size <= self._max_bytes:
+        break
+      path.unlink(missing_ok=True)
+      self._size -= size
+
+  def _list_files(self) -> list[tuple[float, int, Path]]:
+    files = []
+    for path in self._directory.glob("*.json"):
+      try:
+        stat = path.stat()
+      except OSError:
+        continue
+      files.append((stat.st_mtime, stat.st_size, path))
+    return files
+
+  def _get_file_size(self, path: Path) -> int:
+    try:
+      return path.stat().st_size
+    except OSError:
+      return 0
+
+  def _clear(self) -> None:
+    with self._lock:
+      for path in self._directory.glob("*.json"):
+        path.unlink(missing_ok=True)
+      self._size = 0
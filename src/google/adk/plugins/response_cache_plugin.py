@@ -0,0 +1,256 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import json
+import logging
+from typing import Any
+from typing import Collection
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from ..agents.callback_context import CallbackContext
+from ..models.llm_request import LlmRequest
+from ..models.llm_response import LlmResponse
+from ..utils.feature_decorator import experimental
+from .base_plugin import BasePlugin
+from .cache_backends import BaseCacheBackend
+from .cache_backends import InMemoryCacheBackend
+
+if TYPE_CHECKING:
+  from ..agents.invocation_context import InvocationContext
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# Set in the custom metadata of the responses served from the cache.
+RESPONSE_CACHE_HIT_METADATA_KEY = "adk_response_cache_hit"
+
+# The number of model calls awaiting their response that are remembered.
+_MAX_PENDING_KEYS = 1024
+
+
+def get_response_cache_key(llm_request: LlmRequest) -> Optional[str]:
+  """Returns the cache key of a request, if it can be serialized.
+
+  The key is a hash of the model, the generation config, including the system
+  instruction and tools, and the contents of the request.
+  """
+  try:
+    request = llm_request.model_dump(
+        mode="json",
+        include={"model", "config", "contents"},
+        exclude_none=True,
+    )
+    serialized = json.dumps(request, sort_keys=True, separators=(",", ":"))
+  except (TypeError, ValueError):
+    # E.g. a response schema given as a class.
+    return None
+  return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+@experimental
+class ResponseCachePlugin(BasePlugin):
+  """Serves repeated model requests from a cache.
+
+  Responses are cached by a hash of the model, config, system instruction,
+  tools and contents of their request, so an identical request, e.g. from a
+  classification or routing agent or from a rerun of an evaluation, is
+  answered without calling the model. Responses served from the cache have
+  `RESPONSE_CACHE_HIT_METADATA_KEY` set in their custom metadata.
+
+  Only requests with a temperature of 0 are cached by default, as other ones
+  are expected to get varying responses. Partial, interrupted and error
+  responses are never cached.
+
+  Example:
+
+    runner = Runner(
+        app=App(
+            name="my_app",
+            root_agent=root_agent,
+            plugins=[
+                ResponseCachePlugin(
+                    agent_names=["router"],
+                    backend=SqliteCacheBackend("responses.db"),
+                    ttl_seconds=24 * 60 * 60,
+                )
+            ],
+        ),
+        ...
+    )
+  """
+
+  def __init__(
+      self,
+      *,
+      agent_names: Optional[Collection[str]] = None,
+      backend: Optional[BaseCacheBackend] = None,
+      ttl_seconds: Optional[float] = None,
+      deterministic_only: bool = True,
+      name: str = "response_cache_plugin",
+  ):
+    """Initializes the plugin.
+
+    Args:
+      agent_names: The names of the agents whose requests are cached, or None
+        to cache the requests of all agents.
+      backend: Where responses are stored. Defaults to an in-memory LRU of
+        1024 responses.
+      ttl_seconds: How long responses are served from the cache, if bounded.
+      deterministic_only: Whether to only cache requests with a temperature of
+        0.
+      name: The name of the plugin instance.
+    """
+    super().__init__(name)
+    self._agent_names = (
+        frozenset(agent_names) if agent_names is not None else None
+    )
+    self._backend = backend or InMemoryCacheBackend()
+    self._ttl_seconds = ttl_seconds
+    self._deterministic_only = deterministic_only
+    # Keyed by the model call in progress, the cache key of its request, in
+    # the order the calls started.
+    self._pending_keys: collections.OrderedDict[
+        tuple[str, Optional[str], str], str
+    ] = collections.OrderedDict()
+    self._counters: collections.Counter[str] = collections.Counter()
+
+  async def before_model_callback(
+      self, *, callback_context: CallbackContext, llm_request: LlmRequest
+  ) -> Optional[LlmResponse]:
+    """Returns the cached response to the request, if any."""
+    call_id = self._get_call_id(callback_context)
+    # The response to a previous call of the agent may never have reached
+    # after_model_callback, e.g. if another callback answered the request.
+    self._pending_keys.pop(call_id, None)
+    if not self._is_cacheable(callback_context, llm_request):
+      return None
+    key = get_response_cache_key(llm_request)
+    if key is None:
+      return None
+
+    try:
+      cached = await self._backend.get(key)
+    except Exception as e:
+      logger.warning("Failed to read the response cache: %s", e)
+      cached = None
+    if cached is not None:
+      self._counters["hits"] += 1
+      llm_response = LlmResponse.model_validate_json(cached)
+      llm_response.custom_metadata = {
+          **(llm_response.custom_metadata or {}),
+          RESPONSE_CACHE_HIT_METADATA_KEY: True,
+      }
+      return llm_response
+
+    self._counters["misses"] += 1
+    self._pending_keys[call_id] = key
+    # Calls of invocations that were aborted before their run ended are
+    # forgotten eventually.
+    while len(self._pending_keys) > _MAX_PENDING_KEYS:
+      self._pending_keys.popitem(last=False)
+    return None
+
+  async def after_model_callback(
+      self, *, callback_context: CallbackContext, llm_response: LlmResponse
+  ) -> Optional[LlmResponse]:
+    """Caches the final response to a cacheable request."""
+    if llm_response.partial:
+      return None
+    key = self._pending_keys.pop(self._get_call_id(callback_context), None)
+    if (
+        key is None
+        or llm_response.error_code
+        or llm_response.interrupted
+        or not llm_response.content
+    ):
+      return None
+
+    try:
+      await self._backend.set(
+          key,
+          llm_response.model_dump_json(exclude_none=True),
+          ttl_seconds=self._ttl_seconds,
+      )
+      self._counters["writes"] += 1
+    except Exception as e:
+      logger.warning("Failed to write the response cache: %s", e)
+    return None
+
+  async def on_model_error_callback(
+      self,
+      *,
+      callback_context: CallbackContext,
+      llm_request: LlmRequest,
+      error: Exception,
+  ) -> Optional[LlmResponse]:
+    self._pending_keys.pop(self._get_call_id(callback_context), None)
+    return None
+
+  async def after_run_callback(
+      self, *, invocation_context: InvocationContext
+  ) -> None:
+    """Forgets the model calls of the invocation still awaiting a response."""
+    for call_id in [
+        call_id
+        for call_id in self._pending_keys
+        if call_id[0] == invocation_context.invocation_id
+    ]:
+      del self._pending_keys[call_id]
+
+  def get_metrics(self) -> dict[str, Any]:
+    """Returns the usage counters of the cache.
+
+    Returns:
+      A dictionary containing:
+      - hits: Requests served from the cache
+      - misses: Cacheable requests sent to the model
+      - writes: Responses stored in the cache
+      - hit_rate: Fraction of cacheable requests served from the cache
+    """
+    hits = self._counters["hits"]
+    misses = self._counters["misses"]
+    return {
+        "hits": hits,
+        "misses": misses,
+        "writes": self._counters["writes"],
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+    }
+
+  def _is_cacheable(
+      self, callback_context: CallbackContext, llm_request: LlmRequest
+  ) -> bool:
+    if (
+        self._agent_names is not None
+        and callback_context.agent_name not in self._agent_names
+    ):
+      return False
+    if self._deterministic_only and (
+        not llm_request.config or llm_request.config.temperature != 0
+    ):
+      return False
+    return True
+
+  def _get_call_id(
+      self, callback_context: CallbackContext
+  ) -> tuple[str, Optional[str], str]:
+    # The model calls of an agent in a branch of an invocation are sequential.
+    return (
+        callback_context.invocation_id,
+        callback_context._invocation_context.branch,
+        callback_context.agent_name,
+    )
@@ -0,0 +1,243 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import json
+import logging
+from typing import Any
+from typing import Mapping
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from ..tools.base_tool import BaseTool
+from ..tools.tool_cache_config import ToolCacheConfig
+from ..tools.tool_context import ToolContext
+from ..utils.feature_decorator import experimental
+from .base_plugin import BasePlugin
+from .cache_backends import InMemoryCacheBackend
+
+if TYPE_CHECKING:
+  from ..agents.invocation_context import InvocationContext
+
+logger = logging.getLogger("google_adk." + __name__)
+
+
+# The number of ids, from the app down to the invocation, identifying who a
+# result cached in each scope is shared with.
+_SCOPE_DEPTHS = {"app": 1, "user": 2, "session": 3, "invocation": 4}
+
+
+def _get_cache_key(
+    tool: BaseTool,
+    tool_args: dict[str, Any],
+    config: ToolCacheConfig,
+    tool_context: ToolContext,
+) -> Optional[str]:
+  """Returns the cache key of a tool call, if its arguments are serializable.
+
+  The key is a hash of the scope of the result, the name of the tool and its
+  arguments, serialized with sorted keys so that their order doesn't matter.
+  """
+  invocation_context = tool_context._invocation_context
+  scope_ids = [
+      invocation_context.app_name,
+      invocation_context.user_id,
+      invocation_context.session.id,
+      invocation_context.invocation_id,
+  ][: _SCOPE_DEPTHS[config.scope]]
+  try:
+    serialized = json.dumps(
+        [scope_ids, tool.name, tool_args],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+  except (TypeError, ValueError):
+    return None
+  return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _has_side_effects(tool_context: ToolContext) -> bool:
+  """Whether the call did more than return its result."""
+  actions = tool_context.actions
+  return bool(
+      actions.state_delta
+      or actions.artifact_delta
+      or actions.requested_auth_configs
+      or actions.requested_tool_confirmations
+      or actions.transfer_to_agent
+      or actions.escalate
+      or actions.skip_summarization
+  )
+
+
+def _is_error(result: dict[str, Any]) -> bool:
+  return "error" in result or result.get("status") == "ERROR"
+
+
+@experimental
+class ToolResultCachePlugin(BasePlugin):
+  """Serves repeated calls of idempotent tools from a cache.
+
+  A tool is cached if it declares a `cache_config`, as e.g. the metadata tools
+  of the BigQuery, Spanner and Bigtable toolsets do, or if one is given for
+  its name to the plugin, e.g. for MCP tools. Results are cached by the name of
+  the tool and its arguments within the scope of the config: an invocation, a
+  session, a user or the whole app, and expire after its TTL, if any.
+
+  Results are kept in memory, within a budget of `max_bytes` over which the
+  least recently used ones are evicted. Errors, and the results of calls
+  which requested credentials or a confirmation, changed the state or
+  artifacts, or transferred control, are never cached.
+
+  Example:
+
+    runner = Runner(
+        app=App(
+            name="my_app",
+            root_agent=root_agent,
+            plugins=[
+                ToolResultCachePlugin(
+                    tool_configs={
+                        "lookup_customer": ToolCacheConfig(ttl_seconds=60)
+                    },
+                )
+            ],
+        ),
+        ...
+    )
+  """
+
+  def __init__(
+      self,
+      *,
+      tool_configs: Optional[Mapping[str, ToolCacheConfig]] = None,
+      max_bytes: int = 64 * 1024 * 1024,
+      name: str = "tool_result_cache_plugin",
+  ):
+    """Initializes the plugin.
+
+    Args:
+      tool_configs: The cache configs of tools by name, overriding the ones
+        they declare.
+      max_bytes: The maximum total size of the cached results, serialized.
+      name: The name of the plugin instance.
+    """
+    super().__init__(name)
+    self._tool_configs = dict(tool_configs or {})
+    self._backend = InMemoryCacheBackend(max_entries=None, max_bytes=max_bytes)
+    # Keyed by the id of the tool call in progress, the cache key and config
+    # of its result.
+    self._pending_keys: dict[str, tuple[str, ToolCacheConfig]] = {}
+    # Keyed by invocation id, the keys of its invocation-scoped results, which
+    # are dropped when it ends.
+    self._invocation_keys: dict[str, set[str]] = collections.defaultdict(set)
+    self._counters: collections.Counter[str] = collections.Counter()
+
+  async def before_tool_callback(
+      self,
+      *,
+      tool: BaseTool,
+      tool_args: dict[str, Any],
+      tool_context: ToolContext,
+  ) -> Optional[dict]:
+    """Returns the cached result of the call, if any."""
+    config = self._tool_configs.get(tool.name, tool.cache_config)
+    if config is None or tool_context.function_call_id is None:
+      return None
+    key = _get_cache_key(tool, tool_args, config, tool_context)
+    if key is None:
+      return None
+
+    cached = await self._backend.get(key)
+    if cached is not None:
+      self._counters["hits"] += 1
+      return json.loads(cached)
+
+    self._counters["misses"] += 1
+    self._pending_keys[tool_context.function_call_id] = (key, config)
+    return None
+
+  async def after_tool_callback(
+      self,
+      *,
+      tool: BaseTool,
+      tool_args: dict[str, Any],
+      tool_context: ToolContext,
+      result: dict,
+  ) -> Optional[dict]:
+    """Caches the result of a cacheable call."""
+    if tool_context.function_call_id is None:
+      return None
+    pending = self._pending_keys.pop(tool_context.function_call_id, None)
+    if pending is None or _has_side_effects(tool_context):
+      return None
+    key, config = pending
+    if not isinstance(result, dict):
+      # Wrapped as it is in the function response.
+      result = {"result": result}
+    if _is_error(result):
+      return None
+
+    try:
+      serialized = json.dumps(result)
+    except (TypeError, ValueError):
+      logger.debug("Not caching the unserializable result of %s.", tool.name)
+      return None
+    await self._backend.set(key, serialized, ttl_seconds=config.ttl_seconds)
+    self._counters["writes"] += 1
+    if config.scope == "invocation":
+      self._invocation_keys[tool_context.invocation_id].add(key)
+    return None
+
+  async def on_tool_error_callback(
+      self,
+      *,
+      tool: BaseTool,
+      tool_args: dict[str, Any],
+      tool_context: ToolContext,
+      error: Exception,
+  ) -> Optional[dict]:
+    if tool_context.function_call_id is not None:
+      self._pending_keys.pop(tool_context.function_call_id, None)
+    return None
+
+  async def after_run_callback(
+      self, *, invocation_context: InvocationContext
+  ) -> None:
+    for key in self._invocation_keys.pop(invocation_context.invocation_id, ()):
+      await self._backend.delete(key)
+
+  def get_metrics(self) -> dict[str, Any]:
+    """Returns the usage counters of the cache.
+
+    Returns:
+      A dictionary containing:
+      - hits: Calls served from the cache
+      - misses: Cacheable calls run by their tool
+      - writes: Results stored in the cache
+      - hit_rate: Fraction of cacheable calls served from the cache
+      - size_bytes: Total size of the cached results
+    """
+    hits = self._counters["hits"]
+    misses = self._counters["misses"]
+    return {
+        "hits": hits,
+        "misses": misses,
+        "writes": self._counters["writes"],
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        "size_bytes": self._backend.size_bytes,
+    }
@@ -19,6 +19,7 @@ import inspect
 import logging
 from pathlib import Path
 import queue
+import sys
 from typing import Any
 from typing import AsyncGenerator
 from typing import Callable
@@ -27,7 +28,7 @@ from typing import List
 from typing import Optional
 import warnings
 
-from google.adk.apps.compaction import _run_compaction_for_sliding_window
+from google.adk.apps.compaction import CompactionScheduler
 from google.adk.artifacts import artifact_util
 from google.genai import types
 
@@ -162,6 +163,31 @@ class Runner:
     ) = self._infer_agent_origin(self.agent)
     self._app_name_alignment_hint: Optional[str] = None
     self._enforce_app_name_alignment()
+    self._compaction_scheduler = CompactionScheduler(
+        max_concurrent_compactions=(
+            app.events_compaction_config.max_concurrent_compactions
+            if app and app.events_compaction_config
+            else 4
+        )
+    )
+    self._agent_card_prefetch: Optional[asyncio.Task[None]] = None
+
+  def _start_agent_card_prefetch(self) -> None:
+    """Starts resolving the remote A2A agents of the agent tree, if any.
+
+    The agents are resolved together in the background of the first run, rather
+    than one by one as the run reaches them.
+    """
+    if self._agent_card_prefetch:
+      return
+    # Remote A2A agents can only exist once their module was imported, which
+    # the runner doesn't do itself as it requires the A2A SDK.
+    remote_a2a_agent = sys.modules.get('google.adk.agents.remote_a2a_agent')
+    if remote_a2a_agent is None:
+      return
+    self._agent_card_prefetch = asyncio.create_task(
+        remote_a2a_agent.prefetch_agent_cards(self.agent)
+    )
 
   def _validate_runner_params(
       self,
@@ -367,6 +393,7 @@ class Runner:
         new_message are None.
     """
     run_config = run_config or RunConfig()
+    self._start_agent_card_prefetch()
 
     if new_message and not new_message.role:
       new_message.role = 'user'
@@ -433,14 +460,13 @@ class Runner:
         # Run compaction after all events are yielded from the agent.
         # (We don't compact in the middle of an invocation, we only compact at the end of an invocation.)
         if self.app and self.app.events_compaction_config:
-          logger.info('Running event compactor.')
-          # Run compaction in a separate task to avoid blocking the main thread.
-          # So the users can still finish the event loop from the agent while the
-          # compaction is running.
-          asyncio.create_task(
-              _run_compaction_for_sliding_window(
-                  self.app, session, self.session_service
-              )
+          logger.info('Scheduling event compactor.')
+          # Run compaction in a background task to avoid blocking the main
+          # thread, so the users can still finish the event loop from the
+          # agent while the compaction is running. The scheduler coalesces
+          # requests for the same session and is drained on close().
+          self._compaction_scheduler.schedule(
+              self.app, session, self.session_service
           )
 
     async with Aclosing(_run_with_trace(new_message, invocation_id)) as agen:
@@ -1337,6 +1363,13 @@ class Runner:
   async def close(self):
     """Closes the runner."""
     logger.info('Closing runner...')
+    # Wait for background compactions, which may still need the LLM and the
+    # session service.
+    await self._compaction_scheduler.close()
+
+    if self._agent_card_prefetch and not self._agent_card_prefetch.done():
+      self._agent_card_prefetch.cancel()
+
     # Close Toolsets
     await self._cleanup_toolsets(self._collect_toolset(self.agent))
 
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 from typing import Optional
@@ -32,6 +33,8 @@ class _ExtendedJSONSchema(JSONSchema):
   )
 
 
+# Tool and parameter names are converted many times while building toolsets.
+@functools.lru_cache(maxsize=4096)
 def _to_snake_case(text: str) -> str:
   """Converts a string into snake_case.
 
@@ -0,0 +1,408 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Stores large query results as Parquet artifacts for the database tools.
+
+Instead of returning every row of a large result to the model, the result is
+saved as an artifact and the model gets a summary with the schema, the row
+count, the first rows and the artifact name. A reader tool then returns pages
+of the stored result, optionally filtered, without running the query again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import logging
+import tempfile
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+import uuid
+
+from google.genai import types
+
+from .tool_context import ToolContext
+
+logger = logging.getLogger("google_adk." + __name__)
+
+PARQUET_MIME_TYPE = "application/vnd.apache.parquet"
+
+_ARTIFACT_NAME_PREFIX = "query_result_"
+_SAMPLE_ROWS = 5
+# The number of rows converted to Arrow at once, bounding how many rows of a
+# streamed result are held as Python objects.
+_BATCH_ROWS = 10_000
+# The size above which the batches and the Parquet file of a result being
+# stored are spooled to disk rather than held in memory.
+_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
+_storing_large_results: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_storing_large_results", default=False
+)
+
+
+def is_storing_large_results() -> bool:
+  """Whether the running query tool is wrapped by `store_large_results`.
+
+  If so, the tool may return its rows as an iterator over the whole result,
+  not capped to its maximum number of rows, and the wrapper reads at most
+  `max_rows` of them.
+  """
+  return _storing_large_results.get()
+
+
+def store_large_results(
+    func: Callable[..., dict],
+    *,
+    threshold_rows: int,
+    max_rows: int,
+    max_inline_rows: int,
+    reader_tool_name: str,
+) -> Callable[..., Awaitable[dict]]:
+  """Wraps a query tool to store results above a size as artifacts.
+
+  The query, and the reads and conversion of its rows, run in a worker thread.
+
+  Args:
+    func: The query tool. It must accept a `tool_context` argument and return
+      a dict with the result rows under "rows", each row being a dict of column
+      name to JSON compatible value. The rows may be a list, or an iterator
+      over the whole result if `is_storing_large_results()`, which is closed
+      once consumed if it has a `close` method.
+    threshold_rows: Results with more rows than this are stored as an artifact.
+    max_rows: The maximum number of rows stored in an artifact. The rows past
+      it are dropped, and the result is flagged as likely truncated.
+    max_inline_rows: The maximum number of rows of a result returned inline,
+      i.e. the row limit of the tool when its result isn't stored. The rows
+      past it are dropped, and the result is flagged as likely truncated.
+    reader_tool_name: The name of the tool reading stored results, as shown to
+      the model.
+
+  Returns:
+    An async version of the tool, with the same signature.
+  """
+  signature = inspect.signature(func)
+
+  @functools.wraps(func)
+  async def wrapper(*args, **kwargs) -> dict:
+    tool_context = signature.bind(*args, **kwargs).arguments["tool_context"]
+    if tool_context._invocation_context.artifact_service is None:
+      # Without an artifact service, the rows are returned as before.
+      return await asyncio.to_thread(func, *args, **kwargs)
+
+    token = _storing_large_results.set(True)
+    try:
+      # The worker thread runs in a copy of the current context, so the tool
+      # sees that its result may be stored.
+      result = await asyncio.to_thread(func, *args, **kwargs)
+    finally:
+      _storing_large_results.reset(token)
+    rows = result.get("rows")
+    if result.get("status") != "SUCCESS" or rows is None:
+      return result
+
+    try:
+      stored = await asyncio.to_thread(
+          _read_result, rows, threshold_rows, max_rows
+      )
+      if isinstance(stored, list):
+        if len(stored) > max_inline_rows:
+          return {
+              **result,
+              "rows": stored[:max_inline_rows],
+              "result_is_likely_truncated": True,
+          }
+        return {**result, "rows": stored}
+      data, summary = stored
+      artifact_name = f"{_ARTIFACT_NAME_PREFIX}{uuid.uuid4().hex}.parquet"
+      await tool_context.save_artifact(
+          artifact_name,
+          types.Part.from_bytes(data=data, mime_type=PARQUET_MIME_TYPE),
+      )
+    except Exception as ex:  # pylint: disable=broad-except
+      return {
+          "status": "ERROR",
+          "error_details": str(ex),
+      }
+    if result.get("result_is_likely_truncated"):
+      summary["result_is_likely_truncated"] = True
+    return {"status": "SUCCESS", "result_artifact": artifact_name, **summary}
+
+  wrapper.__doc__ = (
+      f"{inspect.cleandoc(func.__doc__ or '')}\n\n"
+      f"If the result has more than {threshold_rows} rows, it is stored as an"
+      ' artifact instead, and a summary is returned with the "schema", the'
+      ' "row_count", the first rows as "sample_rows" and the'
+      ' "result_artifact" name. Use the'
+      f" {reader_tool_name} tool to read further rows of the result, rather"
+      " than running the query again."
+  )
+  return wrapper
+
+
+def _read_result(
+    rows: Iterable[dict[str, Any]], threshold_rows: int, max_rows: int
+) -> Union[list[dict[str, Any]], tuple[bytes, dict]]:
+  """Returns the rows of a small result, or a large one as a Parquet file.
+
+  The rows are closed once read if they have a `close` method, e.g. to
+  release the database snapshot they are streamed from.
+
+  Returns:
+    The rows if there are at most `threshold_rows` of them, otherwise the
+    Parquet file of the first `max_rows` rows and the summary of the result.
+  """
+  try:
+    iterator = iter(rows)
+    head = list(itertools.islice(iterator, threshold_rows + 1))
+    if len(head) <= threshold_rows:
+      return head
+    return _write_parquet(itertools.chain(head, iterator), max_rows)
+  finally:
+    if hasattr(rows, "close"):
+      rows.close()
+
+
+def _write_parquet(
+    rows: Iterator[dict[str, Any]], max_rows: int
+) -> tuple[bytes, dict]:
+  """Writes up to `max_rows` rows to a Parquet file.
+
+  The rows are converted to Arrow in batches, which are spooled to a temporary
+  file as they arrive. Once the types of all the batches are known, they are
+  read back one at a time and written to the Parquet file, itself spooled to a
+  temporary file. So at most one batch is held in memory, besides the Parquet
+  file returned for the artifact service.
+
+  Returns:
+    The Parquet file and the summary of the result.
+  """
+  import pyarrow as pa
+  import pyarrow.parquet as pq
+
+  sample_rows = []
+  schemas = []
+  segment_sizes = []
+  row_count = 0
+  with tempfile.SpooledTemporaryFile(
+      max_size=_SPOOL_MAX_BYTES
+  ) as batches, tempfile.SpooledTemporaryFile(
+      max_size=_SPOOL_MAX_BYTES
+  ) as parquet_file:
+    while batch := list(
+        itertools.islice(rows, min(_BATCH_ROWS, max_rows - row_count))
+    ):
+      if not sample_rows:
+        sample_rows = batch[:_SAMPLE_ROWS]
+      table = _to_arrow_table(batch)
+      del batch
+      sink = pa.BufferOutputStream()
+      with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+      segment_sizes.append(batches.write(sink.getvalue()))
+      schemas.append(table.schema)
+      row_count += table.num_rows
+    truncated = next(rows, None) is not None
+
+    schema, json_columns = _unify_schemas(schemas)
+    batches.seek(0)
+    with pq.ParquetWriter(parquet_file, schema) as writer:
+      for size in segment_sizes:
+        table = pa.ipc.open_stream(batches.read(size)).read_all()
+        writer.write_table(_conform_table(table, schema, json_columns))
+    parquet_file.seek(0)
+    data = parquet_file.read()
+
+  summary = {
+      "row_count": row_count,
+      "schema": [
+          {"name": field.name, "type": str(field.type)} for field in schema
+      ],
+      "sample_rows": sample_rows,
+  }
+  if truncated:
+    summary["result_is_likely_truncated"] = True
+  return data, summary
+
+
+async def read_query_result(
+    tool_context: ToolContext,
+    result_artifact: str,
+    *,
+    offset: int = 0,
+    limit: int,
+    columns: Optional[list[str]] = None,
+    filters: Optional[dict[str, Any]] = None,
+) -> dict:
+  """Reads a page of a query result stored by `store_large_results`.
+
+  Args:
+    tool_context: The context of the tool call.
+    result_artifact: The name of the artifact holding the result.
+    offset: The number of matching rows to skip.
+    limit: The maximum number of rows to return.
+    columns: The columns to return. Defaults to all columns.
+    filters: Column values the returned rows must be equal to.
+
+  Returns:
+    The page of rows, the number of rows matching the filters, and the offset
+    of the next page if there are more matching rows.
+  """
+  import pyarrow as pa
+  import pyarrow.compute as pc
+  import pyarrow.parquet as pq
+
+  if not result_artifact.startswith(_ARTIFACT_NAME_PREFIX):
+    return {
+        "status": "ERROR",
+        "error_details": f"{result_artifact} is not a stored query result.",
+    }
+  try:
+    artifact = await tool_context.load_artifact(result_artifact)
+    if artifact is None or artifact.inline_data is None:
+      return {
+          "status": "ERROR",
+          "error_details": f"Query result {result_artifact} not found.",
+      }
+    table = pq.read_table(pa.BufferReader(artifact.inline_data.data))
+
+    if filters:
+      mask = None
+      for name, value in filters.items():
+        column = table[name]
+        condition = (
+            pc.is_null(column)
+            if value is None
+            else pc.equal(column, pa.scalar(value).cast(column.type))
+        )
+        mask = condition if mask is None else pc.and_(mask, condition)
+      table = table.filter(mask)
+    if columns:
+      table = table.select(columns)
+
+    offset = max(offset, 0)
+    page = table.slice(offset, max(limit, 0))
+    result = {
+        "status": "SUCCESS",
+        "rows": page.to_pylist(),
+        "row_count": table.num_rows,
+    }
+    if offset + page.num_rows < table.num_rows:
+      result["next_offset"] = offset + page.num_rows
+    return result
+  except Exception as ex:  # pylint: disable=broad-except
+    return {
+        "status": "ERROR",
+        "error_details": str(ex),
+    }
+
+
+def _unify_schemas(schemas: list[Any]) -> tuple[Any, set[str]]:
+  """Unifies the schemas of the batches of a result.
+
+  Types are unified across batches, e.g. a column whose values were all null in
+  a batch. Columns that can't be unified, such as JSON values stored as strings
+  in only some batches, are stored as JSON strings in all of them.
+
+  Returns:
+    The schema of the result, and the columns stored as JSON strings.
+  """
+  import pyarrow as pa
+
+  try:
+    return pa.unify_schemas(schemas, promote_options="permissive"), set()
+  except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+    pass
+  names = {name for schema in schemas for name in schema.names}
+  json_columns = {
+      name
+      for name in names
+      if len({
+          schema.field(name).type
+          for schema in schemas
+          if name in schema.names and schema.field(name).type != pa.null()
+      })
+      > 1
+  }
+  schemas = [
+      pa.schema([
+          (field.name, pa.string()) if field.name in json_columns else field
+          for field in schema
+      ])
+      for schema in schemas
+  ]
+  return (
+      pa.unify_schemas(schemas, promote_options="permissive"),
+      json_columns,
+  )
+
+
+def _conform_table(table, schema, json_columns: set[str]):
+  """Returns the table of a batch with the unified schema of the result."""
+  import pyarrow as pa
+
+  table = _json_encode_columns(table, json_columns & set(table.column_names))
+  return pa.concat_tables(
+      [schema.empty_table(), table], promote_options="permissive"
+  ).cast(schema)
+
+
+def _json_encode_columns(table, names: set[str]):
+  """Returns a table with the given columns stored as JSON strings."""
+  import pyarrow as pa
+
+  for name in names:
+    column = table[name]
+    if pa.types.is_string(column.type):
+      continue
+    index = table.column_names.index(name)
+    table = table.set_column(
+        index,
+        name,
+        pa.array(
+            [None if v is None else json.dumps(v) for v in column.to_pylist()],
+            pa.string(),
+        ),
+    )
+  return table
+
+
+def _to_arrow_table(rows: list[dict[str, Any]]):
+  """Builds an Arrow table from rows, one column at a time.
+
+  Columns whose values Arrow can't give a common type, such as JSON values of
+  varying shapes, are stored as JSON strings.
+  """
+  import pyarrow as pa
+
+  arrays = {}
+  for name in rows[0]:
+    values = [row.get(name) for row in rows]
+    try:
+      array = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+      array = pa.array(
+          [None if v is None else json.dumps(v) for v in values], pa.string()
+      )
+    arrays[name] = array
+  return pa.table(arrays)
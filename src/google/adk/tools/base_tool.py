@@ -39,6 +39,7 @@ logger = logging.getLogger("google_adk." + __name__)
 
 if TYPE_CHECKING:
   from ..models.llm_request import LlmRequest
+  from .tool_cache_config import ToolCacheConfig
   from .tool_configs import ToolArgsConfig
 
 SelfTool = TypeVar("SelfTool", bound="BaseTool")
@@ -65,6 +66,12 @@ class BaseTool(ABC):
   NOTE: the entire dict must be JSON serializable.
   """
 
+  cache_config: Optional[ToolCacheConfig] = None
+  """Declares the tool idempotent and how long its results may be cached.
+
+  None if the tool may have side effects or return varying results.
+  """
+
   def __init__(
       self,
       *,
@@ -72,11 +79,13 @@ class BaseTool(ABC):
       description,
       is_long_running: bool = False,
       custom_metadata: Optional[dict[str, Any]] = None,
+      cache_config: Optional[ToolCacheConfig] = None,
   ):
     self.name = name
     self.description = description
     self.is_long_running = is_long_running
     self.custom_metadata = custom_metadata
+    self.cache_config = cache_config
 
   def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
     """Gets the OpenAPI specification of this tool in the form of a FunctionDeclaration.
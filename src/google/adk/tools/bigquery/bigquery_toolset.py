@@ -28,6 +28,7 @@ from ...tools.base_tool import BaseTool
 from ...tools.base_toolset import BaseToolset
 from ...tools.base_toolset import ToolPredicate
 from ...tools.google_tool import GoogleTool
+from ...tools.tool_cache_config import METADATA_TOOL_CACHE_CONFIG
 from ...utils.feature_decorator import experimental
 from .bigquery_credentials import BigQueryCredentialsConfig
 from .config import BigQueryToolConfig
@@ -74,12 +75,22 @@ class BigQueryToolset(BaseToolset):
             func=func,
             credentials_config=self._credentials_config,
             tool_settings=self._tool_settings,
+            cache_config=METADATA_TOOL_CACHE_CONFIG,
         )
         for func in [
             metadata_tool.get_dataset_info,
             metadata_tool.get_table_info,
             metadata_tool.list_dataset_ids,
             metadata_tool.list_table_ids,
+        ]
+    ] + [
+        GoogleTool(
+            func=func,
+            credentials_config=self._credentials_config,
+            tool_settings=self._tool_settings,
+        )
+        for func in [
+            # The state of a job changes until it is done.
             metadata_tool.get_job_info,
             query_tool.get_execute_sql(self._tool_settings),
             query_tool.forecast,
@@ -88,6 +99,14 @@ class BigQueryToolset(BaseToolset):
             data_insights_tool.ask_data_insights,
         ]
     ]
+    if self._tool_settings.result_artifact_threshold_rows is not None:
+      all_tools.append(
+          GoogleTool(
+              func=query_tool.read_query_result,
+              credentials_config=self._credentials_config,
+              tool_settings=self._tool_settings,
+          )
+      )
 
     return [
         tool
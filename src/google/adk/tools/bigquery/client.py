@@ -14,11 +14,15 @@
 
 from __future__ import annotations
 
+import collections
+import threading
+from typing import Hashable
 from typing import Optional
 
 import google.api_core.client_info
 from google.auth.credentials import Credentials
 from google.cloud import bigquery
+import google.oauth2.credentials
 
 from ... import version
 
@@ -28,6 +32,28 @@ USER_AGENT = f"adk-bigquery-tool google-adk/{version.__version__}"
 from typing import List
 from typing import Union
 
+# Clients keep their HTTP session and auth state, so they are reused across
+# tool calls. The cache is bounded, as user credentials differ per session.
+_CLIENT_CACHE_SIZE = 32
+_client_cache: collections.OrderedDict[Hashable, bigquery.Client] = (
+    collections.OrderedDict()
+)
+_client_cache_lock = threading.Lock()
+
+
+def _get_credentials_key(credentials: Credentials) -> Hashable:
+  """Returns a key identifying the identity behind credentials."""
+  if isinstance(credentials, google.oauth2.credentials.Credentials):
+    # User credentials are rebuilt from the session state on every tool call,
+    # so they are identified by their access token rather than by the object.
+    token = getattr(credentials, "token", None)
+    if token:
+      return ("oauth2", token)
+  # Other credentials, such as service account or application default ones,
+  # are configured once and reused. The cached client holds a reference to
+  # them, so their id stays unique while the entry exists.
+  return ("object", id(credentials))
+
 
 def get_bigquery_client(
     *,
@@ -38,6 +64,9 @@ def get_bigquery_client(
 ) -> bigquery.Client:
   """Get a BigQuery client.
 
+  Clients are cached by project, credentials, location and user agent, so
+  repeated calls reuse the same HTTP session.
+
   Args:
     project: The GCP project ID.
     credentials: The credentials to use for the request.
@@ -55,9 +84,20 @@ def get_bigquery_client(
     else:
       user_agents.extend([ua for ua in user_agent if ua])
 
-  client_info = google.api_core.client_info.ClientInfo(
-      user_agent=" ".join(user_agents)
+  user_agent = " ".join(user_agents)
+  cache_key = (
+      project,
+      location,
+      user_agent,
+      _get_credentials_key(credentials),
   )
+  with _client_cache_lock:
+    bigquery_client = _client_cache.get(cache_key)
+    if bigquery_client is not None:
+      _client_cache.move_to_end(cache_key)
+      return bigquery_client
+
+  client_info = google.api_core.client_info.ClientInfo(user_agent=user_agent)
 
   bigquery_client = bigquery.Client(
       project=project,
@@ -66,4 +106,8 @@ def get_bigquery_client(
       client_info=client_info,
   )
 
+  with _client_cache_lock:
+    _client_cache[cache_key] = bigquery_client
+    while len(_client_cache) > _CLIENT_CACHE_SIZE:
+      _client_cache.popitem(last=False)
   return bigquery_client
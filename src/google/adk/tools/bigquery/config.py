@@ -67,6 +67,26 @@ class BigQueryToolConfig(BaseModel):
   By default, the query result will be limited to 50 rows.
   """
 
+  result_artifact_threshold_rows: Optional[int] = None
+  """Number of rows above which a query result is stored as an artifact.
+
+  By default, all the rows of a query result, up to `max_query_result_rows`,
+  are returned to the model. If set, a result with more rows is streamed page
+  by page to a Parquet artifact through the artifact service instead, with up
+  to `max_result_artifact_rows` rows. The model gets a summary with the schema,
+  row count and first rows of the result, and can page through or filter the
+  stored result with the `read_query_result` tool. A result with at most this
+  many rows is returned inline, but still only up to `max_query_result_rows`
+  rows, and is flagged as likely truncated past them.
+  """
+
+  max_result_artifact_rows: int = 1_000_000
+  """Maximum number of rows of a query result stored as an artifact.
+
+  Only applies if `result_artifact_threshold_rows` is set. The rows past it are
+  not fetched, and the result is flagged as likely truncated.
+  """
+
   application_name: Optional[str] = None
   """Name of the application using the BigQuery tools.
 
@@ -98,3 +118,11 @@ class BigQueryToolConfig(BaseModel):
     if v and ' ' in v:
       raise ValueError('Application name should not contain spaces.')
     return v
+
+  @field_validator('max_result_artifact_rows')
+  @classmethod
+  def validate_max_result_artifact_rows(cls, v):
+    """Validate the maximum number of rows of a result artifact."""
+    if v <= 0:
+      raise ValueError('max_result_artifact_rows should be positive.')
+    return v
@@ -14,23 +14,148 @@
 
 from __future__ import annotations
 
+import collections
 import functools
+import hashlib
 import json
+import threading
 import types
+from typing import Any
+from typing import Awaitable
 from typing import Callable
 from typing import Optional
+from typing import Sequence
+from typing import Union
 import uuid
 
 from google.auth.credentials import Credentials
 from google.cloud import bigquery
 
 from . import client
+from .. import _query_result_artifacts
 from ..tool_context import ToolContext
 from .config import BigQueryToolConfig
 from .config import WriteMode
 
 BIGQUERY_SESSION_INFO_KEY = "bigquery_session_info"
 
+# Dry runs used to enforce the write mode are cached per ADK session, keyed by
+# the exact query text, as the statement type of a query can't change. The text
+# isn't normalized: e.g. collapsing a newline would turn the end of a comment
+# into part of it, and give a write the verdict of a read.
+_DRY_RUN_CACHE_SIZE = 1024
+_dry_run_verdicts: collections.OrderedDict[
+    str, tuple[Optional[str], Optional[str]]
+] = collections.OrderedDict()
+_dry_run_verdicts_lock = threading.Lock()
+
+# Scalar types whose Python values are already JSON serializable.
+_JSON_NATIVE_TYPES = frozenset({
+    "BOOL",
+    "BOOLEAN",
+    "FLOAT",
+    "FLOAT64",
+    "GEOGRAPHY",
+    "INT64",
+    "INTEGER",
+    "JSON",
+    "STRING",
+})
+# Scalar types whose Python values are returned as their string form.
+_STRINGIFIED_TYPES = frozenset({
+    "BIGDECIMAL",
+    "BIGNUMERIC",
+    "BYTES",
+    "DATE",
+    "DATETIME",
+    "DECIMAL",
+    "NUMERIC",
+    "TIME",
+    "TIMESTAMP",
+})
+
+
+def _dry_run_query(
+    bq_client: bigquery.Client,
+    query: str,
+    project_id: str,
+    job_config: bigquery.QueryJobConfig,
+    tool_context: ToolContext,
+    bq_session_id: Optional[str] = None,
+) -> tuple[Optional[str], Optional[str]]:
+  """Returns the statement type and destination dataset id of a query."""
+  cache_key = hashlib.sha256(
+      f"{tool_context.session.id}\n{project_id}\n{bq_session_id or ''}\n"
+      f"{query}".encode()
+  ).hexdigest()
+  with _dry_run_verdicts_lock:
+    verdict = _dry_run_verdicts.get(cache_key)
+    if verdict is not None:
+      _dry_run_verdicts.move_to_end(cache_key)
+      return verdict
+
+  dry_run_query_job = bq_client.query(
+      query, project=project_id, job_config=job_config
+  )
+  verdict = (
+      dry_run_query_job.statement_type,
+      dry_run_query_job.destination.dataset_id
+      if dry_run_query_job.destination
+      else None,
+  )
+  with _dry_run_verdicts_lock:
+    _dry_run_verdicts[cache_key] = verdict
+    while len(_dry_run_verdicts) > _DRY_RUN_CACHE_SIZE:
+      _dry_run_verdicts.popitem(last=False)
+  return verdict
+
+
+def _to_json_compatible(value: Any) -> Any:
+  try:
+    # if the json serialization of the value succeeds, use it as is
+    json.dumps(value)
+  except:
+    value = str(value)
+  return value
+
+
+def _to_string(value: Any) -> Optional[str]:
+  return None if value is None else str(value)
+
+
+def _get_row_converter(
+    schema: Optional[Sequence[bigquery.SchemaField]],
+) -> Callable[[Any], dict[str, Any]]:
+  """Returns a function converting result rows to JSON compatible dicts.
+
+  The conversion of each column is chosen once from its type, so that only
+  columns of types without a known JSON representation are checked per cell.
+  """
+  if not schema:
+    return lambda row: {
+        key: _to_json_compatible(val) for key, val in row.items()
+    }
+
+  names = [field.name for field in schema]
+  converted_columns = []
+  for name, field in zip(names, schema):
+    field_type = (field.field_type or "").upper()
+    if field.mode == "REPEATED" or field_type not in _JSON_NATIVE_TYPES:
+      converter = (
+          _to_string
+          if field.mode != "REPEATED" and field_type in _STRINGIFIED_TYPES
+          else _to_json_compatible
+      )
+      converted_columns.append((name, converter))
+
+  def convert(row) -> dict[str, Any]:
+    row_values = dict(zip(names, row.values()))
+    for name, converter in converted_columns:
+      row_values[name] = converter(row_values[name])
+    return row_values
+
+  return convert
+
 
 def _execute_sql(
     project_id: str,
@@ -73,14 +198,14 @@ def _execute_sql(
       bq_job_labels["adk-bigquery-tool"] = caller_id
 
     if not settings or settings.write_mode == WriteMode.BLOCKED:
-      dry_run_query_job = bq_client.query(
+      statement_type, _ = _dry_run_query(
+          bq_client,
           query,
-          project=project_id,
-          job_config=bigquery.QueryJobConfig(
-              dry_run=True, labels=bq_job_labels
-          ),
+          project_id,
+          bigquery.QueryJobConfig(dry_run=True, labels=bq_job_labels),
+          tool_context,
       )
-      if dry_run_query_job.statement_type != "SELECT":
+      if statement_type != "SELECT":
         return {
             "status": "ERROR",
             "error_details": "Read-only mode only supports SELECT statements.",
@@ -116,19 +241,22 @@ def _execute_sql(
       )
 
       # Check the query type w.r.t. the BigQuery session
-      dry_run_query_job = bq_client.query(
+      statement_type, destination_dataset_id = _dry_run_query(
+          bq_client,
           query,
-          project=project_id,
-          job_config=bigquery.QueryJobConfig(
+          project_id,
+          bigquery.QueryJobConfig(
               dry_run=True,
               connection_properties=bq_connection_properties,
               labels=bq_job_labels,
           ),
+          tool_context,
+          bq_session_id=bq_session_id,
       )
       if (
-          dry_run_query_job.statement_type != "SELECT"
-          and dry_run_query_job.destination
-          and dry_run_query_job.destination.dataset_id != bq_session_dataset_id
+          statement_type != "SELECT"
+          and destination_dataset_id
+          and destination_dataset_id != bq_session_dataset_id
       ):
         return {
             "status": "ERROR",
@@ -151,7 +279,10 @@ def _execute_sql(
       )
       return {"status": "SUCCESS", "dry_run_info": dry_run_job.to_api_repr()}
 
-    # Finally execute the query, fetch the result, and return it
+    # Finally execute the query, fetch the result, and return it. If the
+    # result may be stored as an artifact, its rows are streamed to it page by
+    # page, up to one past the artifact cap to tell whether it is truncated.
+    stream_rows = _query_result_artifacts.is_storing_large_results()
     row_iterator = bq_client.query_and_wait(
         query,
         job_config=bigquery.QueryJobConfig(
@@ -159,19 +290,19 @@ def _execute_sql(
             labels=bq_job_labels,
         ),
         project=project_id,
-        max_results=settings.max_query_result_rows,
+        max_results=(
+            settings.max_result_artifact_rows + 1
+            if stream_rows
+            else settings.max_query_result_rows
+        ),
     )
-    rows = []
-    for row in row_iterator:
-      row_values = {}
-      for key, val in row.items():
-        try:
-          # if the json serialization of the value succeeds, use it as is
-          json.dumps(val)
-        except:
-          val = str(val)
-        row_values[key] = val
-      rows.append(row_values)
+    convert_row = _get_row_converter(getattr(row_iterator, "schema", None))
+    if stream_rows:
+      return {
+          "status": "SUCCESS",
+          "rows": (convert_row(row) for row in row_iterator),
+      }
+    rows = [convert_row(row) for row in row_iterator]
 
     result = {"status": "SUCCESS", "rows": rows}
     if (
@@ -715,7 +846,9 @@ def _execute_sql_protected_write_mode(*args, **kwargs) -> dict:
   return execute_sql(*args, **kwargs)
 
 
-def get_execute_sql(settings: BigQueryToolConfig) -> Callable[..., dict]:
+def get_execute_sql(
+    settings: BigQueryToolConfig,
+) -> Callable[..., Union[dict, Awaitable[dict]]]:
   """Get the execute_sql tool customized as per the given tool settings.
 
   Args:
@@ -728,7 +861,7 @@ def get_execute_sql(settings: BigQueryToolConfig) -> Callable[..., dict]:
   """
 
   if not settings or settings.write_mode == WriteMode.BLOCKED:
-    return execute_sql
+    return _store_large_results(execute_sql, settings)
 
   # Create a new function object using the original function's code and globals.
   # We pass the original code, globals, name, defaults, and closure.
@@ -753,7 +886,78 @@ def get_execute_sql(settings: BigQueryToolConfig) -> Callable[..., dict]:
   else:
     execute_sql_wrapper.__doc__ = _execute_sql_write_mode.__doc__
 
-  return execute_sql_wrapper
+  return _store_large_results(execute_sql_wrapper, settings)
+
+
+def _store_large_results(
+    execute_sql_func: Callable[..., dict], settings: BigQueryToolConfig
+) -> Callable[..., Union[dict, Awaitable[dict]]]:
+  if not settings or settings.result_artifact_threshold_rows is None:
+    return execute_sql_func
+  return _query_result_artifacts.store_large_results(
+      execute_sql_func,
+      threshold_rows=settings.result_artifact_threshold_rows,
+      max_rows=settings.max_result_artifact_rows,
+      max_inline_rows=settings.max_query_result_rows,
+      reader_tool_name="read_query_result",
+  )
+
+
+async def read_query_result(
+    result_artifact: str,
+    settings: BigQueryToolConfig,
+    tool_context: ToolContext,
+    offset: int = 0,
+    columns: Optional[list[str]] = None,
+    filters: Optional[dict[str, Any]] = None,
+) -> dict:
+  """Read rows of a query result that execute_sql stored as an artifact.
+
+  Args:
+      result_artifact (str): The "result_artifact" name returned by
+        execute_sql.
+      settings (BigQueryToolConfig): The settings for the tool.
+      tool_context (ToolContext): The context for the tool.
+      offset (int, default 0): The number of matching rows to skip, to page
+        through the result.
+      columns (list[str], optional): The columns to return. If not set, all
+        columns are returned.
+      filters (dict, optional): Column values that the returned rows must be
+        equal to, such as {"country": "US"}.
+
+  Returns:
+      dict: Dictionary with the "rows" of the page and the "row_count" of the
+            rows matching the filters. If there are more matching rows, the
+            "next_offset" field contains the offset of the next page.
+
+  Examples:
+      Read the second page of a stored result:
+
+          >>> read_query_result("query_result_0f1e2d.parquet", offset=50)
+          {
+            "status": "SUCCESS",
+            "rows": [
+                {
+                    "country": "US",
+                    "population": 340110988
+                },
+                ...
+            ],
+            "row_count": 195,
+            "next_offset": 100
+          }
+  """
+  return await _query_result_artifacts.read_query_result(
+      tool_context,
+      result_artifact,
+      offset=offset,
+      limit=(
+          settings.result_artifact_threshold_rows
+          or settings.max_query_result_rows
+      ),
+      columns=columns,
+      filters=filters,
+  )
 
 
 def forecast(
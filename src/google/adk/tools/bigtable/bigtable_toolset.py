@@ -27,6 +27,7 @@ from ...tools.base_tool import BaseTool
 from ...tools.base_toolset import BaseToolset
 from ...tools.base_toolset import ToolPredicate
 from ...tools.google_tool import GoogleTool
+from ...tools.tool_cache_config import METADATA_TOOL_CACHE_CONFIG
 from ...utils.feature_decorator import experimental
 from .bigtable_credentials import BigtableCredentialsConfig
 from .settings import BigtableToolSettings
@@ -88,15 +89,22 @@ class BigtableToolset(BaseToolset):
             func=func,
             credentials_config=self._credentials_config,
             tool_settings=self._tool_settings,
+            cache_config=METADATA_TOOL_CACHE_CONFIG,
         )
         for func in [
             metadata_tool.list_instances,
             metadata_tool.get_instance_info,
             metadata_tool.list_tables,
             metadata_tool.get_table_info,
-            query_tool.execute_sql,
         ]
     ]
+    all_tools.append(
+        GoogleTool(
+            func=query_tool.execute_sql,
+            credentials_config=self._credentials_config,
+            tool_settings=self._tool_settings,
+        )
+    )
     return [
         tool
         for tool in all_tools
@@ -27,6 +27,7 @@ from ..utils.feature_decorator import experimental
 from ._google_credentials import BaseGoogleCredentialsConfig
 from ._google_credentials import GoogleCredentialsManager
 from .function_tool import FunctionTool
+from .tool_cache_config import ToolCacheConfig
 from .tool_context import ToolContext
 
 
@@ -48,6 +49,7 @@ class GoogleTool(FunctionTool):
       *,
       credentials_config: Optional[BaseGoogleCredentialsConfig] = None,
       tool_settings: Optional[BaseModel] = None,
+      cache_config: Optional[ToolCacheConfig] = None,
   ):
     """Initialize the Google API tool.
 
@@ -58,8 +60,11 @@ class GoogleTool(FunctionTool):
           then we don't handle the auth logic
         tool_settings: Tool-specific settings. This settings should be provided
           by each toolset that uses this class to create customized tools.
+        cache_config: How the results of the tool may be cached, if it is
+          idempotent.
     """
     super().__init__(func=func)
+    self.cache_config = cache_config
     self._ignore_params.append("credentials")
     self._ignore_params.append("settings")
     self._credentials_manager = (
@@ -14,10 +14,134 @@
 
 """Tool for web browse."""
 
-import requests
+from __future__ import annotations
 
+import asyncio
+import collections
+import dataclasses
+from email.utils import parsedate_to_datetime
+import threading
+import time
+from typing import Optional
 
-def load_web_page(url: str) -> str:
+import httpx
+
+# Pages are read up to this size; the rest of larger pages is not downloaded.
+_MAX_CONTENT_BYTES = 5 * 1024 * 1024
+# Upper bound for the total length of the page texts kept in the cache.
+_CACHE_MAX_CHARS = 16 * 1024 * 1024
+# Upper bound for how long a page without explicit freshness is reused for.
+_MAX_HEURISTIC_TTL_SECONDS = 24 * 60 * 60
+_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+
+@dataclasses.dataclass
+class _CachedPage:
+  text: str
+  etag: Optional[str]
+  last_modified: Optional[str]
+  expires_at: float
+
+
+_page_cache: collections.OrderedDict[str, _CachedPage] = (
+    collections.OrderedDict()
+)
+_page_cache_chars = 0
+_page_cache_lock = threading.Lock()
+
+# Keyed by the event loop they are bound to, the clients of page loads.
+_http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+_http_clients_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+  """Returns the client shared by page loads on the running loop."""
+  loop = asyncio.get_running_loop()
+  with _http_clients_lock:
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+      # The clients of closed loops can't be closed anymore, as their
+      # connections can only be closed on their loop, so they are forgotten.
+      for client_loop in [l for l in _http_clients if l.is_closed()]:
+        del _http_clients[client_loop]
+      client = _http_clients[loop] = httpx.AsyncClient(
+          timeout=_TIMEOUT, follow_redirects=True
+      )
+    return client
+
+
+def _get_cache_ttl(headers: httpx.Headers) -> Optional[float]:
+  """Returns how long a response may be reused without revalidation.
+
+  Follows Cache-Control, then Expires, and otherwise the heuristic freshness
+  of RFC 9111, a tenth of the time since the page was last modified.
+  """
+  directives = {}
+  for directive in headers.get('cache-control', '').split(','):
+    name, _, value = directive.strip().partition('=')
+    directives[name.lower()] = value.strip('"')
+  if 'no-store' in directives:
+    return None
+  if 'no-cache' in directives:
+    return 0
+  try:
+    return max(int(directives['max-age']), 0)
+  except (KeyError, ValueError):
+    pass
+  try:
+    date = (
+        parsedate_to_datetime(headers['date']).timestamp()
+        if 'date' in headers
+        else time.time()
+    )
+    if 'expires' in headers:
+      return max(
+          parsedate_to_datetime(headers['expires']).timestamp() - date, 0
+      )
+    if 'last-modified' in headers:
+      age = date - parsedate_to_datetime(headers['last-modified']).timestamp()
+      return min(max(age / 10, 0), _MAX_HEURISTIC_TTL_SECONDS)
+  except (TypeError, ValueError):
+    # Invalid dates mean the page is already stale.
+    pass
+  return 0
+
+
+def _get_cached_page(url: str) -> Optional[_CachedPage]:
+  with _page_cache_lock:
+    page = _page_cache.get(url)
+    if page is not None:
+      _page_cache.move_to_end(url)
+    return page
+
+
+def _cache_page(url: str, page: Optional[_CachedPage]) -> None:
+  """Caches the page of url, or drops it from the cache if page is None."""
+  global _page_cache_chars
+  with _page_cache_lock:
+    previous = _page_cache.pop(url, None)
+    if previous is not None:
+      _page_cache_chars -= len(previous.text)
+    if page is None or len(page.text) > _CACHE_MAX_CHARS:
+      return
+    _page_cache[url] = page
+    _page_cache_chars += len(page.text)
+    while _page_cache_chars > _CACHE_MAX_CHARS:
+      _, evicted = _page_cache.popitem(last=False)
+      _page_cache_chars -= len(evicted.text)
+
+
+def _extract_text(content: bytes) -> str:
+  from bs4 import BeautifulSoup
+
+  soup = BeautifulSoup(content, 'lxml')
+  text = soup.get_text(separator='\n', strip=True)
+  # Split the text into lines, filtering out very short lines
+  # (e.g., single words or short subtitles)
+  return '\n'.join(line for line in text.splitlines() if len(line.split()) > 3)
+
+
+async def load_web_page(url: str) -> str:
   """Fetches the content in the url and returns the text in it.
 
   Args:
@@ -26,16 +150,62 @@ def load_web_page(url: str) -> str:
   Returns:
       str: The text content of the url.
   """
-  from bs4 import BeautifulSoup
+  cached = _get_cached_page(url)
+  if cached is not None and time.monotonic() < cached.expires_at:
+    return cached.text
 
-  response = requests.get(url)
+  headers = {}
+  if cached is not None:
+    if cached.etag:
+      headers['If-None-Match'] = cached.etag
+    if cached.last_modified:
+      headers['If-Modified-Since'] = cached.last_modified
 
-  if response.status_code == 200:
-    soup = BeautifulSoup(response.content, 'lxml')
-    text = soup.get_text(separator='\n', strip=True)
-  else:
-    text = f'Failed to fetch url: {url}'
+  client = _get_http_client()
+  async with client.stream('GET', url, headers=headers) as response:
+    if response.status_code == 304 and cached is not None:
+      ttl = _get_cache_ttl(response.headers)
+      _cache_page(
+          url,
+          None
+          if ttl is None
+          else dataclasses.replace(
+              cached,
+              etag=response.headers.get('etag', cached.etag),
+              expires_at=time.monotonic() + ttl,
+          ),
+      )
+      return cached.text
+    if response.status_code != 200:
+      return f'Failed to fetch url: {url}'
 
-  # Split the text into lines, filtering out very short lines
-  # (e.g., single words or short subtitles)
-  return '\n'.join(line for line in text.splitlines() if len(line.split()) > 3)
+    chunks = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+      chunks.append(chunk)
+      size += len(chunk)
+      if size >= _MAX_CONTENT_BYTES:
+        break
+    content = b''.join(chunks)[:_MAX_CONTENT_BYTES]
+    response_headers = response.headers
+
+  # Parsing large pages takes long enough to stall other agents on the loop.
+  text = await asyncio.to_thread(_extract_text, content)
+
+  ttl = _get_cache_ttl(response_headers)
+  etag = response_headers.get('etag')
+  last_modified = response_headers.get('last-modified')
+  if ttl is None or (ttl == 0 and not etag and not last_modified):
+    # The page can't be reused, nor revalidated.
+    _cache_page(url, None)
+  else:
+    _cache_page(
+        url,
+        _CachedPage(
+            text=text,
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=time.monotonic() + ttl,
+        ),
+    )
+  return text
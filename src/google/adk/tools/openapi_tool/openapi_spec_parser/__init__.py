@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from ._pooled_http import HttpClientConfig
 from .openapi_spec_parser import OpenApiSpecParser
 from .openapi_spec_parser import OperationEndpoint
 from .openapi_spec_parser import ParsedOperation
@@ -23,6 +24,7 @@ from .rest_api_tool import snake_to_lower_camel
 from .tool_auth_handler import ToolAuthHandler
 
 __all__ = [
+    'HttpClientConfig',
     'OpenApiSpecParser',
     'OperationEndpoint',
     'ParsedOperation',
@@ -0,0 +1,164 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any
+from typing import Dict
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+from pydantic import BaseModel
+
+logger = logging.getLogger("google_adk." + __name__)
+
+
+class HttpClientConfig(BaseModel):
+  """Connection pool and timeout settings for calls made by RestApiTools."""
+
+  timeout: float = 60.0
+  """Seconds to wait for a response, and between chunks of the response."""
+
+  connect_timeout: float = 10.0
+  """Seconds to wait for a connection to be established."""
+
+  max_connections: int = 100
+  """Maximum number of concurrent connections across all hosts."""
+
+  max_connections_per_host: int = 20
+  """Maximum number of concurrent requests to a single host."""
+
+  max_keepalive_connections: int = 20
+  """Maximum number of idle connections kept open for reuse."""
+
+  keepalive_expiry: float = 30.0
+  """Seconds an idle connection is kept open."""
+
+  http2: bool = True
+  """Whether to negotiate HTTP/2 with hosts that support it.
+
+  Only takes effect if the `h2` package is installed.
+  """
+
+
+class PooledHttpClient:
+  """An async HTTP client that reuses connections across requests.
+
+  The underlying httpx client is bound to the event loop it was created on,
+  so a new one is created when the client is used from a different loop.
+  """
+
+  def __init__(self, config: Optional[HttpClientConfig] = None):
+    self._config = config or HttpClientConfig()
+    self._client: Optional[httpx.AsyncClient] = None
+    self._loop: Optional[asyncio.AbstractEventLoop] = None
+    self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+  async def request(self, **request_params: Any) -> httpx.Response:
+    """Sends a request.
+
+    Args:
+      **request_params: The keyword arguments produced by
+        `RestApiTool._prepare_request_params`, in the form accepted by
+        `requests.request`.
+
+    Returns:
+      The response, with its body read.
+    """
+    client = self._get_client()
+    host = urlsplit(request_params["url"]).netloc
+    semaphore = self._host_semaphores.get(host)
+    if semaphore is None:
+      semaphore = self._host_semaphores[host] = asyncio.Semaphore(
+          self._config.max_connections_per_host
+      )
+    async with semaphore:
+      return await client.request(**_to_httpx_params(request_params))
+
+  async def close(self) -> None:
+    """Closes all pooled connections."""
+    client, self._client = self._client, None
+    self._loop = None
+    self._host_semaphores = {}
+    if client:
+      await client.aclose()
+
+  def _get_client(self) -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    if self._client is not None and self._loop is loop:
+      return self._client
+    if self._client is not None:
+      # The connections of the previous client belong to another event loop,
+      # so they cannot be closed or reused from this one.
+      logger.debug("Event loop changed, creating a new HTTP client.")
+    config = self._config
+    self._client = httpx.AsyncClient(
+        # Like `requests.request`, which RestApiTools used to call.
+        follow_redirects=True,
+        http2=config.http2 and importlib.util.find_spec("h2") is not None,
+        timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+    )
+    self._loop = loop
+    self._host_semaphores = {}
+    return self._client
+
+
+def _to_httpx_params(request_params: Dict[str, Any]) -> Dict[str, Any]:
+  """Converts `requests.request` style keyword arguments to httpx ones."""
+  params = dict(request_params)
+  headers = dict(params.pop("headers", None) or {})
+  # httpx deprecates per-request cookies, so send them as a header instead.
+  cookies = params.pop("cookies", None)
+  if cookies:
+    headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
+  params["headers"] = headers
+  # requests serializes booleans as "True" and "False", httpx as "true" and
+  # "false"; keep the former so that APIs get the same query strings.
+  if params.get("params"):
+    params["params"] = {
+        k: _to_query_value(v) for k, v in params["params"].items()
+    }
+  # httpx only accepts form fields as `data`; raw bodies go in `content`.
+  data = params.get("data")
+  if isinstance(data, (str, bytes)):
+    params["content"] = params.pop("data")
+  return params
+
+
+def _to_query_value(value: Any) -> Any:
+  if isinstance(value, bool):
+    return str(value)
+  if isinstance(value, (list, tuple)):
+    return [str(v) if isinstance(v, bool) else v for v in value]
+  return value
+
+
+_default_client: Optional[PooledHttpClient] = None
+
+
+def get_default_http_client() -> PooledHttpClient:
+  """Returns the client used by RestApiTools that don't belong to a toolset."""
+  global _default_client
+  if _default_client is None:
+    _default_client = PooledHttpClient()
+  return _default_client
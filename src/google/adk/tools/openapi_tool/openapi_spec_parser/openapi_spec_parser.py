@@ -14,7 +14,10 @@
 
 from __future__ import annotations
 
-import copy
+import collections
+import hashlib
+import json
+import threading
 from typing import Any
 from typing import Dict
 from typing import List
@@ -29,6 +32,9 @@ from ..._gemini_schema_util import _to_snake_case
 from ..common.common import ApiParameter
 from .operation_parser import OperationParser
 
+# Number of specs whose parsed operations are kept for reuse.
+_PARSED_SPEC_CACHE_SIZE = 16
+
 
 class OperationEndpoint(BaseModel):
   base_url: str
@@ -48,6 +54,12 @@ class ParsedOperation(BaseModel):
   additional_context: Optional[Any] = None
 
 
+def _get_spec_hash(openapi_spec_dict: Dict[str, Any]) -> str:
+  return hashlib.sha256(
+      json.dumps(openapi_spec_dict, sort_keys=True, default=str).encode()
+  ).hexdigest()
+
+
 class OpenApiSpecParser:
   """Generates Python code, JSON schema, and callables for an OpenAPI operation.
 
@@ -55,8 +67,16 @@ class OpenApiSpecParser:
   1. A string representation of a Python function that handles the operation.
   2. A JSON schema representing the input parameters of the operation.
   3. A callable Python object (a function) that can execute the operation.
+
+  Parsed operations are cached per process, keyed by a hash of the spec, so
+  building several toolsets from the same spec only parses it once.
   """
 
+  _parsed_spec_cache: collections.OrderedDict[str, List[ParsedOperation]] = (
+      collections.OrderedDict()
+  )
+  _parsed_spec_cache_lock = threading.Lock()
+
   def parse(self, openapi_spec_dict: Dict[str, Any]) -> List[ParsedOperation]:
     """Extracts an OpenAPI spec dict into a list of ParsedOperation objects.
 
@@ -69,9 +89,24 @@ class OpenApiSpecParser:
         A list of ParsedOperation objects.
     """
 
-    openapi_spec_dict = self._resolve_references(openapi_spec_dict)
-    operations = self._collect_operations(openapi_spec_dict)
-    return operations
+    spec_hash = _get_spec_hash(openapi_spec_dict)
+    cache = OpenApiSpecParser._parsed_spec_cache
+    with OpenApiSpecParser._parsed_spec_cache_lock:
+      operations = cache.get(spec_hash)
+      if operations is not None:
+        cache.move_to_end(spec_hash)
+
+    if operations is None:
+      openapi_spec_dict = self._resolve_references(openapi_spec_dict)
+      operations = self._collect_operations(openapi_spec_dict)
+      with OpenApiSpecParser._parsed_spec_cache_lock:
+        cache[spec_hash] = operations
+        while len(cache) > _PARSED_SPEC_CACHE_SIZE:
+          cache.popitem(last=False)
+
+    # Callers get their own ParsedOperation objects. The operations and
+    # parameters inside them are shared, and are not modified after parsing.
+    return [operation.model_copy() for operation in operations]
 
   def _collect_operations(
       self, openapi_spec: Dict[str, Any]
@@ -111,10 +146,15 @@ class OpenApiSpecParser:
         if operation_dict is None:
           continue
 
-        # Append path-level parameters
-        operation_dict["parameters"] = operation_dict.get(
-            "parameters", []
-        ) + path_item.get("parameters", [])
+        # Append path-level parameters. The operation is copied first, as the
+        # resolved spec may be shared with other parses of the same spec.
+        operation_dict = {
+            **operation_dict,
+            "parameters": (
+                operation_dict.get("parameters", [])
+                + path_item.get("parameters", [])
+            ),
+        }
 
         # If operation ID is missing, assign an operation id based on path
         # and method
@@ -163,7 +203,9 @@ class OpenApiSpecParser:
         resolved.
     """
 
-    openapi_spec = copy.deepcopy(openapi_spec)  # Work on a copy
+    # The spec is rebuilt rather than modified in place, and each reference is
+    # resolved once. Places that use the same reference share its resolved
+    # value, so the result must be treated as read-only.
     resolved_cache = {}  # Cache resolved references
 
     def resolve_ref(ref_string, current_doc):
@@ -210,7 +252,7 @@ class OpenApiSpecParser:
 
           # Check if we have a cached resolved value
           if ref_string in resolved_cache:
-            return copy.deepcopy(resolved_cache[ref_string])
+            return resolved_cache[ref_string]
 
           resolved_value = resolve_ref(ref_string, current_doc)
           if resolved_value is not None:
@@ -220,7 +262,7 @@ class OpenApiSpecParser:
                 resolved_value, current_doc, seen_refs
             )
             resolved_cache[ref_string] = resolved_value
-            return copy.deepcopy(resolved_value)  # return the cached result
+            return resolved_value
           else:
             return obj  # return original if no resolved value.
 
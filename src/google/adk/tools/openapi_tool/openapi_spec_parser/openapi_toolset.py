@@ -32,6 +32,8 @@ from ....auth.auth_credential import AuthCredential
 from ....auth.auth_schemes import AuthScheme
 from ...base_toolset import BaseToolset
 from ...base_toolset import ToolPredicate
+from ._pooled_http import HttpClientConfig
+from ._pooled_http import PooledHttpClient
 from .openapi_spec_parser import OpenApiSpecParser
 from .rest_api_tool import RestApiTool
 
@@ -68,6 +70,7 @@ class OpenAPIToolset(BaseToolset):
       auth_scheme: Optional[AuthScheme] = None,
       auth_credential: Optional[AuthCredential] = None,
       tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
+      http_client_config: Optional[HttpClientConfig] = None,
   ):
     """Initializes the OpenAPIToolset.
 
@@ -102,10 +105,13 @@ class OpenAPIToolset(BaseToolset):
         ``google.adk.tools.openapi_tool.auth.auth_helpers``
       tool_filter: The filter used to filter the tools in the toolset. It can be
         either a tool predicate or a list of tool names of the tools to expose.
+      http_client_config: Connection pool and timeout settings of the HTTP
+        client shared by all tools in the toolset.
     """
     super().__init__(tool_filter=tool_filter)
     if not spec_dict:
       spec_dict = self._load_spec(spec_str, spec_str_type)
+    self._http_client = PooledHttpClient(http_client_config)
     self._tools: Final[List[RestApiTool]] = list(self._parse(spec_dict))
     if auth_scheme or auth_credential:
       self._configure_auth_all(auth_scheme, auth_credential)
@@ -155,10 +161,11 @@ class OpenAPIToolset(BaseToolset):
     tools = []
     for o in operations:
       tool = RestApiTool.from_parsed_operation(o)
+      tool.set_http_client(self._http_client)
       logger.info("Parsed tool: %s", tool.name)
       tools.append(tool)
     return tools
 
   @override
   async def close(self):
-    pass
+    await self._http_client.close()
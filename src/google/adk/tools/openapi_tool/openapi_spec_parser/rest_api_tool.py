@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import Any
 from typing import Dict
 from typing import List
@@ -25,7 +26,7 @@ from typing import Union
 from fastapi.openapi.models import Operation
 from fastapi.openapi.models import Schema
 from google.genai.types import FunctionDeclaration
-import requests
+import httpx
 from typing_extensions import override
 
 from ....auth.auth_credential import AuthCredential
@@ -38,6 +39,8 @@ from ..auth.auth_helpers import credential_to_param
 from ..auth.auth_helpers import dict_to_auth_scheme
 from ..auth.credential_exchangers.auto_auth_credential_exchanger import AutoAuthCredentialExchanger
 from ..common.common import ApiParameter
+from ._pooled_http import get_default_http_client
+from ._pooled_http import PooledHttpClient
 from .openapi_spec_parser import OperationEndpoint
 from .openapi_spec_parser import ParsedOperation
 from .operation_parser import OperationParser
@@ -65,6 +68,68 @@ def snake_to_lower_camel(snake_case_string: str):
 AuthPreparationState = Literal["pending", "done"]
 
 
+@dataclasses.dataclass(frozen=True)
+class _RequestTemplate:
+  """The parts of a request that only depend on the operation.
+
+  Compiled once per tool, so that each call only has to place its arguments.
+  """
+
+  endpoint: OperationEndpoint
+  operation: Operation
+  operation_parser: Optional[OperationParser]
+  method: str
+  url_prefix: str
+  path: str
+  user_agent: str
+  body_mime_type: Optional[str]
+  body_schema_type: Optional[str]
+  parameters: List[ApiParameter]
+  """The operation's parameters. Must not be modified."""
+  required_defaults: Dict[str, Any]
+  """Defaults of required parameters, by Python name."""
+
+  @classmethod
+  def compile(cls, tool: RestApiTool) -> _RequestTemplate:
+    from ....version import __version__ as adk_version
+
+    method = tool.endpoint.method.lower()
+    if not method:
+      raise ValueError("Operation method not found.")
+
+    base_url = tool.endpoint.base_url or ""
+    body_mime_type, body_schema_type = None, None
+    request_body = tool.operation.requestBody
+    if request_body:
+      # Only the first mime type is used.
+      for mime_type, media_type_object in request_body.content.items():
+        body_mime_type = mime_type
+        body_schema_type = media_type_object.schema_.type
+        break
+
+    operation_parser = getattr(tool, "_operation_parser", None)
+    parameters = operation_parser.get_parameters() if operation_parser else []
+    return cls(
+        endpoint=tool.endpoint,
+        operation=tool.operation,
+        operation_parser=operation_parser,
+        method=method,
+        url_prefix=base_url[:-1] if base_url.endswith("/") else base_url,
+        path=tool.endpoint.path,
+        user_agent=f"google-adk/{adk_version} (tool: {tool.name})",
+        body_mime_type=body_mime_type,
+        body_schema_type=body_schema_type,
+        parameters=parameters,
+        required_defaults={
+            param.py_name: param.param_schema.default
+            for param in parameters
+            if param.required
+            and isinstance(param.param_schema, Schema)
+            and param.param_schema.default is not None
+        },
+    )
+
+
 class RestApiTool(BaseTool):
   """A generic tool that interacts with a REST API.
 
@@ -136,6 +201,8 @@ class RestApiTool(BaseTool):
     # Private properties
     self.credential_exchanger = AutoAuthCredentialExchanger()
     self._default_headers: Dict[str, str] = {}
+    self._http_client: Optional[PooledHttpClient] = None
+    self._request_template: Optional[_RequestTemplate] = None
     if should_parse_operation:
       self._operation_parser = OperationParser(self.operation)
 
@@ -163,6 +230,7 @@ class RestApiTool(BaseTool):
         operation=parsed.operation,
         auth_scheme=parsed.auth_scheme,
         auth_credential=parsed.auth_credential,
+        should_parse_operation=False,
     )
     generated._operation_parser = operation_parser
     return generated
@@ -222,6 +290,26 @@ class RestApiTool(BaseTool):
     """Sets default headers that are merged into every request."""
     self._default_headers = headers
 
+  def set_http_client(self, http_client: Optional[PooledHttpClient]):
+    """Sets the client used to send requests.
+
+    Tools without a client share a process-wide default one.
+    """
+    self._http_client = http_client
+
+  def _get_request_template(self) -> _RequestTemplate:
+    """Returns the compiled request template, recompiling it if needed."""
+    template = self._request_template
+    if (
+        template is None
+        or template.endpoint is not self.endpoint
+        or template.operation is not self.operation
+        or template.operation_parser
+        is not getattr(self, "_operation_parser", None)
+    ):
+      template = self._request_template = _RequestTemplate.compile(self)
+    return template
+
   def _prepare_auth_request_params(
       self,
       auth_scheme: AuthScheme,
@@ -252,20 +340,15 @@ class RestApiTool(BaseTool):
         self._prepare_request_params({"input_id": "test-id"})
     """
 
-    method = self.endpoint.method.lower()
-    if not method:
-      raise ValueError("Operation method not found.")
+    template = self._get_request_template()
 
     path_params: Dict[str, Any] = {}
     query_params: Dict[str, Any] = {}
     header_params: Dict[str, Any] = {}
     cookie_params: Dict[str, Any] = {}
 
-    from ....version import __version__ as adk_version
-
     # Set the custom User-Agent header
-    user_agent = f"google-adk/{adk_version} (tool: {self.name})"
-    header_params["User-Agent"] = user_agent
+    header_params["User-Agent"] = template.user_agent
 
     params_map: Dict[str, ApiParameter] = {p.py_name: p for p in parameters}
 
@@ -289,53 +372,48 @@ class RestApiTool(BaseTool):
         cookie_params[original_k] = v
 
     # Construct URL
-    base_url = self.endpoint.base_url or ""
-    base_url = base_url[:-1] if base_url.endswith("/") else base_url
-    url = f"{base_url}{self.endpoint.path.format(**path_params)}"
+    url = f"{template.url_prefix}{template.path.format(**path_params)}"
 
     # Construct body
     body_kwargs: Dict[str, Any] = {}
-    request_body = self.operation.requestBody
-    if request_body:
-      for mime_type, media_type_object in request_body.content.items():
-        schema = media_type_object.schema_
-        body_data = None
-
-        if schema.type == "object":
-          body_data = {}
-          for param in parameters:
-            if param.param_location == "body" and param.py_name in kwargs:
-              body_data[param.original_name] = kwargs[param.py_name]
-
-        elif schema.type == "array":
-          for param in parameters:
-            if param.param_location == "body" and param.py_name == "array":
-              body_data = kwargs.get("array")
-              break
-        else:  # like string
-          for param in parameters:
-            # original_name = '' indicating this param applies to the full body.
-            if param.param_location == "body" and not param.original_name:
-              body_data = (
-                  kwargs.get(param.py_name) if param.py_name in kwargs else None
-              )
-              break
-
-        if mime_type == "application/json" or mime_type.endswith("+json"):
-          if body_data is not None:
-            body_kwargs["json"] = body_data
-        elif mime_type == "application/x-www-form-urlencoded":
-          body_kwargs["data"] = body_data
-        elif mime_type == "multipart/form-data":
-          body_kwargs["files"] = body_data
-        elif mime_type == "application/octet-stream":
-          body_kwargs["data"] = body_data
-        elif mime_type == "text/plain":
-          body_kwargs["data"] = body_data
-
-        if mime_type:
-          header_params["Content-Type"] = mime_type
-        break  # Process only the first mime_type
+    mime_type = template.body_mime_type
+    if mime_type is not None:
+      body_data = None
+
+      if template.body_schema_type == "object":
+        body_data = {}
+        for param in parameters:
+          if param.param_location == "body" and param.py_name in kwargs:
+            body_data[param.original_name] = kwargs[param.py_name]
+
+      elif template.body_schema_type == "array":
+        for param in parameters:
+          if param.param_location == "body" and param.py_name == "array":
+            body_data = kwargs.get("array")
+            break
+      else:  # like string
+        for param in parameters:
+          # original_name = '' indicating this param applies to the full body.
+          if param.param_location == "body" and not param.original_name:
+            body_data = (
+                kwargs.get(param.py_name) if param.py_name in kwargs else None
+            )
+            break
+
+      if mime_type == "application/json" or mime_type.endswith("+json"):
+        if body_data is not None:
+          body_kwargs["json"] = body_data
+      elif mime_type == "application/x-www-form-urlencoded":
+        body_kwargs["data"] = body_data
+      elif mime_type == "multipart/form-data":
+        body_kwargs["files"] = body_data
+      elif mime_type == "application/octet-stream":
+        body_kwargs["data"] = body_data
+      elif mime_type == "text/plain":
+        body_kwargs["data"] = body_data
+
+      if mime_type:
+        header_params["Content-Type"] = mime_type
 
     filtered_query_params: Dict[str, Any] = {
         k: v for k, v in query_params.items() if v is not None
@@ -345,7 +423,7 @@ class RestApiTool(BaseTool):
       header_params.setdefault(key, value)
 
     request_params: Dict[str, Any] = {
-        "method": method,
+        "method": template.method,
         "url": url,
         "params": filtered_query_params,
         "headers": header_params,
@@ -391,18 +469,12 @@ class RestApiTool(BaseTool):
           "message": "Needs your authorization to access your data.",
       }
 
-    # Attach parameters from auth into main parameters list
-    api_params, api_args = self._operation_parser.get_parameters().copy(), args
+    template = self._get_request_template()
+    api_params, api_args = template.parameters, args
 
     # Add any required arguments that are missing and have defaults:
-    for api_param in api_params:
-      if api_param.py_name not in api_args:
-        if (
-            api_param.required
-            and isinstance(api_param.param_schema, Schema)
-            and api_param.param_schema.default is not None
-        ):
-          api_args[api_param.py_name] = api_param.param_schema.default
+    for py_name, default in template.required_defaults.items():
+      api_args.setdefault(py_name, default)
 
     if auth_credential:
       # Attach parameters from auth into main parameters list
@@ -415,13 +487,14 @@ class RestApiTool(BaseTool):
 
     # Got all parameters. Call the API.
     request_params = self._prepare_request_params(api_params, api_args)
-    response = requests.request(**request_params)
+    http_client = self._http_client or get_default_http_client()
+    response = await http_client.request(**request_params)
 
     # Parse API response
     try:
       response.raise_for_status()  # Raise HTTPError for bad responses
       return response.json()  # Try to decode JSON
-    except requests.exceptions.HTTPError:
+    except httpx.HTTPStatusError:
       error_details = response.content.decode("utf-8")
       return {
           "error": (
@@ -16,17 +16,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import threading
+from typing import Any
 from typing import Optional
 
+from llama_index.core import load_index_from_storage
 from llama_index.core import SimpleDirectoryReader
+from llama_index.core import StorageContext
 from llama_index.core import VectorStoreIndex
+from llama_index.core.base.base_retriever import BaseRetriever
 from llama_index.core.base.embeddings.base import BaseEmbedding
+from typing_extensions import override
 
+from ..tool_context import ToolContext
 from .llama_index_retrieval import LlamaIndexRetrieval
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_MANIFEST_FILE_NAME = "files_manifest.json"
+
 
 def _get_default_embedding_model() -> BaseEmbedding:
   """Get the default Google Gemini embedding model.
@@ -48,6 +61,14 @@ def _get_default_embedding_model() -> BaseEmbedding:
     ) from e
 
 
+def _hash_file(path: str) -> str:
+  digest = hashlib.sha256()
+  with open(path, "rb") as f:
+    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+      digest.update(chunk)
+  return digest.hexdigest()
+
+
 class FilesRetrieval(LlamaIndexRetrieval):
 
   def __init__(
@@ -57,24 +78,166 @@ class FilesRetrieval(LlamaIndexRetrieval):
       description: str,
       input_dir: str,
       embedding_model: Optional[BaseEmbedding] = None,
+      persist_dir: Optional[str] = None,
   ):
     """Initialize FilesRetrieval with optional embedding model.
 
+    The files are indexed when the tool is first used, rather than on
+    construction.
+
     Args:
       name: Name of the tool.
       description: Description of the tool.
       input_dir: Directory path containing files to index.
       embedding_model: Optional custom embedding model. If None, defaults to
         Google's text-embedding-004 model.
+      persist_dir: Optional directory to persist the index in. If set, the
+        index is loaded from there, and only the files added, changed or
+        removed since it was persisted are embedded again. Files are compared
+        by path, modification time, size and content hash.
     """
     self.input_dir = input_dir
+    self.persist_dir = persist_dir
 
     if embedding_model is None:
       embedding_model = _get_default_embedding_model()
-
-    logger.info("Loading data from %s", input_dir)
-    retriever = VectorStoreIndex.from_documents(
-        SimpleDirectoryReader(input_dir).load_data(),
-        embed_model=embedding_model,
-    ).as_retriever()
-    super().__init__(name=name, description=description, retriever=retriever)
+    self._embedding_model = embedding_model
+    self._retriever: Optional[BaseRetriever] = None
+    self._retriever_lock = threading.Lock()
+    super().__init__(name=name, description=description, retriever=None)
+
+  @property
+  def retriever(self) -> BaseRetriever:
+    """The retriever over the indexed files, loaded on first use."""
+    if self._retriever is None:
+      self._load_retriever()
+    return self._retriever
+
+  @retriever.setter
+  def retriever(self, retriever: Optional[BaseRetriever]) -> None:
+    self._retriever = retriever
+
+  @override
+  async def run_async(
+      self, *, args: dict[str, Any], tool_context: ToolContext
+  ) -> Any:
+    if self._retriever is None:
+      # Indexing reads and embeds the files, so it is kept off the event loop.
+      await asyncio.to_thread(self._load_retriever)
+    return await super().run_async(args=args, tool_context=tool_context)
+
+  def _load_retriever(self) -> None:
+    with self._retriever_lock:
+      if self._retriever is not None:
+        return
+      logger.info("Loading data from %s", self.input_dir)
+      if self.persist_dir is None:
+        index = VectorStoreIndex.from_documents(
+            SimpleDirectoryReader(self.input_dir).load_data(),
+            embed_model=self._embedding_model,
+        )
+      else:
+        index = self._load_persisted_index()
+      self._retriever = index.as_retriever()
+
+  def _load_persisted_index(self) -> VectorStoreIndex:
+    """Loads the persisted index, updating it for the changed files."""
+    manifest_path = os.path.join(self.persist_dir, _MANIFEST_FILE_NAME)
+    embedding_model_id = (
+        f"{type(self._embedding_model).__qualname__}:"
+        f"{self._embedding_model.model_name}"
+    )
+    index = None
+    indexed_files = {}
+    if os.path.exists(manifest_path):
+      with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+      # Embeddings of different models can't be compared with each other.
+      if manifest.get("embedding_model") == embedding_model_id:
+        try:
+          index = load_index_from_storage(
+              StorageContext.from_defaults(persist_dir=self.persist_dir),
+              embed_model=self._embedding_model,
+          )
+          indexed_files = manifest["files"]
+        except Exception:  # pylint: disable=broad-except
+          logger.warning(
+              "Failed to load the index from %s, rebuilding it.",
+              self.persist_dir,
+              exc_info=True,
+          )
+
+    files = {}
+    changed_paths = []
+    for input_file in SimpleDirectoryReader(self.input_dir).input_files:
+      # Both readers key files by the same normalized path.
+      path = os.path.abspath(input_file)
+      stat = os.stat(path)
+      entry = indexed_files.get(path)
+      if (
+          entry
+          and entry["mtime_ns"] == stat.st_mtime_ns
+          and entry["size"] == stat.st_size
+      ):
+        files[path] = entry
+        continue
+      content_hash = _hash_file(path)
+      if entry and entry["sha256"] == content_hash:
+        files[path] = {**entry, "mtime_ns": stat.st_mtime_ns}
+        continue
+      files[path] = {
+          "mtime_ns": stat.st_mtime_ns,
+          "size": stat.st_size,
+          "sha256": content_hash,
+          "doc_ids": [],
+      }
+      changed_paths.append(path)
+
+    removed_paths = [path for path in indexed_files if path not in files]
+    is_new_index = index is None
+    if not is_new_index:
+      for path in removed_paths + changed_paths:
+        for doc_id in indexed_files.get(path, {}).get("doc_ids", []):
+          index.delete_ref_doc(doc_id, delete_from_docstore=True)
+
+    documents = (
+        SimpleDirectoryReader(
+            input_files=changed_paths, filename_as_id=True
+        ).load_data()
+        if changed_paths
+        else []
+    )
+    tracked_documents = []
+    for document in documents:
+      file_path = document.metadata.get("file_path")
+      entry = files.get(os.path.abspath(file_path)) if file_path else None
+      if entry is None:
+        # A document that can't be traced to its file could never be removed
+        # from the index once the file changes, so it is not indexed.
+        logger.warning(
+            "Skipping document %s of unknown file %s.", document.id_, file_path
+        )
+        continue
+      entry["doc_ids"].append(document.id_)
+      tracked_documents.append(document)
+    documents = tracked_documents
+    logger.info(
+        "Indexing %d new or changed files, removing %d files from the index.",
+        len(changed_paths),
+        len(removed_paths),
+    )
+
+    if is_new_index:
+      index = VectorStoreIndex.from_documents(
+          documents, embed_model=self._embedding_model
+      )
+    else:
+      for document in documents:
+        index.insert(document)
+
+    if is_new_index or changed_paths or removed_paths:
+      index.storage_context.persist(persist_dir=self.persist_dir)
+    if files != indexed_files:
+      with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"embedding_model": embedding_model_id, "files": files}, f)
+    return index
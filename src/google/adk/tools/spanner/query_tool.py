@@ -14,9 +14,16 @@
 
 from __future__ import annotations
 
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+from typing import Union
+
 from google.auth.credentials import Credentials
 
 from . import utils
+from .. import _query_result_artifacts
 from ..tool_context import ToolContext
 from .settings import SpannerToolSettings
 
@@ -72,3 +79,71 @@ def execute_sql(
       settings,
       tool_context,
   )
+
+
+def get_execute_sql(
+    settings: SpannerToolSettings,
+) -> Callable[..., Union[dict, Awaitable[dict]]]:
+  """Get the execute_sql tool customized as per the given tool settings.
+
+  Args:
+      settings: Spanner tool settings indicating the behavior of the
+        execute_sql tool.
+
+  Returns:
+      callable[..., dict]: A version of the execute_sql tool respecting the tool
+      settings.
+  """
+  if not settings or settings.result_artifact_threshold_rows is None:
+    return execute_sql
+  return _query_result_artifacts.store_large_results(
+      execute_sql,
+      threshold_rows=settings.result_artifact_threshold_rows,
+      max_rows=settings.max_result_artifact_rows,
+      max_inline_rows=(
+          settings.max_executed_query_result_rows
+          if settings.max_executed_query_result_rows > 0
+          else utils.DEFAULT_MAX_EXECUTED_QUERY_RESULT_ROWS
+      ),
+      reader_tool_name="spanner_read_query_result",
+  )
+
+
+async def read_query_result(
+    result_artifact: str,
+    settings: SpannerToolSettings,
+    tool_context: ToolContext,
+    offset: int = 0,
+    columns: Optional[list[str]] = None,
+    filters: Optional[dict[str, Any]] = None,
+) -> dict:
+  """Read rows of a query result that execute_sql stored as an artifact.
+
+  Args:
+      result_artifact (str): The "result_artifact" name returned by
+        execute_sql.
+      settings (SpannerToolSettings): The settings for the tool.
+      tool_context (ToolContext): The context for the tool.
+      offset (int, default 0): The number of matching rows to skip, to page
+        through the result.
+      columns (list[str], optional): The columns to return. If not set, all
+        columns are returned.
+      filters (dict, optional): Column values that the returned rows must be
+        equal to, such as {"country": "US"}.
+
+  Returns:
+      dict: Dictionary with the "rows" of the page and the "row_count" of the
+            rows matching the filters. If there are more matching rows, the
+            "next_offset" field contains the offset of the next page.
+  """
+  return await _query_result_artifacts.read_query_result(
+      tool_context,
+      result_artifact,
+      offset=offset,
+      limit=(
+          settings.result_artifact_threshold_rows
+          or settings.max_executed_query_result_rows
+      ),
+      columns=columns,
+      filters=filters,
+  )
@@ -16,8 +16,10 @@ from __future__ import annotations
 
 from enum import Enum
 from typing import List
+from typing import Optional
 
 from pydantic import BaseModel
+from pydantic import Field
 
 from ...utils.feature_decorator import experimental
 
@@ -44,3 +46,25 @@ class SpannerToolSettings(BaseModel):
 
   max_executed_query_result_rows: int = 50
   """Maximum number of rows to return from a query result."""
+
+  result_artifact_threshold_rows: Optional[int] = None
+  """Number of rows above which a query result is stored as an artifact.
+
+  By default, all the rows of a query result, up to
+  `max_executed_query_result_rows`, are returned to the model as lists of
+  values. If set, rows are returned as objects keyed by column name, and a
+  result with more rows is streamed to a Parquet artifact through the artifact
+  service instead, with up to `max_result_artifact_rows` rows. The model gets a
+  summary with the schema, row count and first rows of the result, and can page
+  through or filter the stored result with the `spanner_read_query_result`
+  tool. A result with at most this many rows is returned
+  inline, but still only up to `max_executed_query_result_rows` rows, and is
+  flagged as likely truncated past them.
+  """
+
+  max_result_artifact_rows: int = Field(default=1_000_000, gt=0)
+  """Maximum number of rows of a query result stored as an artifact.
+
+  Only applies if `result_artifact_threshold_rows` is set. The rows past it are
+  not read, and the result is flagged as likely truncated.
+  """
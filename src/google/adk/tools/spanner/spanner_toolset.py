@@ -28,6 +28,7 @@ from ...tools.base_tool import BaseTool
 from ...tools.base_toolset import BaseToolset
 from ...tools.base_toolset import ToolPredicate
 from ...tools.google_tool import GoogleTool
+from ...tools.tool_cache_config import METADATA_TOOL_CACHE_CONFIG
 from ...utils.feature_decorator import experimental
 from .settings import Capabilities
 from .settings import SpannerToolSettings
@@ -47,6 +48,8 @@ class SpannerToolset(BaseToolset):
     - spanner_list_named_schemas
     - spanner_get_table_schema
     - spanner_execute_sql
+    - spanner_similarity_search
+    - spanner_read_query_result, if `result_artifact_threshold_rows` is set
   """
 
   def __init__(
@@ -91,6 +94,7 @@ class SpannerToolset(BaseToolset):
             func=func,
             credentials_config=self._credentials_config,
             tool_settings=self._tool_settings,
+            cache_config=METADATA_TOOL_CACHE_CONFIG,
         )
         for func in [
             # Metadata tools
@@ -109,11 +113,19 @@ class SpannerToolset(BaseToolset):
     ):
       all_tools.append(
           GoogleTool(
-              func=query_tool.execute_sql,
+              func=query_tool.get_execute_sql(self._tool_settings),
               credentials_config=self._credentials_config,
               tool_settings=self._tool_settings,
           )
       )
+      if self._tool_settings.result_artifact_threshold_rows is not None:
+        all_tools.append(
+            GoogleTool(
+                func=query_tool.read_query_result,
+                credentials_config=self._credentials_config,
+                tool_settings=self._tool_settings,
+            )
+        )
       all_tools.append(
           GoogleTool(
               func=search_tool.similarity_search,
@@ -15,18 +15,50 @@
 from __future__ import annotations
 
 import json
+from typing import Iterator
 from typing import Optional
 
 from google.auth.credentials import Credentials
 from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
 
 from . import client
+from .. import _query_result_artifacts
 from ..tool_context import ToolContext
 from .settings import SpannerToolSettings
 
 DEFAULT_MAX_EXECUTED_QUERY_RESULT_ROWS = 50
 
 
+def _to_json_compatible(value):
+  try:
+    # if the json serialization of the value succeeds, use it as is
+    json.dumps(value)
+  except:
+    value = str(value)
+  return value
+
+
+def _stream_rows(
+    database,
+    query: str,
+    params: Optional[dict],
+    params_types: Optional[dict],
+) -> Iterator[dict]:
+  """Yields all the rows of a query as dicts, holding a snapshot meanwhile."""
+  with database.snapshot() as snapshot:
+    result_set = snapshot.execute_sql(
+        sql=query, params=params, param_types=params_types
+    )
+    column_names = None
+    for row in result_set:
+      if column_names is None:
+        column_names = [field.name for field in result_set.fields]
+      yield {
+          name: _to_json_compatible(value)
+          for name, value in zip(column_names, row)
+      }
+
+
 def execute_sql(
     project_id: str,
     instance_id: str,
@@ -74,6 +106,14 @@ def execute_sql(
           "error_details": "PostgreSQL dialect is not supported.",
       }
 
+    if _query_result_artifacts.is_storing_large_results():
+      # The result may be stored as an artifact, so all of its rows are
+      # streamed to it.
+      return {
+          "status": "SUCCESS",
+          "rows": _stream_rows(database, query, params, params_types),
+      }
+
     with database.snapshot() as snapshot:
       result_set = snapshot.execute_sql(
           sql=query, params=params, param_types=params_types
@@ -84,12 +124,21 @@ def execute_sql(
           if settings and settings.max_executed_query_result_rows > 0
           else DEFAULT_MAX_EXECUTED_QUERY_RESULT_ROWS
       )
+      rows_as_dicts = (
+          settings is not None
+          and settings.result_artifact_threshold_rows is not None
+      )
+      column_names = None
       for row in result_set:
-        try:
-          # if the json serialization of the row succeeds, use it as is
-          json.dumps(row)
-        except:
-          row = str(row)
+        if rows_as_dicts:
+          if column_names is None:
+            column_names = [field.name for field in result_set.fields]
+          row = {
+              name: _to_json_compatible(value)
+              for name, value in zip(column_names, row)
+          }
+        else:
+          row = _to_json_compatible(row)
 
         rows.append(row)
         counter -= 1
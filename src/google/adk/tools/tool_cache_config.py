@@ -0,0 +1,48 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import Literal
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+
+
+class ToolCacheConfig(BaseModel):
+  """Declares that the results of a tool may be served from a cache.
+
+  Setting it on a tool declares the tool idempotent: calling it again with the
+  same arguments, within the scope and TTL given here, returns the same result
+  and has no other effect. Results are only cached when a caching plugin, e.g.
+  `ToolResultCachePlugin`, is used.
+  """
+
+  model_config = ConfigDict(extra="forbid", frozen=True)
+
+  ttl_seconds: Optional[float] = Field(default=None, gt=0)
+  """How long a result stays valid, if bounded."""
+
+  scope: Literal["invocation", "session", "user", "app"] = "session"
+  """Who a cached result is shared with: the calls of the same invocation,
+  session, user, or all the users of the app."""
+
+
+# The results of read-only metadata tools, e.g. those listing the tables of a
+# database, are shared by the calls of a user, who may not have access to the
+# same resources as others, and expire as the metadata may be changed outside
+# of the agent.
+METADATA_TOOL_CACHE_CONFIG = ToolCacheConfig(scope="user", ttl_seconds=5 * 60)
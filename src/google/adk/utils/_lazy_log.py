@@ -0,0 +1,76 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazily rendered log messages.
+
+This module is for ADK internal use only.
+Please do not rely on the implementation details.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+from typing import Callable
+
+# Overrides the length debug messages built by `lazy_log` are truncated to.
+# Zero or a negative value disables truncation.
+_MAX_CHARS_ENV_VAR = 'ADK_DEBUG_LOG_MAX_CHARS'
+_DEFAULT_MAX_CHARS = 64 * 1024
+
+
+def _get_max_chars() -> int:
+  try:
+    return int(os.environ.get(_MAX_CHARS_ENV_VAR, _DEFAULT_MAX_CHARS))
+  except ValueError:
+    return _DEFAULT_MAX_CHARS
+
+
+def truncate_log(message: str, max_chars: int) -> str:
+  """Truncates message to max_chars, noting how much was left out."""
+  if max_chars <= 0 or len(message) <= max_chars:
+    return message
+  return (
+      f'{message[:max_chars]}\n... [truncated {len(message) - max_chars} of'
+      f' {len(message)} chars]'
+  )
+
+
+class lazy_log:  # pylint: disable=invalid-name
+  """A log message built only when the log record is emitted.
+
+  Logging calls only turn their message into a string once a handler emits
+  the record, so passing a `lazy_log` instead of an already built message
+  skips the serialization of requests and responses when the level is
+  disabled:
+
+    logger.debug(lazy_log(_build_request_log, llm_request))
+
+  The built message is truncated to `ADK_DEBUG_LOG_MAX_CHARS` characters.
+  """
+
+  __slots__ = ('_build', '_args', '_kwargs')
+
+  def __init__(self, build: Callable[..., str], *args: Any, **kwargs: Any):
+    self._build = build
+    self._args = args
+    self._kwargs = kwargs
+
+  def __str__(self) -> str:
+    return truncate_log(
+        self._build(*self._args, **self._kwargs), _get_max_chars()
+    )
+
+  def __repr__(self) -> str:
+    return str(self)
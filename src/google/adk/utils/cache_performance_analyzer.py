@@ -26,6 +26,7 @@ from typing import List
 from typing import Optional
 
 from google.adk.models.cache_metadata import CacheMetadata
+from google.adk.models.context_cache_registry import get_context_cache_registry
 from google.adk.sessions.base_session_service import BaseSessionService
 from google.adk.utils.feature_decorator import experimental
 
@@ -97,6 +98,8 @@ class CachePerformanceAnalyzer:
         - avg_cached_tokens_per_request: Average cached tokens per request
         - total_requests: Total number of requests processed
         - requests_with_cache_hits: Number of requests that had cache hits
+        - registry: Metrics of the caches shared by all sessions in the
+          process, see `ContextCacheRegistry.get_metrics`
     """
     cache_history = await self._get_agent_cache_history(
         session_id, user_id, app_name, agent_name
@@ -165,4 +168,5 @@ class CachePerformanceAnalyzer:
         "avg_cached_tokens_per_request": avg_cached_tokens_per_request,
         "total_requests": total_requests,
         "requests_with_cache_hits": requests_with_cache_hits,
+        "registry": get_context_cache_registry().get_metrics(),
     }
@@ -0,0 +1,248 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+# Skip all tests in this module if Python version is less than 3.10
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="A2A requires Python 3.10+"
+)
+
+# Import dependencies with version checking
+try:
+  from a2a.types import AgentCapabilities
+  from a2a.types import AgentCard
+  from google.adk.a2a.utils.client_pool import A2AClientPool
+  from google.adk.agents.llm_agent import LlmAgent
+  from google.adk.agents.remote_a2a_agent import prefetch_agent_cards
+  from google.adk.agents.remote_a2a_agent import RemoteA2aAgent
+  from google.adk.runners import Runner
+  from google.adk.sessions.in_memory_session_service import InMemorySessionService
+except ImportError as e:
+  if sys.version_info < (3, 10):
+    # Imports are only needed for the skipped tests.
+    pass
+  else:
+    raise e
+
+_CARD_URL = "https://example.com/.well-known/agent-card.json"
+
+
+def _card_json(name: str = "remote_agent") -> dict:
+  return AgentCard(
+      name=name,
+      url="https://example.com/rpc",
+      description="A remote agent",
+      version="1.0",
+      capabilities=AgentCapabilities(),
+      default_input_modes=["text/plain"],
+      default_output_modes=["application/json"],
+      skills=[],
+  ).model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+class _CardServer:
+  """Serves an agent card with the given headers, answering revalidations."""
+
+  def __init__(self, headers=None):
+    self.headers = headers or {}
+    self.requests = []
+
+  async def __call__(self, request: httpx.Request) -> httpx.Response:
+    self.requests.append(request)
+    # Lets concurrent fetches overlap.
+    await asyncio.sleep(0)
+    etag = self.headers.get("etag")
+    if etag and request.headers.get("if-none-match") == etag:
+      return httpx.Response(304, headers=self.headers)
+    return httpx.Response(200, headers=self.headers, json=_card_json())
+
+
+class _Clock:
+
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+def _create_pool(server: _CardServer, clock=None) -> A2AClientPool:
+  pool = A2AClientPool(clock=clock or _Clock())
+  client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+  pool.get_client = lambda url, timeout: client
+  return pool
+
+
+@pytest.mark.asyncio
+async def test_get_client_is_shared_per_host_and_timeout():
+  pool = A2AClientPool()
+
+  client = pool.get_client("https://example.com/a", 600.0)
+
+  assert pool.get_client("https://example.com/b", 600.0) is client
+  assert pool.get_client("https://other.com/a", 600.0) is not client
+  assert pool.get_client("https://example.com/a", 30.0) is not client
+  await pool.aclose()
+  assert client.is_closed
+  assert pool.get_client("https://example.com/a", 600.0) is not client
+
+
+def test_clients_are_kept_per_event_loop():
+  pool = A2AClientPool(max_clients=2)
+
+  async def get_client(url):
+    return pool.get_client(url, 600.0)
+
+  first_loop = asyncio.new_event_loop()
+  first = first_loop.run_until_complete(get_client("https://example.com"))
+  second_loop = asyncio.new_event_loop()
+  try:
+    second = second_loop.run_until_complete(get_client("https://example.com"))
+    assert second is not first
+    assert (
+        first_loop.run_until_complete(get_client("https://example.com"))
+        is first
+    )
+
+    # Clients of closed loops are forgotten.
+    first_loop.close()
+    second_loop.run_until_complete(get_client("https://other.com"))
+    assert len(pool._clients) == 2
+
+    # Past the limit, the least recently used clients are forgotten.
+    second_loop.run_until_complete(get_client("https://example.com"))
+    second_loop.run_until_complete(get_client("https://third.com"))
+    assert [key[0] for key in pool._clients] == [
+        "https://example.com",
+        "https://third.com",
+    ]
+  finally:
+    second_loop.run_until_complete(pool.aclose())
+    second_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_agent_card_is_cached_for_max_age():
+  server = _CardServer(headers={"cache-control": "max-age=60"})
+  clock = _Clock()
+  pool = _create_pool(server, clock)
+
+  card = await pool.get_agent_card(_CARD_URL, 10.0)
+  assert card.name == "remote_agent"
+  assert (await pool.get_agent_card(_CARD_URL, 10.0)) == card
+  assert len(server.requests) == 1
+
+  clock.now = 61
+  await pool.get_agent_card(_CARD_URL, 10.0)
+  assert len(server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_agent_card_is_revalidated_with_etag():
+  server = _CardServer(headers={"cache-control": "no-cache", "etag": '"v1"'})
+  pool = _create_pool(server)
+
+  first = await pool.get_agent_card(_CARD_URL, 10.0)
+  second = await pool.get_agent_card(_CARD_URL, 10.0)
+
+  assert second == first
+  assert len(server.requests) == 2
+  assert server.requests[1].headers["if-none-match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_concurrent_agent_card_fetches_are_sent_once():
+  server = _CardServer()
+  pool = _create_pool(server)
+
+  cards = await asyncio.gather(
+      *(pool.get_agent_card(_CARD_URL, 10.0) for _ in range(5))
+  )
+
+  assert len(server.requests) == 1
+  assert all(card == cards[0] for card in cards)
+
+
+@pytest.mark.asyncio
+async def test_prefetch_agent_cards_resolves_pooled_agents():
+  server = _CardServer()
+  pool = _create_pool(server)
+  pooled = [
+      RemoteA2aAgent(
+          name=f"remote_{i}", agent_card=_CARD_URL, a2a_client_pool=pool
+      )
+      for i in range(3)
+  ]
+  unpooled = RemoteA2aAgent(name="unpooled", agent_card=_CARD_URL)
+  root_agent = LlmAgent(name="root", sub_agents=[*pooled, unpooled])
+
+  await prefetch_agent_cards(root_agent)
+
+  assert len(server.requests) == 1
+  assert all(agent._is_resolved for agent in pooled)
+  assert not unpooled._is_resolved
+  assert not pooled[0]._httpx_client_needs_cleanup
+
+
+@pytest.mark.asyncio
+async def test_concurrent_resolutions_run_once():
+  server = _CardServer()
+  pool = _create_pool(server)
+  remote_agent = RemoteA2aAgent(
+      name="remote", agent_card=_CARD_URL, a2a_client_pool=pool
+  )
+  root_agent = LlmAgent(name="root", sub_agents=[remote_agent])
+
+  with patch.object(
+      RemoteA2aAgent,
+      "_resolve_agent_card",
+      autospec=True,
+      side_effect=RemoteA2aAgent._resolve_agent_card,
+  ) as resolve_agent_card:
+    # The prefetch of a runner and a first run resolve the agent together.
+    await asyncio.gather(
+        prefetch_agent_cards(root_agent), remote_agent._ensure_resolved()
+    )
+
+  assert remote_agent._is_resolved
+  assert len(server.requests) == 1
+  resolve_agent_card.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_runner_prefetches_agent_cards():
+  server = _CardServer()
+  pool = _create_pool(server)
+  remote_agent = RemoteA2aAgent(
+      name="remote", agent_card=_CARD_URL, a2a_client_pool=pool
+  )
+  runner = Runner(
+      app_name="test_app",
+      agent=LlmAgent(name="root", sub_agents=[remote_agent]),
+      session_service=InMemorySessionService(),
+  )
+  # Creating the runner doesn't fetch anything.
+  assert runner._agent_card_prefetch is None
+
+  runner._start_agent_card_prefetch()
+  await runner._agent_card_prefetch
+
+  assert remote_agent._is_resolved
+  assert len(server.requests) == 1
@@ -14,6 +14,7 @@
 
 """Tests for GeminiContextCacheManager."""
 
+import asyncio
 import time
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
@@ -21,6 +22,7 @@ from unittest.mock import patch
 
 from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.models.cache_metadata import CacheMetadata
+from google.adk.models.context_cache_registry import ContextCacheRegistry
 from google.adk.models.gemini_context_cache_manager import GeminiContextCacheManager
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
@@ -35,7 +37,8 @@ class TestGeminiContextCacheManager:
   def setup_method(self):
     """Set up test fixtures."""
     mock_client = AsyncMock(spec=Client)
-    self.manager = GeminiContextCacheManager(mock_client)
+    self.registry = ContextCacheRegistry()
+    self.manager = GeminiContextCacheManager(mock_client, self.registry)
     self.cache_config = ContextCacheConfig(
         cache_intervals=10,
         ttl_seconds=1800,
@@ -163,15 +166,8 @@ class TestGeminiContextCacheManager:
     self.manager.genai_client.aio.caches.create.assert_not_called()
 
   async def test_handle_context_caching_invalid_cache_fingerprint_match(self):
-    """Test invalid cache with matching fingerprint creates new cache."""
-    # Setup mocks
-    mock_cached_content = AsyncMock()
-    mock_cached_content.name = (
-        "projects/test/locations/us-central1/cachedContents/new456"
-    )
-    self.manager.genai_client.aio.caches.create = AsyncMock(
-        return_value=mock_cached_content
-    )
+    """Test invalid cache with matching fingerprint has its TTL extended."""
+    self.manager.genai_client.aio.caches.update = AsyncMock()
 
     # Create request with invalid existing cache
     existing_cache = self.create_cache_metadata(
@@ -194,8 +190,47 @@ class TestGeminiContextCacheManager:
 
       result = await self.manager.handle_context_caching(llm_request)
 
-    assert result is not None
-    # Should create new cache when fingerprints match
+    # Same content - the cache is extended instead of recreated
+    assert result.cache_name == existing_cache.cache_name
+    assert result.invocations_used == 1
+    assert result.expire_time > existing_cache.expire_time
+    assert llm_request.config.cached_content == existing_cache.cache_name
+    update_call = self.manager.genai_client.aio.caches.update.call_args
+    assert update_call[1]["name"] == existing_cache.cache_name
+    assert update_call[1]["config"].ttl == "1800s"
+    mock_cleanup.assert_not_called()
+    self.manager.genai_client.aio.caches.create.assert_not_called()
+
+  async def test_handle_context_caching_extension_failure_recreates_cache(
+      self,
+  ):
+    """Test a cache that can't be extended is replaced by a new one."""
+    mock_cached_content = AsyncMock()
+    mock_cached_content.name = (
+        "projects/test/locations/us-central1/cachedContents/new456"
+    )
+    self.manager.genai_client.aio.caches.create = AsyncMock(
+        return_value=mock_cached_content
+    )
+    self.manager.genai_client.aio.caches.update = AsyncMock(
+        side_effect=RuntimeError("not found")
+    )
+
+    existing_cache = self.create_cache_metadata(invocations_used=15)
+    llm_request = self.create_llm_request(cache_metadata=existing_cache)
+    llm_request.cacheable_contents_token_count = 2048
+
+    with (
+        patch.object(self.manager, "_is_cache_valid", return_value=False),
+        patch.object(self.manager, "cleanup_cache") as mock_cleanup,
+        patch.object(
+            self.manager,
+            "_generate_cache_fingerprint",
+            return_value="test_fingerprint",
+        ),
+    ):
+      result = await self.manager.handle_context_caching(llm_request)
+
     assert (
         result.cache_name
         == "projects/test/locations/us-central1/cachedContents/new456"
@@ -203,6 +238,54 @@ class TestGeminiContextCacheManager:
     mock_cleanup.assert_called_once_with(existing_cache.cache_name)
     self.manager.genai_client.aio.caches.create.assert_called_once()
 
+  async def test_handle_context_caching_expired_cache_is_recreated(self):
+    """Test an expired cache is recreated rather than extended."""
+    mock_cached_content = AsyncMock()
+    mock_cached_content.name = (
+        "projects/test/locations/us-central1/cachedContents/new456"
+    )
+    self.manager.genai_client.aio.caches.create = AsyncMock(
+        return_value=mock_cached_content
+    )
+    self.manager.genai_client.aio.caches.update = AsyncMock()
+
+    existing_cache = self.create_cache_metadata(expired=True)
+    llm_request = self.create_llm_request(cache_metadata=existing_cache)
+    llm_request.cacheable_contents_token_count = 2048
+
+    with (
+        patch.object(self.manager, "cleanup_cache"),
+        patch.object(
+            self.manager,
+            "_generate_cache_fingerprint",
+            return_value="test_fingerprint",
+        ),
+    ):
+      result = await self.manager.handle_context_caching(llm_request)
+
+    assert (
+        result.cache_name
+        == "projects/test/locations/us-central1/cachedContents/new456"
+    )
+    assert result.invocations_used == 1
+    self.manager.genai_client.aio.caches.update.assert_not_called()
+
+  async def test_valid_cache_close_to_expiry_is_extended(self):
+    """Test a valid cache about to expire has its TTL extended."""
+    self.manager.genai_client.aio.caches.update = AsyncMock()
+    existing_cache = self.create_cache_metadata(invocations_used=2).model_copy(
+        update={"expire_time": time.time() + 30}
+    )
+    llm_request = self.create_llm_request(cache_metadata=existing_cache)
+
+    with patch.object(self.manager, "_is_cache_valid", return_value=True):
+      result = await self.manager.handle_context_caching(llm_request)
+
+    assert result.cache_name == existing_cache.cache_name
+    assert result.invocations_used == 2
+    assert result.expire_time > time.time() + 1700
+    self.manager.genai_client.aio.caches.update.assert_called_once()
+
   async def test_handle_context_caching_invalid_cache_fingerprint_mismatch(
       self,
   ):
@@ -627,3 +710,159 @@ class TestGeminiContextCacheManager:
     assert result.cache_name is None
     assert result.fingerprint == "test_fp"
     self.manager.genai_client.aio.caches.create.assert_not_called()
+
+
+class TestContextCacheRegistry:
+  """Tests for sharing caches between sessions through the registry."""
+
+  def setup_method(self):
+    self.client = AsyncMock(spec=Client)
+    self.created = 0
+
+    async def create(model, config):
+      self.created += 1
+      await asyncio.sleep(0.01)
+      cached_content = MagicMock()
+      cached_content.name = f"cachedContents/{self.created}"
+      return cached_content
+
+    self.client.aio.caches.create = AsyncMock(side_effect=create)
+    self.client.aio.caches.delete = AsyncMock()
+    self.client.aio.caches.update = AsyncMock()
+    self.registry = ContextCacheRegistry()
+    self.cache_config = ContextCacheConfig(
+        cache_intervals=2, ttl_seconds=1800, min_tokens=0
+    )
+
+  def create_llm_request(self, manager, prefix="Shared history"):
+    """Creates a request whose metadata matches its first content."""
+    llm_request = LlmRequest(
+        model="gemini-2.0-flash",
+        contents=[
+            types.Content(role="model", parts=[types.Part(text=prefix)]),
+            types.Content(role="user", parts=[types.Part(text="Question")]),
+        ],
+        config=types.GenerateContentConfig(
+            system_instruction="Shared instruction"
+        ),
+        cache_config=self.cache_config,
+        cacheable_contents_token_count=4096,
+    )
+    llm_request.cache_metadata = CacheMetadata(
+        fingerprint=manager._generate_cache_fingerprint(llm_request, 1),
+        contents_count=1,
+    )
+    return llm_request
+
+  def create_manager(self):
+    # Each request builds its own manager, sharing the registry.
+    return GeminiContextCacheManager(self.client, self.registry)
+
+  async def test_concurrent_sessions_share_one_cache(self):
+    managers = [self.create_manager() for _ in range(5)]
+
+    results = await asyncio.gather(*[
+        manager.handle_context_caching(self.create_llm_request(manager))
+        for manager in managers
+    ])
+
+    assert self.created == 1
+    assert {r.cache_name for r in results} == {"cachedContents/1"}
+    assert all(r.invocations_used == 1 for r in results)
+    metrics = self.registry.get_metrics()
+    assert metrics["creations"] == 1
+    assert metrics["joins"] == 4
+    assert metrics["live_caches"] == 1
+    assert metrics["hit_rate"] == 0.8
+
+  async def test_later_session_joins_live_cache(self):
+    manager = self.create_manager()
+    await manager.handle_context_caching(self.create_llm_request(manager))
+
+    result = await manager.handle_context_caching(
+        self.create_llm_request(manager)
+    )
+    other = await manager.handle_context_caching(
+        self.create_llm_request(manager, prefix="Other history")
+    )
+
+    assert result.cache_name == "cachedContents/1"
+    assert other.cache_name == "cachedContents/2"
+    assert self.created == 2
+
+  async def test_shared_cache_is_deleted_after_last_release(self):
+    manager = self.create_manager()
+    first = await manager.handle_context_caching(
+        self.create_llm_request(manager)
+    )
+    await manager.handle_context_caching(self.create_llm_request(manager))
+
+    # The first session's prefix changes, the other session still uses it.
+    changed_request = self.create_llm_request(manager, prefix="Changed")
+    changed_request.cache_metadata = first
+    await manager.handle_context_caching(changed_request)
+    self.client.aio.caches.delete.assert_not_called()
+
+    changed_request = self.create_llm_request(manager, prefix="Changed")
+    changed_request.cache_metadata = first
+    await manager.handle_context_caching(changed_request)
+    self.client.aio.caches.delete.assert_called_once_with(
+        name="cachedContents/1"
+    )
+    assert self.registry.get_metrics()["live_caches"] == 0
+
+  async def test_exhausted_cache_is_extended_once_for_all_sessions(self):
+    manager = self.create_manager()
+    cache_metadata = await manager.handle_context_caching(
+        self.create_llm_request(manager)
+    )
+    # Pretend the cache was created long ago and is used past its intervals.
+    self.registry.clear()
+    exhausted = cache_metadata.model_copy(
+        update={"invocations_used": 3, "expire_time": time.time() + 600}
+    )
+
+    requests = []
+    for _ in range(3):
+      llm_request = self.create_llm_request(manager)
+      llm_request.cache_metadata = exhausted
+      requests.append(llm_request)
+    results = await asyncio.gather(
+        *[manager.handle_context_caching(r) for r in requests]
+    )
+
+    self.client.aio.caches.update.assert_called_once()
+    self.client.aio.caches.delete.assert_not_called()
+    assert self.created == 1
+    assert {r.cache_name for r in results} == {cache_metadata.cache_name}
+    assert all(r.invocations_used == 1 for r in results)
+    assert len({r.expire_time for r in results}) == 1
+    assert self.registry.get_metrics()["extensions"] == 1
+
+  async def test_expired_caches_are_forgotten(self):
+    now = 1000.0
+    registry = ContextCacheRegistry(clock=lambda: now)
+
+    async def create(name):
+      return CacheMetadata(
+          cache_name=name,
+          expire_time=now + 600,
+          fingerprint="fingerprint",
+          invocations_used=0,
+          contents_count=1,
+      )
+
+    for name in ["cachedContents/1", "cachedContents/2"]:
+      await registry.acquire(name, lambda name=name: create(name))
+    assert registry.get_metrics()["live_caches"] == 2
+
+    # Caches whose prefix is never sent again are dropped once expired.
+    now += 601
+    await registry.acquire(
+        "cachedContents/3", lambda: create("cachedContents/3")
+    )
+    assert registry.get_metrics()["live_caches"] == 1
+
+    now += 601
+    assert registry.release("cachedContents/1")
+    assert registry.get_metrics()["live_caches"] == 0
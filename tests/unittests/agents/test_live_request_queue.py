@@ -1,9 +1,12 @@
+import asyncio
+import threading
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from google.adk.agents.live_request_queue import LiveRequest
 from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.live_request_queue import OverflowPolicy
 from google.genai import types
 import pytest
 
@@ -54,3 +57,130 @@ async def test_get():
 
     assert result == res
     mock_get.assert_called_once()
+
+
+def _pcm(data: bytes) -> types.Blob:
+  return types.Blob(data=data, mime_type="audio/pcm;rate=16000")
+
+
+async def _drain(queue: LiveRequestQueue) -> list[LiveRequest]:
+  requests = []
+  while queue.stats.depth:
+    requests.append(await queue.get())
+  return requests
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_drops_oldest_frames():
+  queue = LiveRequestQueue(max_size=2)
+
+  queue.send_realtime(_pcm(b"1"))
+  queue.send_content(types.Content(parts=[types.Part(text="hi")]))
+  queue.send_realtime(_pcm(b"2"))
+  queue.send_realtime(_pcm(b"3"))
+
+  requests = await _drain(queue)
+  assert [
+      r.blob.data if r.blob else r.content.parts[0].text for r in requests
+  ] == [
+      "hi",
+      b"2",
+      b"3",
+  ]
+  assert queue.stats.dropped_frames == 1
+  assert queue.stats.max_depth == 3
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_coalesces_pcm_frames():
+  queue = LiveRequestQueue(max_size=1, overflow_policy=OverflowPolicy.COALESCE)
+
+  queue.send_realtime(_pcm(b"ab"))
+  queue.send_realtime(_pcm(b"cd"))
+  queue.send_realtime(types.Blob(data=b"jpeg", mime_type="image/jpeg"))
+
+  requests = await _drain(queue)
+  # The image can't be coalesced, so it replaces the audio frame.
+  assert [r.blob.data for r in requests] == [b"jpeg"]
+  assert queue.stats.coalesced_frames == 1
+  assert queue.stats.dropped_frames == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_block_policy():
+  queue = LiveRequestQueue(max_size=1, overflow_policy=OverflowPolicy.BLOCK)
+  queue.send_realtime(_pcm(b"1"))
+
+  with pytest.raises(asyncio.QueueFull):
+    queue.send_realtime(_pcm(b"2"))
+
+  sender = threading.Thread(
+      target=queue.send_realtime_threadsafe, args=(_pcm(b"3"),)
+  )
+  sender.start()
+  await asyncio.sleep(0.05)
+  # The sender waits until a frame is consumed.
+  assert sender.is_alive()
+  assert (await queue.get()).blob.data == b"1"
+  assert (await queue.get()).blob.data == b"3"
+  await asyncio.to_thread(sender.join)
+
+
+@pytest.mark.asyncio
+async def test_block_policy_does_not_bound_control_requests():
+  queue = LiveRequestQueue(max_size=1, overflow_policy=OverflowPolicy.BLOCK)
+  queue.send_realtime(_pcm(b"1"))
+
+  # A stalled session can still be closed.
+  queue.send_activity_end()
+  queue.send_content(types.Content(parts=[types.Part(text="hi")]))
+  queue.close()
+
+  requests = await _drain(queue)
+  assert requests[0].blob.data == b"1"
+  assert requests[-1].close
+
+
+def _run_in_thread(func, *args):
+  errors = []
+
+  def run():
+    try:
+      func(*args)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      errors.append(e)
+
+  thread = threading.Thread(target=run)
+  thread.start()
+  thread.join(timeout=5)
+  if errors:
+    raise errors[0]
+
+
+def test_send_realtime_threadsafe_before_the_loop_runs():
+  queue = LiveRequestQueue(max_size=1, overflow_policy=OverflowPolicy.BLOCK)
+
+  _run_in_thread(queue.send_realtime_threadsafe, _pcm(b"1"))
+  # There is no room, and no running loop to make some.
+  with pytest.raises(asyncio.QueueFull):
+    _run_in_thread(queue.send_realtime_threadsafe, _pcm(b"2"))
+
+  async def consume():
+    return await queue.get()
+
+  assert asyncio.run(consume()).blob.data == b"1"
+
+
+@pytest.mark.asyncio
+async def test_send_realtime_threadsafe_from_other_thread():
+  queue = LiveRequestQueue()
+
+  def capture_audio():
+    for i in range(100):
+      queue.send_realtime_threadsafe(_pcm(bytes([i])))
+
+  await asyncio.to_thread(capture_audio)
+
+  received = [(await queue.get()).blob.data for _ in range(100)]
+  assert received == [bytes([i]) for i in range(100)]
+  assert queue.stats.depth == 0
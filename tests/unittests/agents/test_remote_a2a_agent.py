@@ -696,6 +696,54 @@ class TestRemoteA2aAgentMessageHandling:
     assert parts == []
     assert context_id is None
 
+  def test_construct_message_parts_from_session_converts_events_once(self):
+    """Test that events are converted once across requests."""
+    self.mock_session.events = [
+        Event(
+            author="user",
+            content=genai_types.Content(
+                role="user", parts=[genai_types.Part(text="Hello")]
+            ),
+        )
+    ]
+    self.mock_genai_part_converter.side_effect = lambda part: Mock()
+
+    first_parts, _ = self.agent._construct_message_parts_from_session(
+        self.mock_context
+    )
+    second_parts, _ = self.agent._construct_message_parts_from_session(
+        self.mock_context
+    )
+
+    assert second_parts == first_parts
+    assert self.mock_genai_part_converter.call_count == 1
+
+  def test_construct_message_parts_from_session_after_sync_cursor(self):
+    """Test that only events after the synced one are sent."""
+
+    def user_event(text):
+      return Event(
+          author="user",
+          content=genai_types.Content(
+              role="user", parts=[genai_types.Part(text=text)]
+          ),
+      )
+
+    synced_event = user_event("First")
+    self.mock_session.events = [synced_event]
+    self.agent._update_sync_cursor(
+        self.mock_context, synced_event, "context-123"
+    )
+    self.mock_session.events.append(user_event("Second"))
+    self.mock_genai_part_converter.side_effect = lambda part: part.text
+
+    parts, context_id = self.agent._construct_message_parts_from_session(
+        self.mock_context
+    )
+
+    assert parts == ["Second"]
+    assert context_id == "context-123"
+
   @pytest.mark.asyncio
   async def test_handle_a2a_response_success_with_message(self):
     """Test successful A2A response handling with message."""
@@ -1695,6 +1743,248 @@ class TestRemoteA2aAgentExecution:
                       request_metadata=request_metadata,
                   )
 
+  async def _run_with_responses(self, agent, responses, error=None):
+    """Runs agent against a client streaming responses, then raising error."""
+    agent._is_resolved = True
+
+    async def send_message(request, request_metadata=None):
+      for response in responses:
+        yield response
+      if error:
+        raise error
+
+    agent._a2a_client = Mock()
+    agent._a2a_client.send_message = send_message
+    self.mock_context.app_name = "test_app"
+    self.mock_context.user_id = "user-123"
+
+    async def handle_response(a2a_response, ctx):
+      return Event(
+          author=agent.name,
+          invocation_id=ctx.invocation_id,
+          branch=ctx.branch,
+      )
+
+    request = A2AMessage(
+        message_id="request-123",
+        parts=[TextPart(text="Hello")],
+        role="user",
+    )
+    with patch.object(
+        agent,
+        "_create_a2a_request_for_user_function_response",
+        return_value=request,
+    ):
+      with patch.object(
+          agent, "_handle_a2a_response", side_effect=handle_response
+      ):
+        return [
+            event async for event in agent._run_async_impl(self.mock_context)
+        ]
+
+  def _create_agent(self, **kwargs):
+    return RemoteA2aAgent(
+        name="test_agent",
+        agent_card=self.agent_card,
+        genai_part_converter=self.mock_genai_part_converter,
+        a2a_part_converter=self.mock_a2a_part_converter,
+        **kwargs,
+    )
+
+  def _create_response(self, text):
+    return A2AMessage(
+        message_id=f"response-{text}",
+        parts=[TextPart(text=text)],
+        role="agent",
+        context_id="context-123",
+    )
+
+  @pytest.mark.asyncio
+  async def test_request_metadata_in_every_event_by_default(self):
+    """Test that the request is embedded in every event by default."""
+    agent = self._create_agent()
+
+    events = await self._run_with_responses(
+        agent, [self._create_response("a"), self._create_response("b")]
+    )
+
+    assert len(events) == 2
+    for event in events:
+      assert (
+          event.custom_metadata[A2A_METADATA_PREFIX + "request"]["messageId"]
+          == "request-123"
+      )
+      assert A2A_METADATA_PREFIX + "request_id" not in event.custom_metadata
+    assert events[1].custom_metadata[A2A_METADATA_PREFIX + "response"] == (
+        self._create_response("b").model_dump(exclude_none=True, by_alias=True)
+    )
+
+  @pytest.mark.asyncio
+  async def test_request_metadata_in_first_event(self):
+    """Test that later events only reference the request by id."""
+    agent = self._create_agent(request_metadata_storage="first_event")
+
+    events = await self._run_with_responses(
+        agent,
+        [self._create_response("a"), self._create_response("b")],
+        error=RuntimeError("stream broken"),
+    )
+
+    assert len(events) == 3
+    assert A2A_METADATA_PREFIX + "request" in events[0].custom_metadata
+    for event in events:
+      assert (
+          event.custom_metadata[A2A_METADATA_PREFIX + "request_id"]
+          == "request-123"
+      )
+    for event in events[1:]:
+      assert A2A_METADATA_PREFIX + "request" not in event.custom_metadata
+    assert events[2].error_message == "A2A request failed: stream broken"
+
+  @pytest.mark.asyncio
+  async def test_request_metadata_in_artifact(self):
+    """Test that the request is saved once as an artifact."""
+    agent = self._create_agent(request_metadata_storage="artifact")
+    self.mock_context.artifact_service = AsyncMock()
+
+    events = await self._run_with_responses(
+        agent, [self._create_response("a"), self._create_response("b")]
+    )
+
+    save_artifact = self.mock_context.artifact_service.save_artifact
+    save_artifact.assert_awaited_once()
+    kwargs = save_artifact.call_args.kwargs
+    assert kwargs["filename"] == "a2a_request_request-123.json"
+    assert kwargs["session_id"] == "session-123"
+    assert json.loads(kwargs["artifact"].inline_data.data)["messageId"] == (
+        "request-123"
+    )
+    for event in events:
+      assert A2A_METADATA_PREFIX + "request" not in event.custom_metadata
+      assert event.custom_metadata[A2A_METADATA_PREFIX + "request_id"] == (
+          "request-123"
+      )
+      assert (
+          event.custom_metadata[A2A_METADATA_PREFIX + "request_artifact"]
+          == "a2a_request_request-123.json"
+      )
+
+  @pytest.mark.asyncio
+  async def test_request_metadata_in_artifact_without_artifact_service(self):
+    """Test that the request is embedded once without artifact service."""
+    agent = self._create_agent(request_metadata_storage="artifact")
+    self.mock_context.artifact_service = None
+
+    events = await self._run_with_responses(
+        agent, [self._create_response("a"), self._create_response("b")]
+    )
+
+    assert A2A_METADATA_PREFIX + "request" in events[0].custom_metadata
+    assert A2A_METADATA_PREFIX + "request" not in events[1].custom_metadata
+    assert (
+        A2A_METADATA_PREFIX + "request_artifact"
+        not in events[0].custom_metadata
+    )
+
+  @pytest.mark.asyncio
+  async def test_response_metadata_summary(self):
+    """Test that summaries only keep the ids and state of responses."""
+    agent = self._create_agent(response_metadata_verbosity="summary")
+    task = A2ATask(
+        id="task-123",
+        context_id="context-123",
+        status=TaskStatus(state=TaskState.working),
+    )
+
+    events = await self._run_with_responses(
+        agent, [self._create_response("a"), (task, None)]
+    )
+
+    assert events[0].custom_metadata[A2A_METADATA_PREFIX + "response"] == {
+        "messageId": "response-a",
+        "contextId": "context-123",
+        "role": "agent",
+    }
+    assert events[1].custom_metadata[A2A_METADATA_PREFIX + "response"] == {
+        "id": "task-123",
+        "contextId": "context-123",
+        "status": {"state": "working"},
+    }
+
+  async def _run_twice_with_eventless_reply(self, reply):
+    """Runs agent for two user messages, the first one replied to by reply."""
+    agent = self._create_agent()
+    agent._is_resolved = True
+    requests = []
+
+    async def send_message(request, request_metadata=None):
+      requests.append(request)
+      if len(requests) == 1:
+        yield reply
+
+    agent._a2a_client = Mock()
+    agent._a2a_client.send_message = send_message
+    self.mock_genai_part_converter.side_effect = lambda part: TextPart(
+        text=part.text
+    )
+
+    def user_event(text):
+      return Event(
+          author="user",
+          content=genai_types.Content(
+              role="user", parts=[genai_types.Part(text=text)]
+          ),
+      )
+
+    self.mock_session.events = [user_event("First")]
+    # The reply has no content of its own, so it emits no event.
+    with patch.object(agent, "_handle_a2a_response", return_value=None):
+      _ = [event async for event in agent._run_async_impl(self.mock_context)]
+      self.mock_session.events.append(user_event("Second"))
+      _ = [event async for event in agent._run_async_impl(self.mock_context)]
+    return requests
+
+  @pytest.mark.asyncio
+  async def test_run_async_impl_sends_only_new_events(self):
+    """Test that events sent without a reply are not sent again."""
+    requests = await self._run_twice_with_eventless_reply(
+        A2AMessage(
+            message_id="response-1",
+            parts=[],
+            role="agent",
+            context_id="context-123",
+        )
+    )
+
+    assert [[part.root.text for part in r.parts] for r in requests] == [
+        ["First"],
+        ["Second"],
+    ]
+    assert [r.context_id for r in requests] == [None, "context-123"]
+
+  @pytest.mark.asyncio
+  async def test_run_async_impl_resends_events_without_known_context(self):
+    """Test that events sent to an unknown remote context are sent again."""
+    requests = await self._run_twice_with_eventless_reply(
+        A2AMessage(message_id="response-1", parts=[], role="agent")
+    )
+
+    assert [[part.root.text for part in r.parts] for r in requests] == [
+        ["First"],
+        ["First", "Second"],
+    ]
+    assert [r.context_id for r in requests] == [None, None]
+
+  @pytest.mark.asyncio
+  async def test_response_metadata_none(self):
+    """Test that responses can be left out of the metadata."""
+    agent = self._create_agent(response_metadata_verbosity="none")
+
+    events = await self._run_with_responses(agent, [self._create_response("a")])
+
+    assert A2A_METADATA_PREFIX + "response" not in events[0].custom_metadata
+    assert A2A_METADATA_PREFIX + "request" in events[0].custom_metadata
+
 
 class TestRemoteA2aAgentExecutionFromFactory:
   """Test agent execution functionality."""
@@ -19,7 +19,9 @@ from unittest.mock import Mock
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.apps.app import App
 from google.adk.apps.app import EventsCompactionConfig
+from google.adk.apps.compaction import _run_compaction
 from google.adk.apps.compaction import _run_compaction_for_sliding_window
+from google.adk.apps.compaction import _run_compaction_for_token_budget
 from google.adk.apps.llm_event_summarizer import LlmEventSummarizer
 from google.adk.events.event import Event
 from google.adk.events.event_actions import EventActions
@@ -225,6 +227,172 @@ class TestCompaction(unittest.IsolatedAsyncioTestCase):
     self.mock_compactor.maybe_summarize_events.assert_called_once()
     self.mock_session_service.append_event.assert_not_called()
 
+  def _token_budget_app(self, token_threshold, target_token_budget=None):
+    return App(
+        name='test',
+        root_agent=Mock(spec=BaseAgent),
+        events_compaction_config=EventsCompactionConfig(
+            summarizer=self.mock_compactor,
+            token_threshold=token_threshold,
+            target_token_budget=target_token_budget,
+        ),
+    )
+
+  def test_events_compaction_config_requires_a_trigger(self):
+    with self.assertRaises(ValueError):
+      EventsCompactionConfig(summarizer=self.mock_compactor)
+    with self.assertRaises(ValueError):
+      EventsCompactionConfig(token_threshold=10, target_token_budget=20)
+
+  async def test_run_compaction_for_token_budget_below_threshold(self):
+    app = self._token_budget_app(token_threshold=100)
+    # Each event is 40 chars, i.e. ~10 tokens.
+    events = [
+        self._create_event(1.0, 'inv1', 'a' * 40),
+        self._create_event(2.0, 'inv2', 'b' * 40),
+    ]
+    session = Session(app_name='test', user_id='u1', id='s1', events=events)
+
+    await _run_compaction_for_token_budget(
+        app, session, self.mock_session_service
+    )
+
+    self.mock_compactor.maybe_summarize_events.assert_not_called()
+    self.mock_session_service.append_event.assert_not_called()
+
+  async def test_run_compaction_for_token_budget_folds_oldest_invocations(
+      self,
+  ):
+    app = self._token_budget_app(token_threshold=25, target_token_budget=15)
+    # ~10 tokens per event, ~40 tokens in total.
+    events = [
+        self._create_event(1.0, 'inv1', 'a' * 40),
+        self._create_event(2.0, 'inv1', 'b' * 40),
+        self._create_event(3.0, 'inv2', 'c' * 40),
+        self._create_event(4.0, 'inv3', 'd' * 40),
+    ]
+    session = Session(app_name='test', user_id='u1', id='s1', events=events)
+    mock_compacted_event = self._create_compacted_event(1.0, 3.0, 'Summary')
+    self.mock_compactor.maybe_summarize_events.return_value = (
+        mock_compacted_event
+    )
+
+    await _run_compaction_for_token_budget(
+        app, session, self.mock_session_service
+    )
+
+    # inv1 and inv2 are folded; inv3 alone fits the target budget.
+    compacted_events_arg = self.mock_compactor.maybe_summarize_events.call_args[
+        1
+    ]['events']
+    self.assertEqual(
+        [e.timestamp for e in compacted_events_arg], [1.0, 2.0, 3.0]
+    )
+    self.mock_session_service.append_event.assert_called_once_with(
+        session=session, event=mock_compacted_event
+    )
+
+  async def test_run_compaction_for_token_budget_keeps_latest_invocation(
+      self,
+  ):
+    app = self._token_budget_app(token_threshold=10, target_token_budget=0)
+    events = [
+        self._create_event(1.0, 'inv1', 'a' * 40),
+        self._create_event(2.0, 'inv2', 'b' * 400),
+    ]
+    session = Session(app_name='test', user_id='u1', id='s1', events=events)
+    self.mock_compactor.maybe_summarize_events.return_value = None
+
+    await _run_compaction_for_token_budget(
+        app, session, self.mock_session_service
+    )
+
+    compacted_events_arg = self.mock_compactor.maybe_summarize_events.call_args[
+        1
+    ]['events']
+    self.assertEqual([e.invocation_id for e in compacted_events_arg], ['inv1'])
+    self.mock_session_service.append_event.assert_not_called()
+
+  async def test_run_compaction_for_token_budget_is_incremental(self):
+    app = self._token_budget_app(token_threshold=25, target_token_budget=10)
+    previous_summary = self._create_compacted_event(1.0, 2.0, 's' * 40)
+    events = [
+        self._create_event(1.0, 'inv1', 'a' * 40),
+        self._create_event(2.0, 'inv2', 'b' * 40),
+        previous_summary,
+        self._create_event(3.0, 'inv3', 'c' * 40),
+        self._create_event(4.0, 'inv4', 'd' * 40),
+    ]
+    session = Session(app_name='test', user_id='u1', id='s1', events=events)
+
+    await _run_compaction_for_token_budget(
+        app, session, self.mock_session_service
+    )
+
+    # Only the previous summary and the newly folded invocation are sent.
+    compacted_events_arg = self.mock_compactor.maybe_summarize_events.call_args[
+        1
+    ]['events']
+    self.assertEqual(compacted_events_arg, [previous_summary, events[3]])
+
+  async def test_run_compaction_dispatches_on_config(self):
+    app = self._token_budget_app(token_threshold=1000)
+    events = [self._create_event(1.0, 'inv1', 'e1')]
+    session = Session(app_name='test', user_id='u1', id='s1', events=events)
+
+    await _run_compaction(app, session, self.mock_session_service)
+
+    # Token mode is configured, so the invocation count is not a trigger.
+    self.mock_compactor.maybe_summarize_events.assert_not_called()
+
+  def test_get_contents_keeps_events_after_range_before_compaction(self):
+    # inv3 finished before the summary of inv1-inv2 was appended.
+    events = [
+        self._create_event(1.0, 'inv1', 'Event 1'),
+        self._create_event(2.0, 'inv2', 'Event 2'),
+        self._create_event(3.0, 'inv3', 'Event 3'),
+        self._create_compacted_event(1.0, 2.0, 'Summary 1-2'),
+        self._create_event(4.0, 'inv4', 'Event 4'),
+    ]
+
+    result_contents = contents._get_contents(None, events)
+    expected_texts = ['Summary 1-2', 'Event 3', 'Event 4']
+    actual_texts = [c.parts[0].text for c in result_contents]
+    self.assertEqual(actual_texts, expected_texts)
+
+  def test_get_contents_skips_superseded_compaction(self):
+    events = [
+        self._create_event(1.0, 'inv1', 'Event 1'),
+        self._create_event(2.0, 'inv2', 'Event 2'),
+        self._create_compacted_event(1.0, 2.0, 'Summary 1-2'),
+        self._create_event(3.0, 'inv3', 'Event 3'),
+        self._create_compacted_event(1.0, 3.0, 'Summary 1-3'),
+        self._create_event(4.0, 'inv4', 'Event 4'),
+    ]
+
+    result_contents = contents._get_contents(None, events)
+    expected_texts = ['Summary 1-3', 'Event 4']
+    actual_texts = [c.parts[0].text for c in result_contents]
+    self.assertEqual(actual_texts, expected_texts)
+
+  def test_get_contents_with_overlapping_compactions(self):
+    events = [
+        self._create_event(1.0, 'inv1', 'Event 1'),
+        self._create_event(2.0, 'inv2', 'Event 2'),
+        self._create_event(3.0, 'inv3', 'Event 3'),
+        self._create_compacted_event(1.0, 3.0, 'Summary 1-3'),
+        self._create_event(4.0, 'inv4', 'Event 4'),
+        # Only a later summary containing its range supersedes a summary.
+        self._create_compacted_event(2.0, 4.0, 'Summary 2-4'),
+        self._create_compacted_event(2.0, 3.0, 'Summary 2-3'),
+        self._create_event(5.0, 'inv5', 'Event 5'),
+    ]
+
+    result_contents = contents._get_contents(None, events)
+    expected_texts = ['Summary 1-3', 'Summary 2-3', 'Summary 2-4', 'Event 5']
+    actual_texts = [c.parts[0].text for c in result_contents]
+    self.assertEqual(actual_texts, expected_texts)
+
   def test_get_contents_with_multiple_compactions(self):
 
     # Event timestamps: 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0
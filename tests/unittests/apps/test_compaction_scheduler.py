@@ -0,0 +1,127 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest import mock
+
+from google.adk.apps import compaction
+from google.adk.apps.compaction import CompactionScheduler
+from google.adk.sessions.base_session_service import BaseSessionService
+from google.adk.sessions.session import Session
+import pytest
+
+
+def _session(session_id: str = 's1') -> Session:
+  return Session(app_name='test', user_id='u1', id=session_id)
+
+
+class _BlockingCompaction:
+  """Stands in for _run_compaction and blocks until released."""
+
+  def __init__(self):
+    self.release = asyncio.Event()
+    self.calls = []
+    self.in_flight = 0
+    self.max_in_flight = 0
+
+  async def __call__(self, app, session, session_service):
+    self.calls.append(session)
+    self.in_flight += 1
+    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+    try:
+      await self.release.wait()
+    finally:
+      self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_requests_for_same_session_are_coalesced():
+  fake = _BlockingCompaction()
+  session_service = mock.AsyncMock(spec=BaseSessionService)
+  refreshed = _session()
+  session_service.get_session.return_value = refreshed
+  scheduler = CompactionScheduler()
+
+  with mock.patch.object(compaction, '_run_compaction', fake):
+    scheduler.schedule(mock.Mock(), _session(), session_service)
+    await asyncio.sleep(0)
+    assert scheduler.stats.in_flight == 1
+
+    # Two more turns finish while the first compaction is running.
+    scheduler.schedule(mock.Mock(), _session(), session_service)
+    scheduler.schedule(mock.Mock(), _session(), session_service)
+    assert scheduler.stats.queued == 1
+    assert scheduler.stats.coalesced == 1
+
+    fake.release.set()
+    await scheduler.close()
+
+  # One run for the first turn and one follow-up for the coalesced turns,
+  # which re-reads the session to see the first run's summary.
+  assert len(fake.calls) == 2
+  assert fake.calls[1] is refreshed
+  session_service.get_session.assert_awaited_once_with(
+      app_name='test', user_id='u1', session_id='s1'
+  )
+  assert scheduler.stats.completed == 2
+  assert scheduler.stats.queued == 0
+  assert scheduler.stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_compactions_are_capped():
+  fake = _BlockingCompaction()
+  session_service = mock.AsyncMock(spec=BaseSessionService)
+  scheduler = CompactionScheduler(max_concurrent_compactions=2)
+
+  with mock.patch.object(compaction, '_run_compaction', fake):
+    for i in range(5):
+      scheduler.schedule(mock.Mock(), _session(f's{i}'), session_service)
+    await asyncio.sleep(0)
+    assert scheduler.stats.in_flight == 2
+    assert scheduler.stats.queued == 3
+
+    fake.release.set()
+    await scheduler.close()
+
+  assert fake.max_in_flight == 2
+  assert len(fake.calls) == 5
+  session_service.get_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_compaction_is_counted_and_does_not_raise():
+  scheduler = CompactionScheduler()
+  failing = mock.AsyncMock(side_effect=ValueError('boom'))
+
+  with mock.patch.object(compaction, '_run_compaction', failing):
+    scheduler.schedule(mock.Mock(), _session(), mock.AsyncMock())
+    await scheduler.close()
+
+  assert scheduler.stats.failed == 1
+  assert scheduler.stats.completed == 1
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_compactions_after_timeout():
+  fake = _BlockingCompaction()
+  scheduler = CompactionScheduler()
+
+  with mock.patch.object(compaction, '_run_compaction', fake):
+    scheduler.schedule(mock.Mock(), _session(), mock.AsyncMock())
+    await asyncio.sleep(0)
+    await scheduler.close(timeout=0.01)
+
+  assert scheduler.stats.in_flight == 0
+  assert fake.in_flight == 0
@@ -160,3 +160,39 @@ class TestLlmEventSummarizer(unittest.IsolatedAsyncioTestCase):
     )
     formatted_history = self.compactor._format_events_for_prompt(events)
     self.assertEqual(formatted_history, expected_formatted_history)
+
+  async def test_maybe_compact_events_extends_previous_summary(self):
+    previous_summary = Event(
+        timestamp=3.0,
+        author='user',
+        actions=EventActions(
+            compaction=EventCompaction(
+                start_timestamp=1.0,
+                end_timestamp=2.0,
+                compacted_content=Content(
+                    role='model', parts=[Part(text='Earlier summary')]
+                ),
+            )
+        ),
+    )
+    events = [previous_summary, self._create_event(4.0, 'New input', 'user')]
+    expected_conversation_history = (
+        'summary of earlier conversation: Earlier summary\\nuser: New input'
+    )
+    expected_prompt = self.compactor._DEFAULT_PROMPT_TEMPLATE.format(
+        conversation_history=expected_conversation_history
+    )
+    mock_llm_response = Mock(content=Content(parts=[Part(text='Summary')]))
+
+    async def async_gen():
+      yield mock_llm_response
+
+    self.mock_llm.generate_content_async.return_value = async_gen()
+
+    compacted_event = await self.compactor.maybe_summarize_events(events=events)
+
+    # The new summary covers the previous summary's range too.
+    self.assertEqual(compacted_event.actions.compaction.start_timestamp, 1.0)
+    self.assertEqual(compacted_event.actions.compaction.end_timestamp, 4.0)
+    llm_request = self.mock_llm.generate_content_async.call_args[0][0]
+    self.assertEqual(llm_request.contents[0].parts[0].text, expected_prompt)
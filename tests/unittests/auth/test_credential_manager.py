@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import time
 from unittest.mock import ANY
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -19,6 +21,7 @@ from unittest.mock import patch
 
 from fastapi.openapi.models import OAuth2
 from fastapi.openapi.models import OAuthFlowAuthorizationCode
+from fastapi.openapi.models import OAuthFlowClientCredentials
 from fastapi.openapi.models import OAuthFlowImplicit
 from fastapi.openapi.models import OAuthFlows
 from google.adk.auth.auth_credential import AuthCredential
@@ -32,10 +35,18 @@ from google.adk.auth.auth_schemes import ExtendedOAuth2
 from google.adk.auth.auth_tool import AuthConfig
 from google.adk.auth.credential_manager import CredentialManager
 from google.adk.auth.credential_manager import ServiceAccountCredentialExchanger
+from google.adk.auth.exchanged_credential_cache import get_exchanged_credential_cache
 from google.adk.auth.oauth2_discovery import AuthorizationServerMetadata
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_exchanged_credential_cache():
+  get_exchanged_credential_cache().clear()
+  yield
+  get_exchanged_credential_cache().clear()
+
+
 class TestCredentialManager:
   """Test suite for CredentialManager."""
 
@@ -667,6 +678,95 @@ class TestCredentialManager:
     assert manager._is_client_credentials_flow() is False
 
 
+class TestCredentialManagerConcurrency:
+  """Tests token requests made by concurrent CredentialManager users."""
+
+  @pytest.fixture
+  def token_endpoint(self):
+    """A stub token endpoint that counts the tokens it issues."""
+    endpoint = Mock()
+    endpoint.expires_in = 3600
+
+    def fetch_token(url, grant_type):
+      endpoint.calls += 1
+      return {
+          "access_token": f"token-{endpoint.calls}",
+          "expires_at": int(time.time()) + endpoint.expires_in,
+      }
+
+    endpoint.calls = 0
+    endpoint.fetch_token = fetch_token
+    with patch(
+        "google.adk.auth.exchanger.oauth2_credential_exchanger.create_oauth2_session",
+        return_value=(endpoint, "https://auth.example.com/token"),
+    ):
+      yield endpoint
+
+  def _client_credentials_config(self):
+    return AuthConfig(
+        auth_scheme=OAuth2(
+            flows=OAuthFlows(
+                clientCredentials=OAuthFlowClientCredentials(
+                    tokenUrl="https://auth.example.com/token", scopes={}
+                )
+            )
+        ),
+        raw_auth_credential=AuthCredential(
+            auth_type=AuthCredentialTypes.OAUTH2,
+            oauth2=OAuth2Auth(client_id="id", client_secret="secret"),
+        ),
+    )
+
+  def _callback_context(self):
+    callback_context = Mock()
+    callback_context._invocation_context.credential_service = None
+    callback_context.get_auth_response = Mock(return_value=None)
+    return callback_context
+
+  @pytest.mark.asyncio
+  async def test_concurrent_calls_request_one_token(self, token_endpoint):
+    managers = [
+        CredentialManager(self._client_credentials_config()) for _ in range(20)
+    ]
+
+    credentials = await asyncio.gather(*[
+        manager.get_auth_credential(self._callback_context())
+        for manager in managers
+    ])
+
+    assert token_endpoint.calls == 1
+    assert {c.oauth2.access_token for c in credentials} == {"token-1"}
+    for manager in managers:
+      assert (
+          manager._auth_config.raw_auth_credential.oauth2.access_token is None
+      )
+
+  @pytest.mark.asyncio
+  async def test_token_reused_across_managers(self, token_endpoint):
+    first = await CredentialManager(
+        self._client_credentials_config()
+    ).get_auth_credential(self._callback_context())
+    second = await CredentialManager(
+        self._client_credentials_config()
+    ).get_auth_credential(self._callback_context())
+
+    assert token_endpoint.calls == 1
+    assert first.oauth2.access_token == second.oauth2.access_token == "token-1"
+
+  @pytest.mark.asyncio
+  async def test_expiring_token_is_replaced(self, token_endpoint):
+    token_endpoint.expires_in = 30
+    manager = CredentialManager(self._client_credentials_config())
+    callback_context = self._callback_context()
+
+    first = await manager.get_auth_credential(callback_context)
+    second = await manager.get_auth_credential(callback_context)
+
+    assert first.oauth2.access_token == "token-1"
+    assert second.oauth2.access_token == "token-2"
+    assert token_endpoint.calls == 2
+
+
 @pytest.fixture
 def oauth2_auth_scheme():
   """OAuth2 auth scheme for testing."""
@@ -0,0 +1,169 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from google.adk.auth.auth_credential import AuthCredential
+from google.adk.auth.auth_credential import AuthCredentialTypes
+from google.adk.auth.auth_credential import OAuth2Auth
+from google.adk.auth.exchanged_credential_cache import ExchangedCredentialCache
+import pytest
+
+
+class _Clock:
+
+  def __init__(self):
+    self.now = 1000.0
+
+  def __call__(self):
+    return self.now
+
+
+def _token(access_token, expires_at=None):
+  return AuthCredential(
+      auth_type=AuthCredentialTypes.OAUTH2,
+      oauth2=OAuth2Auth(access_token=access_token, expires_at=expires_at),
+  )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_operation():
+  cache = ExchangedCredentialCache()
+  calls = 0
+
+  async def operation():
+    nonlocal calls
+    calls += 1
+    await asyncio.sleep(0.01)
+    return _token(f"token-{calls}")
+
+  results = await asyncio.gather(
+      *[cache.get_or_run("key", operation) for _ in range(20)]
+  )
+
+  assert calls == 1
+  assert {r.oauth2.access_token for r in results} == {"token-1"}
+  # Every caller gets its own credential to mutate.
+  assert len({id(r) for r in results}) == 20
+
+
+@pytest.mark.asyncio
+async def test_results_without_expiry_are_not_cached():
+  cache = ExchangedCredentialCache()
+  calls = 0
+
+  async def operation():
+    nonlocal calls
+    calls += 1
+    return _token(f"token-{calls}")
+
+  await cache.get_or_run("key", operation)
+  result = await cache.get_or_run("key", operation)
+
+  assert calls == 2
+  assert result.oauth2.access_token == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_cached_result_is_renewed_before_expiry():
+  clock = _Clock()
+  cache = ExchangedCredentialCache(refresh_margin_seconds=60, clock=clock)
+  calls = 0
+
+  async def operation():
+    nonlocal calls
+    calls += 1
+    return _token(f"token-{calls}", expires_at=int(clock.now) + 3600)
+
+  await cache.get_or_run("key", operation)
+  clock.now += 3500
+  assert (await cache.get_or_run("key", operation)).oauth2.access_token == (
+      "token-1"
+  )
+  assert calls == 1
+
+  clock.now += 41
+  assert (await cache.get_or_run("key", operation)).oauth2.access_token == (
+      "token-2"
+  )
+  assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_is_shared_and_not_cached():
+  cache = ExchangedCredentialCache()
+  calls = 0
+
+  async def failing_operation():
+    nonlocal calls
+    calls += 1
+    await asyncio.sleep(0.01)
+    raise RuntimeError("token endpoint unavailable")
+
+  results = await asyncio.gather(
+      *[cache.get_or_run("key", failing_operation) for _ in range(5)],
+      return_exceptions=True,
+  )
+
+  assert calls == 1
+  assert all(isinstance(r, RuntimeError) for r in results)
+
+  async def operation():
+    return _token("token", expires_at=2**40)
+
+  assert (await cache.get_or_run("key", operation)).oauth2.access_token == (
+      "token"
+  )
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_operation():
+  cache = ExchangedCredentialCache()
+  started = asyncio.Event()
+
+  async def operation():
+    started.set()
+    await asyncio.sleep(0.01)
+    return _token("token", expires_at=2**40)
+
+  first = asyncio.ensure_future(cache.get_or_run("key", operation))
+  await started.wait()
+  second = asyncio.ensure_future(cache.get_or_run("key", operation))
+  await asyncio.sleep(0)
+  first.cancel()
+
+  assert (await second).oauth2.access_token == "token"
+  assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_stale_and_least_recently_used_results_are_evicted():
+  clock = _Clock()
+  cache = ExchangedCredentialCache(
+      refresh_margin_seconds=60, max_entries=2, clock=clock
+  )
+
+  async def token(access_token, expires_at):
+    return _token(access_token, expires_at)
+
+  await cache.get_or_run("old", lambda: token("old", 1100))
+  clock.now = 1050
+  # Storing a result drops the stale ones, whose keys may never be read again.
+  await cache.get_or_run("a", lambda: token("a", 2000))
+  assert list(cache._entries) == ["a"]
+
+  await cache.get_or_run("b", lambda: token("b", 2000))
+  assert cache.get("a") is not None
+  await cache.get_or_run("c", lambda: token("c", 2000))
+  assert list(cache._entries) == ["a", "c"]
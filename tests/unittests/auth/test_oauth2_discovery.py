@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 from unittest.mock import call
 from unittest.mock import Mock
 from unittest.mock import patch
 
+from google.adk.auth import oauth2_discovery
 from google.adk.auth.oauth2_discovery import AuthorizationServerMetadata
 from google.adk.auth.oauth2_discovery import OAuth2DiscoveryManager
 from google.adk.auth.oauth2_discovery import ProtectedResourceMetadata
@@ -24,6 +26,13 @@ import httpx
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_metadata_cache():
+  oauth2_discovery._metadata_cache.clear()
+  yield
+  oauth2_discovery._metadata_cache.clear()
+
+
 class TestOAuth2Discovery:
   """Tests for the OAuth2DiscoveryManager class."""
 
@@ -68,12 +77,21 @@ class TestOAuth2Discovery:
     )
     return response
 
-  def mock_success_response(self, json_data):
+  def mock_success_response(self, json_data, headers=None):
     """Create a mock HTTP successful response with auth server metadata."""
     response = Mock()
+    response.status_code = 200
+    response.headers = httpx.Headers(headers or {})
     response.json = json_data.model_dump
     return response
 
+  def mock_not_modified_response(self):
+    """Create a mock HTTP response to a revalidation request."""
+    response = Mock()
+    response.status_code = 304
+    response.headers = httpx.Headers()
+    return response
+
   @patch("httpx.AsyncClient.get")
   @pytest.mark.asyncio
   async def test_discover_auth_server_metadata_failed(
@@ -283,3 +301,156 @@ class TestOAuth2Discovery:
         "https://resource.example.com/.well-known/oauth-protected-resource",
         timeout=5,
     )
+
+  @patch("httpx.AsyncClient.get")
+  @pytest.mark.asyncio
+  async def test_discover_auth_server_metadata_cached(
+      self, mock_get, auth_server_metadata
+  ):
+    """Test discovered metadata is reused by other discovery managers."""
+    mock_get.side_effect = [
+        self.mock_success_response(auth_server_metadata),
+        self.mock_success_response(auth_server_metadata),
+    ]
+
+    first = await OAuth2DiscoveryManager().discover_auth_server_metadata(
+        "https://auth.example.com"
+    )
+    second = await OAuth2DiscoveryManager().discover_auth_server_metadata(
+        "https://auth.example.com"
+    )
+
+    assert first == second == auth_server_metadata
+    assert mock_get.call_count == 2  # Both endpoints probed once.
+
+  @patch("httpx.AsyncClient.get")
+  @pytest.mark.asyncio
+  async def test_discover_auth_server_metadata_revalidated_with_etag(
+      self, mock_get, auth_server_metadata
+  ):
+    """Test stale metadata is revalidated against the endpoint it came from."""
+    mock_get.side_effect = [
+        Mock(json=lambda: {}),
+        self.mock_success_response(
+            auth_server_metadata,
+            headers={"Cache-Control": "max-age=0", "ETag": '"v1"'},
+        ),
+        self.mock_not_modified_response(),
+    ]
+    discovery_manager = OAuth2DiscoveryManager()
+
+    await discovery_manager.discover_auth_server_metadata(
+        "https://auth.example.com"
+    )
+    result = await discovery_manager.discover_auth_server_metadata(
+        "https://auth.example.com"
+    )
+
+    assert result == auth_server_metadata
+    assert mock_get.call_args == call(
+        "https://auth.example.com/.well-known/openid-configuration",
+        timeout=5,
+        headers={"If-None-Match": '"v1"'},
+    )
+
+  @patch("httpx.AsyncClient.get")
+  @pytest.mark.asyncio
+  async def test_discover_auth_server_metadata_no_store(
+      self, mock_get, auth_server_metadata
+  ):
+    """Test metadata is not cached when the server forbids it."""
+    mock_get.return_value = self.mock_success_response(
+        auth_server_metadata, headers={"Cache-Control": "no-store"}
+    )
+    discovery_manager = OAuth2DiscoveryManager()
+
+    await discovery_manager.discover_auth_server_metadata(
+        "https://auth.example.com"
+    )
+    await discovery_manager.discover_auth_server_metadata(
+        "https://auth.example.com"
+    )
+
+    assert mock_get.call_count == 4
+
+  @patch("httpx.AsyncClient.get")
+  @pytest.mark.asyncio
+  async def test_metadata_cache_evicts_least_recently_used(
+      self, mock_get, auth_server_metadata, monkeypatch
+  ):
+    """Test the metadata cache is bounded."""
+    monkeypatch.setattr(oauth2_discovery, "_MAX_CACHED_METADATA", 2)
+
+    def get(url, timeout):
+      issuer = url.split("/.well-known")[0]
+      return self.mock_success_response(
+          auth_server_metadata.model_copy(update={"issuer": issuer})
+      )
+
+    mock_get.side_effect = get
+    discovery_manager = OAuth2DiscoveryManager()
+
+    for issuer in ["a", "b", "a", "c"]:
+      await discovery_manager.discover_auth_server_metadata(
+          f"https://{issuer}.example.com"
+      )
+
+    assert [url for _, url in oauth2_discovery._metadata_cache] == [
+        "https://a.example.com",
+        "https://c.example.com",
+    ]
+
+  @pytest.mark.asyncio
+  async def test_discover_auth_server_metadata_probes_concurrently(
+      self, auth_server_metadata
+  ):
+    """Test endpoints are probed at once and the preferred one wins."""
+    auth_server_metadata.issuer = "https://auth.example.com/oauth"
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get(url, timeout):
+      nonlocal in_flight, max_in_flight
+      in_flight += 1
+      max_in_flight = max(max_in_flight, in_flight)
+      # Less preferred endpoints answer first.
+      await asyncio.sleep(0.03 if "oauth-authorization-server" in url else 0)
+      in_flight -= 1
+      if url.endswith("/oauth/.well-known/openid-configuration"):
+        return self.mock_success_response(
+            auth_server_metadata.model_copy(
+                update={"token_endpoint": "https://fallback.example.com"}
+            )
+        )
+      return self.mock_success_response(auth_server_metadata)
+
+    with patch("httpx.AsyncClient.get", side_effect=get):
+      result = await OAuth2DiscoveryManager().discover_auth_server_metadata(
+          "https://auth.example.com/oauth"
+      )
+
+    assert max_in_flight == 3
+    assert result == auth_server_metadata
+
+
+def test_http_client_is_kept_per_event_loop(monkeypatch):
+  monkeypatch.setattr(oauth2_discovery, "_http_clients", {})
+
+  async def get_client():
+    return oauth2_discovery._get_http_client()
+
+  loop = asyncio.new_event_loop()
+  try:
+    first = loop.run_until_complete(get_client())
+    assert loop.run_until_complete(get_client()) is first
+    other = asyncio.run(get_client())
+    assert other is not first
+    # The client of a loop that is still open is not replaced.
+    assert loop.run_until_complete(get_client()) is first
+  finally:
+    loop.close()
+
+  # The clients of closed loops are forgotten.
+  assert len(oauth2_discovery._http_clients) == 2
+  asyncio.run(get_client())
+  assert len(oauth2_discovery._http_clients) == 1
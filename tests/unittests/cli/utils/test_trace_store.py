@@ -0,0 +1,136 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the bounded span store behind the /debug/trace endpoints."""
+
+from google.adk.cli.utils.trace_store import TraceStore
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import SpanContext
+
+_span_ids = iter(range(1, 1_000_000))
+
+
+def _span(name, trace_id, session_id=None, event_id=None):
+  attributes = {}
+  if session_id:
+    attributes["gcp.vertex.agent.session_id"] = session_id
+  if event_id:
+    attributes["gcp.vertex.agent.event_id"] = event_id
+  return ReadableSpan(
+      name=name,
+      context=SpanContext(
+          trace_id=trace_id, span_id=next(_span_ids), is_remote=False
+      ),
+      attributes=attributes,
+      start_time=1,
+      end_time=2,
+  )
+
+
+def _trace(trace_id, session_id, event_id=None):
+  """Spans of one invocation, in the order they end."""
+  return [
+      _span("execute_tool lookup", trace_id, event_id=event_id),
+      _span("call_llm", trace_id, session_id=session_id),
+      _span("invocation", trace_id),
+  ]
+
+
+class FakeClock:
+
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+
+def test_session_and_event_lookups():
+  store = TraceStore()
+  store.add_spans(_trace(1, "s1", event_id="e1"))
+  store.add_spans(_trace(2, "s2"))
+
+  spans = store.get_session_spans("s1")
+  assert [s["name"] for s in spans] == [
+      "execute_tool lookup",
+      "call_llm",
+      "invocation",
+  ]
+  assert all(s["trace_id"] == 1 for s in spans)
+  assert len(store.get_trace_spans(2)) == 3
+  event = store.get_event_trace("e1")
+  assert event["trace_id"] == 1
+  assert event["gcp.vertex.agent.event_id"] == "e1"
+  assert store.get_session_spans("missing") == []
+  assert store.get_event_trace("missing") is None
+
+
+def test_least_recently_used_session_is_evicted():
+  store = TraceStore(max_sessions=2)
+  store.add_spans(_trace(1, "s1", event_id="e1"))
+  store.add_spans(_trace(2, "s2"))
+  store.get_session_spans("s1")  # s2 is now the least recently used.
+  store.add_spans(_trace(3, "s3"))
+
+  assert store.get_session_spans("s2") == []
+  assert len(store.get_session_spans("s1")) == 3
+  assert store.get_event_trace("e1") is not None
+
+
+def test_oldest_traces_are_evicted_per_session():
+  store = TraceStore(max_spans_per_session=4)
+  store.add_spans(_trace(1, "s1", event_id="e1"))
+  store.add_spans(_trace(2, "s1"))
+
+  assert {s["trace_id"] for s in store.get_session_spans("s1")} == {2}
+  assert store.get_trace_spans(1) == []
+  assert store.get_event_trace("e1") is None
+
+
+def test_idle_sessions_expire():
+  clock = FakeClock()
+  store = TraceStore(session_ttl_seconds=10, clock=clock)
+  store.add_spans(_trace(1, "s1"))
+  clock.now = 5
+  store.add_spans(_trace(2, "s2"))
+  clock.now = 12
+
+  assert store.get_session_spans("s1") == []
+  assert len(store.get_session_spans("s2")) == 3
+
+
+def test_unassigned_traces_are_bounded():
+  store = TraceStore(max_unassigned_traces=1)
+  store.add_spans([_span("invocation", 1)])
+  store.add_spans([_span("invocation", 2)])
+
+  assert store.get_trace_spans(1) == []
+  assert len(store.get_trace_spans(2)) == 1
+
+
+def test_evicted_traces_spill_to_disk(tmp_path):
+  store = TraceStore(max_sessions=1, spill_path=str(tmp_path / "traces.db"))
+  store.add_spans(_trace(1, "s1", event_id="e1"))
+  store.add_spans(_trace(2, "s2"))
+  # s1 was evicted from memory but is still served from disk.
+  store.add_spans(_trace(3, "s1"))
+
+  spans = store.get_session_spans("s1")
+  assert [s["trace_id"] for s in spans] == [1, 1, 1, 3, 3, 3]
+  assert store.get_event_trace("e1")["trace_id"] == 1
+  assert len(store.get_trace_spans(1)) == 3
+
+  store.clear()
+  assert store.get_session_spans("s1") == []
+  store.close()
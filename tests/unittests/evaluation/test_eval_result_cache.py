@@ -0,0 +1,41 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from google.adk.evaluation.eval_result_cache import InMemoryEvalResultCache
+from google.adk.evaluation.eval_result_cache import LocalEvalResultCache
+import pytest
+
+
+@pytest.mark.parametrize("cache_type", ["memory", "local"])
+def test_get_returns_what_was_put(cache_type, tmp_path):
+  if cache_type == "memory":
+    cache = InMemoryEvalResultCache()
+  else:
+    cache = LocalEvalResultCache(cache_dir=str(tmp_path))
+
+  assert cache.get("ab12") is None
+  cache.put("ab12", '{"score": 1}')
+  cache.put("ab12", '{"score": 2}')
+
+  assert cache.get("ab12") == '{"score": 2}'
+  assert cache.get("cd34") is None
+
+
+def test_local_cache_persists_across_instances(tmp_path):
+  LocalEvalResultCache(cache_dir=str(tmp_path)).put("ab12", "value")
+
+  assert LocalEvalResultCache(cache_dir=str(tmp_path)).get("ab12") == "value"
+  assert [p.name for p in (tmp_path / "ab").iterdir()] == ["ab12.json"]
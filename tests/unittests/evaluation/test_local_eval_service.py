@@ -27,12 +27,14 @@ from google.adk.evaluation.base_eval_service import InferenceRequest
 from google.adk.evaluation.base_eval_service import InferenceResult
 from google.adk.evaluation.base_eval_service import InferenceStatus
 from google.adk.evaluation.eval_case import Invocation
+from google.adk.evaluation.eval_case import SessionInput
 from google.adk.evaluation.eval_metrics import EvalMetric
 from google.adk.evaluation.eval_metrics import EvalMetricResult
 from google.adk.evaluation.eval_metrics import Interval
 from google.adk.evaluation.eval_metrics import MetricInfo
 from google.adk.evaluation.eval_metrics import MetricValueInfo
 from google.adk.evaluation.eval_result import EvalCaseResult
+from google.adk.evaluation.eval_result_cache import InMemoryEvalResultCache
 from google.adk.evaluation.eval_set import EvalCase
 from google.adk.evaluation.eval_set import EvalSet
 from google.adk.evaluation.eval_set_results_manager import EvalSetResultsManager
@@ -44,6 +46,7 @@ from google.adk.evaluation.evaluator import PerInvocationResult
 from google.adk.evaluation.local_eval_service import LocalEvalService
 from google.adk.evaluation.metric_evaluator_registry import DEFAULT_METRIC_EVALUATOR_REGISTRY
 from google.adk.models.registry import LLMRegistry
+from google.adk.tools.base_toolset import BaseToolset
 from google.genai import types as genai_types
 import pytest
 
@@ -675,3 +678,279 @@ async def test_mcp_stdio_agent_no_runtime_error(mocker):
     import shutil
 
     shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def _eval_set_with_one_case() -> EvalSet:
+  return EvalSet(
+      eval_set_id="test_eval_set",
+      eval_cases=[
+          EvalCase(
+              eval_id="case1",
+              conversation=[
+                  Invocation(
+                      user_content=genai_types.Content(
+                          role="user",
+                          parts=[genai_types.Part(text="hello")],
+                      )
+                  )
+              ],
+              session_input=SessionInput(app_name="test_app", user_id="user"),
+          )
+      ],
+  )
+
+
+def _load_mock_agent() -> LlmAgent:
+  from tests.unittests.testing_utils import MockModel
+
+  return LlmAgent(
+      name="test_agent",
+      model=MockModel.create(responses=["mocked response"]),
+  )
+
+
+async def _run_inference(eval_service) -> list[InferenceResult]:
+  return [
+      inference_result
+      async for inference_result in eval_service.perform_inference(
+          InferenceRequest(
+              app_name="test_app",
+              eval_set_id="test_eval_set",
+              inference_config=InferenceConfig(parallelism=1),
+          )
+      )
+  ]
+
+
+@pytest.mark.asyncio
+async def test_perform_inference_is_served_from_cache(mock_eval_sets_manager):
+  mock_eval_sets_manager.get_eval_set.return_value = _eval_set_with_one_case()
+  result_cache = InMemoryEvalResultCache()
+  agent = _load_mock_agent()
+  eval_service = LocalEvalService(
+      root_agent=agent,
+      eval_sets_manager=mock_eval_sets_manager,
+      result_cache=result_cache,
+  )
+
+  [first] = await _run_inference(eval_service)
+  [second] = await _run_inference(eval_service)
+
+  assert len(agent.model.requests) == 1
+  assert second.status == InferenceStatus.SUCCESS
+  assert second.inferences == first.inferences
+  assert second.session_id != first.session_id
+  cached_session = await eval_service._get_inference_session(
+      app_name="test_app", user_id="user", session_id=second.session_id
+  )
+  assert cached_session.id == second.session_id
+  assert eval_service.cache_stats.inference_hits == 1
+  assert eval_service.cache_stats.inference_misses == 1
+
+  # Changing the agent invalidates the cached inference.
+  changed_agent = _load_mock_agent()
+  changed_agent.instruction = "Answer in French."
+  eval_service = LocalEvalService(
+      root_agent=changed_agent,
+      eval_sets_manager=mock_eval_sets_manager,
+      result_cache=result_cache,
+  )
+  await _run_inference(eval_service)
+  assert len(changed_agent.model.requests) == 1
+
+
+class _ConnectionToolset(BaseToolset):
+
+  def __init__(self, url: str):
+    super().__init__()
+    self._connection_params = {"url": url}
+
+  async def get_tools(self, readonly_context=None):
+    return []
+
+
+def _make_greeting_tool(greeting: str):
+
+  def greet(name: str) -> str:
+    return f"{greeting}, {name}"
+
+  return greet
+
+
+def _load_agent_with_tools(
+    greeting: str = "Hello", url: str = "https://a.example.com"
+) -> LlmAgent:
+  agent = _load_mock_agent()
+  agent.tools = [_make_greeting_tool(greeting), _ConnectionToolset(url)]
+  return agent
+
+
+@pytest.mark.asyncio
+async def test_cached_inference_misses_on_closure_and_private_attribute_changes(
+    mock_eval_sets_manager,
+):
+  mock_eval_sets_manager.get_eval_set.return_value = _eval_set_with_one_case()
+  result_cache = InMemoryEvalResultCache()
+
+  async def run(agent: LlmAgent) -> int:
+    eval_service = LocalEvalService(
+        root_agent=agent,
+        eval_sets_manager=mock_eval_sets_manager,
+        result_cache=result_cache,
+    )
+    await _run_inference(eval_service)
+    return len(agent.model.requests)
+
+  assert await run(_load_agent_with_tools()) == 1
+  # An identical agent is served from the cache.
+  assert await run(_load_agent_with_tools()) == 0
+  # A tool closing over another value misses the cache.
+  assert await run(_load_agent_with_tools(greeting="Bonjour")) == 1
+  # So does a toolset with another private configuration.
+  assert await run(_load_agent_with_tools(url="https://b.example.com")) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_inference_is_not_cached(eval_service, mocker):
+  eval_service._result_cache = InMemoryEvalResultCache()
+  eval_service._perform_inference_single_eval_item = mocker.AsyncMock(
+      return_value=InferenceResult(
+          app_name="test_app",
+          eval_set_id="test_eval_set",
+          eval_case_id="case1",
+          session_id="session1",
+          status=InferenceStatus.FAILURE,
+      )
+  )
+  eval_service._eval_sets_manager.get_eval_set.return_value = (
+      _eval_set_with_one_case()
+  )
+
+  await _run_inference(eval_service)
+  await _run_inference(eval_service)
+
+  assert eval_service._perform_inference_single_eval_item.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_evaluate_reuses_cached_metric_results(
+    eval_service, mock_eval_sets_manager, mocker
+):
+  eval_service._result_cache = InMemoryEvalResultCache()
+  invocation = Invocation(
+      invocation_id="inv1",
+      user_content=genai_types.Content(
+          parts=[genai_types.Part(text="test user content.")]
+      ),
+      final_response=genai_types.Content(
+          parts=[genai_types.Part(text="test final response.")]
+      ),
+  )
+  mock_eval_case = mocker.MagicMock(spec=EvalCase)
+  mock_eval_case.conversation = [invocation.model_copy(deep=True)]
+  mock_eval_case.conversation_scenario = None
+  mock_eval_case.session_input = None
+  mock_eval_sets_manager.get_eval_case.return_value = mock_eval_case
+  get_evaluator = mocker.spy(
+      eval_service._metric_evaluator_registry, "get_evaluator"
+  )
+
+  async def evaluate(invocation_id, threshold):
+    inference_result = InferenceResult(
+        app_name="test_app",
+        eval_set_id="test_eval_set",
+        eval_case_id="case1",
+        inferences=[
+            invocation.model_copy(update={"invocation_id": invocation_id})
+        ],
+        session_id="session1",
+    )
+    evaluate_request = EvaluateRequest(
+        inference_results=[inference_result],
+        evaluate_config=EvaluateConfig(
+            eval_metrics=[
+                EvalMetric(metric_name="fake_metric", threshold=threshold)
+            ],
+        ),
+    )
+    return [r async for r in eval_service.evaluate(evaluate_request)]
+
+  [first] = await evaluate("inv1", 0.5)
+  # A new run produces new invocation ids, but the same content.
+  [second] = await evaluate("inv2", 0.5)
+
+  assert get_evaluator.call_count == 1
+  assert second.overall_eval_metric_results == first.overall_eval_metric_results
+
+  # Changing the metric config invalidates the cached metric result.
+  await evaluate("inv2", 0.6)
+  assert get_evaluator.call_count == 2
+  assert eval_service.cache_stats.metric_hits == 1
+  assert eval_service.cache_stats.metric_misses == 2
+
+
+@pytest.mark.asyncio
+async def test_progress_is_reported_per_eval_case(eval_service, mocker):
+  progress = []
+  eval_service._progress_callback = progress.append
+  eval_service._eval_sets_manager.get_eval_set.return_value = EvalSet(
+      eval_set_id="test_eval_set",
+      eval_cases=[
+          EvalCase(eval_id="case1", conversation=[]),
+          EvalCase(eval_id="case2", conversation=[]),
+      ],
+  )
+
+  async def perform_inference(app_name, eval_set_id, eval_case, root_agent):
+    return InferenceResult(
+        app_name=app_name,
+        eval_set_id=eval_set_id,
+        eval_case_id=eval_case.eval_id,
+        session_id="session1",
+    )
+
+  eval_service._perform_inference_single_eval_item = perform_inference
+
+  await _run_inference(eval_service)
+
+  assert [p.stage for p in progress] == ["inference", "inference"]
+  assert {p.eval_case_id for p in progress} == {"case1", "case2"}
+  assert [p.completed for p in progress] == [1, 2]
+  assert all(p.total == 2 and p.elapsed_seconds >= 0 for p in progress)
+
+
+def test_process_pool_requires_root_agent_loader(
+    dummy_agent, mock_eval_sets_manager
+):
+  with pytest.raises(ValueError):
+    LocalEvalService(
+        root_agent=dummy_agent,
+        eval_sets_manager=mock_eval_sets_manager,
+        inference_process_pool_size=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_perform_inference_in_process_pool(mock_eval_sets_manager):
+  mock_eval_sets_manager.get_eval_set.return_value = _eval_set_with_one_case()
+  eval_service = LocalEvalService(
+      root_agent=_load_mock_agent(),
+      eval_sets_manager=mock_eval_sets_manager,
+      inference_process_pool_size=1,
+      root_agent_loader=_load_mock_agent,
+  )
+
+  [inference_result] = await _run_inference(eval_service)
+
+  assert inference_result.status == InferenceStatus.SUCCESS
+  assert (
+      inference_result.inferences[0].final_response.parts[0].text
+      == "mocked response"
+  )
+  # The session created in the worker is available for evaluation.
+  session = await eval_service._get_inference_session(
+      app_name="test_app",
+      user_id="user",
+      session_id=inference_result.session_id,
+  )
+  assert session.id == inference_result.session_id
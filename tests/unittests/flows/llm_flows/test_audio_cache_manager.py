@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import time
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -387,3 +388,107 @@ class TestAudioCacheManager:
     assert filename.startswith(
         f'adk_live_audio_storage_input_audio_{expected_timestamp_ms}'
     )
+
+  @pytest.mark.asyncio
+  async def test_spill_cache_saves_segments_past_size_limit(self):
+    """Test large caches are saved early and referenced by the flush event."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=10))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.side_effect = [1, 2, 3]
+    invocation_context.artifact_service = mock_artifact_service
+
+    for chunk in [b'aaaa', b'bbbb', b'cccc', b'dddd', b'eeee']:
+      manager.cache_audio(
+          invocation_context,
+          types.Blob(data=chunk, mime_type='audio/pcm'),
+          'input',
+      )
+      await manager.spill_cache(invocation_context, 'input')
+
+    # The first three chunks crossed the limit and were saved as one segment.
+    assert mock_artifact_service.save_artifact.call_count == 1
+    saved = mock_artifact_service.save_artifact.call_args.kwargs['artifact']
+    assert saved.inline_data.data == b'aaaabbbbcccc'
+    assert len(invocation_context.input_realtime_cache) == 2
+
+    events = await manager.flush_caches(invocation_context)
+
+    saved = mock_artifact_service.save_artifact.call_args.kwargs['artifact']
+    assert saved.inline_data.data == b'ddddeeee'
+    assert len(events) == 1
+    parts = events[0].content.parts
+    assert [part.file_data.file_uri.rsplit('#')[-1] for part in parts] == [
+        '1',
+        '2',
+    ]
+    assert invocation_context.input_realtime_cache == []
+
+    # Nothing is left to flush.
+    assert await manager.flush_caches(invocation_context) == []
+
+  @pytest.mark.asyncio
+  async def test_spill_cache_below_size_limit(self):
+    """Test caches below the size limit are kept in memory."""
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    mock_artifact_service = AsyncMock()
+    invocation_context.artifact_service = mock_artifact_service
+
+    self.manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'audio', mime_type='audio/pcm'),
+        'output',
+    )
+    await self.manager.spill_cache(invocation_context, 'output')
+
+    mock_artifact_service.save_artifact.assert_not_called()
+    assert len(invocation_context.output_realtime_cache) == 1
+
+  @pytest.mark.asyncio
+  async def test_spill_and_flush_running_concurrently(self):
+    """Test a flush during a spill neither saves nor loses audio."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    saved_chunks = []
+    saving = asyncio.Event()
+    release = asyncio.Event()
+
+    async def save_artifact(**kwargs):
+      saved_chunks.append(kwargs['artifact'].inline_data.data)
+      saving.set()
+      await release.wait()
+      return len(saved_chunks)
+
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.side_effect = save_artifact
+    invocation_context.artifact_service = mock_artifact_service
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'aaaa', mime_type='audio/pcm'),
+        'input',
+    )
+    spill = asyncio.create_task(
+        manager.spill_cache(invocation_context, 'input')
+    )
+    await saving.wait()
+    flush = asyncio.create_task(manager.flush_caches(invocation_context))
+    await asyncio.sleep(0)
+    release.set()
+    await spill
+    events = await flush
+
+    # The spilled chunk was saved once and is referenced by this flush.
+    assert saved_chunks == [b'aaaa']
+    assert len(events) == 1
+    assert [
+        part.file_data.file_uri.rsplit('#')[-1]
+        for part in events[0].content.parts
+    ] == ['1']
+    assert manager._locks == {}
@@ -12,10 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
 import os
 import sys
+import threading
 from unittest import mock
 
+from anthropic import AsyncAnthropicVertex
 from anthropic import types as anthropic_types
 from google.adk import version as adk_version
 from google.adk.models import anthropic_llm
@@ -295,7 +301,10 @@ async def test_function_declaration_to_tool_param(
 async def test_generate_content_async(
     claude_llm, llm_request, generate_content_response, generate_llm_response
 ):
-  with mock.patch.object(claude_llm, "_anthropic_client") as mock_client:
+  with mock.patch.object(
+      Claude, "_anthropic_client", new_callable=mock.PropertyMock
+  ) as mock_client_property:
+    mock_client = mock_client_property.return_value
     with mock.patch.object(
         anthropic_llm,
         "message_to_generate_content_response",
@@ -324,7 +333,10 @@ async def test_generate_content_async_with_max_tokens(
     llm_request, generate_content_response, generate_llm_response
 ):
   claude_llm = Claude(model="claude-3-5-sonnet-v2@20241022", max_tokens=4096)
-  with mock.patch.object(claude_llm, "_anthropic_client") as mock_client:
+  with mock.patch.object(
+      Claude, "_anthropic_client", new_callable=mock.PropertyMock
+  ) as mock_client_property:
+    mock_client = mock_client_property.return_value
     with mock.patch.object(
         anthropic_llm,
         "message_to_generate_content_response",
@@ -346,3 +358,223 @@ async def test_generate_content_async_with_max_tokens(
       mock_client.messages.create.assert_called_once()
       _, kwargs = mock_client.messages.create.call_args
       assert kwargs["max_tokens"] == 4096
+
+
+def _sse(*events: dict) -> bytes:
+  return "".join(
+      f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+      for event in events
+  ).encode()
+
+
+_STREAMED_MESSAGE = _sse(
+    {
+        "type": "message_start",
+        "message": {
+            "id": "msg_1",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-3-5-sonnet-v2@20241022",
+            "content": [],
+            "stop_reason": None,
+            "stop_sequence": None,
+            "usage": {"input_tokens": 13, "output_tokens": 1},
+        },
+    },
+    {
+        "type": "content_block_start",
+        "index": 0,
+        "content_block": {"type": "text", "text": ""},
+    },
+    {
+        "type": "content_block_delta",
+        "index": 0,
+        "delta": {"type": "text_delta", "text": "Let me "},
+    },
+    {
+        "type": "content_block_delta",
+        "index": 0,
+        "delta": {"type": "text_delta", "text": "check."},
+    },
+    {"type": "content_block_stop", "index": 0},
+    {
+        "type": "content_block_start",
+        "index": 1,
+        "content_block": {
+            "type": "tool_use",
+            "id": "toolu_1",
+            "name": "get_weather",
+            "input": {},
+        },
+    },
+    {
+        "type": "content_block_delta",
+        "index": 1,
+        "delta": {"type": "input_json_delta", "partial_json": '{"city": '},
+    },
+    {
+        "type": "content_block_delta",
+        "index": 1,
+        "delta": {"type": "input_json_delta", "partial_json": '"Paris"}'},
+    },
+    {"type": "content_block_stop", "index": 1},
+    {
+        "type": "message_delta",
+        "delta": {"stop_reason": "tool_use", "stop_sequence": None},
+        "usage": {"output_tokens": 20},
+    },
+    {"type": "message_stop"},
+)
+
+
+_MESSAGE = json.dumps({
+    "id": "msg_1",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-3-5-sonnet-v2@20241022",
+    "content": [{"type": "text", "text": "Let me check."}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 13, "output_tokens": 4},
+}).encode()
+
+
+@pytest.fixture
+def messages_api_stub(monkeypatch):
+  """Serves the Claude Messages API on Vertex from canned responses."""
+  requests = []
+
+  class Handler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+      body = self.rfile.read(int(self.headers["Content-Length"]))
+      requests.append((self.path, json.loads(body)))
+      streamed = self.path.endswith(":streamRawPredict")
+      content = _STREAMED_MESSAGE if streamed else _MESSAGE
+      self.send_response(200)
+      self.send_header(
+          "Content-Type",
+          "text/event-stream" if streamed else "application/json",
+      )
+      self.send_header("Content-Length", str(len(content)))
+      self.end_headers()
+      self.wfile.write(content)
+
+    def log_message(self, *args):
+      pass
+
+  server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  client = AsyncAnthropicVertex(
+      project_id="test-project",
+      region="us-east5",
+      access_token="test-token",
+      base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+  )
+  monkeypatch.setattr(anthropic_llm, "_get_shared_client", lambda *_: client)
+  monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
+  monkeypatch.setenv("GOOGLE_CLOUD_LOCATION", "us-east5")
+  yield requests
+  server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_calls_messages_api(
+    claude_llm, llm_request, messages_api_stub
+):
+  responses = [
+      resp
+      async for resp in claude_llm.generate_content_async(
+          llm_request, stream=False
+      )
+  ]
+
+  assert len(messages_api_stub) == 1
+  assert messages_api_stub[0][0].endswith(":rawPredict")
+  assert len(responses) == 1
+  assert responses[0].content.parts[0].text == "Let me check."
+  assert responses[0].usage_metadata.total_token_count == 17
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_streams(
+    claude_llm, llm_request, messages_api_stub
+):
+  responses = [
+      resp
+      async for resp in claude_llm.generate_content_async(
+          llm_request, stream=True
+      )
+  ]
+
+  assert messages_api_stub[0][0].endswith(":streamRawPredict")
+  assert messages_api_stub[0][1]["stream"] is True
+  assert [bool(r.partial) for r in responses] == [True, True, False]
+  assert [r.content.parts[0].text for r in responses[:2]] == [
+      "Let me ",
+      "check.",
+  ]
+  final_response = responses[-1]
+  assert final_response.content.parts[0].text == "Let me check."
+  function_call = final_response.content.parts[1].function_call
+  assert function_call.id == "toolu_1"
+  assert function_call.name == "get_weather"
+  assert function_call.args == {"city": "Paris"}
+  assert final_response.usage_metadata.prompt_token_count == 13
+  assert final_response.usage_metadata.candidates_token_count == 20
+
+
+def test_client_is_shared_per_event_loop(monkeypatch):
+  monkeypatch.setattr(anthropic_llm, "_clients", {})
+
+  async def get_clients():
+    return (
+        anthropic_llm._get_shared_client("test-project", "us-east5"),
+        anthropic_llm._get_shared_client("test-project", "us-east5"),
+        anthropic_llm._get_shared_client("test-project", "europe-west1"),
+    )
+
+  first, same, other_region = asyncio.run(get_clients())
+  assert first is same
+  assert first is not other_region
+
+  next_loop_client, _, _ = asyncio.run(get_clients())
+  assert next_loop_client is not first
+
+
+def test_clients_of_open_loops_are_kept(monkeypatch):
+  monkeypatch.setattr(anthropic_llm, "_clients", {})
+
+  async def get_client():
+    return anthropic_llm._get_shared_client("test-project", "us-east5")
+
+  loop = asyncio.new_event_loop()
+  try:
+    first = loop.run_until_complete(get_client())
+    other = asyncio.run(get_client())
+    assert other is not first
+    # The client of a loop that is still open is not replaced.
+    assert loop.run_until_complete(get_client()) is first
+  finally:
+    loop.close()
+
+  # The clients of closed loops are forgotten.
+  assert len(anthropic_llm._clients) == 2
+  asyncio.run(get_client())
+  assert len(anthropic_llm._clients) == 1
+
+
+def test_model_uses_a_client_per_event_loop(monkeypatch):
+  monkeypatch.setattr(anthropic_llm, "_clients", {})
+  monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
+  monkeypatch.setenv("GOOGLE_CLOUD_LOCATION", "us-east5")
+  claude_llm = Claude(model="claude-3-5-sonnet-v2@20241022")
+
+  async def get_clients():
+    return claude_llm._anthropic_client, claude_llm._anthropic_client
+
+  first, same = asyncio.run(get_clients())
+  assert first is same
+
+  next_loop_client, _ = asyncio.run(get_clients())
+  assert next_loop_client is not first
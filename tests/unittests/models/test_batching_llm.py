@@ -0,0 +1,237 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import AsyncGenerator
+from typing import Optional
+from unittest import mock
+
+from google.adk.models import batching_llm as batching_llm_module
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.batching_llm import BatchingLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+import pytest
+
+
+class FakeLlm(BaseLlm):
+  """Echoes the text of requests, tracking how many are in flight."""
+
+  model: str = 'fake-model'
+  calls: list[LlmRequest] = []
+  in_flight: int = 0
+  max_in_flight: int = 0
+  delay: float = 0.01
+  error: Optional[Exception] = None
+
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    self.calls.append(llm_request)
+    self.in_flight += 1
+    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+    try:
+      if self.delay:
+        await asyncio.sleep(self.delay)
+      if self.error:
+        raise self.error
+    finally:
+      self.in_flight -= 1
+    text = llm_request.contents[-1].parts[0].text
+    yield LlmResponse(
+        content=types.ModelContent(f'echo: {text}'),
+        usage_metadata=types.GenerateContentResponseUsageMetadata(
+            total_token_count=10
+        ),
+    )
+
+
+def _request(text: str) -> LlmRequest:
+  return LlmRequest(model='fake-model', contents=[types.UserContent(text)])
+
+
+async def _generate(llm: BaseLlm, llm_request: LlmRequest) -> LlmResponse:
+  responses = [
+      response async for response in llm.generate_content_async(llm_request)
+  ]
+  assert len(responses) == 1
+  return responses[0]
+
+
+class _Clock:
+
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+def test_model_defaults_to_wrapped_model():
+  assert BatchingLlm(llm=FakeLlm()).model == 'fake-model'
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_batched_and_bounded():
+  fake_llm = FakeLlm(calls=[])
+  llm = BatchingLlm(
+      llm=fake_llm,
+      max_concurrency=2,
+      batch_window_seconds=0.01,
+      max_batch_size=3,
+  )
+
+  responses = await asyncio.gather(
+      *(_generate(llm, _request(f'q{i}')) for i in range(5))
+  )
+
+  assert [r.content.parts[0].text for r in responses] == [
+      f'echo: q{i}' for i in range(5)
+  ]
+  assert len(fake_llm.calls) == 5
+  assert fake_llm.max_in_flight == 2
+  assert llm.get_metrics()['batches'] == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_requests_are_sent_once():
+  fake_llm = FakeLlm(calls=[])
+  llm = BatchingLlm(llm=fake_llm)
+
+  responses = await asyncio.gather(
+      _generate(llm, _request('same')),
+      _generate(llm, _request('same')),
+      _generate(llm, _request('other')),
+  )
+
+  assert len(fake_llm.calls) == 2
+  assert responses[0] == responses[1]
+  assert responses[0] is not responses[1]
+  assert llm.get_metrics()['deduplicated'] == 1
+
+  # Requests are only deduplicated while in flight.
+  await _generate(llm, _request('same'))
+  assert len(fake_llm.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_are_raised_to_each_caller():
+  llm = BatchingLlm(llm=FakeLlm(calls=[], error=ValueError('quota')))
+
+  results = await asyncio.gather(
+      _generate(llm, _request('a')),
+      _generate(llm, _request('a')),
+      return_exceptions=True,
+  )
+
+  assert all(isinstance(result, ValueError) for result in results)
+  # Failed requests are not kept as in flight.
+  with pytest.raises(ValueError):
+    await _generate(llm, _request('a'))
+
+
+class _Interrupt(BaseException):
+  pass
+
+
+@pytest.mark.asyncio
+async def test_base_exceptions_fail_the_requests_of_the_batch():
+  llm = BatchingLlm(llm=FakeLlm(calls=[]))
+  loop = asyncio.get_running_loop()
+  state = batching_llm_module._LoopState(
+      loop=loop, semaphore=asyncio.Semaphore(1)
+  )
+  future = loop.create_future()
+  state.in_flight['key'] = future
+
+  with mock.patch.object(
+      BatchingLlm, '_generate_batch', side_effect=_Interrupt()
+  ):
+    with pytest.raises(_Interrupt):
+      await llm._send_batch(state, [(_request('a'), 'key', future)])
+
+  assert isinstance(future.exception(), _Interrupt)
+  assert not state.in_flight
+
+
+@pytest.mark.asyncio
+async def test_streaming_requests_are_passed_through():
+  fake_llm = FakeLlm(calls=[])
+  llm = BatchingLlm(llm=fake_llm)
+
+  responses = [
+      response
+      async for response in llm.generate_content_async(
+          _request('a'), stream=True
+      )
+  ]
+
+  assert responses[0].content.parts[0].text == 'echo: a'
+  assert llm.get_metrics()['requests'] == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_for_the_request_rate_limit():
+  llm = BatchingLlm(llm=FakeLlm(calls=[], delay=0), requests_per_minute=60)
+  clock = _Clock()
+  llm._request_bucket = batching_llm_module._TokenBucket(60, clock)
+  llm._request_bucket._tokens = 1
+
+  with mock.patch.object(
+      batching_llm_module.asyncio, 'sleep', new_callable=mock.AsyncMock
+  ) as mock_sleep:
+    await _generate(llm, _request('a'))
+    mock_sleep.assert_not_called()
+    await _generate(llm, _request('b'))
+
+  mock_sleep.assert_called_once_with(1.0)
+  assert llm.get_metrics()['throttled_seconds'] == 1.0
+
+
+def test_token_bucket():
+  clock = _Clock()
+  bucket = batching_llm_module._TokenBucket(60, clock)
+
+  assert bucket.reserve(60) == 0
+  assert bucket.reserve(30) == 30
+  clock.now = 30
+  assert bucket.reserve(1) == 1
+  # Overestimated requests give their tokens back.
+  bucket.refund(31)
+  assert bucket.reserve(30) == 0
+  # Requests larger than the bucket wait for a full bucket.
+  clock.now = 90
+  assert bucket.reserve(1000) == 0
+
+
+def test_estimated_tokens_are_reconciled_with_usage():
+  llm = BatchingLlm(llm=FakeLlm(), tokens_per_minute=1000)
+  llm_request = _request('x' * 400)
+  llm_request.config.max_output_tokens = 100
+
+  estimated_tokens = batching_llm_module._estimate_tokens(llm_request)
+  assert estimated_tokens == 200
+
+  llm._token_bucket = batching_llm_module._TokenBucket(1000, _Clock())
+  llm._token_bucket.reserve(estimated_tokens)
+  llm._reconcile_tokens(
+      estimated_tokens,
+      LlmResponse(
+          usage_metadata=types.GenerateContentResponseUsageMetadata(
+              total_token_count=50
+          )
+      ),
+  )
+  assert llm._token_bucket.reserve(950) == 0
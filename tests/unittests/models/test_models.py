@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
+import sys
+
 from google.adk import models
 from google.adk.models.anthropic_llm import Claude
 from google.adk.models.google_llm import Gemini
@@ -60,3 +63,24 @@ def test_non_exist_model():
   with pytest.raises(ValueError) as e_info:
     models.LLMRegistry.resolve('non-exist-model')
   assert 'Model non-exist-model not found.' in str(e_info.value)
+
+
+def test_builtin_models_are_registered_on_first_resolve():
+  # Run in a fresh interpreter, as the registry is process-wide.
+  code = """
+import sys
+from google.adk.models import LLMRegistry
+from google.adk.models.base_llm import BaseLlm
+
+assert 'google.adk.models.google_llm' not in sys.modules
+
+class CustomGemini(BaseLlm):
+  @classmethod
+  def supported_models(cls):
+    return [r'gemini-.*']
+
+LLMRegistry.register(CustomGemini)
+assert LLMRegistry.resolve('gemini-2.5-flash') is CustomGemini
+assert LLMRegistry.resolve('gemma-3-27b-it').__name__ == 'Gemma'
+"""
+  subprocess.run([sys.executable, '-c', code], check=True)
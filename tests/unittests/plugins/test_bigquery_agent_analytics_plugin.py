@@ -129,15 +129,12 @@ def mock_write_client():
   ) as mock_cls:
     mock_client = mock_cls.return_value
     mock_client.transport = mock.AsyncMock()
+    mock_client.sent_requests = []
 
     async def fake_append_rows(requests, **kwargs):
       # This function is now async, so `await client.append_rows` works.
-      mock_append_rows_response = mock.MagicMock()
-      mock_append_rows_response.row_errors = []
-      mock_append_rows_response.error = mock.MagicMock()
-      mock_append_rows_response.error.code = 0  # OK status
-      # This a gen is what's returned *after* the await.
-      return _async_gen(mock_append_rows_response)
+      # The returned async gen answers every request sent on the stream.
+      return _fake_responses(requests, mock_client.sent_requests)
 
     mock_client.append_rows.side_effect = fake_append_rows
     yield mock_client
@@ -194,35 +191,49 @@ async def bq_plugin_inst(
   )
   await plugin._ensure_init()  # Ensure clients are initialized
   mock_write_client.append_rows.reset_mock()
-  return plugin
+  yield plugin
+  await plugin.close()
 
 
 # --- Helper Functions ---
 
 
-async def _async_gen(val):
-  yield val
+def _ok_response():
+  mock_append_rows_response = mock.MagicMock()
+  mock_append_rows_response.row_errors = []
+  mock_append_rows_response.error = mock.MagicMock()
+  mock_append_rows_response.error.code = 0  # OK status
+  return mock_append_rows_response
 
 
-def _get_captured_event_dict(mock_write_client, expected_schema):
-  """Helper to get the event_dict passed to append_rows."""
-  mock_write_client.append_rows.assert_called_once()
-  call_args = mock_write_client.append_rows.call_args
-  requests_iter = call_args.args[0]
-  requests = list(requests_iter)
-  assert len(requests) == 1
-  request = requests[0]
-  assert request.write_stream == DEFAULT_STREAM_NAME
-
-  arrow_rows = request.arrow_rows
-  message = pa.ipc.read_message(arrow_rows.rows.serialized_record_batch)
+async def _fake_responses(requests, sent_requests, response_factory=None):
+  async for request in requests:
+    sent_requests.append(request)
+    yield (response_factory or _ok_response)()
+
+
+def _read_rows(request, expected_schema):
+  message = pa.ipc.read_message(request.arrow_rows.rows.serialized_record_batch)
   batch = pa.ipc.read_record_batch(message, schema=expected_schema)
   table = pa.Table.from_batches([batch])
   assert table.schema.equals(
       expected_schema
   ), f"Schema mismatch: Expected {expected_schema}, got {table.schema}"
   pydict = table.to_pydict()
-  return {k: v[0] for k, v in pydict.items()}
+  return [{k: v[i] for k, v in pydict.items()} for i in range(table.num_rows)]
+
+
+def _get_captured_event_dict(mock_write_client, expected_schema):
+  """Helper to get the latest event_dict sent over the append_rows stream."""
+  mock_write_client.append_rows.assert_called_once()
+  requests = mock_write_client.sent_requests
+  # Only the first request on a stream carries the destination and schema.
+  assert requests[0].write_stream == DEFAULT_STREAM_NAME
+  assert requests[0].arrow_rows.writer_schema.serialized_schema
+
+  rows = _read_rows(requests[-1], expected_schema)
+  assert len(rows) == 1
+  return rows[0]
 
 
 def _assert_common_fields(log_entry, event_type, agent="MyTestAgent"):
@@ -291,7 +302,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await plugin.before_model_callback(
         callback_context=callback_context, llm_request=llm_request
     )
-    await asyncio.sleep(0.01)  # Allow background task to run
+    await plugin.flush()
     mock_write_client.append_rows.assert_called_once()
     mock_write_client.append_rows.reset_mock()
 
@@ -299,7 +310,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await plugin.on_user_message_callback(
         invocation_context=invocation_context, user_message=user_message
     )
-    await asyncio.sleep(0.01)  # Allow background task to run
+    await plugin.flush()
     mock_write_client.append_rows.assert_not_called()
 
   @pytest.mark.asyncio
@@ -324,11 +335,11 @@ class TestBigQueryAgentAnalyticsPlugin:
     await plugin.on_user_message_callback(
         invocation_context=invocation_context, user_message=user_message
     )
-    await asyncio.sleep(0.01)
+    await plugin.flush()
     mock_write_client.append_rows.assert_not_called()
 
     await plugin.before_run_callback(invocation_context=invocation_context)
-    await asyncio.sleep(0.01)
+    await plugin.flush()
     mock_write_client.append_rows.assert_called_once()
 
   @pytest.mark.asyncio
@@ -356,7 +367,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await plugin.on_user_message_callback(
         invocation_context=invocation_context, user_message=user_message
     )
-    await asyncio.sleep(0.01)
+    await plugin.flush()
     mock_write_client.append_rows.assert_called_once()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     assert log_entry["content"] == "User Content: [REDACTED]"
@@ -386,7 +397,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await plugin.on_user_message_callback(
         invocation_context=invocation_context, user_message=user_message
     )
-    await asyncio.sleep(0.01)
+    await plugin.flush()
     mock_write_client.append_rows.assert_called_once()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     assert log_entry["content"] == "User Content: [FORMATTING FAILED]"
@@ -417,14 +428,13 @@ class TestBigQueryAgentAnalyticsPlugin:
     await plugin.on_user_message_callback(
         invocation_context=invocation_context, user_message=user_message
     )
-    await asyncio.sleep(0.01)
+    await plugin.flush()
     mock_write_client.append_rows.assert_called_once()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     assert (
         log_entry["content"]
         == "User Content: text: '1234567890123456789012345678901234567890...' "
     )
-    mock_write_client.append_rows.reset_mock()
 
     # Test before_model_callback full content truncation
     llm_request = llm_request_lib.LlmRequest(
@@ -441,8 +451,10 @@ class TestBigQueryAgentAnalyticsPlugin:
     await plugin.before_model_callback(
         callback_context=callback_context, llm_request=llm_request
     )
-    await asyncio.sleep(0.01)
+    await plugin.flush()
+    # The second batch reuses the already open append stream.
     mock_write_client.append_rows.assert_called_once()
+    assert len(mock_write_client.sent_requests) == 2
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     # Full content: "Model: gemini-pro | Prompt: user: text: 'Prompt' | System Prompt: System Instruction"
     # Truncated to 40 chars + ...:
@@ -480,7 +492,7 @@ class TestBigQueryAgentAnalyticsPlugin:
         tool_args={"param": "long_value"},
         tool_context=tool_context,
     )
-    await asyncio.sleep(0.01)
+    await plugin.flush()
     mock_write_client.append_rows.assert_called_once()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     # JSON string: '{"param": "long_value"}'
@@ -499,7 +511,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.on_user_message_callback(
         invocation_context=invocation_context, user_message=user_message
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "USER_MESSAGE_RECEIVED")
     assert log_entry["content"] == "User Content: text: 'What is up?'"
@@ -523,7 +535,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.on_event_callback(
         invocation_context=invocation_context, event=event
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "TOOL_CALL", agent="MyTestAgent")
     assert "call: get_weather" in log_entry["content"]
@@ -549,7 +561,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.on_event_callback(
         invocation_context=invocation_context, event=event
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "MODEL_RESPONSE", agent="MyTestAgent")
     assert "text: 'Hello there!'" in log_entry["content"]
@@ -580,7 +592,7 @@ class TestBigQueryAgentAnalyticsPlugin:
           invocation_context=invocation_context,
           user_message=types.Content(parts=[types.Part(text="Test")]),
       )
-      await asyncio.sleep(0.01)
+      await plugin_with_fail.flush()
       mock_log_error.assert_any_call("BQ Plugin: Init Failed:", exc_info=True)
     mock_write_client.append_rows.assert_not_called()
 
@@ -589,13 +601,18 @@ class TestBigQueryAgentAnalyticsPlugin:
       self, bq_plugin_inst, mock_write_client, invocation_context
   ):
 
-    async def fake_append_rows_with_error(requests, **kwargs):
+    def error_response():
       mock_append_rows_response = mock.MagicMock()
       mock_append_rows_response.row_errors = []  # No row errors
       mock_append_rows_response.error = mock.MagicMock()
       mock_append_rows_response.error.code = 3  # INVALID_ARGUMENT
       mock_append_rows_response.error.message = "Test BQ Error"
-      return _async_gen(mock_append_rows_response)
+      return mock_append_rows_response
+
+    async def fake_append_rows_with_error(requests, **kwargs):
+      return _fake_responses(
+          requests, mock_write_client.sent_requests, error_response
+      )
 
     mock_write_client.append_rows.side_effect = fake_append_rows_with_error
 
@@ -604,9 +621,11 @@ class TestBigQueryAgentAnalyticsPlugin:
           invocation_context=invocation_context,
           user_message=types.Content(parts=[types.Part(text="Test")]),
       )
-      await asyncio.sleep(0.01)
+      await bq_plugin_inst.flush()
       mock_log_error.assert_called_with("BQ Plugin: Write Error: Test BQ Error")
     mock_write_client.append_rows.assert_called_once()
+    assert bq_plugin_inst.write_stats.rows_failed == 1
+    assert bq_plugin_inst.write_stats.rows_flushed == 0
 
   @pytest.mark.asyncio
   async def test_close(self, bq_plugin_inst, mock_bq_client, mock_write_client):
@@ -630,7 +649,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.before_run_callback(
         invocation_context=invocation_context
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "INVOCATION_STARTING")
     assert log_entry["content"] is None
@@ -646,7 +665,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.after_run_callback(
         invocation_context=invocation_context
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "INVOCATION_COMPLETED")
     assert log_entry["content"] is None
@@ -663,7 +682,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.before_agent_callback(
         agent=mock_agent, callback_context=callback_context
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "AGENT_STARTING")
     assert log_entry["content"] == "Agent Name: MyTestAgent"
@@ -680,7 +699,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.after_agent_callback(
         agent=mock_agent, callback_context=callback_context
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "AGENT_COMPLETED")
     assert log_entry["content"] == "Agent Name: MyTestAgent"
@@ -702,7 +721,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.before_model_callback(
         callback_context=callback_context, llm_request=llm_request
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "LLM_REQUEST")
     assert (
@@ -728,7 +747,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.after_model_callback(
         callback_context=callback_context, llm_response=llm_response
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "LLM_RESPONSE")
     assert (
@@ -758,7 +777,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.after_model_callback(
         callback_context=callback_context, llm_response=llm_response
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "LLM_RESPONSE")
     assert "Tool Name: get_weather" in log_entry["content"]
@@ -779,7 +798,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.before_tool_callback(
         tool=mock_tool, tool_args={"param": "value"}, tool_context=tool_context
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "TOOL_STARTING")
     assert (
@@ -803,7 +822,7 @@ class TestBigQueryAgentAnalyticsPlugin:
         tool_context=tool_context,
         result={"status": "success"},
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "TOOL_COMPLETED")
     assert (
@@ -827,7 +846,7 @@ class TestBigQueryAgentAnalyticsPlugin:
     await bq_plugin_inst.on_model_error_callback(
         callback_context=callback_context, llm_request=llm_request, error=error
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "LLM_ERROR")
     assert log_entry["content"] is None
@@ -849,7 +868,7 @@ class TestBigQueryAgentAnalyticsPlugin:
         tool_context=tool_context,
         error=error,
     )
-    await asyncio.sleep(0.01)
+    await bq_plugin_inst.flush()
     log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
     _assert_common_fields(log_entry, "TOOL_ERROR")
     assert (
@@ -857,3 +876,179 @@ class TestBigQueryAgentAnalyticsPlugin:
         == 'Tool Name: MyTool, Arguments: {"param": "value"}'
     )
     assert log_entry["error_message"] == "Tool timed out"
+
+  @pytest.mark.asyncio
+  async def test_rows_are_batched_into_one_record_batch(
+      self,
+      mock_write_client,
+      invocation_context,
+      mock_auth_default,
+      mock_bq_client,
+      mock_to_arrow_schema,
+      dummy_arrow_schema,
+      mock_asyncio_to_thread,
+  ):
+    config = BigQueryLoggerConfig(batch_size=3, batch_flush_interval=60)
+    plugin = bigquery_agent_analytics_plugin.BigQueryAgentAnalyticsPlugin(
+        PROJECT_ID, DATASET_ID, TABLE_ID, config
+    )
+    for _ in range(2):
+      await plugin.before_run_callback(invocation_context=invocation_context)
+    await asyncio.sleep(0.01)
+    # Below batch_size and before the flush interval: nothing is written.
+    mock_write_client.append_rows.assert_not_called()
+
+    await plugin.after_run_callback(invocation_context=invocation_context)
+    # Waits for the batch the writer was woken up for, or writes it.
+    await plugin.flush()
+    mock_write_client.append_rows.assert_called_once()
+    assert len(mock_write_client.sent_requests) == 1
+    rows = _read_rows(mock_write_client.sent_requests[0], dummy_arrow_schema)
+    assert [r["event_type"] for r in rows] == [
+        "INVOCATION_STARTING",
+        "INVOCATION_STARTING",
+        "INVOCATION_COMPLETED",
+    ]
+    stats = plugin.write_stats
+    assert stats.rows_enqueued == 3
+    assert stats.rows_flushed == 3
+    assert stats.batches_flushed == 1
+    assert stats.buffered_rows == 0
+    await plugin.close()
+
+  @pytest.mark.asyncio
+  async def test_flush_interval_writes_partial_batch(
+      self,
+      mock_write_client,
+      invocation_context,
+      mock_auth_default,
+      mock_bq_client,
+      mock_to_arrow_schema,
+      dummy_arrow_schema,
+      mock_asyncio_to_thread,
+  ):
+    config = BigQueryLoggerConfig(batch_size=100, batch_flush_interval=0.01)
+    plugin = bigquery_agent_analytics_plugin.BigQueryAgentAnalyticsPlugin(
+        PROJECT_ID, DATASET_ID, TABLE_ID, config
+    )
+    await plugin.before_run_callback(invocation_context=invocation_context)
+
+    async def written():
+      while not mock_write_client.sent_requests:
+        await asyncio.sleep(0.01)
+
+    # Only the flush interval makes the writer write the partial batch.
+    await asyncio.wait_for(written(), timeout=5)
+    log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
+    _assert_common_fields(log_entry, "INVOCATION_STARTING")
+    await plugin.close()
+
+  @pytest.mark.asyncio
+  async def test_batches_are_capped_at_batch_size(
+      self,
+      mock_write_client,
+      invocation_context,
+      mock_auth_default,
+      mock_bq_client,
+      mock_to_arrow_schema,
+      dummy_arrow_schema,
+      mock_asyncio_to_thread,
+  ):
+    config = BigQueryLoggerConfig(batch_size=2, batch_flush_interval=60)
+    plugin = bigquery_agent_analytics_plugin.BigQueryAgentAnalyticsPlugin(
+        PROJECT_ID, DATASET_ID, TABLE_ID, config
+    )
+    for _ in range(5):
+      await plugin.before_run_callback(invocation_context=invocation_context)
+    await plugin.flush()
+    mock_write_client.append_rows.assert_called_once()
+    batch_sizes = [
+        len(_read_rows(r, dummy_arrow_schema))
+        for r in mock_write_client.sent_requests
+    ]
+    assert batch_sizes == [2, 2, 1]
+    assert plugin.write_stats.batches_flushed == 3
+    await plugin.close()
+
+  @pytest.mark.asyncio
+  async def test_drop_oldest_when_buffer_full(
+      self,
+      mock_write_client,
+      invocation_context,
+      mock_auth_default,
+      mock_bq_client,
+      mock_to_arrow_schema,
+      dummy_arrow_schema,
+      mock_asyncio_to_thread,
+  ):
+    config = BigQueryLoggerConfig(
+        batch_size=100, batch_flush_interval=60, max_buffer_size=2
+    )
+    plugin = bigquery_agent_analytics_plugin.BigQueryAgentAnalyticsPlugin(
+        PROJECT_ID, DATASET_ID, TABLE_ID, config
+    )
+    await plugin.before_run_callback(invocation_context=invocation_context)
+    await plugin.after_run_callback(invocation_context=invocation_context)
+    await plugin.after_run_callback(invocation_context=invocation_context)
+    assert plugin.write_stats.rows_dropped == 1
+    assert plugin.write_stats.buffered_rows == 2
+
+    await plugin.flush()
+    rows = _read_rows(mock_write_client.sent_requests[0], dummy_arrow_schema)
+    assert [r["event_type"] for r in rows] == [
+        "INVOCATION_COMPLETED",
+        "INVOCATION_COMPLETED",
+    ]
+    await plugin.close()
+
+  @pytest.mark.asyncio
+  async def test_block_policy_waits_for_space(
+      self,
+      mock_write_client,
+      invocation_context,
+      mock_auth_default,
+      mock_bq_client,
+      mock_to_arrow_schema,
+      dummy_arrow_schema,
+      mock_asyncio_to_thread,
+  ):
+    config = BigQueryLoggerConfig(
+        batch_size=100,
+        batch_flush_interval=60,
+        max_buffer_size=1,
+        overflow_policy="block",
+    )
+    plugin = bigquery_agent_analytics_plugin.BigQueryAgentAnalyticsPlugin(
+        PROJECT_ID, DATASET_ID, TABLE_ID, config
+    )
+    await plugin.before_run_callback(invocation_context=invocation_context)
+    # The second row waits until the writer drains the first one.
+    await asyncio.wait_for(
+        plugin.after_run_callback(invocation_context=invocation_context),
+        timeout=1,
+    )
+    await plugin.flush()
+    assert plugin.write_stats.rows_dropped == 0
+    assert plugin.write_stats.rows_flushed == 2
+    await plugin.close()
+
+  @pytest.mark.asyncio
+  async def test_close_flushes_buffered_rows(
+      self,
+      mock_write_client,
+      invocation_context,
+      mock_auth_default,
+      mock_bq_client,
+      mock_to_arrow_schema,
+      dummy_arrow_schema,
+      mock_asyncio_to_thread,
+  ):
+    config = BigQueryLoggerConfig(batch_size=100, batch_flush_interval=60)
+    plugin = bigquery_agent_analytics_plugin.BigQueryAgentAnalyticsPlugin(
+        PROJECT_ID, DATASET_ID, TABLE_ID, config
+    )
+    await plugin.before_run_callback(invocation_context=invocation_context)
+    await plugin.close()
+    log_entry = _get_captured_event_dict(mock_write_client, dummy_arrow_schema)
+    _assert_common_fields(log_entry, "INVOCATION_STARTING")
+    assert plugin.write_stats.buffered_rows == 0
@@ -0,0 +1,139 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from google.adk.plugins.cache_backends import DiskCacheBackend
+from google.adk.plugins.cache_backends import InMemoryCacheBackend
+from google.adk.plugins.cache_backends import SqliteCacheBackend
+import pytest
+
+
+class _Clock:
+
+  def __init__(self):
+    self.now = 1000.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+@pytest.fixture(params=["memory", "sqlite", "disk"])
+def backend_and_clock(request, tmp_path):
+  clock = _Clock()
+  if request.param == "memory":
+    return InMemoryCacheBackend(clock=clock), clock
+  if request.param == "sqlite":
+    return SqliteCacheBackend(tmp_path / "cache.db", clock=clock), clock
+  return DiskCacheBackend(tmp_path / "cache", clock=clock), clock
+
+
+@pytest.mark.asyncio
+async def test_set_get_delete_and_clear(backend_and_clock):
+  backend, _ = backend_and_clock
+
+  assert await backend.get("a") is None
+  await backend.set("a", "value-a")
+  await backend.set("b", "value-b")
+  assert await backend.get("a") == "value-a"
+
+  await backend.set("a", "new-value-a")
+  assert await backend.get("a") == "new-value-a"
+
+  await backend.delete("a")
+  assert await backend.get("a") is None
+  assert await backend.get("b") == "value-b"
+
+  await backend.clear()
+  assert await backend.get("b") is None
+
+
+@pytest.mark.asyncio
+async def test_values_expire_after_ttl(backend_and_clock):
+  backend, clock = backend_and_clock
+
+  await backend.set("a", "value-a", ttl_seconds=10)
+  await backend.set("b", "value-b")
+  clock.now += 9
+  assert await backend.get("a") == "value-a"
+
+  clock.now += 1
+  assert await backend.get("a") is None
+  assert await backend.get("b") == "value-b"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_evicts_least_recently_used():
+  backend = InMemoryCacheBackend(max_entries=2)
+
+  await backend.set("a", "1")
+  await backend.set("b", "2")
+  await backend.get("a")
+  await backend.set("c", "3")
+
+  assert await backend.get("a") == "1"
+  assert await backend.get("b") is None
+  assert await backend.get("c") == "3"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_is_bounded_by_size():
+  backend = InMemoryCacheBackend(max_entries=None, max_bytes=10)
+
+  await backend.set("a", "x" * 6)
+  await backend.set("b", "x" * 4)
+  assert backend.size_bytes == 10
+  await backend.set("c", "x" * 3)
+  await backend.set("too_large", "x" * 11)
+
+  assert await backend.get("a") is None
+  assert await backend.get("b") is not None
+  assert await backend.get("too_large") is None
+  assert backend.size_bytes == 7
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_evicts_least_recently_used(tmp_path):
+  clock = _Clock()
+  backend = SqliteCacheBackend(
+      tmp_path / "cache.db", max_entries=2, clock=clock
+  )
+
+  await backend.set("a", "1")
+  clock.now += 1
+  await backend.set("b", "2")
+  clock.now += 1
+  await backend.get("a")
+  clock.now += 1
+  await backend.set("c", "3")
+
+  assert await backend.get("a") == "1"
+  assert await backend.get("b") is None
+  assert await backend.get("c") == "3"
+
+
+@pytest.mark.asyncio
+async def test_disk_backend_is_bounded_by_size(tmp_path):
+  directory = tmp_path / "cache"
+  backend = DiskCacheBackend(directory, max_bytes=200)
+
+  await backend.set("a", "x" * 60)
+  await backend.set("b", "x" * 60)
+  # Orders the files by last use regardless of the file system resolution.
+  os.utime(directory / "a.json", (1, 1))
+  await backend.set("c", "x" * 60)
+
+  assert await backend.get("a") is None
+  assert await backend.get("b") is not None
+  assert await backend.get("c") is not None
@@ -0,0 +1,186 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.plugins.cache_backends import SqliteCacheBackend
+from google.adk.plugins.response_cache_plugin import get_response_cache_key
+from google.adk.plugins.response_cache_plugin import RESPONSE_CACHE_HIT_METADATA_KEY
+from google.adk.plugins.response_cache_plugin import ResponseCachePlugin
+from google.genai import types
+import pytest
+
+from .. import testing_utils
+
+
+def _create_agent(mock_model, name="classifier", temperature=0.0):
+  return LlmAgent(
+      name=name,
+      model=mock_model,
+      instruction="Classify the message.",
+      generate_content_config=types.GenerateContentConfig(
+          temperature=temperature
+      ),
+  )
+
+
+async def _run(agent, plugin, message="hello"):
+  runner = testing_utils.InMemoryRunner(root_agent=agent, plugins=[plugin])
+  return await runner.run_async(testing_utils.UserContent(message))
+
+
+@pytest.mark.asyncio
+async def test_repeated_request_is_served_from_cache():
+  mock_model = testing_utils.MockModel.create(responses=["positive"])
+  agent = _create_agent(mock_model)
+  plugin = ResponseCachePlugin()
+
+  first_events = await _run(agent, plugin)
+  second_events = await _run(agent, plugin)
+
+  assert len(mock_model.requests) == 1
+  assert testing_utils.simplify_events(second_events) == (
+      testing_utils.simplify_events(first_events)
+  )
+  assert second_events[0].custom_metadata == {
+      RESPONSE_CACHE_HIT_METADATA_KEY: True
+  }
+  assert plugin.get_metrics() == {
+      "hits": 1,
+      "misses": 1,
+      "writes": 1,
+      "hit_rate": 0.5,
+  }
+
+
+@pytest.mark.asyncio
+async def test_different_request_is_not_served_from_cache():
+  mock_model = testing_utils.MockModel.create(
+      responses=["positive", "negative"]
+  )
+  agent = _create_agent(mock_model)
+  plugin = ResponseCachePlugin()
+
+  await _run(agent, plugin, "hello")
+  events = await _run(agent, plugin, "goodbye")
+
+  assert len(mock_model.requests) == 2
+  assert testing_utils.simplify_events(events) == [("classifier", "negative")]
+
+
+@pytest.mark.asyncio
+async def test_non_deterministic_request_is_not_cached():
+  mock_model = testing_utils.MockModel.create(responses=["a", "b"])
+  agent = _create_agent(mock_model, temperature=0.7)
+  plugin = ResponseCachePlugin()
+
+  await _run(agent, plugin)
+  await _run(agent, plugin)
+
+  assert len(mock_model.requests) == 2
+  assert plugin.get_metrics()["misses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_only_opted_in_agents_are_cached():
+  mock_model = testing_utils.MockModel.create(responses=["a", "b"])
+  agent = _create_agent(mock_model, name="other_agent")
+  plugin = ResponseCachePlugin(agent_names=["classifier"])
+
+  await _run(agent, plugin)
+  await _run(agent, plugin)
+
+  assert len(mock_model.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_error_response_is_not_cached():
+  mock_model = testing_utils.MockModel.create(
+      responses=[
+          LlmResponse(error_code="SAFETY"),
+          LlmResponse(
+              content=testing_utils.ModelContent([types.Part(text="ok")])
+          ),
+      ]
+  )
+  agent = _create_agent(mock_model)
+  plugin = ResponseCachePlugin()
+
+  await _run(agent, plugin)
+  await _run(agent, plugin)
+
+  assert len(mock_model.requests) == 2
+  assert plugin.get_metrics()["writes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_shares_cache_across_plugins(tmp_path):
+  mock_model = testing_utils.MockModel.create(responses=["positive"])
+  agent = _create_agent(mock_model)
+  db_path = tmp_path / "responses.db"
+
+  await _run(agent, ResponseCachePlugin(backend=SqliteCacheBackend(db_path)))
+  events = await _run(
+      agent, ResponseCachePlugin(backend=SqliteCacheBackend(db_path))
+  )
+
+  assert len(mock_model.requests) == 1
+  assert testing_utils.simplify_events(events) == [("classifier", "positive")]
+
+
+def test_cache_key():
+  def request(text, **config):
+    return LlmRequest(
+        model="gemini-2.5-flash",
+        contents=[types.UserContent(text)],
+        config=types.GenerateContentConfig(**config),
+    )
+
+  key = get_response_cache_key(request("hello", temperature=0))
+
+  assert key == get_response_cache_key(request("hello", temperature=0))
+  assert key != get_response_cache_key(request("hello", temperature=0.5))
+  assert key != get_response_cache_key(request("goodbye", temperature=0))
+  assert key != get_response_cache_key(
+      request("hello", temperature=0, system_instruction="Be brief.")
+  )
+
+
+class _AnsweringPlugin(BasePlugin):
+  """Answers every model request without calling the model."""
+
+  async def before_model_callback(self, *, callback_context, llm_request):
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text="stub")])
+    )
+
+
+@pytest.mark.asyncio
+async def test_pending_keys_are_forgotten_when_the_model_is_not_called():
+  mock_model = testing_utils.MockModel.create(responses=["positive"])
+  agent = _create_agent(mock_model)
+  plugin = ResponseCachePlugin()
+  runner = testing_utils.InMemoryRunner(
+      root_agent=agent, plugins=[plugin, _AnsweringPlugin("answering")]
+  )
+
+  for message in ["hello", "goodbye"]:
+    events = await runner.run_async(testing_utils.UserContent(message))
+    assert testing_utils.simplify_events(events) == [("classifier", "stub")]
+
+  assert not mock_model.requests
+  assert not plugin._pending_keys
+  assert plugin.get_metrics()["writes"] == 0
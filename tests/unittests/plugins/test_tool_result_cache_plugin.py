@@ -0,0 +1,257 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.plugins.tool_result_cache_plugin import ToolResultCachePlugin
+from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.tool_cache_config import ToolCacheConfig
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+import pytest
+
+from .. import testing_utils
+
+
+def _create_tool(cache_config=ToolCacheConfig(), result=None):
+  calls = []
+
+  def get_table_info(dataset_id: str, table_id: str) -> dict:
+    """Returns the schema of a table."""
+    calls.append((dataset_id, table_id))
+    if result is not None:
+      return result
+    return {"status": "SUCCESS", "schema": f"{dataset_id}.{table_id}"}
+
+  tool = FunctionTool(get_table_info)
+  tool.cache_config = cache_config
+  return tool, calls
+
+
+async def _create_tool_context(
+    function_call_id="call_1", invocation_context=None
+):
+  if invocation_context is None:
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+  return ToolContext(
+      invocation_context=invocation_context, function_call_id=function_call_id
+  )
+
+
+async def _call(plugin, tool, tool_args, tool_context):
+  """Runs a tool call through the callbacks of the plugin."""
+  result = await plugin.before_tool_callback(
+      tool=tool, tool_args=tool_args, tool_context=tool_context
+  )
+  if result is not None:
+    return result
+  result = await tool.run_async(args=tool_args, tool_context=tool_context)
+  await plugin.after_tool_callback(
+      tool=tool, tool_args=tool_args, tool_context=tool_context, result=result
+  )
+  return result
+
+
+@pytest.mark.asyncio
+async def test_repeated_calls_are_served_from_cache():
+  tool, calls = _create_tool()
+  function_call = types.Part.from_function_call(
+      name="get_table_info", args={"dataset_id": "sales", "table_id": "orders"}
+  )
+  mock_model = testing_utils.MockModel.create(
+      responses=[function_call, "first", function_call, "second"]
+  )
+  agent = LlmAgent(name="root_agent", model=mock_model, tools=[tool])
+  plugin = ToolResultCachePlugin()
+  runner = testing_utils.InMemoryRunner(root_agent=agent, plugins=[plugin])
+
+  await runner.run_async(testing_utils.UserContent("describe orders"))
+  events = await runner.run_async(testing_utils.UserContent("again"))
+
+  assert calls == [("sales", "orders")]
+  assert events[1].content.parts[0].function_response.response == {
+      "status": "SUCCESS",
+      "schema": "sales.orders",
+  }
+  metrics = plugin.get_metrics()
+  assert metrics["hits"] == 1
+  assert metrics["misses"] == 1
+  assert metrics["writes"] == 1
+  assert metrics["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_cache_key_ignores_argument_order():
+  tool, calls = _create_tool()
+  plugin = ToolResultCachePlugin()
+  tool_context = await _create_tool_context()
+
+  await _call(
+      plugin, tool, {"dataset_id": "sales", "table_id": "orders"}, tool_context
+  )
+  await _call(
+      plugin, tool, {"table_id": "orders", "dataset_id": "sales"}, tool_context
+  )
+  await _call(
+      plugin, tool, {"dataset_id": "sales", "table_id": "items"}, tool_context
+  )
+
+  assert calls == [("sales", "orders"), ("sales", "items")]
+
+
+@pytest.mark.asyncio
+async def test_tools_without_cache_config_are_not_cached():
+  tool, calls = _create_tool(cache_config=None)
+  plugin = ToolResultCachePlugin()
+  tool_context = await _create_tool_context()
+  args = {"dataset_id": "sales", "table_id": "orders"}
+
+  await _call(plugin, tool, args, tool_context)
+  await _call(plugin, tool, args, tool_context)
+  assert len(calls) == 2
+
+  # The plugin may declare tools cacheable by name, e.g. MCP tools.
+  plugin = ToolResultCachePlugin(
+      tool_configs={"get_table_info": ToolCacheConfig()}
+  )
+  await _call(plugin, tool, args, tool_context)
+  await _call(plugin, tool, args, tool_context)
+  assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "scope, shared_across_sessions, shared_across_users",
+    [
+        ("session", False, False),
+        ("user", True, False),
+        ("app", True, True),
+    ],
+)
+async def test_results_are_shared_within_their_scope(
+    scope, shared_across_sessions, shared_across_users
+):
+  tool, calls = _create_tool(cache_config=ToolCacheConfig(scope=scope))
+  plugin = ToolResultCachePlugin()
+  args = {"dataset_id": "sales", "table_id": "orders"}
+  tool_context = await _create_tool_context()
+  invocation_context = tool_context._invocation_context
+
+  await _call(plugin, tool, args, tool_context)
+
+  other_session = await invocation_context.session_service.create_session(
+      app_name="test_app", user_id="test_user"
+  )
+  await _call(
+      plugin,
+      tool,
+      args,
+      await _create_tool_context(
+          invocation_context=invocation_context.model_copy(
+              update={"session": other_session}
+          )
+      ),
+  )
+  assert len(calls) == (1 if shared_across_sessions else 2)
+
+  other_user_session = await invocation_context.session_service.create_session(
+      app_name="test_app", user_id="other_user"
+  )
+  await _call(
+      plugin,
+      tool,
+      args,
+      await _create_tool_context(
+          invocation_context=invocation_context.model_copy(
+              update={"session": other_user_session}
+          )
+      ),
+  )
+  assert len(calls) == (
+      1 if shared_across_users else 2 if shared_across_sessions else 3
+  )
+
+
+@pytest.mark.asyncio
+async def test_invocation_scoped_results_are_dropped_after_the_run():
+  tool, calls = _create_tool(cache_config=ToolCacheConfig(scope="invocation"))
+  plugin = ToolResultCachePlugin()
+  tool_context = await _create_tool_context()
+  args = {"dataset_id": "sales", "table_id": "orders"}
+
+  await _call(plugin, tool, args, tool_context)
+  await _call(plugin, tool, args, tool_context)
+  assert len(calls) == 1
+  assert plugin.get_metrics()["size_bytes"] > 0
+
+  await plugin.after_run_callback(
+      invocation_context=tool_context._invocation_context
+  )
+  assert plugin.get_metrics()["size_bytes"] == 0
+  await _call(plugin, tool, args, tool_context)
+  assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_and_side_effects_are_not_cached():
+  tool, calls = _create_tool(
+      result={"status": "ERROR", "error_details": "not found"}
+  )
+  plugin = ToolResultCachePlugin()
+  tool_context = await _create_tool_context()
+  args = {"dataset_id": "sales", "table_id": "orders"}
+
+  await _call(plugin, tool, args, tool_context)
+  await _call(plugin, tool, args, tool_context)
+  assert len(calls) == 2
+
+  tool, calls = _create_tool()
+  tool_context.state["last_table"] = "orders"
+  await _call(plugin, tool, args, tool_context)
+  await _call(plugin, tool, args, tool_context)
+  assert len(calls) == 2
+  assert plugin.get_metrics()["writes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_results_are_bounded_by_memory_budget():
+  tool, calls = _create_tool(result={"rows": "x" * 100})
+  plugin = ToolResultCachePlugin(max_bytes=250)
+  tool_context = await _create_tool_context()
+
+  for table_id in ["a", "b", "c"]:
+    await _call(
+        plugin, tool, {"dataset_id": "d", "table_id": table_id}, tool_context
+    )
+  assert plugin.get_metrics()["size_bytes"] <= 250
+
+  # The least recently used result was evicted.
+  await _call(plugin, tool, {"dataset_id": "d", "table_id": "c"}, tool_context)
+  await _call(plugin, tool, {"dataset_id": "d", "table_id": "a"}, tool_context)
+  assert calls == [("d", "a"), ("d", "b"), ("d", "c"), ("d", "a")]
+
+
+@pytest.mark.asyncio
+async def test_non_dict_results_are_cached_wrapped():
+  tool, _ = _create_tool(result=["orders", "items"])
+  plugin = ToolResultCachePlugin()
+  tool_context = await _create_tool_context()
+  args = {"dataset_id": "sales", "table_id": "orders"}
+
+  await _call(plugin, tool, args, tool_context)
+
+  assert await _call(plugin, tool, args, tool_context) == {
+      "result": ["orders", "items"]
+  }
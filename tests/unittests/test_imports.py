@@ -0,0 +1,79 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests that importing the ADK packages stays cheap."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_modules(statement: str, modules: list[str]) -> list[str]:
+  """Returns which of modules are loaded after running statement."""
+  code = (
+      f'import sys\n{statement}\n'
+      f'print(",".join(m for m in {modules!r} if m in sys.modules))'
+  )
+  output = subprocess.run(
+      [sys.executable, '-c', code], check=True, capture_output=True, text=True
+  ).stdout
+  return [m for m in output.strip().split(',') if m]
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        'import google.adk',
+        'import google.adk.agents',
+        'import google.adk.models',
+        'import google.adk.plugins',
+        'import google.adk.tools',
+        'from google.adk.cli import main',
+    ],
+)
+def test_package_import_is_lazy(statement):
+  assert not _loaded_modules(
+      statement,
+      [
+          'google.adk.agents.llm_agent',
+          'google.adk.models.google_llm',
+          'google.adk.runners',
+          'google.genai.types',
+          'mcp',
+      ],
+  )
+
+
+def test_lazy_attributes_resolve():
+  assert _loaded_modules(
+      'from google.adk import Agent, Runner\n'
+      'from google.adk.agents import LlmAgent, SequentialAgent\n'
+      'from google.adk.models import Gemini, LlmRequest\n'
+      'from google.adk.plugins import BasePlugin',
+      ['google.adk.agents.llm_agent', 'google.adk.runners'],
+  ) == ['google.adk.agents.llm_agent', 'google.adk.runners']
+
+
+def test_agent_evaluator_is_missing_without_eval_dependencies():
+  # A None entry in sys.modules makes importing the module fail.
+  code = (
+      'import sys\n'
+      'sys.modules["google.adk.evaluation.agent_evaluator"] = None\n'
+      'import google.adk.evaluation as evaluation\n'
+      'assert not hasattr(evaluation, "AgentEvaluator")\n'
+      'assert evaluation.__all__ == []\n'
+      'from google.adk.evaluation import *\n'
+  )
+  subprocess.run([sys.executable, '-c', code], check=True)
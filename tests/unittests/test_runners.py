@@ -573,6 +573,15 @@ class TestRunnerWithPlugins:
 
     self.runner.plugin_manager.close.assert_awaited_once()
 
+  @pytest.mark.asyncio
+  async def test_runner_close_drains_compactions(self):
+    """Test that runner.close() waits for background compactions."""
+    self.runner._compaction_scheduler.close = AsyncMock()
+
+    await self.runner.close()
+
+    self.runner._compaction_scheduler.close.assert_awaited_once()
+
   @pytest.mark.asyncio
   async def test_runner_passes_plugin_close_timeout(self):
     """Test that runner passes plugin_close_timeout to PluginManager."""
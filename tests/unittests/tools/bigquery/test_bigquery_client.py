@@ -18,9 +18,18 @@ import os
 from unittest import mock
 
 import google.adk
+from google.adk.tools.bigquery import client as bq_client_lib
 from google.adk.tools.bigquery.client import get_bigquery_client
 from google.auth.exceptions import DefaultCredentialsError
 from google.oauth2.credentials import Credentials
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+  bq_client_lib._client_cache.clear()
+  yield
+  bq_client_lib._client_cache.clear()
 
 
 def test_bigquery_client_default():
@@ -193,3 +202,38 @@ def test_bigquery_client_location_custom():
   # Verify that the client has the desired project set
   assert client.project == "test-gcp-project"
   assert client.location == "us-central1"
+
+
+def test_bigquery_client_reused():
+  """Test BigQuery clients are reused for the same project and identity."""
+  credentials = Credentials(token="token-1")
+
+  client = get_bigquery_client(
+      project="test-gcp-project", credentials=credentials
+  )
+
+  # User credentials are rebuilt on each tool call with the same token.
+  assert (
+      get_bigquery_client(
+          project="test-gcp-project", credentials=Credentials(token="token-1")
+      )
+      is client
+  )
+  assert (
+      get_bigquery_client(project="other-gcp-project", credentials=credentials)
+      is not client
+  )
+  assert (
+      get_bigquery_client(
+          project="test-gcp-project", credentials=Credentials(token="token-2")
+      )
+      is not client
+  )
+  assert (
+      get_bigquery_client(
+          project="test-gcp-project",
+          credentials=credentials,
+          user_agent="my-agent",
+      )
+      is not client
+  )
@@ -26,6 +26,8 @@ import dateutil.relativedelta
 from google.adk.tools.base_tool import BaseTool
 from google.adk.tools.bigquery import BigQueryCredentialsConfig
 from google.adk.tools.bigquery import BigQueryToolset
+from google.adk.tools.bigquery import client as bq_client_lib
+from google.adk.tools.bigquery import query_tool
 from google.adk.tools.bigquery.config import BigQueryToolConfig
 from google.adk.tools.bigquery.config import WriteMode
 from google.adk.tools.bigquery.query_tool import analyze_contribution
@@ -39,6 +41,15 @@ from google.oauth2.credentials import Credentials
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_bigquery_caches():
+  bq_client_lib._client_cache.clear()
+  query_tool._dry_run_verdicts.clear()
+  yield
+  bq_client_lib._client_cache.clear()
+  query_tool._dry_run_verdicts.clear()
+
+
 async def get_tool(
     name: str, tool_settings: Optional[BigQueryToolConfig] = None
 ) -> BaseTool:
@@ -1132,6 +1143,167 @@ def test_execute_sql_result_dtype(
   assert result == {"status": "SUCCESS", "rows": tool_result_rows}
 
 
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch("google.cloud.bigquery.Client.query_and_wait", autospec=True)
+@mock.patch("google.cloud.bigquery.Client.query", autospec=True)
+def test_execute_sql_result_dtype_with_schema(mock_query, mock_query_and_wait):
+  """Test execute_sql tool converts rows using the result schema."""
+  schema = [
+      bigquery.SchemaField("i", "INTEGER"),
+      bigquery.SchemaField("s", "STRING"),
+      bigquery.SchemaField("n", "NUMERIC"),
+      bigquery.SchemaField("ts", "TIMESTAMP"),
+      bigquery.SchemaField("d", "DATE", mode="REPEATED"),
+      bigquery.SchemaField(
+          "r",
+          "RECORD",
+          fields=[bigquery.SchemaField("x", "INTEGER")],
+      ),
+  ]
+  field_to_index = {field.name: i for i, field in enumerate(schema)}
+  rows = [
+      bigquery.Row(
+          (
+              1,
+              "a",
+              decimal.Decimal("1.5"),
+              datetime.datetime(
+                  2025, 7, 21, 17, 30, 45, tzinfo=datetime.timezone.utc
+              ),
+              [],
+              {"x": 1},
+          ),
+          field_to_index,
+      ),
+      bigquery.Row(
+          (None, None, None, None, [datetime.date(2025, 7, 21)], None),
+          field_to_index,
+      ),
+  ]
+  row_iterator = mock.MagicMock()
+  row_iterator.schema = schema
+  row_iterator.__iter__.return_value = iter(rows)
+
+  query_job = mock.create_autospec(bigquery.QueryJob)
+  query_job.statement_type = "SELECT"
+  mock_query.return_value = query_job
+  mock_query_and_wait.return_value = row_iterator
+
+  result = execute_sql(
+      "my_project",
+      "SELECT * FROM t",
+      mock.create_autospec(Credentials, instance=True),
+      BigQueryToolConfig(),
+      mock.create_autospec(ToolContext, instance=True),
+  )
+  assert result == {
+      "status": "SUCCESS",
+      "rows": [
+          {
+              "i": 1,
+              "s": "a",
+              "n": "1.5",
+              "ts": "2025-07-21 17:30:45+00:00",
+              "d": [],
+              "r": {"x": 1},
+          },
+          {
+              "i": None,
+              "s": None,
+              "n": None,
+              "ts": None,
+              "d": "[datetime.date(2025, 7, 21)]",
+              "r": None,
+          },
+      ],
+  }
+
+
+@pytest.mark.parametrize(
+    ("write_mode", "second_query"),
+    [
+        pytest.param(WriteMode.BLOCKED, "SELECT 123 AS num", id="blocked"),
+        pytest.param(WriteMode.PROTECTED, "SELECT 123 AS num", id="protected"),
+    ],
+)
+def test_execute_sql_dry_run_verdict_cached(write_mode, second_query):
+  """Test execute_sql reuses the write mode dry run of a repeated query."""
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_settings = BigQueryToolConfig(write_mode=write_mode)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  tool_context.session.id = "session-1"
+  tool_context.state = {}
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    query_job = mock.create_autospec(bigquery.QueryJob)
+    query_job.statement_type = "SELECT"
+    bq_client.query.return_value = query_job
+
+    execute_sql(
+        "my_project",
+        "SELECT 123 AS num",
+        credentials,
+        tool_settings,
+        tool_context,
+    )
+    first_query_call_count = bq_client.query.call_count
+    execute_sql(
+        "my_project", second_query, credentials, tool_settings, tool_context
+    )
+    assert bq_client.query.call_count == first_query_call_count
+    assert bq_client.query_and_wait.call_count == 2
+
+    # A different query needs its own dry run.
+    execute_sql(
+        "my_project", "SELECT 1", credentials, tool_settings, tool_context
+    )
+    assert bq_client.query.call_count == first_query_call_count + 1
+
+
+@pytest.mark.parametrize("write_mode", [WriteMode.BLOCKED, WriteMode.PROTECTED])
+def test_execute_sql_dry_run_verdict_keyed_by_exact_query(write_mode):
+  """Test a query differing only in whitespace is dry run again."""
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_settings = BigQueryToolConfig(write_mode=write_mode)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  tool_context.session.id = "session-1"
+  # The BigQuery session of the protected write mode was already created.
+  tool_context.state = {
+      query_tool.BIGQUERY_SESSION_INFO_KEY: ("bq-session", "_anonymous")
+  }
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    select_job = mock.create_autospec(bigquery.QueryJob)
+    select_job.statement_type = "SELECT"
+    select_job.destination = None
+    drop_job = mock.create_autospec(bigquery.QueryJob)
+    drop_job.statement_type = "DROP_TABLE"
+    drop_job.destination.dataset_id = "d"
+    bq_client.query.side_effect = [select_job, drop_job]
+
+    execute_sql(
+        "my_project",
+        "SELECT 1 -- DROP TABLE d.t",
+        credentials,
+        tool_settings,
+        tool_context,
+    )
+    # The newline ends the comment, so this query drops the table.
+    result = execute_sql(
+        "my_project",
+        "SELECT 1 --\nDROP TABLE d.t",
+        credentials,
+        tool_settings,
+        tool_context,
+    )
+
+    assert bq_client.query.call_count == 2
+    assert result["status"] == "ERROR"
+    assert bq_client.query_and_wait.call_count == 1
+
+
 @mock.patch(
     "google.adk.tools.bigquery.client.get_bigquery_client", autospec=True
 )
@@ -1826,3 +1998,67 @@ def test_execute_sql_no_truncation():
     # Check no truncation flag when fewer rows than limit
     assert result["status"] == "SUCCESS"
     assert "result_is_likely_truncated" not in result
+
+
+@pytest.mark.asyncio
+async def test_execute_sql_streams_large_result_to_artifact():
+  """Test all the rows of a large result are stored, past the row limit."""
+  project = "my_project"
+  query = "SELECT num FROM t"
+  query_result = [{"num": i} for i in range(25)]
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_config = BigQueryToolConfig(
+      max_query_result_rows=10, result_artifact_threshold_rows=5
+  )
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  tool_context.session.id = "session-1"
+  tool_context._invocation_context = mock.Mock()
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    query_job = mock.create_autospec(bigquery.QueryJob)
+    query_job.statement_type = "SELECT"
+    bq_client.query.return_value = query_job
+    bq_client.query_and_wait.return_value = query_result
+
+    result = await query_tool.get_execute_sql(tool_config)(
+        project, query, credentials, tool_config, tool_context
+    )
+
+    assert (
+        bq_client.query_and_wait.call_args.kwargs["max_results"]
+        == tool_config.max_result_artifact_rows + 1
+    )
+    assert result["row_count"] == 25
+    assert "result_is_likely_truncated" not in result
+    tool_context.save_artifact.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_sql_caps_inline_result_below_artifact_threshold():
+  """Test a result under the artifact threshold still has the row limit."""
+  project = "my_project"
+  query = "SELECT num FROM t"
+  query_result = [{"num": i} for i in range(200)]
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_config = BigQueryToolConfig(
+      max_query_result_rows=50, result_artifact_threshold_rows=500
+  )
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  tool_context.session.id = "session-1"
+  tool_context._invocation_context = mock.Mock()
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    query_job = mock.create_autospec(bigquery.QueryJob)
+    query_job.statement_type = "SELECT"
+    bq_client.query.return_value = query_job
+    bq_client.query_and_wait.return_value = query_result
+
+    result = await query_tool.get_execute_sql(tool_config)(
+        project, query, credentials, tool_config, tool_context
+    )
+
+    assert len(result["rows"]) == 50
+    assert result["result_is_likely_truncated"] is True
+    tool_context.save_artifact.assert_not_awaited()
@@ -18,6 +18,7 @@ from google.adk.tools.bigquery import BigQueryCredentialsConfig
 from google.adk.tools.bigquery import BigQueryToolset
 from google.adk.tools.bigquery.config import BigQueryToolConfig
 from google.adk.tools.google_tool import GoogleTool
+from google.adk.tools.tool_cache_config import METADATA_TOOL_CACHE_CONFIG
 import pytest
 
 
@@ -131,3 +132,46 @@ async def test_bigquery_toolset_unknown_tool(selected_tools, returned_tools):
   expected_tool_names = set(returned_tools)
   actual_tool_names = set([tool.name for tool in tools])
   assert actual_tool_names == expected_tool_names
+
+
+@pytest.mark.asyncio
+async def test_bigquery_toolset_result_artifacts():
+  """Test BigQuery toolset with query results stored as artifacts."""
+  toolset = BigQueryToolset(
+      bigquery_tool_config=BigQueryToolConfig(
+          result_artifact_threshold_rows=20
+      ),
+  )
+  tools = {tool.name: tool for tool in await toolset.get_tools()}
+
+  assert len(tools) == 11
+  assert "read_query_result" in tools["execute_sql"].description
+  declaration = tools["read_query_result"]._get_declaration()
+  assert list(declaration.parameters.properties) == [
+      "result_artifact",
+      "offset",
+      "columns",
+      "filters",
+  ]
+
+
+@pytest.mark.asyncio
+async def test_bigquery_toolset_metadata_tools_are_cacheable():
+  """Test that only the read-only metadata tools declare a cache config."""
+  toolset = BigQueryToolset()
+  tools = await toolset.get_tools()
+
+  cacheable_tool_names = {
+      tool.name for tool in tools if tool.cache_config is not None
+  }
+  assert cacheable_tool_names == {
+      "list_dataset_ids",
+      "get_dataset_info",
+      "list_table_ids",
+      "get_table_info",
+  }
+  assert all(
+      tool.cache_config is METADATA_TOOL_CACHE_CONFIG
+      for tool in tools
+      if tool.cache_config is not None
+  )
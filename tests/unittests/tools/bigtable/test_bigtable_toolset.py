@@ -22,6 +22,7 @@ from google.adk.tools.bigtable import query_tool
 from google.adk.tools.bigtable.bigtable_toolset import BigtableToolset
 from google.adk.tools.bigtable.bigtable_toolset import DEFAULT_BIGTABLE_TOOL_NAME_PREFIX
 from google.adk.tools.google_tool import GoogleTool
+from google.adk.tools.tool_cache_config import METADATA_TOOL_CACHE_CONFIG
 import pytest
 
 
@@ -131,3 +132,25 @@ async def test_bigtable_toolset_unknown_tool(selected_tools, returned_tools):
   expected_tool_names = set(returned_tools)
   actual_tool_names = set([tool.name for tool in tools])
   assert actual_tool_names == expected_tool_names
+
+
+@pytest.mark.asyncio
+async def test_bigtable_toolset_metadata_tools_are_cacheable():
+  """Test that only the read-only metadata tools declare a cache config."""
+  toolset = BigtableToolset()
+  tools = await toolset.get_tools()
+
+  cacheable_tool_names = {
+      tool.name for tool in tools if tool.cache_config is not None
+  }
+  assert cacheable_tool_names == {
+      "list_instances",
+      "get_instance_info",
+      "list_tables",
+      "get_table_info",
+  }
+  assert all(
+      tool.cache_config is METADATA_TOOL_CACHE_CONFIG
+      for tool in tools
+      if tool.cache_config is not None
+  )
@@ -131,6 +131,19 @@ class TestApiParameter:
         'py_name': 'test_param_custom',
     }
 
+  def test_api_parameter_required_round_trips(self):
+    param = ApiParameter(
+        original_name='userId',
+        param_location='path',
+        param_schema=Schema(type='string'),
+        required=True,
+    )
+
+    restored = ApiParameter.model_validate(param.model_dump(mode='json'))
+
+    assert restored.required
+    assert restored.py_name == 'user_id'
+
   @pytest.mark.parametrize(
       'schema, expected_type_value, expected_type_hint',
       [
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from typing import Any
 from typing import Dict
+from unittest import mock
 
 from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_spec_parser import OpenApiSpecParser
 import pytest
@@ -371,7 +373,9 @@ def test_parse_external_ref_raises_error(openapi_spec_generator):
                           "content": {
                               "application/json": {
                                   "schema": {
-                                      "$ref": "external_file.json#/components/schemas/ExternalSchema"
+                                      "$ref": (
+                                          "external_file.json#/components/schemas/ExternalSchema"
+                                      )
                                   }
                               }
                           },
@@ -681,3 +685,33 @@ def test_parse_spec_with_path_level_parameters(openapi_spec_generator):
   assert local_param is not None
   assert local_param.param_location == "header"
   assert local_param.type_value is int
+
+
+def test_parse_reuses_parsed_operations_for_same_spec(openapi_spec_generator):
+  openapi_spec = create_minimal_openapi_spec()
+  openapi_spec["paths"]["/test"]["get"]["responses"]["200"]["content"] = {
+      "application/json": {"schema": {"$ref": "#/components/schemas/Item"}}
+  }
+  openapi_spec["components"] = {
+      "schemas": {"Item": {"type": "object", "properties": {}}}
+  }
+  original_spec = copy.deepcopy(openapi_spec)
+
+  with mock.patch.object(
+      OpenApiSpecParser,
+      "_collect_operations",
+      autospec=True,
+      side_effect=OpenApiSpecParser._collect_operations,
+  ) as collect_operations:
+    first = OpenApiSpecParser().parse(openapi_spec)
+    second = OpenApiSpecParser().parse(copy.deepcopy(openapi_spec))
+    openapi_spec["info"]["title"] = "Changed API"
+    OpenApiSpecParser().parse(openapi_spec)
+
+  assert collect_operations.call_count == 2
+  assert first == second
+  # Each caller gets its own ParsedOperation objects.
+  assert first[0] is not second[0]
+  openapi_spec["info"]["title"] = original_spec["info"]["title"]
+  # Parsing does not modify the spec.
+  assert openapi_spec == original_spec
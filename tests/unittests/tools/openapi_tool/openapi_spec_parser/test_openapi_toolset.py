@@ -14,6 +14,8 @@
 
 import os
 from typing import Dict
+from unittest.mock import AsyncMock
+from unittest.mock import patch
 
 from fastapi.openapi.models import APIKey
 from fastapi.openapi.models import APIKeyIn
@@ -137,3 +139,17 @@ def test_openapi_toolset_configure_auth_on_init(openapi_spec: Dict):
   for tool in toolset._tools:
     assert tool.auth_scheme == auth_scheme
     assert tool.auth_credential == auth_credential
+
+
+@pytest.mark.asyncio
+async def test_openapi_toolset_tools_share_http_client(openapi_spec: Dict):
+  toolset = OpenAPIToolset(spec_dict=openapi_spec)
+  tools = await toolset.get_tools()
+
+  assert all(tool._http_client is toolset._http_client for tool in tools)
+
+  with patch.object(
+      toolset._http_client, "close", new_callable=AsyncMock
+  ) as mock_close:
+    await toolset.close()
+  mock_close.assert_awaited_once()
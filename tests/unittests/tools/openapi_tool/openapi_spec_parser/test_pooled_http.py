@@ -0,0 +1,119 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import patch
+
+from google.adk.tools.openapi_tool.openapi_spec_parser._pooled_http import _to_httpx_params
+from google.adk.tools.openapi_tool.openapi_spec_parser._pooled_http import HttpClientConfig
+from google.adk.tools.openapi_tool.openapi_spec_parser._pooled_http import PooledHttpClient
+import httpx
+import pytest
+
+
+def test_to_httpx_params_moves_cookies_and_raw_bodies():
+  params = _to_httpx_params({
+      "method": "post",
+      "url": "https://example.com/items",
+      "params": {"q": "x"},
+      "headers": {"User-Agent": "adk"},
+      "cookies": {"a": "1", "b": "2"},
+      "data": b"raw",
+  })
+
+  assert params == {
+      "method": "post",
+      "url": "https://example.com/items",
+      "params": {"q": "x"},
+      "headers": {"User-Agent": "adk", "Cookie": "a=1; b=2"},
+      "content": b"raw",
+  }
+  # Booleans are serialized as by `requests`.
+  assert _to_httpx_params(
+      {"url": "u", "params": {"a": True, "b": [False, 1], "c": 0}}
+  )["params"] == {"a": "True", "b": ["False", 1], "c": 0}
+  # Form fields stay in `data`.
+  assert _to_httpx_params({"url": "u", "data": {"k": "v"}})["data"] == {
+      "k": "v"
+  }
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_one_client_and_are_limited_per_host():
+  in_flight = {}
+  max_in_flight = {}
+  sent = []
+
+  async def handler(request: httpx.Request) -> httpx.Response:
+    host = request.url.host
+    in_flight[host] = in_flight.get(host, 0) + 1
+    max_in_flight[host] = max(max_in_flight.get(host, 0), in_flight[host])
+    await asyncio.sleep(0.01)
+    in_flight[host] -= 1
+    sent.append(request)
+    return httpx.Response(200, json={"ok": True})
+
+  original_init = httpx.AsyncClient.__init__
+  created = []
+
+  def init_with_mock_transport(self, **kwargs):
+    created.append(kwargs)
+    original_init(self, transport=httpx.MockTransport(handler), **kwargs)
+
+  client = PooledHttpClient(HttpClientConfig(max_connections_per_host=2))
+  with patch.object(httpx.AsyncClient, "__init__", init_with_mock_transport):
+    responses = await asyncio.gather(*[
+        client.request(method="get", url=f"https://{host}.example.com/x")
+        for host in ["a", "a", "a", "a", "b"]
+    ])
+    await client.close()
+
+  assert [r.json() for r in responses] == [{"ok": True}] * 5
+  assert len(created) == 1
+  assert max_in_flight == {"a.example.com": 2, "b.example.com": 1}
+  assert sent[0].method == "GET"
+
+
+@pytest.mark.asyncio
+async def test_redirects_are_followed():
+
+  async def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/old":
+      return httpx.Response(302, headers={"Location": "/new"})
+    return httpx.Response(200, json={"path": request.url.path})
+
+  original_init = httpx.AsyncClient.__init__
+
+  def init_with_mock_transport(self, **kwargs):
+    original_init(self, transport=httpx.MockTransport(handler), **kwargs)
+
+  client = PooledHttpClient()
+  with patch.object(httpx.AsyncClient, "__init__", init_with_mock_transport):
+    response = await client.request(method="get", url="https://example.com/old")
+    await client.close()
+
+  assert response.status_code == 200
+  assert response.json() == {"path": "/new"}
+
+
+def test_client_is_recreated_for_a_new_event_loop():
+  client = PooledHttpClient()
+
+  async def get_client():
+    return client._get_client()
+
+  first = asyncio.run(get_client())
+  second = asyncio.run(get_client())
+
+  assert first is not second
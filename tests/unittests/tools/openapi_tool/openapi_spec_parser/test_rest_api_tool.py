@@ -26,8 +26,10 @@ from fastapi.openapi.models import Schema as OpenAPISchema
 from google.adk.sessions.state import State
 from google.adk.tools.openapi_tool.auth.auth_helpers import token_to_scheme_credential
 from google.adk.tools.openapi_tool.common.common import ApiParameter
+from google.adk.tools.openapi_tool.openapi_spec_parser._pooled_http import PooledHttpClient
 from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_spec_parser import OperationEndpoint
 from google.adk.tools.openapi_tool.openapi_spec_parser.operation_parser import OperationParser
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import _RequestTemplate
 from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
 from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import snake_to_lower_camel
 from google.adk.tools.tool_context import ToolContext
@@ -192,9 +194,7 @@ class TestRestApiTool:
     assert declaration.description == "Test description"
     assert isinstance(declaration.parameters, Schema)
 
-  @patch(
-      "google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool.requests.request"
-  )
+  @patch.object(PooledHttpClient, "request", new_callable=AsyncMock)
   @pytest.mark.asyncio
   async def test_call_success(
       self,
@@ -224,9 +224,7 @@ class TestRestApiTool:
     # Check the result
     assert result == {"result": "success"}
 
-  @patch(
-      "google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool.requests.request"
-  )
+  @patch.object(PooledHttpClient, "request", new_callable=AsyncMock)
   @pytest.mark.asyncio
   async def test_call_auth_pending(
       self,
@@ -262,9 +260,7 @@ class TestRestApiTool:
           "message": "Needs your authorization to access your data.",
       }
 
-  @patch(
-      "google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool.requests.request"
-  )
+  @patch.object(PooledHttpClient, "request", new_callable=AsyncMock)
   @pytest.mark.asyncio
   async def test_call_with_required_param_defaults(
       self,
@@ -314,6 +310,36 @@ class TestRestApiTool:
     assert call_kwargs["url"] == "https://example.com/users/me/messages"
     assert result == {"result": "success"}
 
+  def test_request_template_is_compiled_once(
+      self, sample_endpoint, sample_operation
+  ):
+    tool = RestApiTool(
+        name="test_tool",
+        description="Test Tool",
+        endpoint=sample_endpoint,
+        operation=sample_operation,
+    )
+
+    with patch.object(
+        _RequestTemplate,
+        "compile",
+        autospec=True,
+        side_effect=_RequestTemplate.compile,
+    ) as compile_template:
+      tool._prepare_request_params([], {})
+      tool._prepare_request_params([], {})
+      assert compile_template.call_count == 1
+
+      # Changing the endpoint recompiles the template.
+      tool.endpoint = OperationEndpoint(
+          base_url="https://other.example.com/", path="/test", method="POST"
+      )
+      request_params = tool._prepare_request_params([], {})
+      assert compile_template.call_count == 2
+
+    assert request_params["method"] == "post"
+    assert request_params["url"] == "https://other.example.com/test"
+
   def test_prepare_request_params_query_body(
       self, sample_endpoint, sample_auth_credential, sample_auth_scheme
   ):
@@ -14,6 +14,7 @@
 
 """Tests for FilesRetrieval tool."""
 
+import os
 import sys
 import unittest.mock as mock
 
@@ -39,6 +40,21 @@ class MockEmbedding(BaseEmbedding):
     return [0.1] * 384
 
 
+class CountingEmbedding(MockEmbedding):
+  """Mock embedding model counting the texts it embeds."""
+
+  embedded_texts: list[str] = []
+
+  def _get_text_embedding(self, text):
+    self.embedded_texts.append(text)
+    return [0.1] * 384
+
+
+def _indexed_file_names(retrieval):
+  docstore = retrieval.retriever._index.docstore
+  return sorted({doc.metadata["file_name"] for doc in docstore.docs.values()})
+
+
 class TestFilesRetrieval:
 
   def test_files_retrieval_with_custom_embedding(self, tmp_path):
@@ -151,3 +167,124 @@ class TestFilesRetrieval:
       assert retrieval.name == "test_retrieval"
       assert retrieval.input_dir == str(tmp_path)
       mock_get_default.assert_called_once()
+
+  def test_files_are_indexed_on_first_use(self, tmp_path):
+    """Test FilesRetrieval doesn't index files on construction."""
+    (tmp_path / "test.txt").write_text("This is a test document.")
+    embedding = CountingEmbedding(embedded_texts=[])
+
+    retrieval = FilesRetrieval(
+        name="test_retrieval",
+        description="Test retrieval tool",
+        input_dir=str(tmp_path),
+        embedding_model=embedding,
+    )
+    assert not embedding.embedded_texts
+
+    assert retrieval.retriever is not None
+    assert len(embedding.embedded_texts) == 1
+
+  @pytest.mark.asyncio
+  async def test_run_async_indexes_files(self, tmp_path):
+    """Test FilesRetrieval indexes the files on the first query."""
+    (tmp_path / "test.txt").write_text("This is a test document.")
+    retrieval = FilesRetrieval(
+        name="test_retrieval",
+        description="Test retrieval tool",
+        input_dir=str(tmp_path),
+        embedding_model=MockEmbedding(),
+    )
+
+    result = await retrieval.run_async(
+        args={"query": "test"}, tool_context=mock.MagicMock()
+    )
+
+    assert result == "This is a test document."
+
+  def test_persisted_index_only_embeds_changed_files(self, tmp_path):
+    """Test FilesRetrieval re-embeds only added and changed files."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    persist_dir = str(tmp_path / "index")
+    (input_dir / "a.txt").write_text("Document A.")
+    (input_dir / "b.txt").write_text("Document B.")
+    (input_dir / "c.txt").write_text("Document C.")
+
+    def load(embedding):
+      retrieval = FilesRetrieval(
+          name="test_retrieval",
+          description="Test retrieval tool",
+          input_dir=str(input_dir),
+          embedding_model=embedding,
+          persist_dir=persist_dir,
+      )
+      return _indexed_file_names(retrieval)
+
+    embedding = CountingEmbedding(embedded_texts=[])
+    assert load(embedding) == ["a.txt", "b.txt", "c.txt"]
+    assert len(embedding.embedded_texts) == 3
+
+    embedding = CountingEmbedding(embedded_texts=[])
+    assert load(embedding) == ["a.txt", "b.txt", "c.txt"]
+    assert not embedding.embedded_texts
+
+    # A touched file with the same content is not embedded again.
+    stat = os.stat(input_dir / "a.txt")
+    os.utime(input_dir / "a.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    (input_dir / "b.txt").write_text("Document B, revised.")
+    (input_dir / "c.txt").unlink()
+    (input_dir / "d.txt").write_text("Document D.")
+    embedding = CountingEmbedding(embedded_texts=[])
+    assert load(embedding) == ["a.txt", "b.txt", "d.txt"]
+    assert len(embedding.embedded_texts) == 2
+    assert "Document B, revised." in embedding.embedded_texts[0]
+    assert "Document D." in embedding.embedded_texts[1]
+
+  def test_persisted_index_is_rebuilt_for_other_embedding_model(self, tmp_path):
+    """Test FilesRetrieval doesn't reuse embeddings of another model."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "a.txt").write_text("Document A.")
+    persist_dir = str(tmp_path / "index")
+
+    for model_name, expected_embedded_texts in [
+        ("model-1", 1),
+        ("model-1", 0),
+        ("model-2", 1),
+    ]:
+      embedding = CountingEmbedding(model_name=model_name, embedded_texts=[])
+      retrieval = FilesRetrieval(
+          name="test_retrieval",
+          description="Test retrieval tool",
+          input_dir=str(input_dir),
+          embedding_model=embedding,
+          persist_dir=persist_dir,
+      )
+      assert _indexed_file_names(retrieval) == ["a.txt"]
+      assert len(embedding.embedded_texts) == expected_embedded_texts
+
+  def test_documents_of_unknown_files_are_skipped(self, tmp_path, monkeypatch):
+    """Test documents the manifest can't trace to a file are not indexed."""
+    from llama_index.core import Document
+    from llama_index.core import SimpleDirectoryReader
+
+    (tmp_path / "a.txt").write_text("Document A.")
+    load_data = SimpleDirectoryReader.load_data
+
+    def load_data_with_unknown_file(self, *args, **kwargs):
+      return load_data(self, *args, **kwargs) + [
+          Document(text="Unknown.", metadata={"file_name": "unknown.txt"})
+      ]
+
+    monkeypatch.setattr(
+        SimpleDirectoryReader, "load_data", load_data_with_unknown_file
+    )
+    retrieval = FilesRetrieval(
+        name="test_retrieval",
+        description="Test retrieval tool",
+        input_dir=f"{tmp_path}/./",
+        embedding_model=MockEmbedding(),
+        persist_dir=str(tmp_path / "index"),
+    )
+
+    assert _indexed_file_names(retrieval) == ["a.txt"]
@@ -18,6 +18,7 @@ from google.adk.tools.google_tool import GoogleTool
 from google.adk.tools.spanner import SpannerCredentialsConfig
 from google.adk.tools.spanner import SpannerToolset
 from google.adk.tools.spanner.settings import SpannerToolSettings
+from google.adk.tools.tool_cache_config import METADATA_TOOL_CACHE_CONFIG
 import pytest
 
 
@@ -184,3 +185,47 @@ async def test_spanner_toolset_without_read_capability(
   expected_tool_names = set(returned_tools)
   actual_tool_names = set([tool.name for tool in tools])
   assert actual_tool_names == expected_tool_names
+
+
+@pytest.mark.asyncio
+async def test_spanner_toolset_result_artifacts():
+  """Test Spanner toolset with query results stored as artifacts."""
+  toolset = SpannerToolset(
+      spanner_tool_settings=SpannerToolSettings(
+          result_artifact_threshold_rows=20
+      ),
+  )
+  tools = {tool.name: tool for tool in await toolset.get_tools()}
+
+  assert len(tools) == 8
+  assert "spanner_read_query_result" in tools["execute_sql"].description
+  declaration = tools["read_query_result"]._get_declaration()
+  assert list(declaration.parameters.properties) == [
+      "result_artifact",
+      "offset",
+      "columns",
+      "filters",
+  ]
+
+
+@pytest.mark.asyncio
+async def test_spanner_toolset_metadata_tools_are_cacheable():
+  """Test that only the read-only metadata tools declare a cache config."""
+  toolset = SpannerToolset()
+  tools = await toolset.get_tools()
+
+  cacheable_tool_names = {
+      tool.name for tool in tools if tool.cache_config is not None
+  }
+  assert cacheable_tool_names == {
+      "list_table_names",
+      "list_table_indexes",
+      "list_table_index_columns",
+      "list_named_schemas",
+      "get_table_schema",
+  }
+  assert all(
+      tool.cache_config is METADATA_TOOL_CACHE_CONFIG
+      for tool in tools
+      if tool.cache_config is not None
+  )
@@ -0,0 +1,196 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the load_web_page tool."""
+
+from __future__ import annotations
+
+import asyncio
+
+from google.adk.tools import load_web_page as load_web_page_module
+from google.adk.tools.load_web_page import load_web_page
+import httpx
+import pytest
+
+_PAGE = (
+    b'<html><body><h1>Title</h1>'
+    b'<p>This is the first paragraph of the page.</p>'
+    b'<p>This is the second paragraph of the page.</p>'
+    b'</body></html>'
+)
+_PAGE_TEXT = (
+    'This is the first paragraph of the page.\n'
+    'This is the second paragraph of the page.'
+)
+
+
+class _Server:
+  """Serves _PAGE with the given headers, answering revalidations."""
+
+  def __init__(self, headers=None, status_code=200, content=_PAGE):
+    self.headers = headers or {}
+    self.status_code = status_code
+    self.content = content
+    self.requests = []
+
+  def __call__(self, request: httpx.Request) -> httpx.Response:
+    self.requests.append(request)
+    etag = self.headers.get('etag')
+    if etag and request.headers.get('if-none-match') == etag:
+      return httpx.Response(304, headers=self.headers)
+    return httpx.Response(
+        self.status_code, headers=self.headers, content=self.content
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_page_cache(monkeypatch):
+  monkeypatch.setattr(load_web_page_module, '_page_cache_chars', 0)
+  load_web_page_module._page_cache.clear()
+  yield
+  load_web_page_module._page_cache.clear()
+
+
+def _serve(monkeypatch, server: _Server) -> None:
+  client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+  monkeypatch.setattr(load_web_page_module, '_get_http_client', lambda: client)
+
+
+@pytest.mark.asyncio
+async def test_load_web_page_returns_text(monkeypatch):
+  _serve(monkeypatch, _Server())
+
+  assert await load_web_page('https://example.com') == _PAGE_TEXT
+
+
+@pytest.mark.asyncio
+async def test_load_web_page_failure(monkeypatch):
+  _serve(monkeypatch, _Server(status_code=404))
+
+  assert (
+      await load_web_page('https://example.com')
+      == 'Failed to fetch url: https://example.com'
+  )
+
+
+@pytest.mark.asyncio
+async def test_fresh_page_is_served_from_cache(monkeypatch):
+  server = _Server(headers={'cache-control': 'max-age=60'})
+  _serve(monkeypatch, server)
+
+  assert await load_web_page('https://example.com') == _PAGE_TEXT
+  assert await load_web_page('https://example.com') == _PAGE_TEXT
+  assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_page_is_revalidated(monkeypatch):
+  server = _Server(headers={'cache-control': 'no-cache', 'etag': '"v1"'})
+  _serve(monkeypatch, server)
+
+  assert await load_web_page('https://example.com') == _PAGE_TEXT
+  assert await load_web_page('https://example.com') == _PAGE_TEXT
+  assert len(server.requests) == 2
+  assert server.requests[1].headers['if-none-match'] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_no_store_page_is_not_cached(monkeypatch):
+  server = _Server(headers={'cache-control': 'no-store', 'etag': '"v1"'})
+  _serve(monkeypatch, server)
+
+  await load_web_page('https://example.com')
+  await load_web_page('https://example.com')
+  assert len(server.requests) == 2
+  assert 'if-none-match' not in server.requests[1].headers
+
+
+@pytest.mark.asyncio
+async def test_page_is_read_up_to_size_limit(monkeypatch):
+  monkeypatch.setattr(load_web_page_module, '_MAX_CONTENT_BYTES', 80)
+  _serve(monkeypatch, _Server())
+
+  assert (
+      await load_web_page('https://example.com')
+      == 'This is the first paragraph of the page.'
+  )
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_pages(monkeypatch):
+  monkeypatch.setattr(
+      load_web_page_module, '_CACHE_MAX_CHARS', 2 * len(_PAGE_TEXT)
+  )
+  server = _Server(headers={'cache-control': 'max-age=60'})
+  _serve(monkeypatch, server)
+
+  await load_web_page('https://example.com/a')
+  await load_web_page('https://example.com/b')
+  await load_web_page('https://example.com/a')
+  await load_web_page('https://example.com/c')
+  assert len(server.requests) == 3
+
+  await load_web_page('https://example.com/a')
+  assert len(server.requests) == 3
+  await load_web_page('https://example.com/b')
+  assert len(server.requests) == 4
+
+
+def test_cache_ttl():
+  get_ttl = load_web_page_module._get_cache_ttl
+
+  assert get_ttl(httpx.Headers({'cache-control': 'public, max-age=300'})) == 300
+  assert get_ttl(httpx.Headers({'cache-control': 'no-store'})) is None
+  assert get_ttl(httpx.Headers({})) == 0
+  assert (
+      get_ttl(
+          httpx.Headers({
+              'date': 'Mon, 20 Oct 2025 10:00:00 GMT',
+              'expires': 'Mon, 20 Oct 2025 10:05:00 GMT',
+          })
+      )
+      == 300
+  )
+  assert (
+      get_ttl(
+          httpx.Headers({
+              'date': 'Mon, 20 Oct 2025 10:00:00 GMT',
+              'last-modified': 'Mon, 20 Oct 2025 09:00:00 GMT',
+          })
+      )
+      == 360
+  )
+
+
+def test_http_client_is_kept_per_event_loop(monkeypatch):
+  monkeypatch.setattr(load_web_page_module, '_http_clients', {})
+
+  async def get_client():
+    return load_web_page_module._get_http_client()
+
+  loop = asyncio.new_event_loop()
+  try:
+    first = loop.run_until_complete(get_client())
+    assert loop.run_until_complete(get_client()) is first
+    other = asyncio.run(get_client())
+    assert other is not first
+    # The client of a loop that is still open is not replaced.
+    assert loop.run_until_complete(get_client()) is first
+  finally:
+    loop.close()
+
+  # The clients of closed loops are forgotten.
+  assert len(load_web_page_module._http_clients) == 2
+  asyncio.run(get_client())
+  assert len(load_web_page_module._http_clients) == 1
@@ -0,0 +1,297 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import inspect
+import types
+from typing import Optional
+
+from google.adk.tools import _query_result_artifacts
+from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.tool_context import ToolContext
+import pytest
+
+
+class _FakeToolContext:
+
+  def __init__(self, has_artifact_service: bool = True):
+    self.artifacts = {}
+    self._invocation_context = types.SimpleNamespace(
+        artifact_service=object() if has_artifact_service else None
+    )
+
+  async def save_artifact(self, filename, artifact):
+    self.artifacts[filename] = artifact
+    return 0
+
+  async def load_artifact(self, filename):
+    return self.artifacts.get(filename)
+
+
+def _query(row_count: int):
+
+  def execute_sql(query: str, tool_context: ToolContext) -> dict:
+    """Run a query."""
+    rows = [
+        {"id": i, "country": "US" if i % 2 else "FR", "score": i / 2}
+        for i in range(row_count)
+    ]
+    return {"status": "SUCCESS", "rows": rows}
+
+  return execute_sql
+
+
+def _store(func, max_rows: int = 100, max_inline_rows: int = 10):
+  return _query_result_artifacts.store_large_results(
+      func,
+      threshold_rows=10,
+      max_rows=max_rows,
+      max_inline_rows=max_inline_rows,
+      reader_tool_name="read_query_result",
+  )
+
+
+@pytest.mark.asyncio
+async def test_small_result_is_returned_inline():
+  tool_context = _FakeToolContext()
+
+  result = await _store(_query(10))("SELECT 1", tool_context=tool_context)
+
+  assert len(result["rows"]) == 10
+  assert not tool_context.artifacts
+
+
+@pytest.mark.asyncio
+async def test_large_result_is_stored_as_artifact():
+  tool_context = _FakeToolContext()
+
+  result = await _store(_query(25))("SELECT 1", tool_context=tool_context)
+
+  assert result["status"] == "SUCCESS"
+  assert "rows" not in result
+  assert result["row_count"] == 25
+  assert result["schema"] == [
+      {"name": "id", "type": "int64"},
+      {"name": "country", "type": "string"},
+      {"name": "score", "type": "double"},
+  ]
+  assert [row["id"] for row in result["sample_rows"]] == [0, 1, 2, 3, 4]
+  artifact = tool_context.artifacts[result["result_artifact"]]
+  assert artifact.inline_data.mime_type == (
+      _query_result_artifacts.PARQUET_MIME_TYPE
+  )
+
+
+@pytest.mark.asyncio
+async def test_large_result_is_returned_inline_without_artifact_service():
+  tool_context = _FakeToolContext(has_artifact_service=False)
+
+  result = await _store(_query(25))("SELECT 1", tool_context=tool_context)
+
+  assert len(result["rows"]) == 25
+
+
+def test_wrapped_tool_keeps_signature():
+  tool = FunctionTool(_store(_query(1)))
+
+  assert inspect.iscoroutinefunction(tool.func)
+  declaration = tool._get_declaration()
+  assert declaration.name == "execute_sql"
+  assert list(declaration.parameters.properties) == ["query"]
+  assert "read_query_result" in declaration.description
+
+
+@pytest.mark.asyncio
+async def test_read_query_result_pages_and_filters():
+  tool_context = _FakeToolContext()
+  summary = await _store(_query(25))("SELECT 1", tool_context=tool_context)
+  name = summary["result_artifact"]
+
+  page = await _query_result_artifacts.read_query_result(
+      tool_context, name, offset=20, limit=10
+  )
+  assert [row["id"] for row in page["rows"]] == [20, 21, 22, 23, 24]
+  assert page["row_count"] == 25
+  assert "next_offset" not in page
+
+  page = await _query_result_artifacts.read_query_result(
+      tool_context,
+      name,
+      limit=3,
+      columns=["id"],
+      filters={"country": "US"},
+  )
+  assert page == {
+      "status": "SUCCESS",
+      "rows": [{"id": 1}, {"id": 3}, {"id": 5}],
+      "row_count": 12,
+      "next_offset": 3,
+  }
+
+
+@pytest.mark.asyncio
+async def test_read_query_result_errors():
+  tool_context = _FakeToolContext()
+
+  missing = await _query_result_artifacts.read_query_result(
+      tool_context, "query_result_missing.parquet", limit=10
+  )
+  assert missing["status"] == "ERROR"
+
+  other = await _query_result_artifacts.read_query_result(
+      tool_context, "report.pdf", limit=10
+  )
+  assert other["status"] == "ERROR"
+
+  summary = await _store(_query(25))("SELECT 1", tool_context=tool_context)
+  unknown_column = await _query_result_artifacts.read_query_result(
+      tool_context,
+      summary["result_artifact"],
+      limit=10,
+      filters={"city": "Paris"},
+  )
+  assert unknown_column["status"] == "ERROR"
+
+
+@pytest.mark.asyncio
+async def test_columns_of_mixed_types_are_stored_as_json():
+  tool_context = _FakeToolContext()
+
+  def execute_sql(tool_context: ToolContext) -> dict:
+    rows = [
+        {"payload": {"a": 1} if i % 2 else ["b"], "tags": []} for i in range(20)
+    ]
+    return {"status": "SUCCESS", "rows": rows}
+
+  summary = await _store(execute_sql)(tool_context=tool_context)
+  page = await _query_result_artifacts.read_query_result(
+      tool_context, summary["result_artifact"], limit=2
+  )
+
+  assert page["rows"] == [
+      {"payload": '["b"]', "tags": []},
+      {"payload": '{"a": 1}', "tags": []},
+  ]
+
+
+def _streamed_query(row_count: int, error: Optional[Exception] = None):
+  closed = []
+
+  def execute_sql(tool_context: ToolContext) -> dict:
+    if not _query_result_artifacts.is_storing_large_results():
+      return {"status": "SUCCESS", "rows": [{"id": i} for i in range(10)]}
+
+    def rows():
+      try:
+        for i in range(row_count):
+          # The score is only known past the first batch.
+          yield {"id": i, "score": i / 2 if i >= 4 else None}
+        if error:
+          raise error
+      finally:
+        closed.append(True)
+
+    return {"status": "SUCCESS", "rows": rows()}
+
+  return execute_sql, closed
+
+
+@pytest.mark.asyncio
+async def test_streamed_result_is_stored_in_batches(monkeypatch):
+  monkeypatch.setattr(_query_result_artifacts, "_BATCH_ROWS", 4)
+  tool_context = _FakeToolContext()
+  execute_sql, closed = _streamed_query(25)
+
+  summary = await _store(execute_sql)(tool_context=tool_context)
+
+  assert summary["row_count"] == 25
+  assert summary["schema"] == [
+      {"name": "id", "type": "int64"},
+      {"name": "score", "type": "double"},
+  ]
+  assert closed == [True]
+  page = await _query_result_artifacts.read_query_result(
+      tool_context, summary["result_artifact"], offset=3, limit=2
+  )
+  assert page["rows"] == [{"id": 3, "score": None}, {"id": 4, "score": 2.0}]
+
+
+@pytest.mark.asyncio
+async def test_streamed_result_is_returned_inline_or_truncated():
+  execute_sql, closed = _streamed_query(10)
+  result = await _store(execute_sql)(tool_context=_FakeToolContext())
+  assert len(result["rows"]) == 10
+  assert closed == [True]
+
+  # Without an artifact service, the tool isn't asked to stream its rows.
+  execute_sql, closed = _streamed_query(25)
+  result = await _store(execute_sql)(
+      tool_context=_FakeToolContext(has_artifact_service=False)
+  )
+  assert len(result["rows"]) == 10
+  assert not closed
+
+  execute_sql, closed = _streamed_query(25)
+  tool_context = _FakeToolContext()
+  summary = await _store(execute_sql, max_rows=20)(tool_context=tool_context)
+  assert summary["row_count"] == 20
+  assert summary["result_is_likely_truncated"] is True
+  assert closed == [True]
+
+  execute_sql, closed = _streamed_query(25, error=RuntimeError("quota"))
+  result = await _store(execute_sql)(tool_context=_FakeToolContext())
+  assert result == {"status": "ERROR", "error_details": "quota"}
+  assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_inline_result_is_capped_below_threshold():
+  execute_sql, closed = _streamed_query(8)
+
+  result = await _store(execute_sql, max_inline_rows=5)(
+      tool_context=_FakeToolContext()
+  )
+
+  assert [row["id"] for row in result["rows"]] == [0, 1, 2, 3, 4]
+  assert result["result_is_likely_truncated"] is True
+  assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_columns_of_mixed_types_across_batches_are_stored_as_json(
+    monkeypatch,
+):
+  monkeypatch.setattr(_query_result_artifacts, "_BATCH_ROWS", 2)
+  tool_context = _FakeToolContext()
+
+  def execute_sql(tool_context: ToolContext) -> dict:
+    # The first batch has objects of one shape, the second of varying ones.
+    payloads = [{"a": 1}, {"a": 2}, {"a": 3}, ["b"]] * 5
+    return {
+        "status": "SUCCESS",
+        "rows": iter({"payload": payload} for payload in payloads),
+    }
+
+  summary = await _store(execute_sql)(tool_context=tool_context)
+  page = await _query_result_artifacts.read_query_result(
+      tool_context, summary["result_artifact"], limit=4
+  )
+
+  assert page["rows"] == [
+      {"payload": '{"a": 1}'},
+      {"payload": '{"a": 2}'},
+      {"payload": '{"a": 3}'},
+      {"payload": '["b"]'},
+  ]
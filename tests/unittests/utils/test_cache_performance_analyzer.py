@@ -20,6 +20,7 @@ from unittest.mock import MagicMock
 
 from google.adk.events.event import Event
 from google.adk.models.cache_metadata import CacheMetadata
+from google.adk.models.context_cache_registry import get_context_cache_registry
 from google.adk.sessions.base_session_service import BaseSessionService
 from google.adk.sessions.session import Session
 from google.adk.utils.cache_performance_analyzer import CachePerformanceAnalyzer
@@ -299,6 +300,30 @@ class TestCachePerformanceAnalyzer:
     assert result["cache_utilization_ratio_percent"] == 100.0  # 1/1 * 100
     assert result["avg_cached_tokens_per_request"] == 1500.0
 
+  async def test_analyze_agent_cache_performance_includes_registry(self):
+    """Test analysis reports the metrics of the process-wide registry."""
+    cache = self.create_cache_metadata(invocations_used=1)
+    mock_session = Session(
+        id="test_session",
+        app_name="test_app",
+        user_id="test_user",
+        events=[
+            self.create_mock_event(author="test_agent", cache_metadata=cache)
+        ],
+    )
+    self.mock_session_service.get_session = AsyncMock(return_value=mock_session)
+    registry = get_context_cache_registry()
+    registry.clear()
+    registry.record_reuse()
+
+    result = await self.analyzer.analyze_agent_cache_performance(
+        "test_session", "test_user", "test_app", "test_agent"
+    )
+
+    assert result["registry"]["reuses"] == 1
+    assert result["registry"]["hit_rate"] == 1.0
+    registry.clear()
+
   async def test_analyze_agent_cache_performance_no_token_data(self):
     """Test analysis when events have no usage_metadata."""
     cache = self.create_cache_metadata(invocations_used=5)
@@ -0,0 +1,62 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for lazily rendered log messages."""
+
+import logging
+from unittest import mock
+
+from google.adk.utils._lazy_log import lazy_log
+from google.adk.utils._lazy_log import truncate_log
+
+
+def test_message_is_not_built_when_level_is_disabled(caplog):
+  build = mock.Mock(return_value='request')
+  logger = logging.getLogger('google_adk.test_lazy_log')
+
+  with caplog.at_level(logging.INFO, logger='google_adk.test_lazy_log'):
+    logger.debug(lazy_log(build, 'arg', key='value'))
+
+  build.assert_not_called()
+  assert not caplog.records
+
+
+def test_message_is_built_when_emitted(caplog):
+  build = mock.Mock(return_value='request')
+  logger = logging.getLogger('google_adk.test_lazy_log')
+
+  with caplog.at_level(logging.DEBUG, logger='google_adk.test_lazy_log'):
+    logger.debug(lazy_log(build, 'arg', key='value'))
+    logger.debug('Response: %s', lazy_log(build, 'other'))
+
+  assert [r.getMessage() for r in caplog.records] == [
+      'request',
+      'Response: request',
+  ]
+  build.assert_any_call('arg', key='value')
+  build.assert_any_call('other')
+
+
+def test_message_is_truncated(monkeypatch):
+  monkeypatch.setenv('ADK_DEBUG_LOG_MAX_CHARS', '10')
+
+  assert str(lazy_log(lambda: 'x' * 25)) == (
+      'xxxxxxxxxx\n... [truncated 15 of 25 chars]'
+  )
+  assert str(lazy_log(lambda: 'short')) == 'short'
+
+
+def test_truncation_can_be_disabled():
+  assert truncate_log('x' * 25, 0) == 'x' * 25
+  assert truncate_log('x' * 25, 25) == 'x' * 25